@@ -0,0 +1,82 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Package import benchmark
+************************
+
+Measure the cumulative import time of pykiso modules in fresh
+interpreters with ``python -X importtime`` and fail if a budget or the
+lazy loading of the heavy dependencies is exceeded.
+
+Usage::
+
+    python benchmarks/bench_import_time.py --runs 5 --budget-ms 150
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+#: modules only loaded when running tests or rendering reports
+LAZY_MODULES = ["click", "jinja2", "xmlrunner", "yaml", "pykiso.cli", "pykiso.test_coordinator.test_execution"]
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """Import a module in a fresh interpreter.
+
+    :param module: module to import
+
+    :return: the cumulative import time in microseconds of each loaded
+        module
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == "site":
+            # only keep the modules loaded by the import itself, not by the interpreter start-up
+            times.clear()
+            continue
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[5])
+    parser.add_argument("--module", default="pykiso", help="module to import")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if the median import time exceeds it")
+    args = parser.parse_args()
+
+    runs: List[Dict[str, int]] = [_import_times(args.module) for _ in range(args.runs)]
+    median_ms = statistics.median(run[args.module] for run in runs) / 1000
+    print(f"import {args.module}: {median_ms:.1f} ms (median of {args.runs} runs)")
+
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)[1:11]
+    for name, cumulative in slowest:
+        print(f"  {name:<60}{cumulative / 1000:>8.1f} ms")
+
+    loaded = [name for name in LAZY_MODULES if name in runs[-1]]
+    if args.module == "pykiso" and loaded:
+        sys.exit(f"modules expected to be loaded lazily were imported: {', '.join(loaded)}")
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        sys.exit(f"import time {median_ms:.1f} ms exceeds the budget of {args.budget_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
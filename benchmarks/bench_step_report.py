@@ -0,0 +1,72 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Step report assertion benchmark
+*******************************
+
+Compare the assertion throughput of a test case with and without the
+step report, with a cold and a warm call-site cache.
+
+Usage::
+
+    python benchmarks/bench_step_report.py --asserts 10000
+"""
+import argparse
+import time
+import unittest
+
+from pykiso.test_result import assert_step_report
+
+
+class AssertLoop(unittest.TestCase):
+    def test_run(self):
+        for value in range(self.iterations):
+            self.assertEqual(value, value)
+            self.assertTrue(value >= 0)
+
+
+def _decorate(test_case: unittest.TestCase) -> None:
+    """Decorate the assert methods the way the step report does."""
+    test_case.step_report = assert_step_report.StepReportData()
+    for method_name in [method for method in dir(test_case) if method.startswith("assert")]:
+        setattr(test_case, method_name, assert_step_report.assert_decorator(getattr(test_case, method_name)))
+
+
+def _run(asserts: int, step_report: bool) -> float:
+    """Run the assertion loop and return the number of asserts per second."""
+    test_case = AssertLoop("test_run")
+    test_case.iterations = asserts
+    if step_report:
+        _decorate(test_case)
+    start = time.perf_counter()
+    test_case.test_run()
+    elapsed = time.perf_counter() - start
+    assert_step_report.ALL_STEP_REPORT.clear()
+    return 2 * asserts / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[5])
+    parser.add_argument("--asserts", type=int, default=10000, help="number of loop iterations")
+    args = parser.parse_args()
+
+    assert_step_report._CALL_SITE_CACHE.clear()
+    results = {
+        "without step report": _run(args.asserts, step_report=False),
+        "step report (cold cache)": _run(args.asserts, step_report=True),
+        "step report (warm cache)": _run(args.asserts, step_report=True),
+    }
+    baseline = results["without step report"]
+    for name, throughput in results.items():
+        print(f"{name:<28}{throughput:>14,.0f} asserts/s  (x{baseline / throughput:.1f} slower)")
+
+
+if __name__ == "__main__":
+    main()
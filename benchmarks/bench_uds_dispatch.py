@@ -0,0 +1,76 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+UDS server callback dispatch benchmark
+**************************************
+
+Compare the time to find the callback of a received request with the
+prefix trie of the UdsServerAuxiliary and with a scan of all registered
+callbacks, for ReadDataByIdentifier callbacks of distinct DIDs.
+
+Usage::
+
+    python benchmarks/bench_uds_dispatch.py --callbacks 1000
+"""
+import argparse
+import time
+from typing import Callable, List
+
+from pykiso.lib.auxiliaries.udsaux.common.uds_callback import UdsCallback, UdsCallbackTrie
+
+
+def _scan(callbacks: List[UdsCallback]) -> Callable[[List[int]], UdsCallback]:
+    """Create the dispatch comparing each registered request in turn."""
+
+    def dispatch(data: List[int]) -> UdsCallback:
+        for callback in callbacks:
+            if callback.request == data[: len(callback.request)]:
+                return callback
+
+    return dispatch
+
+
+def _trie(callbacks: List[UdsCallback]) -> Callable[[List[int]], UdsCallback]:
+    """Create the dispatch looking the request up in a prefix trie."""
+    trie = UdsCallbackTrie()
+    for callback in callbacks:
+        trie = trie.insert(callback.request, callback)
+    return trie.match
+
+
+def _run(dispatch: Callable[[List[int]], UdsCallback], requests: List[List[int]]) -> float:
+    """Dispatch all requests and return the mean time per request in µs."""
+    start = time.perf_counter()
+    for request in requests:
+        dispatch(request)
+    return (time.perf_counter() - start) / len(requests) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[5])
+    parser.add_argument("--callbacks", type=int, default=1000, help="number of registered callbacks")
+    parser.add_argument("--requests", type=int, default=20000, help="number of dispatched requests")
+    args = parser.parse_args()
+
+    callbacks = [UdsCallback([0x22, did >> 8, did & 0xFF]) for did in range(0xF000, 0xF000 + args.callbacks)]
+    # cycle over all DIDs so that the scan hits on average the middle of the list
+    requests = [callbacks[index % args.callbacks].request + [0x00] for index in range(args.requests)]
+
+    start = time.perf_counter()
+    _trie(callbacks)
+    print(f"trie built in {(time.perf_counter() - start) * 1e3:.1f} ms for {args.callbacks} callbacks")
+    scan = _run(_scan(callbacks), requests)
+    trie = _run(_trie(callbacks), requests)
+    print(f"{'scan':<8}{scan:>10.2f} µs/request")
+    print(f"{'trie':<8}{trie:>10.2f} µs/request  (x{scan / trie:.0f} faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,15 +19,10 @@ pykiso - extensible framework for (embedded) integration testing.
 
 """
 
-try:
-    from importlib import metadata
-except ImportError:  # for Python<3.8
-    import importlib_metadata as metadata
+import importlib
+from typing import Any, List
 
-# get version from package metadata to automatically set the version dunder
-__version__ = metadata.version(__name__)
-
-from . import cli, config_parser, connector, logging_initializer, message, types
+from . import connector, logging_initializer, message, types
 from .auxiliary import AuxiliaryInterface
 from .connector import CChannel, Flasher
 from .exceptions import AuxiliaryCreationError, InvalidTestModuleName, PykisoError, TestCollectionError
@@ -36,7 +31,6 @@ from .logging_initializer import disable_logging
 from .message import Message
 from .test_coordinator import test_case, test_message_handler, test_suite
 from .test_coordinator.test_case import BasicTest, RemoteTest, define_test_parameters, retry_test_case, xray
-from .test_coordinator.test_execution import abort
 from .test_coordinator.test_suite import (
     BasicTestSuiteSetup,
     BasicTestSuiteTeardown,
@@ -46,9 +40,44 @@ from .test_coordinator.test_suite import (
 
 logging_initializer.add_internal_log_levels()
 
-# Experimental - load configuration and create auxiliaries
-from .config_parser import parse_config
-from .test_setup.config_registry import ConfigRegistry
+# the CLI, the test execution and the YAML parsing are only loaded on first access,
+# test modules and helper scripts only importing the test API do not pay for them
+_LAZY_SUBMODULES = ("cli", "config_parser")
+_LAZY_ATTRIBUTES = {
+    "abort": ".test_coordinator.test_execution",
+    "parse_config": ".config_parser",
+    "ConfigRegistry": ".test_setup.config_registry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Load the lazy submodules and attributes on first access.
+
+    :param name: name of the accessed attribute
+
+    :raises AttributeError: if the attribute does not exist
+    :return: the loaded submodule or attribute
+    """
+    if name == "__version__":
+        try:
+            from importlib import metadata
+        except ImportError:  # for Python<3.8
+            import importlib_metadata as metadata
+
+        # get version from package metadata to automatically set the version dunder
+        value = metadata.version(__name__)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), "__version__", *_LAZY_SUBMODULES, *_LAZY_ATTRIBUTES})
 
 
 def load_config(config_file: str):
@@ -57,5 +86,9 @@ def load_config(config_file: str):
     :param config_file: path to the pykiso yaml file
 
     """
+    # Experimental - load configuration and create auxiliaries
+    from .config_parser import parse_config
+    from .test_setup.config_registry import ConfigRegistry
+
     cfg = parse_config(config_file)
     ConfigRegistry.register_aux_con(cfg)
@@ -18,13 +18,14 @@ Auxiliary common Interface Definition
 
 """
 import abc
+import concurrent.futures
 import enum
 import functools
 import logging
 import queue
 import threading
 from enum import Enum, unique
-from typing import Any, Callable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 from typing_extensions import Self
 
@@ -33,8 +34,39 @@ from pykiso.test_setup.config_registry import ConfigRegistry
 from .exceptions import AuxiliaryCreationError, AuxiliaryNotStarted
 from .logging_initializer import add_internal_log_levels, initialize_loggers
 
+if TYPE_CHECKING:
+    from .auxiliary_reactor import AuxiliaryReactor
+
 log = logging.getLogger(__name__)
 
+#: executor shared by all auxiliaries to serve asynchronous commands
+_async_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_async_executor_lock = threading.Lock()
+
+
+def _get_async_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the executor serving asynchronous auxiliary commands and
+    create it on first use.
+
+    :return: the shared thread pool executor
+    """
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="pykiso_async")
+        return _async_executor
+
+
+def _get_reactor() -> "AuxiliaryReactor":
+    """Return the reactor shared by the auxiliaries using it, only
+    loading its dependencies on first use.
+
+    :return: the shared reactor
+    """
+    from .auxiliary_reactor import get_reactor
+
+    return get_reactor()
+
 
 @unique
 class AuxCommand(Enum):
@@ -70,6 +102,7 @@ class AuxiliaryInterface(abc.ABC):
         tx_task_on=True,
         rx_task_on=True,
         auto_start: bool = True,
+        use_reactor: bool = False,
     ) -> None:
         """Initialize auxiliary attributes
 
@@ -83,6 +116,9 @@ class AuxiliaryInterface(abc.ABC):
         :param rx_task_on: enable or not the rx thread
         :param auto_start: determine if the auxiliayry is automatically
              started (magic import) or manually (by user)
+        :param use_reactor: if True, the tx and rx tasks are serviced by
+            the reactor shared between all auxiliaries instead of
+            dedicated threads (see :py:mod:`pykiso.auxiliary_reactor`)
         """
         initialize_loggers(activate_log)
         add_internal_log_levels()
@@ -94,7 +130,14 @@ class AuxiliaryInterface(abc.ABC):
         self._stop_event = threading.Event()
         self.stop_tx = threading.Event()
         self.stop_rx = threading.Event()
-        self.queue_in = queue.Queue()
+        self.use_reactor = use_reactor
+        if use_reactor:
+            # only load the reactor's dependencies when an auxiliary uses it
+            from .auxiliary_reactor import ReactorQueue
+
+            self.queue_in = ReactorQueue(self._notify_reactor)
+        else:
+            self.queue_in = queue.Queue()
         self.queue_out = queue.Queue()
         self.tx_task_on = tx_task_on
         self.rx_task_on = rx_task_on
@@ -139,18 +182,58 @@ class AuxiliaryInterface(abc.ABC):
             if not self.is_instance:
                 raise AuxiliaryNotStarted(self.name)
 
-            log.internal_debug(f"sending command '{cmd_message}' with payload {cmd_data} using {self.name} aux.")
+            log.internal_debug("sending command '%s' with payload %s using %s aux.", cmd_message, cmd_data, self.name)
             response_received = timeout_result
             self.queue_in.put((cmd_message, cmd_data))
             try:
                 response_received = self.queue_out.get(blocking, timeout_in_s)
-                log.internal_debug(f"reply to command '{cmd_message}' received: '{response_received}' in {self.name}")
+                log.internal_debug(
+                    "reply to command '%s' received: '%s' in %s", cmd_message, response_received, self.name
+                )
             except queue.Empty:
                 log.error(
                     f"no reply received within time for command {cmd_message} for payload {cmd_data} using {self.name} aux."
                 )
         return response_received
 
+    def run_command_async(self, cmd_message: Any, cmd_data: Any = None, **kwargs: Any) -> concurrent.futures.Future:
+        """Send a request without blocking the caller.
+
+        The command is executed through :meth:`run_command` and its
+        result is delivered through the returned future. Commands sent
+        to the same auxiliary are still executed one after another
+        (guarded by the auxiliary's lock), whereas commands sent to
+        different auxiliaries run concurrently.
+
+        :param cmd_message: command request to the auxiliary
+        :param cmd_data: data you would like to populate the command
+            with
+        :param kwargs: additional named arguments forwarded to
+            :meth:`run_command` (e.g. timeout_in_s)
+
+        :return: future holding the response of the auxiliary or the
+            exception raised by :meth:`run_command`
+        """
+        log.internal_debug("submitting asynchronous command '%s' using %s aux.", cmd_message, self.name)
+        return _get_async_executor().submit(self.run_command, cmd_message, cmd_data, **kwargs)
+
+    async def run_command_awaitable(self, cmd_message: Any, cmd_data: Any = None, **kwargs: Any) -> Any:
+        """Awaitable variant of :meth:`run_command` to be used from
+        asyncio based tests.
+
+        :param cmd_message: command request to the auxiliary
+        :param cmd_data: data you would like to populate the command
+            with
+        :param kwargs: additional named arguments forwarded to
+            :meth:`run_command` (e.g. timeout_in_s)
+
+        :return: the response of the auxiliary
+        """
+        # only needed from a running event loop, asyncio is already loaded then
+        import asyncio
+
+        return await asyncio.wrap_future(self.run_command_async(cmd_message, cmd_data, **kwargs))
+
     def create_instance(self) -> bool:
         """Start auxiliary's running tasks and activities.
 
@@ -212,6 +295,11 @@ class AuxiliaryInterface(abc.ABC):
             log.internal_debug("transmit task is not needed, don't start it")
             return
 
+        if self.use_reactor:
+            log.internal_debug("start transmit task of %s in shared reactor", self.name)
+            _get_reactor().register_tx(self)
+            return
+
         task_name = f"{self.name}_tx"
         log.internal_debug("start transmit task %s", task_name)
         # Any created thread should disappear after main-thread exit
@@ -223,6 +311,10 @@ class AuxiliaryInterface(abc.ABC):
         if self.rx_task_on is False:
             log.internal_debug("reception task is not needed, don't start it")
             return
+        if self.use_reactor:
+            log.internal_debug("start reception task of %s in shared reactor", self.name)
+            _get_reactor().register_rx(self)
+            return
         with self.rx_lock:
             task_name = f"{self.name}_rx"
             log.internal_debug("start reception task %s", task_name)
@@ -236,6 +328,11 @@ class AuxiliaryInterface(abc.ABC):
             log.internal_debug("transmit task was not started, no need to stop it")
             return
 
+        if self.use_reactor:
+            log.internal_debug("stop transmit task of %s in shared reactor", self.name)
+            _get_reactor().unregister_tx(self)
+            return
+
         log.internal_debug(f"stop transmit task {self.name}_tx")
         self.queue_in.put((AuxCommand.DELETE_AUXILIARY, None))
         self.stop_tx.set()
@@ -247,6 +344,10 @@ class AuxiliaryInterface(abc.ABC):
         if self.rx_task_on is False:
             log.internal_debug("reception task was not started, no need to stop it")
             return
+        if self.use_reactor:
+            log.internal_debug("stop reception task of %s in shared reactor", self.name)
+            _get_reactor().unregister_rx(self)
+            return
         with self.rx_lock:
             log.internal_debug(f"stop reception task {self.name}_rx")
             self.stop_rx.set()
@@ -325,6 +426,10 @@ class AuxiliaryInterface(abc.ABC):
         while not self.stop_rx.is_set():
             self._receive_message(timeout_in_s=self.recv_timeout)
 
+    def _notify_reactor(self) -> None:
+        """Notify the shared reactor that a command was put in queue_in."""
+        _get_reactor().notify_tx(self)
+
     def wait_for_queue_out(self, blocking: bool = False, timeout_in_s: int = 0) -> Optional[Any]:
         """Wait for data from the queue out.
 
@@ -0,0 +1,558 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Shared auxiliary reactor
+************************
+
+:module: auxiliary_reactor
+
+:synopsis: single reactor thread and small worker pool servicing the
+    transmission and reception of all auxiliaries that opted in.
+
+Instead of starting a dedicated ``_tx`` and ``_rx`` thread per auxiliary,
+auxiliaries created with ``use_reactor=True`` are serviced by one reactor
+thread and a small pool of worker threads:
+
+- auxiliaries whose channel exposes a file descriptor (see
+  :py:meth:`~pykiso.connector.CChannel.fileno`) are only polled when the
+  operating system reports incoming data,
+- auxiliaries whose channel notifies incoming messages (see
+  :py:meth:`~pykiso.connector.CChannel.set_rx_notifier`), like the proxy
+  channels, are only polled once per notified message,
+- all other auxiliaries are polled periodically by the reactor's poll
+  scheduler,
+- commands put in an auxiliary's ``queue_in`` are executed by the worker
+  pool, one after another for a given auxiliary.
+
+The poll scheduler is not free: each poll of an idle channel costs a
+worker wake-up and a ``_receive_message`` call with a short timeout. To
+keep the idle load low, the poll interval of an auxiliary doubles each
+time nothing was received, up to ``max_poll_interval``, and is reset as
+soon as its channel receives a message. A message arriving on an idle
+polled channel is therefore read up to ``max_poll_interval`` later than
+with a dedicated reception thread.
+
+The worker pool is shared by the reception jobs and by the commands of
+all auxiliaries. A command blocking a worker for a long time, e.g. a
+``_run_command`` waiting for a response, delays the other auxiliaries if
+all workers are busy: increase the number of workers with
+:py:func:`configure_reactor` in such setups.
+
+.. currentmodule:: auxiliary_reactor
+
+"""
+from __future__ import annotations
+
+import functools
+import heapq
+import logging
+import queue
+import selectors
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .auxiliary import AuxiliaryInterface
+
+log = logging.getLogger(__name__)
+
+#: job sentinel retiring a worker if there are more workers than configured
+_RETIRE = object()
+
+
+class ReactorQueue(queue.Queue):
+    """Queue notifying a callback each time an item is put in it."""
+
+    def __init__(self, on_put: Callable[[], None], maxsize: int = 0) -> None:
+        """Initialize attributes.
+
+        :param on_put: callable executed after each put
+        :param maxsize: maximum number of queued items
+        """
+        super().__init__(maxsize)
+        self._on_put = on_put
+
+    def put(self, item, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Put an item into the queue and notify the reactor.
+
+        :param item: item to put
+        :param block: block if necessary until a free slot is available
+        :param timeout: maximum time to block
+        """
+        super().put(item, block, timeout)
+        self._on_put()
+
+
+class AuxiliaryReactor:
+    """Reactor servicing the tx and rx tasks of several auxiliaries."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        poll_interval: float = 0.01,
+        poll_timeout: float = 0.001,
+        max_poll_interval: float = 0.1,
+    ) -> None:
+        """Initialize attributes.
+
+        :param workers: number of worker threads executing the
+            auxiliaries' tasks
+        :param poll_interval: period (in s) at which auxiliaries without
+            file descriptor are polled while they receive messages
+        :param poll_timeout: timeout (in s) given to ``_receive_message``
+            on each poll
+        :param max_poll_interval: period (in s) the poll interval of an
+            idle auxiliary grows up to
+        """
+        if workers < 1:
+            raise ValueError(f"The reactor needs at least one worker, got {workers}")
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.poll_timeout = poll_timeout
+        self.max_poll_interval = max(poll_interval, max_poll_interval)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._jobs = queue.SimpleQueue()
+        self._requests = queue.SimpleQueue()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_r: Optional[socket.socket] = None
+        self._wakeup_w: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._worker_threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+        # auxiliaries registered for reception, mapped to their file descriptor (None if polled)
+        self._rx_registered: Dict[AuxiliaryInterface, Optional[int]] = {}
+        # auxiliaries whose channel notifies incoming messages, mapped to the number of pending messages
+        self._rx_notified: Dict[AuxiliaryInterface, int] = {}
+        # current poll interval of the polled auxiliaries
+        self._poll_intervals: Dict[AuxiliaryInterface, float] = {}
+        self._tx_registered: Set[AuxiliaryInterface] = set()
+        # auxiliaries for which a job is currently queued or running
+        self._rx_busy: Set[AuxiliaryInterface] = set()
+        self._tx_busy: Set[AuxiliaryInterface] = set()
+        self._poll_heap: List[Tuple[float, int, AuxiliaryInterface]] = []
+        self._poll_counter = 0
+        self._worker_counter = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Return True if the reactor thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the reactor thread and its worker pool."""
+        with self._lock:
+            if self.is_running:
+                return
+            self._stop_event.clear()
+            self._selector = selectors.DefaultSelector()
+            self._wakeup_r, self._wakeup_w = socket.socketpair()
+            self._wakeup_r.setblocking(False)
+            self._wakeup_w.setblocking(False)
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+            self._worker_threads = []
+            self._start_workers(self.workers)
+            self._thread = threading.Thread(name="aux_reactor", target=self._reactor_task, daemon=True)
+            self._thread.start()
+        log.internal_debug("auxiliary reactor started with %d workers", self.workers)
+
+    def stop(self) -> None:
+        """Stop the reactor thread and its worker pool."""
+        with self._lock:
+            if not self.is_running:
+                return
+            self._stop_event.set()
+        self._wakeup()
+        self._thread.join()
+        with self._lock:
+            workers = list(self._worker_threads)
+        for _ in workers:
+            self._jobs.put(None)
+        for worker in workers:
+            worker.join()
+        self._selector.close()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+        self._thread = None
+        self._worker_threads = []
+        log.internal_debug("auxiliary reactor stopped")
+
+    def set_workers(self, workers: int) -> None:
+        """Change the number of worker threads, also while running.
+
+        :param workers: number of worker threads
+
+        :raises ValueError: if the number of workers is not positive
+        """
+        if workers < 1:
+            raise ValueError(f"The reactor needs at least one worker, got {workers}")
+        with self._lock:
+            self.workers = workers
+            if not self.is_running:
+                return
+            missing = workers - len(self._worker_threads)
+            self._start_workers(missing)
+        for _ in range(-missing):
+            self._jobs.put(_RETIRE)
+        log.internal_debug("auxiliary reactor resized to %d workers", workers)
+
+    def register_rx(self, aux: AuxiliaryInterface) -> None:
+        """Service the reception of the given auxiliary.
+
+        :param aux: auxiliary whose ``_receive_message`` is called
+        """
+        fileno = self._get_fileno(aux)
+        with self._lock:
+            self._rx_registered[aux] = fileno
+        notified = fileno is None and self._set_rx_notifier(aux, functools.partial(self._notify_rx, aux))
+        if notified:
+            with self._lock:
+                self._rx_notified[aux] = 0
+            # messages could have been received before the notifier was set
+            self._notify_rx(aux)
+        else:
+            if fileno is None:
+                with self._lock:
+                    self._poll_intervals[aux] = self.poll_interval
+            self._requests.put(("add", aux, fileno))
+            self._wakeup()
+        log.internal_debug(
+            "reception of %s serviced by the reactor (%s)",
+            aux.name,
+            "selected" if fileno is not None else "notified" if notified else "polled",
+        )
+
+    def unregister_rx(self, aux: AuxiliaryInterface) -> None:
+        """Stop servicing the reception of the given auxiliary and wait
+        until its current reception job is over.
+
+        :param aux: auxiliary to unregister
+        """
+        with self._lock:
+            fileno = self._rx_registered.pop(aux, None)
+            notified = self._rx_notified.pop(aux, None) is not None
+            self._poll_intervals.pop(aux, None)
+        if notified:
+            self._set_rx_notifier(aux, None)
+        with self._lock:
+            if not self._is_worker_thread():
+                self._idle.wait_for(lambda: aux not in self._rx_busy)
+        self._requests.put(("remove", aux, fileno))
+        self._wakeup()
+
+    def register_tx(self, aux: AuxiliaryInterface) -> None:
+        """Execute the commands put in the auxiliary's queue_in.
+
+        :param aux: auxiliary whose ``_run_command`` is called
+        """
+        with self._lock:
+            self._tx_registered.add(aux)
+        self.notify_tx(aux)
+
+    def unregister_tx(self, aux: AuxiliaryInterface) -> None:
+        """Stop executing the auxiliary's commands and wait until the
+        command currently executed is over.
+
+        :param aux: auxiliary to unregister
+        """
+        with self._lock:
+            self._tx_registered.discard(aux)
+            if not self._is_worker_thread():
+                self._idle.wait_for(lambda: aux not in self._tx_busy)
+
+    def notify_tx(self, aux: AuxiliaryInterface) -> None:
+        """Schedule the execution of the auxiliary's pending commands.
+
+        :param aux: auxiliary that received a command
+        """
+        with self._lock:
+            if aux not in self._tx_registered or aux in self._tx_busy:
+                return
+            self._tx_busy.add(aux)
+        self._jobs.put((self._transmit_job, aux))
+
+    def _wakeup(self) -> None:
+        """Interrupt the reactor's wait for events."""
+        try:
+            self._wakeup_w.send(b"\x00")
+        except (AttributeError, BlockingIOError, OSError):
+            # reactor not started or wakeup already pending
+            pass
+
+    def _notify_rx(self, aux: AuxiliaryInterface) -> None:
+        """Schedule the reception of a message notified by the
+        auxiliary's channel.
+
+        :param aux: auxiliary whose channel received a message
+        """
+        with self._lock:
+            if aux not in self._rx_notified:
+                return
+            self._rx_notified[aux] += 1
+        self._dispatch_rx(aux)
+
+    @staticmethod
+    def _set_rx_notifier(aux: AuxiliaryInterface, notifier: Optional[Callable[[], None]]) -> bool:
+        """Set or remove the notifier of the auxiliary's channel.
+
+        :param aux: auxiliary to inspect
+        :param notifier: callable to execute on each received message,
+            None to remove it
+
+        :return: True if the channel supports the notification
+        """
+        set_rx_notifier = getattr(getattr(aux, "channel", None), "set_rx_notifier", None)
+        if set_rx_notifier is None:
+            return False
+        return set_rx_notifier(notifier) is True
+
+    @staticmethod
+    def _get_rx_count(aux: AuxiliaryInterface) -> Optional[int]:
+        """Get the number of messages received by the auxiliary's channel.
+
+        :param aux: auxiliary to inspect
+
+        :return: the number of received messages or None if unknown
+        """
+        return getattr(getattr(aux, "channel", None), "rx_count", None)
+
+    @staticmethod
+    def _get_fileno(aux: AuxiliaryInterface) -> Optional[int]:
+        """Get the file descriptor of the auxiliary's channel if any.
+
+        :param aux: auxiliary to inspect
+
+        :return: the file descriptor or None if the channel has to be
+            polled
+        """
+        channel = getattr(aux, "channel", None)
+        fileno = getattr(channel, "fileno", None)
+        if fileno is None:
+            return None
+        try:
+            return fileno()
+        except Exception:
+            log.internal_debug("file descriptor of %s not available, fall back to polling", channel)
+            return None
+
+    def _is_worker_thread(self) -> bool:
+        """Return True if the caller is one of the reactor's workers."""
+        return threading.current_thread() in self._worker_threads
+
+    def _start_workers(self, count: int) -> None:
+        """Start additional worker threads, called with the lock held.
+
+        :param count: number of workers to start
+        """
+        for _ in range(count):
+            self._worker_counter += 1
+            # Any created thread should disappear after main-thread exit
+            worker = threading.Thread(
+                name=f"aux_reactor_worker_{self._worker_counter}", target=self._worker_task, daemon=True
+            )
+            self._worker_threads.append(worker)
+            worker.start()
+
+    def _reactor_task(self) -> None:
+        """Wait for readiness notifications or poll deadlines and
+        dispatch the reception jobs to the workers."""
+        while not self._stop_event.is_set():
+            self._handle_requests()
+            timeout = None
+            if self._poll_heap:
+                timeout = max(0.0, self._poll_heap[0][0] - time.monotonic())
+            for key, _ in self._selector.select(timeout):
+                if key.data is None:
+                    self._drain_wakeup()
+                else:
+                    # stop watching the descriptor until the reception job is done
+                    self._selector.unregister(key.fileobj)
+                    self._dispatch_rx(key.data)
+            now = time.monotonic()
+            while self._poll_heap and self._poll_heap[0][0] <= now:
+                _, _, aux = heapq.heappop(self._poll_heap)
+                if self._rx_registered.get(aux, -1) is None:
+                    self._dispatch_rx(aux)
+
+    def _handle_requests(self) -> None:
+        """Apply the registration changes requested by other threads."""
+        while True:
+            try:
+                action, aux, fileno = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            if fileno is None:
+                if action in ("add", "rearm") and self._rx_registered.get(aux, -1) is None:
+                    with self._lock:
+                        delay = self._poll_intervals.get(aux, self.poll_interval)
+                    self._schedule_poll(aux, 0.0 if action == "add" else delay)
+                continue
+            try:
+                if action == "remove":
+                    self._selector.unregister(fileno)
+                elif fileno == self._rx_registered.get(aux):
+                    self._selector.register(fileno, selectors.EVENT_READ, aux)
+            except (KeyError, ValueError, OSError):
+                # descriptor already (un)registered or closed meanwhile
+                pass
+
+    def _schedule_poll(self, aux: AuxiliaryInterface, delay: float) -> None:
+        """Schedule the next poll of an auxiliary without descriptor.
+
+        :param aux: auxiliary to poll
+        :param delay: time to wait before polling it
+        """
+        self._poll_counter += 1
+        heapq.heappush(self._poll_heap, (time.monotonic() + delay, self._poll_counter, aux))
+
+    def _drain_wakeup(self) -> None:
+        """Empty the wakeup socket."""
+        try:
+            while self._wakeup_r.recv(1024):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _dispatch_rx(self, aux: AuxiliaryInterface) -> None:
+        """Queue a reception job for the given auxiliary.
+
+        :param aux: auxiliary to service
+        """
+        with self._lock:
+            if aux not in self._rx_registered or aux in self._rx_busy:
+                return
+            self._rx_busy.add(aux)
+        self._jobs.put((self._reception_job, aux))
+
+    def _worker_task(self) -> None:
+        """Execute the queued jobs."""
+        while True:
+            job = self._jobs.get()
+            if job is None or job is _RETIRE:
+                with self._lock:
+                    # stale sentinels of a previous stop or resizing are ignored
+                    retired = self._stop_event.is_set() if job is None else len(self._worker_threads) > self.workers
+                    if retired:
+                        self._worker_threads.remove(threading.current_thread())
+                if retired:
+                    break
+                continue
+            func, aux = job
+            try:
+                func(aux)
+            except Exception:
+                log.exception(f"encountered error while servicing auxiliary {aux.name}")
+
+    def _reception_job(self, aux: AuxiliaryInterface) -> None:
+        """Receive one message for the given auxiliary.
+
+        :param aux: auxiliary to service
+        """
+        with self._lock:
+            if self._rx_notified.get(aux):
+                self._rx_notified[aux] -= 1
+        rx_count = self._get_rx_count(aux)
+        try:
+            aux._receive_message(timeout_in_s=self.poll_timeout)
+        finally:
+            received = rx_count is not None and self._get_rx_count(aux) != rx_count
+            with self._lock:
+                self._rx_busy.discard(aux)
+                fileno = self._rx_registered.get(aux, -1)
+                pending = self._rx_notified.get(aux)
+                if aux in self._poll_intervals:
+                    # back off while the channel stays idle
+                    interval = self._poll_intervals[aux]
+                    self._poll_intervals[aux] = (
+                        self.poll_interval if received else min(interval * 2, self.max_poll_interval)
+                    )
+                self._idle.notify_all()
+            if pending is not None:
+                if pending:
+                    self._dispatch_rx(aux)
+            elif fileno != -1:
+                self._requests.put(("rearm", aux, fileno))
+                self._wakeup()
+
+    def _transmit_job(self, aux: AuxiliaryInterface) -> None:
+        """Execute all commands pending in the auxiliary's queue_in.
+
+        :param aux: auxiliary to service
+        """
+        try:
+            while True:
+                with self._lock:
+                    if aux not in self._tx_registered or aux.queue_in.empty():
+                        break
+                cmd, data = aux.queue_in.get_nowait()
+                aux._run_command(cmd, data)
+        finally:
+            with self._lock:
+                self._tx_busy.discard(aux)
+                self._idle.notify_all()
+            # a command could have been put between the emptiness check and the release
+            if not aux.queue_in.empty():
+                self.notify_tx(aux)
+
+
+_reactor: Optional[AuxiliaryReactor] = None
+_reactor_lock = threading.Lock()
+
+
+def configure_reactor(
+    workers: Optional[int] = None,
+    poll_interval: Optional[float] = None,
+    poll_timeout: Optional[float] = None,
+    max_poll_interval: Optional[float] = None,
+) -> AuxiliaryReactor:
+    """Configure the reactor shared by all auxiliaries, before or while
+    it is running. Parameters left to None keep their current value.
+
+    :param workers: number of worker threads
+    :param poll_interval: period (in s) at which the polled auxiliaries
+        are polled while they receive messages
+    :param poll_timeout: timeout (in s) given to ``_receive_message`` on
+        each poll
+    :param max_poll_interval: period (in s) the poll interval of an idle
+        auxiliary grows up to
+
+    :return: the shared reactor
+    """
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = AuxiliaryReactor(workers=workers or 4)
+        reactor = _reactor
+    if workers is not None:
+        reactor.set_workers(workers)
+    if poll_interval is not None:
+        reactor.poll_interval = poll_interval
+    if poll_timeout is not None:
+        reactor.poll_timeout = poll_timeout
+    if max_poll_interval is not None:
+        reactor.max_poll_interval = max_poll_interval
+    reactor.max_poll_interval = max(reactor.poll_interval, reactor.max_poll_interval)
+    return reactor
+
+
+def get_reactor() -> AuxiliaryReactor:
+    """Return the reactor shared by all auxiliaries and start it on
+    first use.
+
+    :return: the shared reactor
+    """
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = AuxiliaryReactor()
+        _reactor.start()
+        return _reactor
@@ -24,6 +24,7 @@ import pprint
 import sys
 import threading
 import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -32,8 +33,17 @@ import click
 from . import __version__
 from .config_parser import parse_config
 from .global_config import Grabber
-from .logging_initializer import change_logger_class, initialize_logging
+from .logging_initializer import (
+    DEFAULT_LOG_QUEUE_SIZE,
+    OverflowPolicy,
+    change_logger_class,
+    initialize_logging,
+    stop_async_logging,
+)
 from .test_coordinator import test_execution
+from .test_coordinator.tag_index import TagExpression
+from .test_coordinator.test_scheduling import RunHistory, TestOrder
+from .test_coordinator.test_sharding import TestShard, load_junit_timings
 from .test_setup.config_registry import ConfigRegistry
 from .types import PathType
 
@@ -89,6 +99,38 @@ def check_file_extension(click_context: click.Context, param: click.Parameter, p
     return paths
 
 
+def get_test_shard(
+    shard_index: Optional[int], shard_count: Optional[int], shard_timings: Optional[PathType], workers: int
+) -> Optional[TestShard]:
+    """Check the sharding options and create the shard to run.
+
+    :param shard_index: index of the shard to run
+    :param shard_count: number of shards
+    :param shard_timings: JUnit report or run history of a previous run
+    :param workers: number of worker processes
+    :raises click.UsageError: if the sharding options are incomplete or
+        inconsistent
+    :return: the shard to run or None if the test cases are not sharded
+    """
+    if shard_index is None and shard_count is None:
+        if shard_timings is not None:
+            raise click.UsageError("--shard-timings requires --shard-index and --shard-count")
+        return None
+    if shard_index is None or shard_count is None:
+        raise click.UsageError("--shard-index and --shard-count must be provided together")
+    if shard_index >= shard_count:
+        raise click.UsageError(f"--shard-index must be lower than --shard-count ({shard_count})")
+    if shard_timings is not None and workers > 1:
+        raise click.UsageError("--shard-timings cannot be combined with --workers")
+    if shard_timings is None:
+        timings = None
+    elif Path(shard_timings).suffix == ".json":
+        timings = RunHistory.load(shard_timings).get_durations()
+    else:
+        timings = load_junit_timings(shard_timings)
+    return TestShard(shard_index, shard_count, timings)
+
+
 def active_threads() -> list[tuple[str, str]]:
     """Get the names and current execution frame of all active threads except the main thread.
 
@@ -204,6 +246,18 @@ class CommandWithOptionalFlagValues(click.Command):
     type=click.Path(writable=True),
     help="generate the step report at the specified path",
 )
+@click.option(
+    "--step-report-streaming",
+    is_flag=True,
+    help="write the step report incrementally: one page per test class linked from an index at the step report path",
+)
+@click.option(
+    "--step-report-export",
+    required=False,
+    default=None,
+    type=click.Path(writable=True, dir_okay=False),
+    help="also export the step report with timings and summaries to the specified .jsonl or .parquet file",
+)
 @click.option(
     "--failfast",
     is_flag=True,
@@ -229,6 +283,87 @@ class CommandWithOptionalFlagValues(click.Command):
     required=False,
     help="use the specified logger class in pykiso",
 )
+@click.option(
+    "--async-logging",
+    is_flag=True,
+    help="write the logs from a dedicated thread instead of the threads logging them",
+)
+@click.option(
+    "--log-queue-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_LOG_QUEUE_SIZE,
+    show_default=True,
+    help="maximum number of log records waiting to be written with --async-logging",
+)
+@click.option(
+    "--log-overflow",
+    type=click.Choice([policy.value for policy in OverflowPolicy]),
+    default=OverflowPolicy.BLOCK.value,
+    show_default=True,
+    help="policy applied when the log queue of --async-logging is full: wait for room or drop the new or oldest record",
+)
+@click.option(
+    "--parallel-start",
+    is_flag=True,
+    help="create all auxiliaries concurrently before the test collection",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="run the test suites bound to disjoint auxiliaries in parallel in up to WORKERS processes",
+)
+@click.option(
+    "--shard-index",
+    type=click.IntRange(min=0),
+    default=None,
+    help="only run the test cases of this shard (starting at 0), requires --shard-count",
+)
+@click.option(
+    "--shard-count",
+    type=click.IntRange(min=1),
+    default=None,
+    help="split the test cases by test ID in SHARD_COUNT shards, e.g. to share them between several test benches",
+)
+@click.option(
+    "--shard-timings",
+    type=click.Path(exists=True, readable=True),
+    default=None,
+    help="JUnit report (file or folder) or run history (.json) of a previous run, "
+    "to split the test cases in shards of similar durations",
+)
+@click.option(
+    "--test-history",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="JSON file recording the duration and outcome of each test case, updated after each run",
+)
+@click.option(
+    "--test-order",
+    type=click.Choice([order.value for order in TestOrder]),
+    default=TestOrder.DISCOVERY.value,
+    show_default=True,
+    help="order of the test cases within their test suite and test class, based on the --test-history",
+)
+@click.option(
+    "--collection-cache",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="JSON file caching the collected test cases, to verify the provided tags before loading the test modules",
+)
+@click.option(
+    "--config-cache",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="JSON file caching the resolved YAML configurations, reused as long as their files and variables are unchanged",
+)
+@click.option(
+    "--tag-expression",
+    default=None,
+    help="only run the test cases whose tags match this boolean expression, "
+    "e.g. 'variant=variant1,variant2 and not branch-level=nightly'",
+)
 @click.version_option(__version__)
 @click.pass_context
 @Grabber.grab_cli_config
@@ -244,6 +379,21 @@ def main(
     verbose: bool = False,
     logger: Optional[str] = None,
     junit: Optional[str] = None,
+    parallel_start: bool = False,
+    step_report_streaming: bool = False,
+    step_report_export: Optional[PathType] = None,
+    workers: int = 1,
+    shard_index: Optional[int] = None,
+    shard_count: Optional[int] = None,
+    shard_timings: Optional[PathType] = None,
+    test_history: Optional[PathType] = None,
+    test_order: str = TestOrder.DISCOVERY.value,
+    collection_cache: Optional[PathType] = None,
+    config_cache: Optional[PathType] = None,
+    tag_expression: Optional[str] = None,
+    async_logging: bool = False,
+    log_queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+    log_overflow: str = OverflowPolicy.BLOCK.value,
 ):
     """Embedded Integration Test Framework - CLI Entry Point.
 
@@ -265,6 +415,28 @@ def main(
     :param failfast: stop the test run on the first error or failure
     :param verbose: activate logging for the whole framework
     :param logger: class of the logger that will be used in the tests
+    :param parallel_start: create all auxiliaries concurrently before
+        the test collection
+    :param step_report_streaming: write the step report incrementally,
+        one page per test class plus an index
+    :param step_report_export: file path of the structured step report
+        export, requires a step report
+    :param workers: number of worker processes running the test suites
+    :param shard_index: index of the shard to run
+    :param shard_count: number of shards the test cases are split in
+    :param shard_timings: JUnit report or run history of a previous run
+        to balance the durations of the shards
+    :param test_history: JSON file recording the duration and outcome of
+        the test cases
+    :param test_order: order of the test cases, based on the test history
+    :param collection_cache: JSON file caching the collected test cases
+    :param config_cache: JSON file caching the resolved configurations
+    :param tag_expression: boolean expression the tags of the test cases
+        to run have to match
+    :param async_logging: write the logs from a dedicated thread
+    :param log_queue_size: maximum number of log records waiting to be
+        written in asynchronous mode
+    :param log_overflow: policy applied when the log queue is full
     """
     # we are expecting one log file path or as many as the provided configuration files
     if log_path and len(log_path) not in (1, len(test_configuration_file)):
@@ -272,6 +444,19 @@ def main(
             f"Mismatch: {len(log_path)} log files were provided for {len(test_configuration_file)} yaml configuration files"
         )
 
+    if step_report_export is not None and step_report is None:
+        raise click.UsageError("--step-report-export requires --step-report")
+
+    shard = get_test_shard(shard_index, shard_count, shard_timings, workers)
+
+    if test_order != TestOrder.DISCOVERY and test_history is None:
+        raise click.UsageError(f"--test-order {test_order} requires --test-history")
+
+    try:
+        expression = TagExpression(tag_expression) if tag_expression is not None else None
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--tag-expression'")
+
     if junit is not None:
         report_type = "junit"
 
@@ -291,14 +476,17 @@ def main(
         else:
             log_file = None
 
-        log = initialize_logging(log_file, log_level, verbose, report_type, yaml_name)
+        log = initialize_logging(
+            log_file, log_level, verbose, report_type, yaml_name, async_logging, log_queue_size, log_overflow
+        )
 
         # Get YAML configuration
-        cfg_dict = parse_config(config_file)
+        cfg_dict = parse_config(config_file, config_cache)
         log.debug("cfg_dict:\n%s", pprint.pformat(cfg_dict))
 
-        # Run tests
-        with ConfigRegistry.provide_auxiliaries(cfg_dict):
+        # Run tests, each worker process registers the auxiliaries its test suites need
+        registry = ConfigRegistry.provide_auxiliaries(cfg_dict, parallel_start) if workers == 1 else nullcontext()
+        with registry:
             exit_code = test_execution.execute(
                 cfg_dict,
                 report_type,
@@ -308,8 +496,18 @@ def main(
                 pattern,
                 failfast,
                 junit,
+                step_report_streaming,
+                step_report_export,
+                workers,
+                shard,
+                TestOrder(test_order),
+                test_history,
+                collection_cache,
+                expression,
             )
 
+        # write the remaining logs before closing the log file
+        stop_async_logging()
         for handler in logging.getLogger().handlers:
             if isinstance(handler, logging.FileHandler):
                 logging.getLogger().removeHandler(handler)
@@ -15,20 +15,33 @@ Configuration File Parser
 
 :synopsis: Load and parse the YAML configuration file.
 
+The YAML files are loaded with the libyaml based ``CSafeLoader`` if
+available, with a fallback on the pure python ``SafeLoader``.
+
+On request, the resolved configurations are cached in a JSON file, to
+skip the parsing on the next runs. A cached configuration is only reused
+if the content of the configuration file and of all its included files,
+the environment variables it references and the existence of the relative
+paths it resolves did not change.
+
 .. currentmodule:: config_parser
 
 
 """
 
+import functools
+import hashlib
+import json
 import logging
 import operator
 import os
 import re
 import sys
 from collections import ChainMap
+from dataclasses import dataclass, field
 from io import TextIOBase
 from pathlib import Path
-from typing import Callable, Dict, List, TextIO, Union
+from typing import Any, Callable, Dict, List, Optional, TextIO, Union
 
 if sys.version_info < (3, 8):
     import importlib_metadata as metadata
@@ -41,8 +54,131 @@ from packaging import version
 from .global_config import Grabber
 from .types import PathType
 
+#: libyaml based loader if available, much faster on large configurations
+_BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass
+class ConfigDependencies:
+    """Everything a resolved configuration depends on, to know if a
+    cached configuration is still valid."""
+
+    #: sha256 of the content of the configuration and included files
+    files: Dict[Path, str] = field(default_factory=dict)
+    #: value of the referenced environment variables, None if not set
+    env_vars: Dict[str, Optional[str]] = field(default_factory=dict)
+    #: existence of the resolved relative paths
+    paths: Dict[Path, bool] = field(default_factory=dict)
+
+    def add_file(self, path: Path, content: str) -> None:
+        """Record a loaded YAML file.
+
+        :param path: resolved path of the file
+        :param content: content of the file
+        """
+        self.files[path] = hashlib.sha256(content.encode()).hexdigest()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Convert the dependencies to JSON serializable values.
+
+        :return: the dependencies with the paths as strings
+        """
+        return {
+            "files": {str(path): digest for path, digest in self.files.items()},
+            "env_vars": dict(self.env_vars),
+            "paths": {str(path): exists for path, exists in self.paths.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, content: Dict[str, Dict[str, Any]]) -> "ConfigDependencies":
+        """Create the dependencies from their JSON serializable values.
+
+        :param content: dependencies as returned by :py:meth:`to_dict`
+
+        :return: the dependencies
+        """
+        return cls(
+            files={Path(path): digest for path, digest in content["files"].items()},
+            env_vars=dict(content["env_vars"]),
+            paths={Path(path): exists for path, exists in content["paths"].items()},
+        )
+
+    def is_up_to_date(self) -> bool:
+        """Check that none of the dependencies changed.
+
+        :return: True if the cached configuration is still valid
+        """
+        for path, digest in self.files.items():
+            try:
+                content = path.read_text()
+            except OSError:
+                return False
+            if hashlib.sha256(content.encode()).hexdigest() != digest:
+                return False
+        if any(os.environ.get(name) != value for name, value in self.env_vars.items()):
+            return False
+        return all(path.exists() == exists for path, exists in self.paths.items())
+
+
+class ConfigCache:
+    """On-disk cache of the resolved configurations."""
+
+    #: version of the cache layout, a cache of another version is discarded
+    VERSION = 1
+
+    def __init__(self, path: PathType) -> None:
+        """Load the cache, an unreadable cache is started over.
+
+        :param path: JSON file of the cache
+        """
+        self.path = Path(path)
+        self.configs: Dict[str, Dict[str, Any]] = {}
+        if self.path.is_file():
+            try:
+                content = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                logging.warning(f"configuration cache {self.path} could not be read, starting a new one")
+                return
+            if content.get("version") == self.VERSION:
+                self.configs = content["configs"]
+
+    def get(self, config_path: Path) -> Optional[Dict[str, Any]]:
+        """Get a cached configuration.
+
+        :param config_path: resolved path of the configuration file
 
-class YamlLoader(yaml.SafeLoader):
+        :return: the resolved configuration, None if it is not cached or
+            if any of its dependencies changed
+        """
+        entry = self.configs.get(str(config_path))
+        if entry is None or not ConfigDependencies.from_dict(entry["dependencies"]).is_up_to_date():
+            return None
+        return entry["config"]
+
+    def put(self, config_path: Path, config: Dict[str, Any], dependencies: ConfigDependencies) -> None:
+        """Store a resolved configuration and write the cache, replacing
+        it atomically. Configurations which cannot be stored as JSON
+        without changes are not cached.
+
+        :param config_path: resolved path of the configuration file
+        :param config: resolved configuration
+        :param dependencies: dependencies of the configuration
+        """
+        try:
+            cached_config = json.loads(json.dumps(config))
+        except (TypeError, ValueError):
+            cached_config = None
+        if cached_config != config:
+            logging.debug(f"Configuration {config_path} cannot be cached as JSON")
+            return
+        self.configs[str(config_path)] = {"config": config, "dependencies": dependencies.to_dict()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps({"version": self.VERSION, "configs": self.configs}))
+        os.replace(tmp_path, self.path)
+
+
+class YamlLoader(_BaseLoader):
     """Extension of default yaml.SafeLoader that integrates custom
     !include tag management and performs config parsing at load time.
     """
@@ -51,19 +187,25 @@ class YamlLoader(yaml.SafeLoader):
     env_var_pattern = re.compile(r"ENV{(\w+)(=(.+))?}")
     rel_path_pattern = re.compile(r'[^\n"?:*<>|]')
 
-    def __init__(self, file: Union[TextIO, PathType]):
+    def __init__(self, file: Union[TextIO, PathType], dependencies: Optional[ConfigDependencies] = None):
         """Initialize attributes and add the YAML constructors to parse it.
 
         For usage with yaml.load, the passed stream must be a path to the
         YAML file or an actual stream, not its read content.
 
         :param file: full path to the YAML file to load.
+        :param dependencies: records the files, environment variables
+            and paths the configuration depends on, shared with the
+            included files.
         """
         if isinstance(file, TextIOBase):
             file = file.name
         yaml_file = Path(file).resolve()
         self._base_dir = yaml_file.parent
-        super().__init__(yaml_file.read_text())
+        self._dependencies = dependencies if dependencies is not None else ConfigDependencies()
+        content = yaml_file.read_text()
+        self._dependencies.add_file(yaml_file, content)
+        super().__init__(content)
 
         # load paths to sub-yamls on include tag
         YamlLoader.add_constructor("!include", YamlLoader.include)
@@ -98,10 +240,24 @@ class YamlLoader(yaml.SafeLoader):
 
         :return: True if the node is a key otherwise False.
         """
-        if node.end_mark.buffer is None:
-            # undetermined, buffer does not exist when file_path parameter is a stream
-            return True
-        return node.end_mark.buffer[node.end_mark.pointer] == ":"
+        # the libyaml parser does not keep the buffer in the node marks,
+        # the mapping keys are flagged before being constructed instead
+        return getattr(node, "is_mapping_key", False)
+
+    def construct_mapping(self, node: yaml.nodes.MappingNode, deep: bool = False) -> dict:
+        """Flag the keys of a mapping before constructing it.
+
+        :param node: MappingNode currently in use
+        :param deep: construct the nested objects immediately
+
+        :return: the constructed mapping
+        """
+        if isinstance(node, yaml.nodes.MappingNode):
+            # resolve the merge keys first to also flag the merged keys
+            self.flatten_mapping(node)
+            for key_node, _ in node.value:
+                key_node.is_mapping_key = True
+        return super().construct_mapping(node, deep=deep)
 
     def include(self, node: yaml.nodes.ScalarNode) -> dict:
         """Return the content of a yaml file identified by !include tag.
@@ -111,7 +267,8 @@ class YamlLoader(yaml.SafeLoader):
         :return: included yaml file's content
         """
         nested_yaml = (self._base_dir / Path(node.value)).resolve()
-        nested_cfg = yaml.load(nested_yaml, Loader=YamlLoader)  # nosec B506 YamlLoader inherits from yaml.SafeLoader.
+        loader = functools.partial(YamlLoader, dependencies=self._dependencies)
+        nested_cfg = yaml.load(nested_yaml, Loader=loader)  # nosec B506 YamlLoader inherits from yaml.SafeLoader.
         return nested_cfg
 
     def resolve_path(self, node: yaml.nodes.ScalarNode) -> str:
@@ -132,7 +289,8 @@ class YamlLoader(yaml.SafeLoader):
             except OSError:
                 # for some rare values a WinError is raised by an invalid path
                 return str(value)
-            if config_path.exists():
+            self._dependencies.paths[config_path] = config_path.exists()
+            if self._dependencies.paths[config_path]:
                 value = config_path
                 logging.debug(f"Resolved relative path {config_path_unresolved} to {value}")
         return str(value)
@@ -184,6 +342,7 @@ class YamlLoader(yaml.SafeLoader):
 
         # Parse detected environment variable
         env_name, _, env_default = match[0]
+        self._dependencies.env_vars[env_name] = os.environ.get(env_name)
 
         if env_name in os.environ:
             env = os.environ[env_name]
@@ -285,7 +444,7 @@ def check_requirements(requirements: List[dict]):
 
 
 @Grabber.grab_yaml_config
-def parse_config(file_name: PathType) -> Dict:
+def parse_config(file_name: PathType, cache: Optional[PathType] = None) -> Dict:
     """Parse the YAML configuration file and verify the dependencie's
     version requirement if encountered.
 
@@ -297,11 +456,24 @@ def parse_config(file_name: PathType) -> Dict:
         * Including the sub-YAML files marked by the !include tag.
 
     :param file_name: path to the config file
+    :param cache: JSON file caching the resolved configurations, the
+        cached configuration is reused if none of its dependencies
+        changed
 
     :return: config dict with resolved paths where needed
     """
-    with open(file_name, "r") as f:
-        cfg = yaml.load(f, Loader=YamlLoader)  # nosec B506 YamlLoader inherits from yaml.SafeLoader.
+    config_path = Path(file_name).resolve()
+    config_cache = ConfigCache(cache) if cache is not None else None
+    cfg = config_cache.get(config_path) if config_cache is not None else None
+    if cfg is not None:
+        logging.debug(f"Using cached configuration of {config_path}")
+    else:
+        dependencies = ConfigDependencies()
+        loader = functools.partial(YamlLoader, dependencies=dependencies)
+        with open(file_name, "r") as f:
+            cfg = yaml.load(f, Loader=loader)  # nosec B506 YamlLoader inherits from yaml.SafeLoader.
+        if config_cache is not None:
+            config_cache.put(config_path, cfg, dependencies)
 
     # Check requirements
     requirements = cfg.get("requirements")
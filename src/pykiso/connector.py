@@ -23,8 +23,9 @@ import abc
 import logging
 import pathlib
 import threading
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
+from .traffic_recorder import RECORDING_SUFFIX, Direction, TrafficRecorder
 from .types import MsgType, PathType
 
 log = logging.getLogger(__name__)
@@ -74,11 +75,23 @@ class Connector(abc.ABC):
 class CChannel(Connector):
     """Abstract class for coordination channel."""
 
-    def __init__(self, processing=False, auto_open: bool = False, **kwargs: dict) -> None:
+    #: number of messages received with cc_receive
+    rx_count: int = 0
+    #: path of the recording of the traffic, written while the channel is open
+    record_path: Optional[PathType] = None
+    #: recorder of the sent and received messages, if recording
+    recorder: Optional[TrafficRecorder] = None
+
+    def __init__(
+        self, processing=False, auto_open: bool = False, record_path: Optional[PathType] = None, **kwargs: dict
+    ) -> None:
         """Constructor.
 
         :param processing: deprecated, will not be taken into account.
         :param auto_open: determine if the channel is automatically open.
+        :param record_path: record the sent and received messages to this
+            file or folder while the channel is open, see
+            :py:mod:`pykiso.traffic_recorder`
         """
         super().__init__(**kwargs)
 
@@ -86,21 +99,70 @@ class CChannel(Connector):
         self._lock_rx = threading.RLock()
         self._lock = threading.Lock()
         self.auto_open = auto_open
+        self.record_path = record_path
 
     def open(self) -> None:
         """Open a thread-safe channel."""
         with self._lock:
             self._cc_open()
+            if self.record_path is not None:
+                self.start_recording(self.record_path)
 
     def close(self) -> None:
         """Close a thread-safe channel."""
         with self._lock:
             self._cc_close()
+            self.stop_recording()
+
+    def start_recording(self, path: PathType) -> TrafficRecorder:
+        """Record the sent and received messages, appending to an existing
+        recording. A previous recording of the channel is stopped.
+
+        :param path: path of the recording, or folder in which the
+            recording is named after the channel
+        :return: the recorder
+        """
+        path = pathlib.Path(path)
+        if path.suffix != RECORDING_SUFFIX:
+            path = path / f"{self.name or type(self).__name__}{RECORDING_SUFFIX}"
+        self.stop_recording()
+        self.recorder = TrafficRecorder(path, name=self.name or type(self).__name__)
+        return self.recorder
+
+    def stop_recording(self) -> None:
+        """Stop recording the sent and received messages, if recording."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.close()
 
     def shutdown(self) -> None:
         """Uninitialize channel. Will be called at the end of the test session."""
         pass
 
+    def fileno(self) -> Optional[int]:
+        """Return the file descriptor signaling incoming data, if any.
+
+        Channels returning a file descriptor are only read when data is
+        available when their auxiliary is serviced by the shared reactor
+        (see :py:mod:`pykiso.auxiliary_reactor`), others are polled.
+
+        :return: the file descriptor or None if not available
+        """
+        return None
+
+    def set_rx_notifier(self, notifier: Optional[Callable[[], None]]) -> bool:
+        """Set a callable executed each time a message can be received.
+
+        Channels supporting it are only read once per notified message
+        when their auxiliary is serviced by the shared reactor (see
+        :py:mod:`pykiso.auxiliary_reactor`), others are polled.
+
+        :param notifier: callable to execute, None to remove it
+
+        :return: True if the channel supports the notification
+        """
+        return False
+
     def cc_send(self, msg: MsgType, *args, **kwargs) -> None:
         """Send a thread-safe message on the channel and wait for an acknowledgement.
 
@@ -111,6 +173,10 @@ class CChannel(Connector):
             log.internal_warning("Use of 'raw' keyword argument is deprecated. It won't be passed to '_cc_send'.")
         with self._lock_tx:
             self._cc_send(msg=msg, **kwargs)
+            # the recording can be stopped concurrently
+            recorder = self.recorder
+            if recorder is not None:
+                recorder.record(Direction.TX, msg, kwargs.get("remote_id"))
 
     def cc_receive(self, timeout: float = 0.1, *args, **kwargs) -> Dict[str, Optional[bytes]]:
         """Read a thread-safe message on the channel and send an acknowledgement.
@@ -123,7 +189,13 @@ class CChannel(Connector):
         if ("raw" in kwargs) or args:
             log.internal_warning("Use of 'raw' keyword argument is deprecated. It won't be passed to '_cc_receive'.")
         with self._lock_rx:
-            return self._cc_receive(timeout=timeout, **kwargs)
+            response = self._cc_receive(timeout=timeout, **kwargs)
+            if isinstance(response, dict) and response.get("msg") is not None:
+                self.rx_count += 1
+                recorder = self.recorder
+                if recorder is not None:
+                    recorder.record(Direction.RX, response["msg"], response.get("remote_id"))
+            return response
 
     @abc.abstractmethod
     def _cc_open(self) -> None:
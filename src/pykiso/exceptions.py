@@ -95,3 +95,18 @@ class InvalidTestModuleName(PykisoError):
             "needs to start with a letter or underscore"
         )
         super().__init__(self.message)
+
+
+class ProxyBufferOverflowError(PykisoError):
+    """Raised when a proxy channel did not read the messages broadcast by
+    its proxy auxiliary fast enough and some of them were discarded.
+    """
+
+    def __init__(self, channel_name: str, dropped: int) -> None:
+        """Initialize attributes.
+
+        :param channel_name: name of the overflowed proxy channel.
+        :param dropped: number of discarded messages.
+        """
+        self.message = f"Proxy channel {channel_name} overflowed, {dropped} message(s) discarded"
+        super().__init__(self.message)
@@ -26,8 +26,6 @@ from typing import Any, Callable
 
 import click
 
-import pykiso.cli as cli
-
 
 class Singleton(type):
     """Thread safe Singleton pattern implementation."""
@@ -147,6 +145,9 @@ class Grabber:
             :param args: positonal arguments
             :param kwargs: named arguments
             """
+            # the decorated entry point is defined in the cli module itself
+            from . import cli
+
             click_args = cli.eval_user_tags(click_context)
             # replace all dashes with underscore to make valid variable names out of the tag names
             click_args = {tag_name.replace("-", "_"): tag_value for tag_name, tag_value in click_args.items()}
@@ -33,6 +33,7 @@ from typing import Any, Optional
 from pykiso import Message
 from pykiso.auxiliary import AuxiliaryInterface, close_connector, open_connector
 from pykiso.connector import CChannel
+from pykiso.periodic_scheduler import PeriodicJob, get_scheduler
 
 from .can_message import CanMessage
 from .can_parser import CanMessageParser
@@ -82,6 +83,7 @@ class CanAuxiliary(AuxiliaryInterface):
         self._collect_msg = threading.Event()
         self._messages_collected = []
         self.collect_messages = functools.partial(_collect_messages, can_aux=self)
+        self._periodic_jobs: list[PeriodicJob] = []
 
     @open_connector
     def _create_auxiliary_instance(self) -> bool:
@@ -98,6 +100,7 @@ class CanAuxiliary(AuxiliaryInterface):
 
         :return: always True
         """
+        self.stop_periodic_messages()
         log.internal_info("Auxiliary instance deleted")
         return True
 
@@ -110,7 +113,7 @@ class CanAuxiliary(AuxiliaryInterface):
         try:
             rcv_data = self.channel.cc_receive(timeout=timeout_in_s)
             if rcv_data.get("msg") is not None:
-                log.internal_debug(f"received message '{rcv_data}' from {self.channel}")
+                log.internal_debug("received message '%s' from %s", rcv_data, self.channel)
                 message_name = self.parser.dbc.get_message_by_frame_id(rcv_data["remote_id"]).name
                 message_signals = self.parser.decode(rcv_data["msg"], rcv_data["remote_id"])
                 message_timestamp = float(rcv_data.get("timestamp", 0))
@@ -234,15 +237,16 @@ class CanAuxiliary(AuxiliaryInterface):
 
         return message_to_return
 
-    def send_message(self, message: str, signals: dict[str, Any]) -> bool:
-        """Send one message, the message need to be defined in the dbc file.
+    def _encode_message(self, message: str, signals: dict[str, Any]) -> tuple[bytes, int]:
+        """Encode a message defined in the dbc file.
 
-        :param message: name of the message to send.
+        :param message: name of the message to encode.
         :param signals: dict of the signals of the message and their value.
 
-        :return: True or False if the message has been successfully send or not.
-        """
+        :raises ValueError: if the message is not defined in the dbc file.
 
+        :return: the data and the arbitration ID of the message.
+        """
         for signal, value in signals.items():
             if isinstance(value, str):
                 signals[signal] = int.from_bytes(value.encode("utf8"), byteorder="big")
@@ -250,9 +254,49 @@ class CanAuxiliary(AuxiliaryInterface):
             message = self.parser.dbc.get_message_by_name(message)
         except KeyError:
             raise ValueError(f"{message} is not a message defined in the DBC file.")
-        msg_to_send = self.parser.encode(message, signals)
+        return self.parser.encode(message, signals)
+
+    def send_message(self, message: str, signals: dict[str, Any]) -> bool:
+        """Send one message, the message need to be defined in the dbc file.
+
+        :param message: name of the message to send.
+        :param signals: dict of the signals of the message and their value.
+
+        :return: True or False if the message has been successfully send or not.
+        """
+        msg_to_send = self._encode_message(message, signals)
         self.channel.cc_send(msg_to_send[0], remote_id=msg_to_send[1])
 
+    def send_message_periodically(self, message: str, signals: dict[str, Any], period: float) -> PeriodicJob:
+        """Send one message cyclically until the returned job is cancelled
+        or the auxiliary is deleted, the message need to be defined in the
+        dbc file.
+
+        The message is encoded once and sent by the periodic scheduler
+        shared by all auxiliaries, see :py:mod:`pykiso.periodic_scheduler`.
+        The timing statistics of the transmissions are available from the
+        ``statistics`` attribute of the returned job.
+
+        :param message: name of the message to send.
+        :param signals: dict of the signals of the message and their value.
+        :param period: cycle time in seconds.
+
+        :return: the periodic job sending the message.
+        """
+        data, remote_id = self._encode_message(message, signals)
+        job = get_scheduler().schedule(
+            functools.partial(self.channel.cc_send, data, remote_id=remote_id),
+            period,
+            name=f"{self.name}.{message}",
+        )
+        self._periodic_jobs.append(job)
+        return job
+
+    def stop_periodic_messages(self) -> None:
+        """Stop sending all messages started with :py:meth:`send_message_periodically`."""
+        while self._periodic_jobs:
+            self._periodic_jobs.pop().cancel()
+
     def _run_command(self, cmd_message: str, cmd_data: bytes = None) -> bool:
         """Run the corresponding command.
 
@@ -267,6 +311,6 @@ class CanAuxiliary(AuxiliaryInterface):
             except Exception:
                 log.exception(f"encountered error while sending message '{cmd_data}' to {self.channel}")
         elif isinstance(cmd_message, Message):
-            log.internal_debug(f"ignored command '{cmd_message} in {self}'")
+            log.internal_debug("ignored command '%s in %s'", cmd_message, self)
         else:
             log.internal_warning(f"received unknown command '{cmd_message} in {self}'")
@@ -122,12 +122,12 @@ class CommunicationAuxiliary(AuxiliaryInterface):
             False
         """
         with self.lock:
-            log.internal_debug(f"sending command '{cmd_message}' with payload {cmd_data} using {self.name} aux.")
+            log.internal_debug("sending command '%s' with payload %s using %s aux.", cmd_message, cmd_data, self.name)
             state = None
             self.queue_in.put((cmd_message, cmd_data))
             try:
                 state = self.queue_tx.get(blocking, timeout_in_s)
-                log.internal_debug(f"command '{cmd_message}' successfully sent for {self.name} aux")
+                log.internal_debug("command '%s' successfully sent for %s aux", cmd_message, self.name)
             except queue.Empty:
                 log.error(f"no feedback received regarding request {cmd_message} for {self.name} aux.")
         return state
@@ -152,7 +152,7 @@ class CommunicationAuxiliary(AuxiliaryInterface):
         if self.queueing_event.is_set():
             in_ctx_manager = True
 
-        log.internal_debug(f"retrieving message in {self} (blocking={blocking}, timeout={timeout_in_s})")
+        log.internal_debug("retrieving message in %s (blocking=%s, timeout=%s)", self, blocking, timeout_in_s)
         # In case we are not in the context manager, we have a enable the receiver thread (and afterwards disable it)
         if not in_ctx_manager:
             self.queueing_event.set()
@@ -160,7 +160,7 @@ class CommunicationAuxiliary(AuxiliaryInterface):
         if not in_ctx_manager:
             self.queueing_event.clear()
 
-        log.internal_debug(f"retrieved message '{response}' in {self}")
+        log.internal_debug("retrieved message '%s' in %s", response, self)
 
         # if queue.Empty exception is raised None is returned so just
         # directly return it
@@ -200,7 +200,7 @@ class CommunicationAuxiliary(AuxiliaryInterface):
             except Exception:
                 log.exception(f"encountered error while sending message '{cmd_data}' to {self.channel}")
         elif isinstance(cmd_message, Message):
-            log.internal_debug(f"ignored command '{cmd_message} in {self}'")
+            log.internal_debug("ignored command '%s in %s'", cmd_message, self)
         else:
             log.internal_warning(f"received unknown command '{cmd_message} in {self}'")
 
@@ -215,7 +215,7 @@ class CommunicationAuxiliary(AuxiliaryInterface):
         """
         try:
             rcv_data = self.channel.cc_receive(timeout=timeout_in_s)
-            log.internal_debug(f"received message '{rcv_data}' from {self.channel}")
+            log.internal_debug("received message '%s' from %s", rcv_data, self.channel)
             msg = rcv_data.get("msg")
             if msg is not None and self.queueing_event.is_set():
                 self.queue_out.put(rcv_data)
@@ -31,6 +31,7 @@ using the corresponding auxiliary, but also using a CLI.
    pykiso.lib.auxiliaries.instrument_control_auxiliary.instrument_control_cli
    pykiso.lib.auxiliaries.instrument_control_auxiliary.lib_scpi_commands
    pykiso.lib.auxiliaries.instrument_control_auxiliary.lib_instruments
+   pykiso.lib.auxiliaries.instrument_control_auxiliary.measurement_acquisition
 
 .. automodule:: pykiso.lib.auxiliaries.instrument_control_auxiliary.instrument_control_auxiliary
    :members:
@@ -43,9 +44,13 @@ using the corresponding auxiliary, but also using a CLI.
 
 .. automodule:: pykiso.lib.auxiliaries.instrument_control_auxiliary.lib_instruments
    :members:
+
+.. automodule:: pykiso.lib.auxiliaries.instrument_control_auxiliary.measurement_acquisition
+   :members:
 """
 
-from . import instrument_control_auxiliary, lib_instruments, lib_scpi_commands
-from .instrument_control_auxiliary import InstrumentControlAuxiliary
+from . import instrument_control_auxiliary, lib_instruments, lib_scpi_commands, measurement_acquisition
+from .instrument_control_auxiliary import InstrumentControlAuxiliary, parse_scpi_values, split_scpi_response
 from .lib_instruments import REGISTERED_INSTRUMENTS, SCPI_COMMANDS_DICT
 from .lib_scpi_commands import LibSCPI
+from .measurement_acquisition import MeasurementAcquisition
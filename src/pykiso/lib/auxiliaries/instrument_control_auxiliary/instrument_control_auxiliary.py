@@ -19,20 +19,80 @@ InstrumentControl Auxiliary
 .. currentmodule:: instrument_control_auxiliary
 
 """
+import functools
 import logging
 import queue
 import re
+import threading
 import time
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
 from pykiso import CChannel
 from pykiso.auxiliary import AuxiliaryInterface, close_connector
 
 from .lib_scpi_commands import LibSCPI
+from .measurement_acquisition import MeasurementAcquisition
 
 log = logging.getLogger(__name__)
 
 
+def _transaction(method: Callable) -> Callable:
+    """Serialize the decorated request with the other requests to the
+    instrument, so that each response is read by its requester.
+
+    :param method: request method of the auxiliary
+
+    :return: the decorated method
+    """
+
+    @functools.wraps(method)
+    def inner(self, *args, **kwargs):
+        with self._transaction_lock:
+            return method(self, *args, **kwargs)
+
+    return inner
+
+
+def split_scpi_response(response: str, separator: str = ";") -> List[str]:
+    """Split a SCPI response on a separator outside of quoted strings.
+
+    :param response: response of the instrument
+    :param separator: ``;`` between the responses of several queries,
+        ``,`` between the values of a query
+
+    :return: the stripped parts of the response
+    """
+    parts, start, quote = [], 0, None
+    for index, char in enumerate(response):
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == separator:
+            parts.append(response[start:index].strip())
+            start = index + 1
+    parts.append(response[start:].strip())
+    return parts
+
+
+def parse_scpi_values(response: str) -> List[Union[float, str]]:
+    """Parse the comma separated values of a query response, numbers are
+    converted to float and quotes are removed from strings.
+
+    :param response: response of one query, e.g. ``+5.0E+00,"CH1",ON``
+
+    :return: the values of the response
+    """
+    values = []
+    for value in split_scpi_response(response, ","):
+        try:
+            values.append(float(value))
+        except ValueError:
+            values.append(value.strip("\"'"))
+    return values
+
+
 class InstrumentControlAuxiliary(AuxiliaryInterface):
     """Auxiliary used to communicate via a VISA connector using the SCPI
     protocol.
@@ -66,6 +126,8 @@ class InstrumentControlAuxiliary(AuxiliaryInterface):
         self.write_termination = write_termination
         self.output_channel = output_channel
         self.helpers = LibSCPI(self, self.instrument)
+        self._transaction_lock = threading.RLock()
+        self._acquisitions: List[MeasurementAcquisition] = []
 
     def write(
         self,
@@ -81,6 +143,7 @@ class InstrumentControlAuxiliary(AuxiliaryInterface):
         log.internal_debug(f"Sending a write request in {self} for {write_command}")
         return self.handle_write(write_command, validation)
 
+    @_transaction
     def handle_write(
         self,
         write_command: str,
@@ -156,6 +219,7 @@ class InstrumentControlAuxiliary(AuxiliaryInterface):
         log.internal_debug(f"Sending a read request in {self}")
         return self.handle_read()
 
+    @_transaction
     def handle_read(self) -> Optional[str]:
         """Handle read command by calling associated connector
         cc_receive.
@@ -181,6 +245,7 @@ class InstrumentControlAuxiliary(AuxiliaryInterface):
         log.internal_debug(f"Sending a query request in {self}) for {query_command}")
         return self.handle_query(query_command)
 
+    @_transaction
     def handle_query(self, query_command: str) -> Optional[str]:
         """Send a query request to the instrument. Uses the 'query' method of the
             channel if available, uses 'cc_send' and 'cc_receive' otherwise.
@@ -202,6 +267,102 @@ class InstrumentControlAuxiliary(AuxiliaryInterface):
                 response_data = response_data.decode().strip()
             return response_data
 
+    @_transaction
+    def execute_batch(
+        self,
+        commands: Sequence[str],
+        synchronize: bool = True,
+        timeout: float = 5.0,
+    ) -> Optional[List[str]]:
+        """Send several SCPI commands in a single transaction and get the
+        responses of the queries among them.
+
+        The commands are joined with ``;:`` so that each one starts from
+        the root of the command tree. With ``synchronize``, ``*OPC?`` is
+        appended: the instrument only answers once all commands are
+        completed, instead of waiting for a fixed delay.
+
+        :param commands: write and query commands, e.g.
+            ``["SOUR:VOLT 5", "SOUR:CURR 1", "SOUR:VOLT?", "SOUR:CURR?"]``
+        :param synchronize: wait for the completion of all commands
+        :param timeout: maximum time in seconds to wait for the response
+
+        :return: the response of each query in order, see
+            :py:func:`parse_scpi_values` to get their values, or None if
+            the response is missing or incomplete
+        """
+        commands = list(commands) + (["*OPC?"] if synchronize else [])
+        if not commands:
+            return []
+        message = ";".join(
+            command if index == 0 or command.startswith((":", "*")) else f":{command}"
+            for index, command in enumerate(commands)
+        )
+        expected_responses = sum(command.split()[0].endswith("?") for command in commands if command.strip())
+        log.internal_debug(f"Sending a batch request in {self} for {message}")
+        if expected_responses == 0:
+            self.channel.cc_send(msg=message + self.write_termination)
+            return []
+
+        if hasattr(self.channel, "query"):
+            response = self.channel.query(message + self.write_termination).get("msg")
+        else:
+            self.channel.cc_send(msg=message + self.write_termination)
+            response = self._receive_response(timeout)
+        responses = split_scpi_response(response) if response else []
+        if len(responses) != expected_responses:
+            log.internal_warning(
+                f"Batch request {message} failed! Expected {expected_responses} responses, got {response!r}"
+            )
+            return None
+        if synchronize:
+            responses.pop()
+        return responses
+
+    def _receive_response(self, timeout: float) -> Optional[str]:
+        """Receive a response until its termination character, as it can
+        be split over several messages.
+
+        :param timeout: maximum time in seconds to wait for the response
+
+        :return: the response, None if nothing was received
+        """
+        data = b""
+        deadline = time.monotonic() + timeout
+        while not data.endswith(b"\n"):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            received = self.channel.cc_receive(timeout=remaining).get("msg")
+            if received:
+                data += received if isinstance(received, bytes) else received.encode()
+        return data.decode().strip() if data else None
+
+    def start_acquisition(
+        self,
+        measurements: Sequence[str] = ("voltage", "current"),
+        rate: float = 10.0,
+        capacity: int = 10000,
+    ) -> MeasurementAcquisition:
+        """Start sampling measurements in the background, until the
+        returned acquisition is stopped or the auxiliary is deleted.
+
+        :param measurements: measurements to sample, among ``voltage``,
+            ``current`` and ``power``
+        :param rate: target number of samples per second
+        :param capacity: maximum number of samples kept, the oldest ones
+            are overwritten
+
+        :raises ValueError: if a measurement is unknown or not available
+            on the instrument
+
+        :return: the running acquisition, also usable as context manager
+        """
+        acquisition = MeasurementAcquisition(self, measurements, rate, capacity)
+        acquisition.start()
+        self._acquisitions.append(acquisition)
+        return acquisition
+
     def _create_auxiliary_instance(self) -> bool:
         """Open the connector.
 
@@ -245,6 +406,8 @@ class InstrumentControlAuxiliary(AuxiliaryInterface):
 
         :return: True if the connectors is closed otherwise False
         """
+        while self._acquisitions:
+            self._acquisitions.pop().stop()
         log.internal_info("Auxiliary instance deleted")
         return True
 
@@ -0,0 +1,346 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Measurement acquisition
+***********************
+
+:module: measurement_acquisition
+
+:synopsis: sample measurements of an instrument in the background into
+    a ring buffer, with statistics and threshold waits.
+
+An acquisition thread queries all configured measurements in a single
+SCPI transaction (see
+:py:meth:`~pykiso.lib.auxiliaries.instrument_control_auxiliary.instrument_control_auxiliary.InstrumentControlAuxiliary.execute_batch`)
+at a target rate. The sampling times are computed from the start of the
+acquisition so that the rate does not drift, the samples that could not
+be taken in time are skipped and counted.
+
+The samples are stored in a fixed size ring buffer, the oldest samples
+being overwritten once it is full. They are returned as NumPy arrays if
+NumPy is installed, as :py:class:`array.array` otherwise.
+
+.. currentmodule:: measurement_acquisition
+
+"""
+from __future__ import annotations
+
+import array
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from .instrument_control_auxiliary import InstrumentControlAuxiliary
+
+log = logging.getLogger(__name__)
+
+#: SCPI command tag of each measurement
+MEASUREMENT_COMMANDS = {
+    "voltage": "MEASURE_VOLTAGE",
+    "current": "MEASURE_CURRENT",
+    "power": "MEASURE_POWER",
+}
+
+
+@dataclass(frozen=True)
+class MeasurementStatistics:
+    """Statistics of the buffered samples of a measurement."""
+
+    count: int
+    min: float
+    max: float
+    mean: float
+    #: value of each requested percentile
+    percentiles: Dict[float, float]
+
+
+class MeasurementRingBuffer:
+    """Fixed size buffer of timestamped samples of several measurements."""
+
+    def __init__(self, measurements: Sequence[str], capacity: int) -> None:
+        """Initialize attributes.
+
+        :param measurements: names of the measurements of each sample
+        :param capacity: maximum number of samples kept
+
+        :raises ValueError: if the capacity is not strictly positive
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity of a measurement buffer must be positive, got {capacity}")
+        self.measurements = tuple(measurements)
+        self.capacity = capacity
+        self._timestamps = array.array("d", bytes(8 * capacity))
+        self._values = {name: array.array("d", bytes(8 * capacity)) for name in self.measurements}
+        self._next = 0
+        self._count = 0
+        #: number of samples appended since the creation of the buffer
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, values: Sequence[float]) -> None:
+        """Store a sample, overwriting the oldest one if the buffer is
+        full.
+
+        :param timestamp: time of the sample in seconds since the epoch
+        :param values: value of each measurement
+        """
+        index = self._next
+        self._timestamps[index] = timestamp
+        for name, value in zip(self.measurements, values):
+            self._values[name][index] = value
+        self._next = (index + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.total += 1
+
+    def get(self, position: int, measurement: str) -> Tuple[float, float]:
+        """Get a sample of a measurement by its position.
+
+        :param position: number of samples appended before this one
+        :param measurement: name of the measurement
+
+        :raises IndexError: if the sample is not stored anymore or not
+            yet
+
+        :return: the timestamp and the value of the sample
+        """
+        if not self.total - self._count <= position < self.total:
+            raise IndexError(f"sample {position} is not in the buffer")
+        index = position % self.capacity
+        return self._timestamps[index], self._values[measurement][index]
+
+    def _ordered(self, data: array.array) -> array.array:
+        """Get the stored items of an array from the oldest to the newest."""
+        start = (self._next - self._count) % self.capacity
+        end = start + self._count
+        ordered = data[start:end] if end <= self.capacity else data[start:] + data[: end - self.capacity]
+        return numpy.frombuffer(ordered, dtype=numpy.float64) if numpy is not None else ordered
+
+    def timestamps(self) -> Sequence[float]:
+        """Get the timestamps of the stored samples, oldest first."""
+        return self._ordered(self._timestamps)
+
+    def values(self, measurement: str) -> Sequence[float]:
+        """Get the values of a measurement, oldest first.
+
+        :param measurement: name of the measurement
+
+        :raises KeyError: if the measurement is not acquired
+        """
+        return self._ordered(self._values[measurement])
+
+    def clear(self) -> None:
+        """Forget all stored samples."""
+        self._count = 0
+
+
+def _percentile(ordered: Sequence[float], percent: float) -> float:
+    """Get a percentile with a linear interpolation between the closest
+    ranks.
+
+    :param ordered: sorted values
+    :param percent: percentile between 0 and 100
+
+    :return: the value of the percentile
+    """
+    rank = (len(ordered) - 1) * percent / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class MeasurementAcquisition:
+    """Background sampling of the measurements of an instrument."""
+
+    def __init__(
+        self,
+        aux: InstrumentControlAuxiliary,
+        measurements: Sequence[str] = ("voltage", "current"),
+        rate: float = 10.0,
+        capacity: int = 10000,
+    ) -> None:
+        """Initialize attributes.
+
+        :param aux: auxiliary of the instrument
+        :param measurements: measurements to sample, among ``voltage``,
+            ``current`` and ``power``
+        :param rate: target number of samples per second
+        :param capacity: maximum number of samples kept
+
+        :raises ValueError: if a measurement is unknown or not available
+            on the instrument, or if the rate is not strictly positive
+        """
+        if rate <= 0:
+            raise ValueError(f"acquisition rate must be positive, got {rate}")
+        self.aux = aux
+        self.rate = rate
+        self._queries = []
+        for name in measurements:
+            if name not in MEASUREMENT_COMMANDS:
+                raise ValueError(f"unknown measurement {name!r}, expected one of {list(MEASUREMENT_COMMANDS)}")
+            command, _ = aux.helpers.get_command(cmd_tag=MEASUREMENT_COMMANDS[name], cmd_type="query")
+            if command == "COMMAND_NOT_AVAILABLE":
+                raise ValueError(f"measurement {name!r} is not available on instrument {aux.helpers.instrument}")
+            self._queries.append(command)
+        self.buffer = MeasurementRingBuffer(measurements, capacity)
+        #: number of samples skipped because the previous one took too long
+        self.missed_samples = 0
+        #: number of samples without a valid response of the instrument
+        self.failed_samples = 0
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> MeasurementAcquisition:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def measurements(self) -> Tuple[str, ...]:
+        """Names of the sampled measurements."""
+        return self.buffer.measurements
+
+    @property
+    def is_running(self) -> bool:
+        """True if the acquisition thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling, the buffered samples are kept."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(name=f"{self.aux.name}.Acquisition", target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the acquisition thread to end."""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Take the samples at the target rate until stopped."""
+        period = 1 / self.rate
+        start = time.monotonic()
+        cycle = 0
+        while not self._stop_event.is_set():
+            self._sample()
+            cycle += 1
+            delay = start + cycle * period - time.monotonic()
+            if delay < 0:
+                missed = math.ceil(-delay / period)
+                self.missed_samples += missed
+                cycle += missed
+                delay += missed * period
+            self._stop_event.wait(delay)
+
+    def _sample(self) -> None:
+        """Query all measurements and store them in the buffer."""
+        timestamp = time.time()
+        try:
+            responses = self.aux.execute_batch(self._queries, synchronize=False)
+            values = [float(response.split()[0]) for response in responses]
+        except Exception:
+            log.internal_debug(f"invalid sample of {self.measurements} in {self.aux}", exc_info=True)
+            self.failed_samples += 1
+            return
+        with self._condition:
+            self.buffer.append(timestamp, values)
+            self._condition.notify_all()
+
+    def get_samples(self) -> Dict[str, Sequence[float]]:
+        """Get a copy of the buffered samples.
+
+        :return: the timestamps under ``timestamp`` and the values of
+            each measurement under its name, oldest first
+        """
+        with self._condition:
+            samples = {"timestamp": self.buffer.timestamps()}
+            samples.update({name: self.buffer.values(name) for name in self.measurements})
+        return samples
+
+    def statistics(self, measurement: str, percentiles: Sequence[float] = (50, 95, 99)) -> MeasurementStatistics:
+        """Get the statistics of the buffered samples of a measurement.
+
+        :param measurement: name of the measurement
+        :param percentiles: percentiles to compute, between 0 and 100
+
+        :raises KeyError: if the measurement is not acquired
+        :raises ValueError: if no sample was taken
+
+        :return: the statistics of the samples
+        """
+        with self._condition:
+            values = self.buffer.values(measurement)
+        if not len(values):
+            raise ValueError(f"no sample of {measurement!r} was acquired")
+        ordered = sorted(values)
+        return MeasurementStatistics(
+            count=len(ordered),
+            min=ordered[0],
+            max=ordered[-1],
+            mean=math.fsum(ordered) / len(ordered),
+            percentiles={percent: _percentile(ordered, percent) for percent in percentiles},
+        )
+
+    def wait_for_threshold(
+        self,
+        measurement: str,
+        above: Optional[float] = None,
+        below: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[Tuple[float, float]]:
+        """Wait for the next sample of a measurement beyond a threshold,
+        the samples taken before the call are not considered.
+
+        :param measurement: name of the measurement
+        :param above: threshold the value has to exceed
+        :param below: threshold the value has to fall under
+        :param timeout: maximum time to wait in seconds, None to wait
+            forever
+
+        :raises KeyError: if the measurement is not acquired
+        :raises ValueError: if no threshold is given
+
+        :return: the timestamp and the value of the sample crossing the
+            threshold, None if the timeout expired
+        """
+        if above is None and below is None:
+            raise ValueError("at least one of the thresholds 'above' and 'below' is required")
+        if measurement not in self.measurements:
+            raise KeyError(measurement)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            position = self.buffer.total
+            while True:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+                # skip the samples already overwritten if many were taken in between
+                position = max(position, self.buffer.total - len(self.buffer))
+                for position in range(position, self.buffer.total):
+                    timestamp, value = self.buffer.get(position, measurement)
+                    if (above is not None and value > above) or (below is not None and value < below):
+                        return timestamp, value
+                position = self.buffer.total
@@ -18,6 +18,12 @@ Proxy Auxiliary
 This auxiliary simply spread all commands and received messages to all connected
 auxiliaries. This auxiliary is only usable through proxy connector.
 
+If some proxy connectors define a filter (see
+:py:meth:`~pykiso.lib.connectors.cc_proxy.CCProxy.set_filter`), messages are
+only given to the proxy connectors they match. Messages are routed by remote id
+through a dispatch table built once, so that filtered auxiliaries do not pay for
+the traffic they are not interested in.
+
 .. code-block:: none
 
      ___________   ___________         ___________
@@ -53,13 +59,14 @@ import queue
 import sys
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from pykiso import CChannel
 from pykiso.auxiliary import AuxiliaryInterface, close_connector, open_connector
-from pykiso.lib.connectors.cc_proxy import CCProxy
+from pykiso.lib.connectors.cc_proxy import BroadcastRing, CCProxy, RingSubscriber
 from pykiso.test_setup.config_registry import ConfigRegistry
 from pykiso.test_setup.dynamic_loader import PACKAGE
+from pykiso.traffic_recorder import RECORDING_SUFFIX
 
 log = logging.getLogger(__name__)
 
@@ -74,6 +81,8 @@ class ProxyAuxiliary(AuxiliaryInterface):
         activate_trace: bool = False,
         trace_dir: Optional[str] = None,
         trace_name: Optional[str] = None,
+        buffer_size: Optional[int] = None,
+        trace_format: str = "text",
         **kwargs,
     ):
         """Initialize attributes.
@@ -84,19 +93,42 @@ class ProxyAuxiliary(AuxiliaryInterface):
             dedicated trace file or not
         :param trace_dir: where to place the trace
         :param trace_name: trace's file name
+        :param buffer_size: if set, broadcast the messages to the proxy
+            channels through a ring buffer of this size shared by all
+            of them instead of one unbounded queue per proxy channel
+        :param trace_format: "text" to log the received messages in a
+            text file, "binary" to record the raw sent and received
+            messages with their timestamp, see
+            :py:mod:`pykiso.traffic_recorder`
+
+        :raises ValueError: if the trace format is unknown
         """
+        if trace_format not in ("text", "binary"):
+            raise ValueError(f"unknown trace format {trace_format!r}, expected 'text' or 'binary'")
         super().__init__(is_proxy_capable=True, tx_task_on=False, rx_task_on=True, **kwargs)
         self.channel = com
         self._open_count = 0
-        self.logger = self._init_trace(activate_trace, trace_dir, trace_name)
+        self.ring = BroadcastRing(buffer_size) if buffer_size else None
+        if activate_trace and trace_format == "binary":
+            # the channel records its traffic while it is open
+            self.channel.record_path = self._get_trace_path(trace_dir, trace_name, RECORDING_SUFFIX)
+            self.logger = log
+        else:
+            self.logger = self._init_trace(activate_trace, trace_dir, trace_name)
+        self._dispatch_table: Dict[int, Tuple[CCProxy, ...]] = {}
+        self._unrouted_channels: Tuple[CCProxy, ...] = ()
+        self._filtered = False
         self.proxy_channels = self.get_proxy_con(aux_list)
+        self._build_dispatch_table()
 
     def _count_open_proxy_channels(self) -> int:
         """
         Get the number of proxy channels connected to this auxiliary
         that are currently open.
         """
-        return len([ccproxy for ccproxy in self.proxy_channels if isinstance(ccproxy.queue_out, queue.Queue)])
+        return len(
+            [ccproxy for ccproxy in self.proxy_channels if isinstance(ccproxy.queue_out, (queue.Queue, RingSubscriber))]
+        )
 
     @property
     def _open_connections(self) -> int:
@@ -137,6 +169,27 @@ class ProxyAuxiliary(AuxiliaryInterface):
         elif first_connection_opened and not self.is_instance:
             self.create_instance()
 
+    @staticmethod
+    def _get_trace_path(t_dir: Optional[str], t_name: Optional[str], suffix: str) -> Path:
+        """Get the path of a trace file.
+
+        :param t_dir: trace directory path (absolute or relative)
+        :param t_name: trace full name (without file extension)
+        :param suffix: file extension of the trace
+
+        :return: the path of the trace, prefixed with the current time
+        """
+        # Just avoid the case the given trace directory is None
+        t_dir = "" if t_dir is None else t_dir
+        # if the given log path is not absolute add root path
+        # (where pykiso is launched) otherwise take it as it is
+        dir_path = (Path() / t_dir).resolve() if not Path(t_dir).is_absolute() else Path(t_dir)
+        # if no specific logging file name is given take the default one
+        t_name = "proxy_logging" if t_name is None else t_name
+        t_name = time.strftime(f"%Y-%m-%d_%H-%M-%S_{t_name}{suffix}")
+        # if path doesn't exists take root path (where pykiso is launched)
+        return dir_path / t_name if dir_path.exists() else (Path() / t_name).resolve()
+
     @staticmethod
     def _init_trace(
         activate: bool,
@@ -158,19 +211,7 @@ class ProxyAuxiliary(AuxiliaryInterface):
         if not activate:
             return logger
 
-        # Just avoid the case the given trace directory is None
-        t_dir = "" if t_dir is None else t_dir
-        # if the given log path is not absolute add root path
-        # (where pykiso is launched) otherwise take it as it is
-        dir_path = (Path() / t_dir).resolve() if not Path(t_dir).is_absolute() else Path(t_dir)
-        # if no specific logging file name is given take the default one
-        t_name = (
-            time.strftime(f"%Y-%m-%d_%H-%M-%S_{t_name}.log")
-            if t_name is not None
-            else time.strftime("%Y-%m-%d_%H-%M-%S_proxy_logging.log")
-        )
-        # if path doesn't exists take root path (where pykiso is launched)
-        log_path = dir_path / t_name if dir_path.exists() else (Path() / t_name).resolve()
+        log_path = ProxyAuxiliary._get_trace_path(t_dir, t_name, ".log")
 
         # configure the file handler and create the trace file
         log_format = logging.Formatter("%(asctime)s : %(message)s")
@@ -256,6 +297,40 @@ class ProxyAuxiliary(AuxiliaryInterface):
             if not isinstance(channel, CCProxy):
                 raise TypeError(f"Channel {channel} is not compatible!")
 
+    def _build_dispatch_table(self) -> None:
+        """Build the table routing each remote id to the proxy channels
+        interested in it.
+
+        .. note:: called again by the proxy channels when their filter
+            changes.
+        """
+        channels = getattr(self, "proxy_channels", ())
+        filters = [(conn, getattr(conn, "remote_ids", None)) for conn in channels]
+        unrouted = tuple(conn for conn, remote_ids in filters if remote_ids is None)
+        dispatch_table = {}
+        for remote_id in {remote_id for _, remote_ids in filters for remote_id in remote_ids or ()}:
+            dispatch_table[remote_id] = tuple(
+                conn for conn, remote_ids in filters if remote_ids is None or remote_id in remote_ids
+            )
+        self._filtered = len(unrouted) != len(filters) or any(
+            getattr(conn, "msg_prefix", None) is not None or getattr(conn, "predicate", None) is not None
+            for conn in channels
+        )
+        # swap the references at the end so that a concurrent dispatch uses a consistent table
+        self._unrouted_channels = unrouted
+        self._dispatch_table = dispatch_table
+
+    def _get_targets(self, message: dict) -> Tuple[CCProxy, ...]:
+        """Get the proxy channels a message has to be given to.
+
+        :param message: received message or dispatched command
+        :return: all proxy channels whose filter matches the message
+        """
+        if not self._filtered:
+            return self.proxy_channels
+        channels = self._dispatch_table.get(message.get("remote_id"), self._unrouted_channels)
+        return tuple(conn for conn in channels if conn.accepts(message))
+
     def _dispatch_tx_method_to_channels(self) -> None:
         """Attached public run_command method to all connected proxy
         channels.
@@ -276,6 +351,17 @@ class ProxyAuxiliary(AuxiliaryInterface):
         for conn in self.proxy_channels:
             conn.detach_tx_callback()
 
+    def get_dropped_messages(self) -> Dict[str, int]:
+        """Get the number of messages discarded for each proxy channel
+        because they were not read fast enough.
+
+        :return: number of discarded messages per proxy channel name,
+            empty if no ring buffer is used
+        """
+        if self.ring is None:
+            return {}
+        return {getattr(owner, "name", str(owner)): dropped for owner, dropped in self.ring.dropped.items()}
+
     @open_connector
     def _create_auxiliary_instance(self) -> bool:
         """Open current associated channel and dispatch tx method.
@@ -335,7 +421,11 @@ class ProxyAuxiliary(AuxiliaryInterface):
             comes from
         :param kwargs: named arguments
         """
-        for conn in self.proxy_channels:
+        targets = self._get_targets(kwargs)
+        if self.ring is not None:
+            self.ring.publish(kwargs, exclude=con_use, targets=frozenset(targets) if self._filtered else None)
+            return
+        for conn in targets:
             if conn != con_use and conn.queue_out is not None:
                 conn.queue_out.put(kwargs)
 
@@ -360,7 +450,11 @@ class ProxyAuxiliary(AuxiliaryInterface):
                     received_data,
                     self.channel.name,
                 )
-                for conn in self.proxy_channels:
+                targets = self._get_targets(recv_response)
+                if self.ring is not None:
+                    self.ring.publish(recv_response, targets=frozenset(targets) if self._filtered else None)
+                    return
+                for conn in targets:
                     if conn.queue_out is not None:
                         conn.queue_out.put(recv_response)
         except Exception:
@@ -7,9 +7,10 @@
 # SPDX-License-Identifier: EPL-2.0
 ##########################################################################
 
-from . import uds_auxiliary, uds_server_auxiliary
+from . import uds_auxiliary, uds_multi_client_auxiliary, uds_server_auxiliary
 from .common import UdsCallback, UdsDownloadCallback
 from .common.uds_request import UDSCommands
 from .common.uds_response import NegativeResponseCode, UdsResponse
 from .uds_auxiliary import UdsAuxiliary
+from .uds_multi_client_auxiliary import UdsMultiClientAuxiliary
 from .uds_server_auxiliary import UdsServerAuxiliary
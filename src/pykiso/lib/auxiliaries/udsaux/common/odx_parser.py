@@ -15,22 +15,136 @@ ODX Parser for UDS Server Auxiliary
 :synopsis: odx parser used by a uds server to dynamically configure its
     uds callbacks from an odx file
 
+The diag services and the coded values of their requests and responses
+are indexed in a single streamed pass over the ODX file, so that each
+callback configuration is a dictionary lookup instead of a search over
+the whole document. The index can be stored in a cache folder, keyed by
+the hash of the ODX file, to skip the parsing in later runs.
+
 .. currentmodule:: odx_parser
 
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from xml.etree.ElementTree import Element
 
 # Use defusedxml, as xml is not secure against maliciously constructed data.
 from defusedxml import ElementTree
 
+from pykiso.types import PathType
+
 log = logging.getLogger(__name__)
 
+#: version of the cached index layout, an index of another version is built again
+INDEX_VERSION = 1
+
+#: tags of the elements referenced by the diag services
+_MESSAGE_TAGS = ("REQUEST", "POS-RESPONSE", "NEG-RESPONSE")
+
+
+@dataclass
+class OdxIndex:
+    """Information of an ODX file needed to create UDS callbacks."""
+
+    #: references of the diag services by SD instance name, each as a
+    #: mapping of the reference tag to the referenced odx id
+    services: Dict[str, List[Dict[str, str]]] = field(default_factory=dict)
+    #: service id and coded values of the requests and responses by odx
+    #: id, as found in the ODX file
+    messages: Dict[str, Tuple[Optional[str], List[str]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_file(cls, odx_file: PathType) -> OdxIndex:
+        """Index an ODX file in a single streamed pass, the processed
+        elements are discarded to bound the memory usage.
+
+        :param odx_file: path to the ODX file
+
+        :return: the index of the file
+        """
+        index = cls()
+        ancestors: List[Element] = []
+        # SD instance names found in each diag service not processed yet
+        service_names: Dict[Element, List[str]] = {}
+        for event, element in ElementTree.iterparse(str(odx_file), events=("start", "end")):
+            if event == "start":
+                ancestors.append(element)
+                continue
+            ancestors.pop()
+            if element.tag == "SD" and "SI" in element.attrib and len(ancestors) >= 3:
+                # the diag service is the parent of the <SDGS> containing the <SDG>
+                names = service_names.setdefault(ancestors[-3], [])
+                name = "".join(element.itertext())
+                if name not in names:
+                    names.append(name)
+            elif element in service_names:
+                references = {}
+                for ref_type in OdxParser.RefType:
+                    reference = element.find(f".//{ref_type.value}")
+                    if reference is not None:
+                        references[ref_type.value] = reference.attrib["ID-REF"]
+                for name in service_names.pop(element):
+                    index.services.setdefault(name, []).append(references)
+                element.clear()
+            elif element.tag in _MESSAGE_TAGS and "ID" in element.attrib:
+                sid = element.find(".//PARAM[@SEMANTIC='SERVICE-ID']/CODED-VALUE")
+                coded_values = [coded_value.text for coded_value in element.iterfind(".//CODED-VALUE")]
+                index.messages.setdefault(element.attrib["ID"], (None if sid is None else sid.text, coded_values))
+                element.clear()
+        return index
+
+    @classmethod
+    def load(cls, path: Path) -> Optional[OdxIndex]:
+        """Load a cached index.
+
+        :param path: JSON file of the index
+
+        :return: the index, None if it is missing, unreadable or of
+            another version
+        """
+        try:
+            content = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if content.get("version") != INDEX_VERSION:
+            return None
+        messages = {odx_id: (sid, coded_values) for odx_id, (sid, coded_values) in content["messages"].items()}
+        return cls(content["services"], messages)
+
+    def save(self, path: Path) -> None:
+        """Write the index to a JSON file, replacing it atomically.
+
+        :param path: JSON file of the index
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps({"version": INDEX_VERSION, "services": self.services, "messages": self.messages})
+        )
+        os.replace(tmp_path, path)
+
+
+def get_file_hash(path: PathType) -> str:
+    """Compute the sha256 of a file.
+
+    :param path: file to hash
+
+    :return: the hexadecimal digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class OdxParser:
     """Used to parse ODX files to configure a Uds server"""
@@ -39,10 +153,49 @@ class OdxParser:
         REQUEST = "REQUEST-REF"
         POS_RESPONSE = "POS-RESPONSE-REF"
 
-    def __init__(self, odx_file: Path) -> None:
-        with open(odx_file) as odx:
-            # create a xml tree from root <ODX>
-            self.odx_tree = ElementTree.parse(odx)
+    def __init__(self, odx_file: PathType, cache_dir: Optional[PathType] = None) -> None:
+        """Index the ODX file.
+
+        :param odx_file: path to the ODX file
+        :param cache_dir: folder in which the index is cached, keyed by
+            the hash of the ODX file, not cached if None
+        """
+        self.odx_file = Path(odx_file)
+        self._odx_tree: Optional[ElementTree.ElementTree] = None
+        self._elements_by_id: Optional[Dict[str, Element]] = None
+        self._services_by_sd: Optional[Dict[str, List[Element]]] = None
+        self.index = self._load_index(cache_dir)
+
+    def _load_index(self, cache_dir: Optional[PathType]) -> OdxIndex:
+        """Load the index of the ODX file from the cache or build it.
+
+        :param cache_dir: folder in which the index is cached, not
+            cached if None
+
+        :return: the index of the ODX file
+        """
+        if cache_dir is None:
+            return OdxIndex.from_file(self.odx_file)
+        cache_path = Path(cache_dir) / f"{get_file_hash(self.odx_file)}.json"
+        index = OdxIndex.load(cache_path)
+        if index is not None:
+            log.internal_debug("loaded the index of %s from %s", self.odx_file, cache_path)
+            return index
+        index = OdxIndex.from_file(self.odx_file)
+        try:
+            index.save(cache_path)
+        except OSError as e:
+            log.warning(f"index of {self.odx_file} could not be cached in {cache_path}: {e}")
+        return index
+
+    @property
+    def odx_tree(self) -> ElementTree.ElementTree:
+        """Complete xml tree of the ODX file, only parsed on first access."""
+        if self._odx_tree is None:
+            with open(self.odx_file) as odx:
+                # create a xml tree from root <ODX>
+                self._odx_tree = ElementTree.parse(odx)
+        return self._odx_tree
 
     def _find_element_by_odx_id(self, odx_id: str) -> Element:
         """Find an odx element by the given id
@@ -51,20 +204,33 @@ class OdxParser:
         :raises ValueError: if no element with given odx id found
         :return: the element with the given odx id
         """
-        # xpath finding the element with the given id
-        element = self.odx_tree.find(f".//*[@ID='{odx_id}']")
+        if self._elements_by_id is None:
+            self._elements_by_id = {}
+            for element in self.odx_tree.iter():
+                if "ID" in element.attrib:
+                    self._elements_by_id.setdefault(element.attrib["ID"], element)
+        element = self._elements_by_id.get(odx_id)
         if element is None:
             raise ValueError(f"No element with id={odx_id} found")
         return element
 
-    def _find_diag_services_by_sd(self, sd_instance_name: str) -> Element:
+    def _find_diag_services_by_sd(self, sd_instance_name: str) -> List[Element]:
         """Find the <DIAG-SERVICE> with the given sd_instance_name
 
         :param sd_instance_name: content of the <SD SI="DiagInstanceName">
         :return: the parent diag service odx element of the sd element with given name
         """
-        # xpath to diag service for given sd instance name
-        diag_services = self.odx_tree.findall(f".//SD[@SI][.='{sd_instance_name}']../../..")
+        if self._services_by_sd is None:
+            self._services_by_sd = {}
+            parents = {child: parent for parent in self.odx_tree.iter() for child in parent}
+            for sd in self.odx_tree.iter("SD"):
+                # the diag service is the parent of the <SDGS> containing the <SDG>
+                diag_service = parents.get(parents.get(parents.get(sd)))
+                if "SI" in sd.attrib and diag_service is not None:
+                    diag_services = self._services_by_sd.setdefault("".join(sd.itertext()), [])
+                    if diag_service not in diag_services:
+                        diag_services.append(diag_service)
+        diag_services = self._services_by_sd.get(sd_instance_name)
         if not diag_services:
             raise ValueError(f"No DIAG-SERVICE has a SD containing {sd_instance_name}")
         return diag_services
@@ -77,15 +243,31 @@ class OdxParser:
         :raises ValueError: if no request could be created for the given sd name and SID
         :return: a list of the coded values to be converted into a uds request
         """
-        diag_services = self._find_diag_services_by_sd(sd)
-        for diag_service in diag_services:
-            request_id = diag_service.find(f".//{ref_type.value}").attrib["ID-REF"]
-            request_element = self._find_element_by_odx_id(request_id)
+        services = self.index.services.get(sd)
+        if not services:
+            raise ValueError(f"No DIAG-SERVICE has a SD containing {sd}")
+        for references in services:
+            request_sid, coded_values = self._get_message(references[ref_type.value])
             # compare SIDs to differentiate between e.g. read and write request with same sd name
-            request_sid = int(request_element.find(".//PARAM[@SEMANTIC='SERVICE-ID']/CODED-VALUE").text)
-            if request_sid == sid:
-                coded_value_elements = request_element.findall(".//CODED-VALUE")
-                coded_values = [int(coded_value.text) for coded_value in coded_value_elements]
-                return coded_values
+            if request_sid is not None and int(request_sid) == sid:
+                return [int(coded_value) for coded_value in coded_values]
         log.error(f"Could not create request for service={sid} and sd={sd}")
         raise ValueError(f"Could not create request for service={sid} and sd={sd}")
+
+    def _get_message(self, odx_id: str) -> Tuple[Optional[str], List[str]]:
+        """Get the service id and the coded values of a request or a
+        response.
+
+        :param odx_id: odx id of the request or response
+        :raises ValueError: if no element with given odx id found
+        :return: the service id (None if not defined) and the coded
+            values, as found in the ODX file
+        """
+        message = self.index.messages.get(odx_id)
+        if message is not None:
+            return message
+        # referenced element of another type, not indexed
+        element = self._find_element_by_odx_id(odx_id)
+        sid = element.find(".//PARAM[@SEMANTIC='SERVICE-ID']/CODED-VALUE")
+        coded_values = [coded_value.text for coded_value in element.iterfind(".//CODED-VALUE")]
+        return None if sid is None else sid.text, coded_values
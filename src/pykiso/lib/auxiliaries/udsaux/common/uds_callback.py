@@ -28,7 +28,6 @@ import logging
 import time
 import typing
 from dataclasses import dataclass
-from itertools import cycle
 from typing import Callable, ClassVar, Dict, List, Optional, Tuple, Union
 
 from uds import IsoServices
@@ -120,6 +119,27 @@ class UdsCallback:
         return integer.to_bytes((integer.bit_length() + 7) // 8, "big")
 
 
+@dataclass
+class TransferStatistics:
+    """Statistics of a data download handled by a :py:class:`UdsDownloadCallback`."""
+
+    #: number of received data bytes, including the estimated size of the missed frames
+    size: int = 0
+    #: number of received TransferData requests
+    blocks: int = 0
+    #: number of received consecutive frames
+    frames: int = 0
+    #: number of consecutive frames missed according to their sequence numbers
+    missed_frames: int = 0
+    #: time from the RequestDownload response to the last TransferData response in seconds
+    duration: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Received data bytes per second."""
+        return self.size / self.duration if self.duration > 0 else 0.0
+
+
 @dataclass
 class UdsDownloadCallback(UdsCallback):
     """UDS Callback for DownloadData handling on server-side.
@@ -143,6 +163,10 @@ class UdsDownloadCallback(UdsCallback):
         self.callback = self.handle_data_download
         self.transfer_successful = False
         self.transferred_data_size = 0
+        #: data of the last download, the missed frames are left zeroed
+        self.downloaded_data = bytearray()
+        #: statistics of the last download
+        self.statistics = TransferStatistics()
 
     @staticmethod
     def get_transfer_size(download_request: List[int]) -> int:
@@ -219,6 +243,7 @@ class UdsDownloadCallback(UdsCallback):
         """
         self.transfer_successful = False
         self.transferred_data_size = 0
+        self.statistics = statistics = TransferStatistics()
 
         # send RequestDownload response
         request_download_response = self.make_request_download_response()
@@ -231,18 +256,17 @@ class UdsDownloadCallback(UdsCallback):
 
         # get expected transfer data size from DownloadData request
         expected_transfer_size = self.get_transfer_size(download_request)
-        transfer_size = 0
+        self.downloaded_data = bytearray(max(expected_transfer_size, 0))
         transfer_start_time = time.perf_counter()
+        deadline = transfer_start_time + self.TRANSFER_TIMEOUT
 
         # handle data transfer
-        while (
-            not aux.stop_rx.is_set()
-            and transfer_size < expected_transfer_size
-            and time.perf_counter() - transfer_start_time < self.TRANSFER_TIMEOUT
-        ):
+        while not aux.stop_rx.is_set() and statistics.size < expected_transfer_size:
             # wait for initial transfer data request
-            transfer_request = aux.receive()
+            transfer_request = aux.receive(timeout=max(deadline - time.perf_counter(), 0))
             if transfer_request is None:
+                if time.perf_counter() >= deadline:
+                    break
                 continue
 
             # decode PCI to extract the block data length
@@ -257,41 +281,12 @@ class UdsDownloadCallback(UdsCallback):
             # send flow control with configured STmin
             aux.send_flow_control(stmin=self.stmin)
 
-            # expected PCI sequence of the received frames
-            transfer_data_pci_sequence = cycle(tuple(range(0x21, 0x30)) + (0x20,))
-
-            # initial received block data length -> remove UDS service bytes
-            block_data_len = len(block_data)
-            elapsed_time = 0
-            block_start_time = time.perf_counter()
-
-            # receive block data
-            while (
-                not aux.stop_rx.is_set()
-                and block_data_len < (expected_data_len - 1)
-                and elapsed_time < self.TRANSFER_TIMEOUT
-            ):
-                data = aux.receive()
-                if data is None:
-                    time.sleep(1e-4)
-                    elapsed_time = time.perf_counter() - block_start_time
-                    continue
-                # reset data reception timeout
-                block_start_time, elapsed_time = time.perf_counter(), 0
-                # verify received PCI and increase receive length if one was missed
-                expected_pci = next(transfer_data_pci_sequence)
-                if data[0] != expected_pci:
-                    block_data_len += len(data) - 1
-                    log.internal_warning(
-                        "Consecutive frame missed: expected PCI " f"{hex(expected_pci)}, got {hex(data[0])}",
-                    )
-                block_data_len += len(data) - 1
-
-            transfer_size += block_data_len
+            # remove the UDS service id and sequence number from the expected length
+            self._receive_block(block_data, expected_data_len - 2, aux)
             log.internal_info(
                 "Block number %s : Received %s B out of %s B",
                 sequence_number,
-                transfer_size,
+                statistics.size,
                 expected_transfer_size,
             )
             # send TransferData positive response with current sequence number
@@ -301,7 +296,149 @@ class UdsDownloadCallback(UdsCallback):
             ]
             aux.send_response(success_response)
             # reset transfer timer
-            transfer_start_time = time.perf_counter()
+            deadline = time.perf_counter() + self.TRANSFER_TIMEOUT
+
+        statistics.duration = time.perf_counter() - transfer_start_time
+        del self.downloaded_data[statistics.size :]
+        self.transfer_successful = statistics.size >= expected_transfer_size
+        self.transferred_data_size = statistics.size
+        log.internal_info(
+            "Downloaded %s B in %.3f s (%.1f kB/s) with %s block(s), %s frame(s) missed",
+            statistics.size,
+            statistics.duration,
+            statistics.throughput / 1000,
+            statistics.blocks,
+            statistics.missed_frames,
+        )
+
+    def _receive_block(self, first_frame_data: List[int], block_size: int, aux: UdsServerAuxiliary) -> None:
+        """Receive the consecutive frames of a TransferData request and
+        store its block data after the already downloaded data.
+
+        Each frame is awaited until the transfer timeout, the reception
+        is stopped early if the auxiliary stops receiving.
+
+        :param first_frame_data: block data contained in the first frame
+        :param block_size: expected size of the block data
+        :param aux: UdsServerAuxiliary instance used to receive the frames
+        """
+        statistics = self.statistics
+        offset = statistics.size
+        end = offset + block_size
+        if len(self.downloaded_data) < end:
+            # more data than announced by the RequestDownload request
+            self.downloaded_data.extend(bytes(end - len(self.downloaded_data)))
+        # the padding of the last frame is not part of the block data
+        chunk = first_frame_data[:block_size]
+        self.downloaded_data[offset : offset + len(chunk)] = bytes(chunk)
+        offset += len(chunk)
+        # sequence number of the next consecutive frame, in the low nibble of its PCI
+        sequence_number = 1
+        deadline = time.perf_counter() + self.TRANSFER_TIMEOUT
+
+        while not aux.stop_rx.is_set() and offset < end:
+            data = aux.receive(timeout=max(deadline - time.perf_counter(), 0))
+            if data is None:
+                if time.perf_counter() >= deadline:
+                    break
+                continue
+            # reset data reception timeout
+            deadline = time.perf_counter() + self.TRANSFER_TIMEOUT
+            statistics.frames += 1
+            frame_data_len = len(data) - 1
+            # verify received PCI and skip the size of the missed frames
+            missed_frames = (data[0] - sequence_number) & 0x0F
+            if missed_frames:
+                log.internal_warning(
+                    f"Consecutive frame missed: expected PCI {hex(0x20 | sequence_number)}, got {hex(data[0])}",
+                )
+                statistics.missed_frames += missed_frames
+                offset = min(offset + missed_frames * frame_data_len, end)
+            chunk = data[1 : 1 + end - offset]
+            self.downloaded_data[offset : offset + len(chunk)] = bytes(chunk)
+            offset += len(chunk)
+            sequence_number = (data[0] + 1) & 0x0F
+
+        statistics.blocks += 1
+        statistics.size = offset
+
+
+class UdsCallbackTrie:
+    """Immutable byte-prefix trie of the registered callbacks.
+
+    Each node holds the callback registered for the request leading to
+    it. Inserting or removing a callback copies the nodes along the
+    request's path and shares the others, so a trie can be read by any
+    thread without locking while a new one is built.
+    """
+
+    __slots__ = ("callback", "children")
+
+    def __init__(
+        self, callback: Optional[UdsCallback] = None, children: Optional[Dict[int, UdsCallbackTrie]] = None
+    ) -> None:
+        """Create a trie node.
+
+        :param callback: callback registered for the request leading to
+            this node
+        :param children: child node of each following request byte
+        """
+        self.callback = callback
+        self.children: Dict[int, UdsCallbackTrie] = children or {}
 
-        self.transfer_successful = transfer_size >= expected_transfer_size
-        self.transferred_data_size = transfer_size
+    def insert(self, request: List[int], callback: UdsCallback) -> UdsCallbackTrie:
+        """Register a callback, replacing the one of the same request.
+
+        :param request: request bytes of the callback
+        :param callback: callback to register
+
+        :return: the new trie
+        """
+        return self._replace(request, 0, callback)
+
+    def remove(self, request: List[int]) -> UdsCallbackTrie:
+        """Unregister the callback of a request.
+
+        :param request: request bytes of the callback
+
+        :return: the new trie
+        """
+        return self._replace(request, 0, None)
+
+    def _replace(self, request: List[int], position: int, callback: Optional[UdsCallback]) -> UdsCallbackTrie:
+        """Copy the path of a request with a new callback at its end.
+
+        :param request: request bytes of the callback
+        :param position: position of this node in the request
+        :param callback: callback to set, None to remove it
+
+        :return: the copy of this node
+        """
+        if position == len(request):
+            return UdsCallbackTrie(callback, self.children)
+        byte = request[position]
+        child = self.children.get(byte, UdsCallbackTrie())._replace(request, position + 1, callback)
+        children = dict(self.children)
+        if child.callback is None and not child.children:
+            # drop the branches left without any callback
+            children.pop(byte, None)
+        else:
+            children[byte] = child
+        return UdsCallbackTrie(self.callback, children)
+
+    def match(self, data: List[int]) -> Optional[UdsCallback]:
+        """Find the callback of the longest registered request starting
+        the given data.
+
+        :param data: received UDS request
+
+        :return: the matching callback, None if there is none
+        """
+        node, matched = self, self.callback
+        for byte in data:
+            node = node.children.get(byte)
+            if node is None:
+                break
+            if node.callback is not None:
+                matched = node.callback
+        return matched
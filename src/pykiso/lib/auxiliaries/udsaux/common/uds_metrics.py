@@ -0,0 +1,254 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+uds_metrics
+***********
+
+:module: uds_metrics
+
+:synopsis: Collect the latency of the UDS requests, their negative
+    response codes and their pending responses per service ID.
+
+The latencies are accumulated in a histogram with fixed buckets, so that
+the memory used does not depend on the number of requests and the
+metrics of runs on different firmware builds can be compared bucket by
+bucket.
+
+.. currentmodule:: uds_metrics
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from pykiso.types import PathType
+
+from .uds_response import UdsResponse
+
+#: version of the metrics file format
+METRICS_VERSION = 1
+
+#: upper bounds in milliseconds of the latency histogram buckets, the
+#: last bucket collects the slower responses
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class ServiceMetrics:
+    """Metrics of the requests of one UDS service."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS) -> None:
+        """Initialize attributes.
+
+        :param buckets: upper bounds in milliseconds of the latency
+            histogram buckets
+        """
+        self.buckets = tuple(buckets)
+        #: number of sent requests
+        self.requests = 0
+        #: number of requests that could not be sent
+        self.errors = 0
+        #: number of requests without response
+        self.timeouts = 0
+        #: number of final responses, pending responses excluded
+        self.responses = 0
+        #: number of responses in each latency bucket, plus the slower ones
+        self.histogram = [0] * (len(self.buckets) + 1)
+        self.latency_sum = 0.0
+        self.latency_min: Optional[float] = None
+        self.latency_max: Optional[float] = None
+        #: number of negative responses by NRC name
+        self.nrc: Counter = Counter()
+        #: number of requests answered with at least one pending response
+        self.pending_requests = 0
+        #: number of pending (0x78) responses
+        self.pending_responses = 0
+        #: time in seconds between the first pending response and the final response
+        self.pending_duration_sum = 0.0
+        self.pending_duration_max = 0.0
+
+    def record_response(self, response: UdsResponse) -> None:
+        """Record the final response of a request.
+
+        :param response: response with its timing
+        """
+        self.responses += 1
+        if response.is_negative:
+            self.nrc[response.nrc.name] += 1
+        latency = response.resp_time
+        if latency is not None:
+            self.latency_sum += latency
+            self.latency_min = latency if self.latency_min is None else min(self.latency_min, latency)
+            self.latency_max = latency if self.latency_max is None else max(self.latency_max, latency)
+            self.histogram[self._bucket_index(latency * 1000)] += 1
+        pending_times = response.pending_resp_times
+        if pending_times and latency is not None:
+            # the first time is measured from the request, the next ones from the previous pending response
+            duration = latency - pending_times[0]
+            self.pending_requests += 1
+            self.pending_responses += len(pending_times)
+            self.pending_duration_sum += duration
+            self.pending_duration_max = max(self.pending_duration_max, duration)
+
+    def _bucket_index(self, latency_ms: float) -> int:
+        """Get the index of the histogram bucket of a latency.
+
+        :param latency_ms: latency in milliseconds
+
+        :return: the index of the first bucket whose bound is not lower
+        """
+        for index, bound in enumerate(self.buckets):
+            if latency_ms <= bound:
+                return index
+        return len(self.buckets)
+
+    @property
+    def latency_mean(self) -> Optional[float]:
+        """Mean latency in seconds of the timed responses."""
+        count = sum(self.histogram)
+        return self.latency_sum / count if count else None
+
+    def as_dict(self) -> dict:
+        """Get the metrics as JSON serializable dictionary."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "responses": self.responses,
+            "latency": {
+                "min": self.latency_min,
+                "max": self.latency_max,
+                "mean": self.latency_mean,
+                "histogram": [
+                    {"le_ms": bound, "count": count}
+                    for bound, count in zip(list(self.buckets) + [None], self.histogram)
+                ],
+            },
+            "nrc": dict(self.nrc),
+            "pending": {
+                "requests": self.pending_requests,
+                "responses": self.pending_responses,
+                "duration_sum": self.pending_duration_sum,
+                "duration_max": self.pending_duration_max,
+            },
+        }
+
+    def summary(self) -> str:
+        """Get a one line summary of the metrics."""
+        text = f"{self.requests} requests"
+        if self.latency_mean is not None:
+            text += f", latency mean {self.latency_mean * 1000:.1f} ms, max {self.latency_max * 1000:.1f} ms"
+        if self.timeouts:
+            text += f", {self.timeouts} timeouts"
+        if self.nrc:
+            text += ", NRC " + ", ".join(f"{name} x{count}" for name, count in self.nrc.most_common())
+        if self.pending_requests:
+            text += (
+                f", {self.pending_responses} pending responses,"
+                f" pending max {self.pending_duration_max * 1000:.1f} ms"
+            )
+        return text
+
+
+class UdsMetrics:
+    """Metrics of the UDS requests of an auxiliary by service ID."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS) -> None:
+        """Initialize attributes.
+
+        :param buckets: upper bounds in milliseconds of the latency
+            histogram buckets
+        """
+        self.buckets = tuple(buckets)
+        #: metrics by request service ID
+        self.services: Dict[int, ServiceMetrics] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, service_id: int) -> ServiceMetrics:
+        """Get the metrics of a service.
+
+        :param service_id: service ID of the requests
+
+        :raises KeyError: if no request of the service was recorded
+        """
+        return self.services[service_id]
+
+    def _service(self, request: Union[bytes, List[int], tuple]) -> ServiceMetrics:
+        """Get the metrics of the service of a request, the lock must
+        be held."""
+        service_id = request[0] if len(request) else -1
+        metrics = self.services.get(service_id)
+        if metrics is None:
+            metrics = self.services[service_id] = ServiceMetrics(self.buckets)
+        return metrics
+
+    def record(
+        self,
+        request: Union[bytes, List[int], tuple],
+        response: Optional[UdsResponse] = None,
+        response_required: bool = True,
+    ) -> None:
+        """Record a sent request and its response.
+
+        :param request: raw request
+        :param response: response of the request, None if no response
+            was received
+        :param response_required: False if no response was expected
+        """
+        with self._lock:
+            metrics = self._service(request)
+            metrics.requests += 1
+            if response is not None:
+                metrics.record_response(response)
+            elif response_required:
+                metrics.timeouts += 1
+
+    def record_error(self, request: Union[bytes, List[int], tuple]) -> None:
+        """Record a request that could not be sent.
+
+        :param request: raw request
+        """
+        with self._lock:
+            self._service(request).errors += 1
+
+    def reset(self) -> None:
+        """Forget all recorded requests."""
+        with self._lock:
+            self.services = {}
+
+    def as_dict(self) -> dict:
+        """Get the metrics as JSON serializable dictionary, with the
+        service IDs as hexadecimal strings."""
+        with self._lock:
+            return {
+                "version": METRICS_VERSION,
+                "services": {f"0x{sid:02X}": metrics.as_dict() for sid, metrics in sorted(self.services.items())},
+            }
+
+    def summary(self) -> str:
+        """Get a summary of the metrics with one line per service."""
+        with self._lock:
+            return "\n".join(f"0x{sid:02X}: {metrics.summary()}" for sid, metrics in sorted(self.services.items()))
+
+    def write_json(self, path: PathType, **info) -> None:
+        """Write the metrics to a JSON file, replacing it atomically.
+
+        :param path: path of the metrics file
+        :param info: additional entries of the file, e.g. the name of
+            the auxiliary
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(json.dumps({**info, **self.as_dict()}, indent=2))
+        os.replace(tmp_path, path)
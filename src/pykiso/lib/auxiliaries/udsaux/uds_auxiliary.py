@@ -19,11 +19,10 @@ uds_auxiliary
 
 """
 import logging
-import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
 
 try:
     import can
@@ -32,13 +31,19 @@ except ImportError as e:
     raise ImportError(f"{e.name} dependency missing, consider installing pykiso with 'pip install pykiso[can]'")
 
 from pykiso.connector import CChannel
+from pykiso.periodic_scheduler import PeriodicJob, get_scheduler
+from pykiso.types import PathType
 
 from .common import uds_exceptions
 from .common.uds_base_auxiliary import UdsBaseAuxiliary
+from .common.uds_metrics import UdsMetrics
 from .common.uds_request import UDSCommands
 from .common.uds_response import UdsResponse
 from .common.uds_utils import get_uds_service
 
+if TYPE_CHECKING:
+    from pykiso.test_coordinator.test_case import BasicTest
+
 log = logging.getLogger(__name__)
 
 
@@ -56,6 +61,7 @@ class UdsAuxiliary(UdsBaseAuxiliary):
         response_id: Optional[int] = None,
         tp_layer: dict = None,
         uds_layer: dict = None,
+        metrics_file: Optional[PathType] = None,
         **kwargs,
     ):
         """Initialize attributes.
@@ -66,8 +72,13 @@ class UdsAuxiliary(UdsBaseAuxiliary):
         :param response_id: optional CAN ID used for receiving messages.
         :param tp_layer: isotp configuration given at yaml level
         :param uds_layer: uds configuration given at yaml level
+        :param metrics_file: if given, path of the JSON file the request
+            metrics are written to when the auxiliary is deleted
         """
         self.is_tester_present = None
+        #: latency, NRC and pending response metrics of the sent requests
+        self.metrics = UdsMetrics()
+        self.metrics_file = metrics_file
         super().__init__(
             com,
             config_ini_path,
@@ -88,7 +99,7 @@ class UdsAuxiliary(UdsBaseAuxiliary):
         :param extended: True if addressing mode is extended otherwise
             False
         """
-        self.channel._cc_send(msg=data, remote_id=req_id)
+        self.channel.cc_send(msg=data, remote_id=req_id)
 
     def send_uds_raw(
         self,
@@ -124,9 +135,11 @@ class UdsAuxiliary(UdsBaseAuxiliary):
             )
         except Exception:
             log.exception("Error while sending uds raw request")
+            self.metrics.record_error(msg_to_send)
             return False
 
         if resp is None:
+            self.metrics.record(msg_to_send, response_required=response_required)
             if not response_required:
                 return True
             else:
@@ -137,9 +150,19 @@ class UdsAuxiliary(UdsBaseAuxiliary):
             resp_time=self.uds_config.last_resp_time,
             pending_resp_times=self.uds_config.last_pending_resp_times,
         )
+        self.metrics.record(msg_to_send, resp)
         log.internal_info("UDS response received %s", resp)
         return resp
 
+    def report_metrics(self, test_case: "BasicTest") -> None:
+        """Add the summary of the request metrics to the header of the
+        step report of a test case.
+
+        :param test_case: test case whose step report is completed, e.g.
+            ``self`` in its ``tearDown``
+        """
+        test_case.step_report.header[f"UDS metrics {self.name}"] = self.metrics.summary()
+
     @staticmethod
     def check_max_pending_time(resp: UdsResponse, max_pending_time: float) -> bool:
         """Check that the time between pending response messages does not exceed a
@@ -287,36 +310,33 @@ class UdsAuxiliary(UdsBaseAuxiliary):
             log.error("No uds config found")
             return
 
-    def _sender_run(self, period: int, stop_event: threading.Event) -> None:
-        """send tester present at defined period until stopped
-
-        :param period: period in seconds to use for the cyclic sending of tester present
-        :param stop_event: event to set to stop the sending of tester present
-        """
-        while not stop_event.is_set():
-            self.send_uds_raw(
-                UDSCommands.TesterPresent.TESTER_PRESENT_NO_RESPONSE,
-                response_required=False,
-            )
-            stop_event.wait(period)
+    def _send_tester_present(self) -> None:
+        """Send a tester present request without waiting for a response."""
+        self.send_uds_raw(
+            UDSCommands.TesterPresent.TESTER_PRESENT_NO_RESPONSE,
+            response_required=False,
+        )
 
     @contextmanager
-    def tester_present_sender(self, period: int = 4) -> Iterator[None]:
+    def tester_present_sender(self, period: int = 4) -> Iterator[PeriodicJob]:
         """Context manager that continuously sends tester present messages via UDS
 
+        The first request is sent on entering the context, the next ones
+        by the periodic scheduler shared by all auxiliaries, see
+        :py:mod:`pykiso.periodic_scheduler`.
+
         :param period: period in seconds to use for the cyclic sending of tester present
+
+        :return: the periodic job sending the tester present requests
         """
-        stop_event = threading.Event()
-        sender = threading.Thread(
-            name="TesterPresentSender",
-            target=self._sender_run,
-            args=(period, stop_event),
+        self._send_tester_present()
+        job = get_scheduler().schedule(
+            self._send_tester_present, period, name=f"{self.name}.TesterPresentSender", delay=period
         )
         try:
-            yield sender.start()
+            yield job
         finally:
-            stop_event.set()
-            sender.join()
+            job.cancel()
 
     def start_tester_present_sender(self, period: int = 4):
         """Start to continuously send tester present messages via UDS"""
@@ -363,4 +383,9 @@ class UdsAuxiliary(UdsBaseAuxiliary):
         """
         if self.is_tester_present:
             self.stop_tester_present_sender()
+        if self.metrics_file is not None:
+            try:
+                self.metrics.write_json(self.metrics_file, auxiliary=self.name)
+            except OSError:
+                log.exception(f"Could not write the UDS metrics to {self.metrics_file}")
         return super()._delete_auxiliary_instance()
@@ -0,0 +1,301 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+uds_multi_client_auxiliary
+**************************
+
+:module: uds_multi_client_auxiliary
+
+:synopsis: Auxiliary used to handle the Unified Diagnostic Service protocol
+    on client (tester) side with several ECUs sharing one channel.
+
+Each ECU is addressed through a session defined by its request and response
+CAN identifiers. A single reception thread reads the channel and hands each
+frame to the ISO TP reassembler of the session owning its arbitration ID,
+frames of unknown identifiers are dropped without being decoded. Requests to
+different ECUs can be sent concurrently, requests to the same ECU are
+serialized.
+
+.. currentmodule:: uds_multi_client_auxiliary
+
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional, Union
+
+from uds import Config, Uds
+
+from pykiso.auxiliary import AuxiliaryInterface, close_connector, open_connector
+from pykiso.connector import CChannel
+
+from .common import uds_exceptions
+from .common.uds_base_auxiliary import UdsBaseAuxiliary
+from .common.uds_metrics import UdsMetrics
+from .common.uds_response import UdsResponse
+from .uds_auxiliary import UdsAuxiliary
+
+log = logging.getLogger(__name__)
+
+
+class UdsEcuSession:
+    """UDS client session with one ECU of a :py:class:`UdsMultiClientAuxiliary`."""
+
+    errors = uds_exceptions
+
+    def __init__(
+        self,
+        name: str,
+        request_id: int,
+        response_id: int,
+        tp_layer: Optional[dict] = None,
+        uds_layer: Optional[dict] = None,
+    ) -> None:
+        """Initialize attributes.
+
+        :param name: name of the ECU
+        :param request_id: CAN ID used for sending the requests to the ECU
+        :param response_id: CAN ID of the responses of the ECU
+        :param tp_layer: isotp configuration of the session
+        :param uds_layer: uds configuration of the session
+        """
+        self.name = name
+        self.req_id = request_id
+        self.res_id = response_id
+        self.tp_layer = {
+            **(tp_layer or UdsBaseAuxiliary.DEFAULT_TP_CONFIG),
+            "req_id": request_id,
+            "res_id": response_id,
+        }
+        self.uds_layer = dict(uds_layer or UdsBaseAuxiliary.DEFAULT_UDS_CONFIG)
+        self.uds_config: Optional[Uds] = None
+        self.tp_waiting_time = 0.010
+        #: latency, NRC and pending response metrics of the requests to the ECU
+        self.metrics = UdsMetrics()
+        self._frames: queue.Queue = queue.Queue()
+        self._request_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, request_id={self.req_id:#x}, response_id={self.res_id:#x})"
+
+    def open(self, channel: CChannel) -> None:
+        """Create the python-uds instance of the session.
+
+        :param channel: channel shared by all sessions, its transmit
+            method is overwritten by the auxiliary
+        """
+        # python-uds reads its configuration from class attributes on instantiation
+        Config.load_com_layer_config(dict(self.tp_layer), dict(self.uds_layer))
+        self.uds_config = Uds(None, connector=channel)
+        self.uds_config.overwrite_receive_method(self.receive)
+        self._frames = queue.Queue()
+
+    def put_frame(self, frame: bytes) -> None:
+        """Hand a received frame over to the ISO TP reassembler.
+
+        :param frame: data of a CAN frame received on the response ID
+        """
+        self._frames.put(list(frame))
+
+    def receive(self, timeout: float = 0) -> Optional[List[int]]:
+        """Get the next frame received from the ECU, used as python-uds
+        reception method.
+
+        :param timeout: time to wait for a frame in seconds
+
+        :return: the frame data, None if no frame was received in time
+        """
+        try:
+            return self._frames.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def send_uds_raw(
+        self,
+        msg_to_send: Union[bytes, List[int], tuple],
+        timeout_in_s: float = 6,
+        response_required: bool = True,
+    ) -> Union[UdsResponse, bool]:
+        """Send a UDS diagnostic request to the ECU and check response.
+
+        See :py:meth:`~pykiso.lib.auxiliaries.udsaux.uds_auxiliary.UdsAuxiliary.send_uds_raw`,
+        the requests sent from several threads to this ECU are serialized.
+
+        :param msg_to_send: can uds raw bytes to be sent
+        :param timeout_in_s: not used, the response timeout is the
+            p2_can_client parameter of the uds layer
+        :param response_required: Wait for a response if True
+
+        :raise ResponseNotReceivedError: raised when no answer has been received
+
+        :return: the uds response, or True if a response is not expected
+            and the command is properly sent otherwise False
+        """
+        with self._request_lock:
+            return UdsAuxiliary.send_uds_raw(self, msg_to_send, timeout_in_s, response_required)
+
+    check_raw_response_positive = UdsAuxiliary.check_raw_response_positive
+    check_raw_response_negative = UdsAuxiliary.check_raw_response_negative
+
+
+class UdsMultiClientAuxiliary(AuxiliaryInterface):
+    """Auxiliary used to handle the UDS protocol on client (tester) side
+    with several ECUs over one channel."""
+
+    errors = uds_exceptions
+
+    def __init__(
+        self,
+        com: CChannel,
+        ecus: Mapping[str, dict],
+        tp_layer: Optional[dict] = None,
+        uds_layer: Optional[dict] = None,
+        **kwargs,
+    ):
+        """Initialize attributes.
+
+        :param com: communication channel connector.
+        :param ecus: request_id and response_id of each ECU by name, and
+            optionally its own tp_layer and uds_layer
+        :param tp_layer: isotp configuration of the ECUs not defining it
+        :param uds_layer: uds configuration of the ECUs not defining it
+
+        :raises ValueError: if several ECUs share a response ID
+        """
+        super().__init__(is_proxy_capable=True, tx_task_on=False, rx_task_on=True, **kwargs)
+        self.channel = com
+        #: session of each ECU by name
+        self.sessions: Dict[str, UdsEcuSession] = {
+            name: UdsEcuSession(
+                name,
+                params["request_id"],
+                params["response_id"],
+                params.get("tp_layer", tp_layer),
+                params.get("uds_layer", uds_layer),
+            )
+            for name, params in ecus.items()
+        }
+        self._sessions_by_res_id: Dict[int, UdsEcuSession] = {}
+        for session in self.sessions.values():
+            other = self._sessions_by_res_id.setdefault(session.res_id, session)
+            if other is not session:
+                raise ValueError(f"ECUs {other.name!r} and {session.name!r} share the response ID {session.res_id:#x}")
+
+    def __getitem__(self, ecu: str) -> UdsEcuSession:
+        """Get the session of an ECU.
+
+        :param ecu: name of the ECU
+
+        :raises KeyError: if the ECU is not configured
+        """
+        return self.sessions[ecu]
+
+    @open_connector
+    def _create_auxiliary_instance(self) -> bool:
+        """Open the channel and create the python-uds instance of each
+        session.
+
+        :return: True if the sessions are created otherwise False
+        """
+        try:
+            for session in self.sessions.values():
+                session.open(self.channel)
+            # all sessions share the channel, their transmit method is the same
+            for session in self.sessions.values():
+                session.uds_config.overwrite_transmit_method(self.transmit)
+            return True
+        except Exception:
+            log.exception("An error occurred during kiso-python-uds initialization")
+            return False
+
+    @close_connector
+    def _delete_auxiliary_instance(self) -> bool:
+        """Close the channel.
+
+        :return: always True
+        """
+        return True
+
+    def transmit(self, data: bytes, req_id: int, extended: bool = False) -> None:
+        """Transmit a frame of any session, used as python-uds
+        transmission method.
+
+        :param data: data to send
+        :param req_id: CAN message identifier
+        :param extended: True if addressing mode is extended otherwise
+            False
+        """
+        self.channel.cc_send(msg=data, remote_id=req_id)
+
+    def send_uds_raw(
+        self,
+        ecu: str,
+        msg_to_send: Union[bytes, List[int], tuple],
+        timeout_in_s: float = 6,
+        response_required: bool = True,
+    ) -> Union[UdsResponse, bool]:
+        """Send a UDS diagnostic request to an ECU and check response.
+
+        :param ecu: name of the ECU
+        :param msg_to_send: can uds raw bytes to be sent
+        :param timeout_in_s: not used, the response timeout is the
+            p2_can_client parameter of the uds layer
+        :param response_required: Wait for a response if True
+
+        :raise ResponseNotReceivedError: raised when no answer has been received
+
+        :return: the uds response, or True if a response is not expected
+            and the command is properly sent otherwise False
+        """
+        return self.sessions[ecu].send_uds_raw(msg_to_send, timeout_in_s, response_required)
+
+    def send_uds_raw_concurrently(
+        self,
+        requests: Mapping[str, Union[bytes, List[int], tuple]],
+        response_required: bool = True,
+    ) -> Dict[str, Union[UdsResponse, bool]]:
+        """Send a UDS diagnostic request to several ECUs at once and wait
+        for all responses.
+
+        :param requests: request to send to each ECU by name
+        :param response_required: Wait for the responses if True
+
+        :raise ResponseNotReceivedError: raised when an ECU did not answer,
+            after all requests are finished
+
+        :return: the response of each ECU by name, see :py:meth:`send_uds_raw`
+        """
+        if not requests:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(requests), thread_name_prefix="UdsRequest") as executor:
+            futures = {
+                ecu: executor.submit(self.send_uds_raw, ecu, request, response_required=response_required)
+                for ecu, request in requests.items()
+            }
+        return {ecu: future.result() for ecu, future in futures.items()}
+
+    def _receive_message(self, timeout_in_s: float) -> None:
+        """Hand the received frame over to the session owning its
+        arbitration ID, the others are dropped.
+
+        :param timeout_in_s: timeout on reception.
+        """
+        recv_response = self.channel.cc_receive(timeout=timeout_in_s)
+        received_data = recv_response.get("msg")
+        session = self._sessions_by_res_id.get(recv_response.get("remote_id"))
+        if received_data is not None and session is not None:
+            session.put_frame(received_data)
+
+    def _run_command(self, cmd_message, cmd_data=None) -> Union[dict, bytes, bool]:
+        """Not used."""
+        pass
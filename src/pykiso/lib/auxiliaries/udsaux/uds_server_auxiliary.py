@@ -23,15 +23,16 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Callable, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Union
 
 from uds import IsoServices
 
-from pykiso.types import OdxRequestConfigDict
+from pykiso.types import OdxRequestConfigDict, PathType
 
 from .common.odx_parser import OdxParser
 from .common.uds_base_auxiliary import UdsBaseAuxiliary
-from .common.uds_callback import UdsCallback
+from .common.uds_callback import UdsCallback, UdsCallbackTrie
 from .common.uds_response import UdsResponse
 
 log = logging.getLogger(__name__)
@@ -46,7 +47,7 @@ class UdsServerAuxiliary(UdsBaseAuxiliary):
     CAN_FD_PADDING_PATTERN = 0xCC
     services = IsoServices
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, odx_cache_dir: Optional[PathType] = None, **kwargs):
         """Initialize attributes.
 
         :param com: communication channel connector.
@@ -54,24 +55,42 @@ class UdsServerAuxiliary(UdsBaseAuxiliary):
         :param request_id: optional CAN ID used for sending messages.
         :param response_id: optional CAN ID used for receiving messages.
         :param odx_file_path: ecu diagnostic definition file.
+        :param odx_cache_dir: folder in which the index of the odx file
+            is cached to skip its parsing in later runs, not cached if None
         """
         super().__init__(*args, **kwargs)
 
         self._ecu_config = None
         if self.odx_file_path is not None:
-            self.odx_parser = OdxParser(self.odx_file_path)
+            self.odx_parser = OdxParser(self.odx_file_path, cache_dir=odx_cache_dir)
 
+        # both are replaced on each (un)registration and read without lock
         self._callbacks: Dict[str, UdsCallback] = {}
+        self._callback_trie = UdsCallbackTrie()
         self._callback_lock = threading.Lock()
 
     @property
-    def callbacks(self):
-        """Access the callback dictionary in a thread-safe way.
+    def callbacks(self) -> Mapping[str, UdsCallback]:
+        """Access the registered callbacks in a thread-safe way.
 
-        :return: the internal callbacks dictionary.
+        :return: a read-only view of the registered callbacks.
+        """
+        return MappingProxyType(self._callbacks)
+
+    def _add_callback(self, keys: List[str], callback: UdsCallback) -> None:
+        """Register a callback under the given keys.
+
+        The callbacks dictionary and the dispatch trie are copied, so
+        that the reception thread never sees a partial registration.
+
+        :param keys: keys to register the callback under
+        :param callback: callback to register
         """
         with self._callback_lock:
-            return self._callbacks
+            callbacks = dict(self._callbacks)
+            callbacks.update(dict.fromkeys(keys, callback))
+            self._callback_trie = self._callback_trie.insert(callback.request, callback)
+            self._callbacks = callbacks
 
     def _create_auxiliary_instance(self) -> bool:
         """Open communication channel, create UDS instance and adapt
@@ -124,7 +143,7 @@ class UdsServerAuxiliary(UdsBaseAuxiliary):
         """
         req_id = req_id or self.req_id
         data = self._pad_message(data)
-        self.channel._cc_send(msg=data, remote_id=req_id)
+        self.channel.cc_send(msg=data, remote_id=req_id)
 
     def receive(self, timeout: float = 0) -> Optional[bytes]:
         """Receive a message through ITF connector. Called inside a thread,
@@ -134,7 +153,7 @@ class UdsServerAuxiliary(UdsBaseAuxiliary):
         :param timeout: Time to wait in second for a message to be received
         :return: the received message or None.
         """
-        rcv_data = self.channel._cc_receive(timeout=timeout)
+        rcv_data = self.channel.cc_receive(timeout=timeout)
         msg, arbitration_id = rcv_data.get("msg"), rcv_data.get("remote_id")
         if msg is not None and arbitration_id == self.res_id:
             return msg
@@ -213,12 +232,12 @@ class UdsServerAuxiliary(UdsBaseAuxiliary):
             to have a fixed length (zero-padded).
         :param callback: custom callback to register
         """
+        keys = []
         # handle odx based callbacks
         if isinstance(request, dict) or isinstance(response, dict):
             odx_param = self._get_odx_callback_param(request, response)
             request = self._create_callback_from_odx(request, response, response_data, data_length, callback)
-            odx_key = f"{IsoServices(request.request[0]).name}.{odx_param}"
-            self.callbacks[odx_key] = request
+            keys.append(f"{IsoServices(request.request[0]).name}.{odx_param}")
         elif isinstance(request, UdsCallback) and (
             isinstance(request.request, dict) or isinstance(request.response, dict)
         ):
@@ -230,8 +249,7 @@ class UdsServerAuxiliary(UdsBaseAuxiliary):
                 request.data_length,
                 request.callback,
             )
-            odx_key = f"{IsoServices(request.request[0]).name}.{odx_param}"
-            self.callbacks[odx_key] = request
+            keys.append(f"{IsoServices(request.request[0]).name}.{odx_param}")
 
         callback = (
             request
@@ -244,7 +262,8 @@ class UdsServerAuxiliary(UdsBaseAuxiliary):
                 callback=callback,
             )
         )
-        self.callbacks[self.format_data(callback.request)] = callback
+        keys.append(self.format_data(callback.request))
+        self._add_callback(keys, callback)
 
     def unregister_callback(self, request: Union[str, int, List[int]]) -> None:
         """Unregister previously registered callback.
@@ -264,13 +283,14 @@ class UdsServerAuxiliary(UdsBaseAuxiliary):
         if isinstance(request, list):
             request = self.format_data(request)
         with self._callback_lock:
-            try:
-                callback = self._callbacks.pop(request)
-                for key, value in list(self._callbacks.items()):
-                    if value == callback:
-                        self._callbacks.pop(key)
-            except KeyError as e:
-                log.error(f"Could not unregister callback {e}: no such callback registered.")
+            callback = self._callbacks.get(request)
+            if callback is None:
+                log.error(f"Could not unregister callback '{request}': no such callback registered.")
+                return
+            # the request may have been registered again with another callback since
+            if self._callback_trie.match(callback.request) == callback:
+                self._callback_trie = self._callback_trie.remove(callback.request)
+            self._callbacks = {key: value for key, value in self._callbacks.items() if value != callback}
 
     def _receive_message(self, timeout_in_s: float) -> None:
         """Reception method called by the auxiliary thread. This method received
@@ -300,14 +320,14 @@ class UdsServerAuxiliary(UdsBaseAuxiliary):
         """Verify if the received UDS request has an associated response
         registered by a callback and send it.
 
+        The callback of the longest registered request starting the
+        received request is triggered.
+
         :param received_uds_data: received UDS request from the client.
         """
-        for callback in self.callbacks.values():
-            # match on the registered request instead of the entire received request
-            if callback.request == received_uds_data[: len(callback.request)]:
-                callback_to_execute = callback
-                break
-        else:
+        # match on the registered request instead of the entire received request
+        callback_to_execute = self._callback_trie.match(received_uds_data)
+        if callback_to_execute is None:
             log.internal_warning(f"Unregistered request received: {self.format_data(received_uds_data)}")
             return
 
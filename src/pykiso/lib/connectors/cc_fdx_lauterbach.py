@@ -236,8 +236,8 @@ class CCFdxLauterbach(connector.CChannel):
 
         :return: poll length
         """
-        log.internal_debug(f"===> {msg}")
-        log.internal_debug(f"Sent on channel {self.fdxout}")
+        log.internal_debug("===> %s", msg)
+        log.internal_debug("Sent on channel %s", self.fdxout)
 
         # Create and fill the buffer with the message
         buffer = ctypes.pointer(ctypes.create_string_buffer(len(msg)))
@@ -288,9 +288,9 @@ class CCFdxLauterbach(connector.CChannel):
 
             # Check if a message has been received
             elif poll_len > 0:
-                log.internal_info(f"Message size: {poll_len}")
-                log.internal_info(f"<=== {Message.parse_packet(buffer.contents.raw[:poll_len])}")
-                log.internal_debug(f"Received on channel {self.fdxin}")
+                log.internal_info("Message size: %s", poll_len)
+                log.internal_info("<=== %s", Message.parse_packet(buffer.contents.raw[:poll_len]))
+                log.internal_debug("Received on channel %s", self.fdxin)
                 received_msg = Message.parse_packet(buffer.contents.raw[:poll_len])
                 break
 
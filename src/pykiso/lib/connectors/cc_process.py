@@ -200,7 +200,7 @@ class CCProcess(CChannel):
         elif self._pipe_stdin:
             if self._process is None:
                 raise CCProcessError("Process is not running.")
-            log.internal_debug(f"write stdin: {msg}")
+            log.internal_debug("write stdin: %s", msg)
             self._process.stdin.write(msg)
             self._process.stdin.flush()
         else:
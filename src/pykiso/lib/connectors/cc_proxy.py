@@ -24,12 +24,16 @@ has to be used with a so called proxy auxiliary.
 """
 from __future__ import annotations
 
+import enum
 import logging
 import queue
 import threading
-from typing import TYPE_CHECKING, Any, Callable
+import time
+import types
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 from pykiso.connector import CChannel
+from pykiso.exceptions import ProxyBufferOverflowError
 
 if TYPE_CHECKING:
     from pykiso.lib.auxiliaries.proxy_auxiliary import ProxyAuxiliary
@@ -39,6 +43,259 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+class OverflowPolicy(str, enum.Enum):
+    """Behaviour of a :py:class:`BroadcastRing` subscriber that does not
+    read the broadcast messages fast enough."""
+
+    #: discard the oldest unread message
+    DROP_OLDEST = "drop-oldest"
+    #: make the publisher wait until the subscriber reads a message
+    BLOCK = "block"
+    #: discard the oldest unread message and raise an error at next read
+    ERROR = "error"
+
+
+class BroadcastRing:
+    """Bounded ring buffer broadcasting each published message to all of
+    its subscribers.
+
+    Each message is stored once as a read-only mapping shared by all
+    subscribers, each subscriber only holding its own read cursor. Only
+    the messages a subscriber accepts count against its capacity: the
+    messages it is excluded from or not targeted by are skipped without
+    applying its overflow policy, and do not wake it up.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initialize attributes.
+
+        :param capacity: maximum number of messages a subscriber can lag
+            behind before the overflow policy applies
+        """
+        if capacity < 1:
+            raise ValueError(f"Ring buffer capacity has to be strictly positive, got {capacity}")
+        self.capacity = capacity
+        self.published = 0
+        self._slots: List[Optional[Tuple[types.MappingProxyType, Any, Optional[FrozenSet[Any]]]]] = [None] * capacity
+        self._lock = threading.Lock()
+        # publishers waiting for a subscriber with the block policy
+        self._cond = threading.Condition(self._lock)
+        self._subscribers: List[RingSubscriber] = []
+
+    def subscribe(self, owner: Any = None, policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST) -> RingSubscriber:
+        """Create a subscriber reading the messages published from now on.
+
+        :param owner: object to which the subscription belongs, used to
+            exclude messages published by it
+        :param policy: overflow policy of the subscriber
+
+        :return: the created subscriber
+        """
+        with self._cond:
+            subscriber = RingSubscriber(self, owner, OverflowPolicy(policy), self.published)
+            self._subscribers.append(subscriber)
+            return subscriber
+
+    def unsubscribe(self, subscriber: RingSubscriber) -> None:
+        """Stop broadcasting messages to the given subscriber.
+
+        :param subscriber: subscriber to remove
+        """
+        with self._cond:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+            # release a publisher possibly waiting for this subscriber
+            self._cond.notify_all()
+
+    @property
+    def dropped(self) -> Dict[Any, int]:
+        """Number of messages discarded for each subscriber's owner."""
+        with self._cond:
+            return {subscriber.owner: subscriber.dropped for subscriber in self._subscribers}
+
+    def publish(self, message: Dict[str, Any], exclude: Any = None, targets: Optional[FrozenSet[Any]] = None) -> None:
+        """Broadcast a message to all subscribers.
+
+        :param message: message to broadcast
+        :param exclude: owner of the subscriber that should not receive
+            the message
+        :param targets: owners of the only subscribers that should
+            receive the message, all subscribers if None
+        """
+        record = types.MappingProxyType(message)
+        with self._cond:
+            self._cond.wait_for(self._has_room_for_blocking_subscribers)
+            self._release_oldest_slot()
+            notifiers = []
+            for subscriber in self._subscribers:
+                if subscriber._accepts(exclude, targets):
+                    subscriber._cond.notify_all()
+                    if subscriber.notifier is not None:
+                        notifiers.append(subscriber.notifier)
+                elif subscriber._cursor == self.published:
+                    # nothing to read before this message, skip it right away
+                    subscriber._cursor += 1
+            self._slots[self.published % self.capacity] = (record, exclude, targets)
+            self.published += 1
+        for notifier in notifiers:
+            notifier()
+
+    def _lags_on_oldest_slot(self, subscriber: RingSubscriber) -> bool:
+        """Return True if the slot overwritten by the next message holds a
+        message the subscriber accepts and did not read yet, called with
+        the lock held."""
+        if self.published - subscriber._cursor < self.capacity:
+            return False
+        _, exclude, targets = self._slots[subscriber._cursor % self.capacity]
+        return subscriber._accepts(exclude, targets)
+
+    def _has_room_for_blocking_subscribers(self) -> bool:
+        """Return True if no subscriber with the block policy would lose
+        a message."""
+        return not any(
+            self._lags_on_oldest_slot(subscriber)
+            for subscriber in self._subscribers
+            if subscriber.policy is OverflowPolicy.BLOCK
+        )
+
+    def _release_oldest_slot(self) -> None:
+        """Move the subscribers still pointing to the slot overwritten by
+        the next message past it, applying their overflow policy if they
+        did not read it. Called with the lock held."""
+        for subscriber in self._subscribers:
+            if self.published - subscriber._cursor >= self.capacity:
+                if self._lags_on_oldest_slot(subscriber):
+                    subscriber._overflow()
+                else:
+                    subscriber._cursor += 1
+
+
+class RingSubscriber:
+    """Read cursor of a :py:class:`BroadcastRing`, offering the reading
+    part of the :py:class:`queue.Queue` API."""
+
+    def __init__(self, ring: BroadcastRing, owner: Any, policy: OverflowPolicy, cursor: int) -> None:
+        """Initialize attributes.
+
+        :param ring: ring buffer to read from
+        :param owner: object to which the subscription belongs
+        :param policy: overflow policy of the subscriber
+        :param cursor: sequence number of the next message to read
+        """
+        self.ring = ring
+        self.owner = owner
+        self.policy = policy
+        self.dropped = 0
+        #: callable executed for each published message to read
+        self.notifier: Optional[Callable[[], None]] = None
+        # woken up by the messages accepted by this subscriber only
+        self._cond = threading.Condition(ring._lock)
+        self._cursor = cursor
+        self._pending_error = 0
+
+    def _accepts(self, exclude: Any, targets: Optional[FrozenSet[Any]]) -> bool:
+        """Check if a published message has to be read by this subscriber.
+
+        :param exclude: owner of the subscriber excluded by the message
+        :param targets: owners of the subscribers targeted by the
+            message, all subscribers if None
+
+        :return: True if the message is for this subscriber
+        """
+        return (exclude is None or exclude is not self.owner) and (targets is None or self.owner in targets)
+
+    def _overflow(self) -> None:
+        """Discard the oldest unread message, called with the ring's lock held."""
+        self._cursor += 1
+        self.dropped += 1
+        if self.policy is OverflowPolicy.ERROR:
+            self._pending_error += 1
+
+    def _next(self) -> Optional[types.MappingProxyType]:
+        """Get the next message not excluded for this subscriber, called
+        with the ring's lock held.
+
+        :raises ProxyBufferOverflowError: if messages were discarded
+            since the last read and the policy is error
+        :return: the next message or None if all messages were read
+        """
+        if self._pending_error:
+            dropped, self._pending_error = self._pending_error, 0
+            raise ProxyBufferOverflowError(getattr(self.owner, "name", str(self.owner)), dropped)
+        ring = self.ring
+        while self._cursor < ring.published:
+            record, exclude, targets = ring._slots[self._cursor % ring.capacity]
+            self._cursor += 1
+            if self.policy is OverflowPolicy.BLOCK:
+                ring._cond.notify_all()
+            if self._accepts(exclude, targets):
+                return record
+        return None
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> types.MappingProxyType:
+        """Read the next message.
+
+        :param block: wait for a message if none is available
+        :param timeout: maximum time to wait in seconds, infinite if None
+
+        :raises queue.Empty: if no message is available in time
+        :return: the read message
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.ring._cond:
+            while True:
+                record = self._next()
+                if record is not None:
+                    return record
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise queue.Empty
+                self._cond.wait(remaining)
+
+    def get_nowait(self) -> types.MappingProxyType:
+        """Read the next message without waiting.
+
+        :raises queue.Empty: if no message is available
+        :return: the read message
+        """
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        """Return the number of unread messages (including the ones
+        excluded for or not targeting this subscriber)."""
+        with self.ring._cond:
+            return self.ring.published - self._cursor
+
+    def empty(self) -> bool:
+        """Return True if all messages were read."""
+        return self.qsize() == 0
+
+
+class NotifyingQueue(queue.Queue):
+    """Queue executing a callable each time an item is put in it."""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initialize attributes.
+
+        :param maxsize: maximum number of queued items
+        """
+        super().__init__(maxsize)
+        #: callable executed after each put
+        self.notifier: Optional[Callable[[], None]] = None
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Put an item into the queue and execute the notifier.
+
+        :param item: item to put
+        :param block: block if necessary until a free slot is available
+        :param timeout: maximum time to block
+        """
+        super().put(item, block, timeout)
+        notifier = self.notifier
+        if notifier is not None:
+            notifier()
+
+
 class CCProxy(CChannel):
     """Proxy CChannel to bind multiple auxiliaries to a single 'physical' CChannel."""
 
@@ -48,13 +305,72 @@ class CCProxy(CChannel):
     _proxy: ProxyAuxiliary = None
     _physical_channel: CChannel = None
 
-    def __init__(self, **kwargs):
-        """Initialize attributes."""
+    def __init__(
+        self,
+        overflow_policy: str = OverflowPolicy.DROP_OLDEST,
+        remote_ids: Optional[Iterable[int]] = None,
+        msg_prefix: Optional[Union[bytes, Iterable[int]]] = None,
+        **kwargs,
+    ):
+        """Initialize attributes.
+
+        :param overflow_policy: behaviour when the messages broadcast by a
+            proxy auxiliary using a ring buffer are not read fast enough
+            (one of "drop-oldest", "block" or "error")
+        :param remote_ids: only receive the messages with one of these
+            remote ids, all messages if None
+        :param msg_prefix: only receive the messages starting with these
+            bytes, all messages if None
+        """
         super().__init__(**kwargs)
         self.queue_out = None
         self.timeout = 1
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.remote_ids: Optional[FrozenSet[int]] = None
+        self.msg_prefix: Optional[bytes] = None
+        self.predicate: Optional[Callable[[ProxyReturn], bool]] = None
         self._lock = threading.Lock()
         self._tx_callback = None
+        self._rx_notifier: Optional[Callable[[], None]] = None
+        self.set_filter(remote_ids, msg_prefix)
+
+    def set_filter(
+        self,
+        remote_ids: Optional[Iterable[int]] = None,
+        msg_prefix: Optional[Union[bytes, Iterable[int]]] = None,
+        predicate: Optional[Callable[[ProxyReturn], bool]] = None,
+    ) -> None:
+        """Define which messages of the proxy auxiliary this channel
+        receives. Calling it without argument removes the filter.
+
+        :param remote_ids: only receive the messages with one of these
+            remote ids, all messages if None
+        :param msg_prefix: only receive the messages starting with these
+            bytes, all messages if None
+        :param predicate: only receive the messages for which this
+            callable returns True, all messages if None
+        """
+        self.remote_ids = frozenset(remote_ids) if remote_ids is not None else None
+        self.msg_prefix = bytes(msg_prefix) if msg_prefix is not None else None
+        self.predicate = predicate
+        if self._proxy is not None:
+            self._proxy._build_dispatch_table()
+
+    def accepts(self, message: ProxyReturn) -> bool:
+        """Check if a message matches the filter of this channel.
+
+        .. note:: the remote id is not checked here as the proxy
+            auxiliary already routes the messages by remote id.
+
+        :param message: message received or sent by the proxy auxiliary
+        :return: True if the message has to be given to this channel
+        """
+        if self.msg_prefix is not None:
+            msg = message.get("msg")
+            # only raw messages can start with the prefix
+            if not isinstance(msg, (bytes, bytearray)) or not msg.startswith(self.msg_prefix):
+                return False
+        return self.predicate is None or bool(self.predicate(message))
 
     def _bind_channel_info(self, proxy_aux: ProxyAuxiliary):
         """Bind a :py:class:`~pykiso.lib.auxiliaries.proxy_auxiliary.ProxyAuxiliary`
@@ -69,6 +385,33 @@ class CCProxy(CChannel):
         """
         self._proxy = proxy_aux
         self._physical_channel = proxy_aux.channel
+        # the proxied auxiliary could already be started, subscribe to the proxy's ring buffer
+        if self.queue_out is not None:
+            self.queue_out = self._make_queue_out()
+
+    def _make_queue_out(self) -> NotifyingQueue | RingSubscriber:
+        """Create the queue populated by the bound proxy auxiliary.
+
+        :return: a subscriber of the proxy's ring buffer if it uses one,
+            otherwise a queue
+        """
+        ring = getattr(self._proxy, "ring", None) if self._proxy is not None else None
+        queue_out = NotifyingQueue() if ring is None else ring.subscribe(self, self.overflow_policy)
+        queue_out.notifier = self._rx_notifier
+        return queue_out
+
+    def set_rx_notifier(self, notifier: Optional[Callable[[], None]]) -> bool:
+        """Set a callable executed each time the proxy auxiliary gives
+        a message to this channel.
+
+        :param notifier: callable to execute, None to remove it
+
+        :return: True as the proxy channels support the notification
+        """
+        self._rx_notifier = notifier
+        if self.queue_out is not None:
+            self.queue_out.notifier = notifier
+        return True
 
     def __getattr__(self, name: str) -> Any:
         """Implement getattr to retrieve attributes from the real channel attached
@@ -119,11 +462,13 @@ class CCProxy(CChannel):
     def _cc_open(self) -> None:
         """Open proxy channel."""
         log.internal_info("Open proxy channel")
-        self.queue_out = queue.Queue()
+        self.queue_out = self._make_queue_out()
 
     def _cc_close(self) -> None:
         """Close proxy channel."""
         log.internal_debug("Close proxy channel")
+        if isinstance(self.queue_out, RingSubscriber):
+            self.queue_out.ring.unsubscribe(self.queue_out)
         self.queue_out = None
 
     def _cc_send(self, *args: Any, **kwargs: Any) -> None:
@@ -133,7 +478,7 @@ class CCProxy(CChannel):
         :param args: positionnal arguments to pass to the callback
         :param kwargs: named arguments to pass to the callback
         """
-        log.internal_debug(f"put at proxy level: {args} {kwargs}")
+        log.internal_debug("put at proxy level: %s %s", args, kwargs)
         if self._tx_callback is not None:
             # call the attached ProxyAuxiliary's run_command method
             self._tx_callback(self, *args, **kwargs)
@@ -141,14 +486,16 @@ class CCProxy(CChannel):
     def _cc_receive(self, timeout: float = 0.1) -> ProxyReturn:
         """Depopulate the queue out of the proxy connector.
 
-        :param timeout: not used
+        :param timeout: only used when a notifier is set, as a message
+            is then known to be available
 
         :return: bytes and source when it exist. if queue timeout
             is reached return None
         """
+        timeout = timeout if self._rx_notifier is not None else self.timeout
         try:
-            return_response = self.queue_out.get(True, self.timeout)
-            log.internal_debug(f"received at proxy level : {return_response}")
+            return_response = self.queue_out.get(True, timeout)
+            log.internal_debug("received at proxy level : %s", return_response)
             return return_response
         except queue.Empty:
             return {"msg": None}
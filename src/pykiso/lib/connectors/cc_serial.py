@@ -184,6 +184,15 @@ class CCSerial(connector.CChannel):
         """Close serial port"""
         self.serial.close()
 
+    def fileno(self) -> Optional[int]:
+        """Return the file descriptor of the opened serial port (POSIX only).
+
+        :return: the port's file descriptor or None if not available
+        """
+        if not self.serial.is_open or not hasattr(self.serial, "fileno"):
+            return None
+        return self.serial.fileno()
+
     def _cc_send(self, msg: Union[ByteString, str], timeout: float = None, **kwargs) -> None:
         """Sends data to the serial port
 
@@ -169,6 +169,13 @@ class CCSocketCan(CChannel):
 
         self.opened = False
 
+    def fileno(self) -> Optional[int]:
+        """Return the file descriptor of the opened CAN socket.
+
+        :return: the socket's file descriptor or None if not opened
+        """
+        return self.bus.fileno() if self.bus else None
+
     def _cc_send(self, msg: MessageType, remote_id: int | None = None, **kwargs) -> None:
         """Send a CAN message at the configured id.
         If remote_id parameter is not given take configured ones
@@ -188,7 +195,7 @@ class CCSocketCan(CChannel):
         )
         self.bus.send(can_msg)
 
-        log.internal_debug(f"{self} sent CAN Message: {can_msg}, data: {msg}")
+        log.internal_debug("%s sent CAN Message: %s, data: %s", self, can_msg, msg)
 
     def _cc_receive(self, timeout: float = 0.0001) -> Dict[str, Union[bytes, int]]:
         """Receive a can message using configured filters.
@@ -209,7 +216,7 @@ class CCSocketCan(CChannel):
             else:
                 return {"msg": None}
         except can.CanError as can_error:
-            log.internal_debug(f"encountered can error: {can_error}")
+            log.internal_debug("encountered can error: %s", can_error)
             return {"msg": None}
         except Exception:
             log.exception(f"encountered error while receiving message via {self}")
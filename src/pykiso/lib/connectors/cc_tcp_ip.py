@@ -67,6 +67,13 @@ class CCTcpip(CChannel):
             self.socket.close()
             self.socket = None
 
+    def fileno(self) -> Optional[int]:
+        """Return the file descriptor of the opened socket.
+
+        :return: the socket's file descriptor or None if not opened
+        """
+        return self.socket.fileno() if self.socket else None
+
     def _cc_send(self, msg: bytes or str, **kwargs) -> None:
         """Send a message via socket.
 
@@ -77,7 +84,7 @@ class CCTcpip(CChannel):
             raise RuntimeError("Channel must be opened before messages can be sent")
         if isinstance(msg, str):
             msg = msg.encode()
-        log.internal_debug(f"Sending {msg} via socket to {self.dest_ip}")
+        log.internal_debug("Sending %s via socket to %s", msg, self.dest_ip)
         self.socket.send(msg)
 
     def _cc_receive(self, timeout=0.01) -> Dict[str, Optional[bytes]]:
@@ -94,7 +101,7 @@ class CCTcpip(CChannel):
 
         try:
             msg_received = self.socket.recv(self.max_msg_size)
-            log.internal_debug(f"Socket at {self.dest_ip} received: {msg_received}")
+            log.internal_debug("Socket at %s received: %s", self.dest_ip, msg_received)
         except socket.timeout:
             log.exception(f"encountered timeout error while receiving message via {self}")
             return {"msg": None}
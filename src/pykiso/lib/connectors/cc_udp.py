@@ -60,6 +60,13 @@ class CCUdp(connector.CChannel):
         """Close the udp socket."""
         self.udp_socket.close()
 
+    def fileno(self) -> Optional[int]:
+        """Return the file descriptor of the opened socket.
+
+        :return: the socket's file descriptor or None if not opened
+        """
+        return self.udp_socket.fileno() if self.udp_socket else None
+
     def _cc_send(self, msg: bytes, **kwargs) -> None:
         """Send message using udp socket
 
@@ -83,10 +90,10 @@ class CCUdp(connector.CChannel):
 
         # catch the errors linked to the socket timeout without blocking
         except BlockingIOError:
-            log.internal_debug(f"encountered error while receiving message via {self}")
+            log.internal_debug("encountered error while receiving message via %s", self)
             return {"msg": None}
         except socket.timeout:
-            log.internal_debug(f"encountered error while receiving message via {self}")
+            log.internal_debug("encountered error while receiving message via %s", self)
             return {"msg": None}
         except BaseException:
             log.exception(f"encountered error while receiving message via {self}")
@@ -61,13 +61,20 @@ class CCUdpServer(connector.CChannel):
         log.internal_info(f"UDP socket closed at address: {self.address}")
         self.udp_socket.close()
 
+    def fileno(self) -> Optional[int]:
+        """Return the file descriptor of the opened socket.
+
+        :return: the socket's file descriptor or None if not opened
+        """
+        return self.udp_socket.fileno() if self.udp_socket else None
+
     def _cc_send(self, msg: bytes, **kwargs) -> None:
         """Send back a UDP message to the previous sender.
 
         :param msg: message to sent, should be bytes
         :param kwargs: not used
         """
-        log.internal_debug(f"UDP server send: {msg} at {self.address}")
+        log.internal_debug("UDP server send: %s at %s", msg, self.address)
         self.udp_socket.sendto(msg, self.address)
 
     def _cc_receive(self, timeout=0.0000001) -> Dict[str, Optional[bytes]]:
@@ -82,13 +89,13 @@ class CCUdpServer(connector.CChannel):
 
         try:
             msg_received, self.address = self.udp_socket.recvfrom(self.max_msg_size)
-            log.internal_debug(f"UDP server receives: {msg_received} at {self.address}")
+            log.internal_debug("UDP server receives: %s at %s", msg_received, self.address)
         # catch the errors linked to the socket timeout without blocking
         except BlockingIOError:
-            log.internal_debug(f"encountered error while receiving message via {self}")
+            log.internal_debug("encountered error while receiving message via %s", self)
             return {"msg": None}
         except socket.timeout:
-            log.internal_debug(f"encountered error while receiving message via {self}")
+            log.internal_debug("encountered error while receiving message via %s", self)
             return {"msg": None}
         except BaseException:
             log.exception(f"encountered error while receiving message via {self}")
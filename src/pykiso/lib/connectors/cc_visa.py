@@ -69,22 +69,22 @@ class VISAChannel(CChannel):
         recv = ""
         try:
             if request == "read":
-                log.internal_debug(f"Reading {self.resource_name} ")
+                log.internal_debug("Reading %s ", self.resource_name)
                 recv = self.resource.read().strip()
             elif request == "query":
-                log.internal_debug(f"Querying {request_data} to {self.resource_name}")
+                log.internal_debug("Querying %s to %s", request_data, self.resource_name)
                 recv = self.resource.query(request_data).strip()
             else:
-                log.internal_warning(f"Unknown request '{request}'!")
+                log.internal_warning("Unknown request '%s'!", request)
 
         except pyvisa.errors.InvalidSession:
-            log.exception(f"Request {request}:{request_data} failed! Invalid session (resource might be closed).")
+            log.exception("Request %s:%s failed! Invalid session (resource might be closed).", request, request_data)
         except pyvisa.errors.VisaIOError:
-            log.exception(f"Request {request}:{request_data} failed! Timeout expired before operation completed.")
+            log.exception("Request %s:%s failed! Timeout expired before operation completed.", request, request_data)
         except Exception as e:
-            log.exception(f"Request {request}: {request_data} failed!\n{e}")
+            log.exception("Request %s: %s failed!\n%s", request, request_data, e)
         else:
-            log.internal_debug(f"Response received: {recv}")
+            log.internal_debug("Response received: %s", recv)
         finally:
             response = {"msg": str(recv)}
             return response
@@ -96,7 +96,7 @@ class VISAChannel(CChannel):
         """
         msg = msg.decode()
 
-        log.internal_debug(f"Writing {msg} to {self.resource_name}")
+        log.internal_debug("Writing %s to %s", msg, self.resource_name)
         self.resource.write(msg)
 
     def _cc_receive(self, timeout: float = 0.1) -> Dict[str, Optional[bytes]]:
@@ -20,6 +20,8 @@ Instrument control auxiliary plugin
 
 """
 
+from typing import List, Optional
+
 from robot.api.deco import keyword, library
 
 from ..auxiliaries.instrument_control_auxiliary import InstrumentControlAuxiliary as InstAux
@@ -79,6 +81,20 @@ class InstrumentControlAuxiliary(RobotAuxInterface):
         aux = self._get_aux(aux_alias)
         return aux.query(query_command)
 
+    @keyword(name="Execute batch")
+    def execute_batch(self, commands: List[str], aux_alias: str, synchronize: bool = True) -> Optional[List[str]]:
+        """Send several commands in a single transaction.
+
+        :param commands: write and query commands to send
+        :param aux_alias: auxiliary's alias
+        :param synchronize: wait for the completion of all commands
+
+        :return: the response of each query, None if the response is
+            incomplete
+        """
+        aux = self._get_aux(aux_alias)
+        return aux.execute_batch(commands, synchronize)
+
     @keyword(name="Get identification")
     def get_identification(self, aux_alias: str) -> str:
         """Get the identification information of an instrument.
@@ -15,18 +15,29 @@ Integration Test Framework
 
 :synopsis: Handles initialization of the loggers and custom logging levels.
 
+In asynchronous mode, the root logger only puts the records into a
+bounded queue and a single writer thread formats them and writes them to
+the log file and to the console, so that the threads of the auxiliaries
+do not wait for the file and console I/O. The policy applied when the
+queue is full is configurable, the queued, dropped and blocked records
+are counted in the :py:class:`BoundedQueueHandler`.
+
 .. currentmodule:: logging
 
 """
+import atexit
+import enum
 import importlib
 import logging
+import logging.handlers
+import queue
 import re
 import sys
 import time
 from ast import literal_eval
 from functools import partialmethod, wraps
 from pathlib import Path
-from typing import List, NamedTuple, Optional, Union
+from typing import List, NamedTuple, Optional, TextIO, Union
 
 from .test_setup.dynamic_loader import PACKAGE
 from .types import PathType
@@ -38,6 +49,20 @@ LEVELS = {
     "ERROR": logging.ERROR,
 }
 
+#: default maximum number of records queued in asynchronous mode
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
+
+class OverflowPolicy(str, enum.Enum):
+    """Behaviour of the asynchronous logging when its queue is full."""
+
+    #: wait until the writer thread made room in the queue, no record is lost
+    BLOCK = "block"
+    #: discard the record being logged
+    DROP_NEW = "drop-new"
+    #: discard the oldest queued record to make room for the new one
+    DROP_OLDEST = "drop-oldest"
+
 
 class LogOptions(NamedTuple):
     """
@@ -48,6 +73,9 @@ class LogOptions(NamedTuple):
     log_level: str
     report_type: str
     verbose: bool
+    async_logging: bool = False
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK
 
 
 # used to store the selected logging options
@@ -56,6 +84,91 @@ log_options: Optional[LogOptions] = None
 # used to store the loggers that shouldn't be silenced
 active_loggers = set()
 
+# queue handler and writer thread of the asynchronous logging, if active
+_queue_handler: Optional["BoundedQueueHandler"] = None
+_queue_listener: Optional["_QueueListener"] = None
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler with a bounded queue and an overflow policy, counting
+    the records it handles.
+
+    The message of a record is merged with its arguments when it is
+    queued, as the arguments could be modified before the writer thread
+    handles it. The formatting of the log line and the I/O are done by
+    the writer thread.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_LOG_QUEUE_SIZE, overflow: OverflowPolicy = OverflowPolicy.BLOCK) -> None:
+        """Initialize attributes.
+
+        :param maxsize: maximum number of queued records
+        :param overflow: policy applied when the queue is full
+
+        :raises ValueError: if the size is not strictly positive or the
+            policy is unknown
+        """
+        if maxsize <= 0:
+            raise ValueError(f"size of the logging queue must be positive, got {maxsize}")
+        super().__init__(queue.Queue(maxsize))
+        self.overflow = OverflowPolicy(overflow)
+        #: number of queued records
+        self.enqueued = 0
+        #: number of records discarded because the queue was full
+        self.dropped = 0
+        #: number of records that waited for room in the queue
+        self.blocked = 0
+        #: highest number of records in the queue
+        self.max_depth = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record into the queue, applying the overflow policy if it
+        is full. Called with the handler lock held.
+
+        :param record: prepared record
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow is OverflowPolicy.DROP_NEW:
+                self.dropped += 1
+                return
+            if self.overflow is OverflowPolicy.BLOCK:
+                self.blocked += 1
+                self.queue.put(record)
+            else:
+                self._replace_oldest(record)
+        self.enqueued += 1
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def _replace_oldest(self, record: logging.LogRecord) -> None:
+        """Discard the oldest queued records until the new one fits.
+
+        :param record: prepared record
+        """
+        while True:
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.dropped += 1
+            except queue.Empty:
+                # the writer thread emptied the queue in between
+                pass
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                continue
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """Writer thread of the asynchronous logging."""
+
+    def enqueue_sentinel(self) -> None:
+        """Wait for room in the queue to put the stop sentinel, the records
+        queued before are still written."""
+        self.queue.put(self._sentinel)
+
 
 def get_logging_options() -> LogOptions:
     """Simply return the previous logging options.
@@ -86,12 +199,87 @@ def add_internal_log_levels() -> None:
         add_logging_level("INTERNAL_DEBUG", get_internal_level(logging.DEBUG))
 
 
+def start_async_logging(
+    handlers: List[logging.Handler],
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+) -> BoundedQueueHandler:
+    """Write the records of the root logger to the given handlers from a
+    writer thread, instead of writing them in the thread logging them.
+
+    :param handlers: handlers used by the writer thread, they must not be
+        attached to the root logger
+    :param queue_size: maximum number of queued records
+    :param overflow: policy applied when the queue is full
+
+    :return: the handler queuing the records, attached to the root logger
+    """
+    global _queue_handler, _queue_listener
+    stop_async_logging()
+    queue_handler = BoundedQueueHandler(queue_size, overflow)
+    listener = _QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_handler, _queue_listener = queue_handler, listener
+    logging.getLogger().addHandler(queue_handler)
+    return queue_handler
+
+
+def stop_async_logging() -> None:
+    """Write the queued records, stop the writer thread and attach its
+    handlers back to the root logger. Does nothing if the asynchronous
+    logging is not active.
+    """
+    global _queue_handler, _queue_listener
+    queue_handler, listener = _queue_handler, _queue_listener
+    if listener is None:
+        return
+    _queue_handler = _queue_listener = None
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(queue_handler)
+    # wait for a record being queued by another thread
+    with queue_handler.lock:
+        listener.stop()
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+    if queue_handler.dropped:
+        logging.getLogger(__name__).warning(
+            "%d log records were dropped because the logging queue was full", queue_handler.dropped
+        )
+
+
+def _redirect_async_logging(stream: TextIO) -> None:
+    """Write the queued records, then make the writer thread log to the
+    given stream instead of the previous one.
+
+    :param stream: new output stream of the stream handlers
+    """
+    _queue_handler.queue.join()
+    for handler in _queue_listener.handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setStream(stream)
+
+
+def get_async_logging_handler() -> Optional[BoundedQueueHandler]:
+    """Return the handler queuing the records in asynchronous mode.
+
+    :return: the queue handler, None if the asynchronous logging is not
+        active
+    """
+    return _queue_handler
+
+
+atexit.register(stop_async_logging)
+
+
 def initialize_logging(
     log_path: Optional[PathType],
     log_level: str,
     verbose: bool,
     report_type: str = None,
     yaml_name: str = None,
+    async_logging: bool = False,
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK,
 ) -> logging.Logger:
     """Initialize the logging.
 
@@ -103,12 +291,30 @@ def initialize_logging(
     :param verbose: activate internal kiso logging if True
     :param report_type: expected report type (junit, text,...)
     :param yaml_name: name of current yaml config file
+    :param async_logging: write the logs from a writer thread
+    :param queue_size: maximum number of queued records in asynchronous
+        mode
+    :param overflow: policy applied when the queue is full in
+        asynchronous mode
 
     :returns: configured Logger
     """
+    global log_options
+    overflow = OverflowPolicy(overflow)
+    # for junit use sys.stdout as stream, otherwise print to stderr
+    stream = sys.stdout if report_type == "junit" else sys.stderr
+
+    options = LogOptions(log_path, log_level, report_type, verbose, async_logging, queue_size, overflow)
+    if async_logging and _queue_listener is not None and options == log_options:
+        # keep the running writer thread, only follow a replaced sys.stdout (e.g. for each junit test)
+        _redirect_async_logging(stream)
+        return logging.getLogger(__name__)
+
+    stop_async_logging()
     root_logger = logging.getLogger()
     # reset all previously added handlers to allow multiple calls
     root_logger.handlers = []
+    handlers = []
 
     log_format = logging.Formatter("%(asctime)s [%(levelname)s] %(module)s:%(lineno)d: %(message)s")
     # add internal kiso log levels
@@ -125,21 +331,23 @@ def initialize_logging(
         file_handler.setFormatter(log_format)
         # always include internal logs in log files
         file_handler.setLevel(get_internal_level(log_level))
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # update logging options after having modified the log path
-    global log_options
-    log_options = LogOptions(log_path, log_level, report_type, verbose)
-
-    # for junit use sys.stdout as stream, otherwise print to stderr
-    stream = sys.stdout if report_type == "junit" else sys.stderr
+    log_options = options._replace(log_path=log_path)
 
     # for all report types add a StreamHandler
     stream_handler = logging.StreamHandler(stream)
     stream_handler.setFormatter(log_format)
     # disable internal logs if no verbose is wanted
     stream_handler.setLevel(LEVELS[log_level] if not verbose else get_internal_level(log_level))
-    root_logger.addHandler(stream_handler)
+    handlers.append(stream_handler)
+
+    if async_logging:
+        start_async_logging(handlers, queue_size, overflow)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # set the root logger's level to the internal one if any of the provided options activates internal logging
     if verbose or log_path is not None:
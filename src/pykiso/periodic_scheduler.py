@@ -0,0 +1,279 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Shared periodic scheduler
+*************************
+
+:module: periodic_scheduler
+
+:synopsis: single thread executing the periodic jobs of all auxiliaries,
+    like cyclic tester present requests, cyclic CAN frames or keep-alive
+    messages.
+
+Instead of starting a thread looping on a ``sleep`` per periodic
+transmission, auxiliaries register their jobs with the scheduler returned
+by :py:func:`get_scheduler`. The jobs are kept in a heap ordered by
+deadline and executed one after another by the scheduler thread, which
+is started with the first job and ends once the last job is cancelled.
+
+The deadlines of a job are computed from its start time and not from the
+end of its previous execution, so that the time spent in the callback
+and the scheduling latency do not accumulate over the cycles. A job whose
+deadline has passed by more than one period, e.g. because another job
+blocked the scheduler thread, skips the missed cycles instead of
+executing them in a burst, they are counted in its statistics.
+
+As all jobs share one thread, a callback should only transmit its message
+and return: a callback waiting for a response delays the other jobs.
+
+.. currentmodule:: periodic_scheduler
+
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JobStatistics:
+    """Timing statistics of a periodic job, the jitter being the delay
+    between the deadline of an execution and its actual start."""
+
+    #: number of executions
+    executions: int
+    #: number of cycles skipped because the job was too late
+    missed_cycles: int
+    #: smallest jitter in seconds
+    min_jitter: float
+    #: largest jitter in seconds
+    max_jitter: float
+    #: mean jitter in seconds
+    mean_jitter: float
+
+
+class PeriodicJob:
+    """Job executed periodically by a :py:class:`PeriodicScheduler`."""
+
+    def __init__(
+        self,
+        scheduler: PeriodicScheduler,
+        callback: Callable[[], None],
+        period: float,
+        name: str,
+        start: float,
+    ) -> None:
+        """Initialize attributes.
+
+        :param scheduler: scheduler executing the job
+        :param callback: callable executed at each cycle
+        :param period: period of the job in seconds
+        :param name: name of the job used in the logs
+        :param start: monotonic time of the first execution
+        """
+        self.scheduler = scheduler
+        self.callback = callback
+        self.period = period
+        self.name = name
+        self.start = start
+        self.cancelled = False
+        self._cycle = 0
+        self._executions = 0
+        self._missed_cycles = 0
+        self._min_jitter = float("inf")
+        self._max_jitter = 0.0
+        self._jitter_sum = 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, period={self.period})"
+
+    @property
+    def deadline(self) -> float:
+        """Monotonic time of the next execution."""
+        return self.start + self._cycle * self.period
+
+    @property
+    def statistics(self) -> JobStatistics:
+        """Timing statistics of the executions so far."""
+        executions = self._executions
+        return JobStatistics(
+            executions=executions,
+            missed_cycles=self._missed_cycles,
+            min_jitter=self._min_jitter if executions else 0.0,
+            max_jitter=self._max_jitter,
+            mean_jitter=self._jitter_sum / executions if executions else 0.0,
+        )
+
+    def cancel(self) -> None:
+        """Stop executing the job. If the job is being executed by the
+        scheduler thread, wait until the execution is finished."""
+        self.scheduler.cancel(self)
+
+    def _execute(self, now: float) -> None:
+        """Execute the callback and record its jitter.
+
+        :param now: monotonic time at which the execution starts
+        """
+        jitter = now - self.deadline
+        self._executions += 1
+        self._jitter_sum += jitter
+        self._min_jitter = min(self._min_jitter, jitter)
+        self._max_jitter = max(self._max_jitter, jitter)
+        try:
+            self.callback()
+        except Exception:
+            log.exception(f"periodic job {self.name!r} raised an exception")
+
+    def _advance(self, now: float) -> None:
+        """Move the deadline to the next cycle not yet passed.
+
+        :param now: current monotonic time
+        """
+        self._cycle += 1
+        if self.deadline <= now:
+            missed = int((now - self.deadline) // self.period) + 1
+            self._cycle += missed
+            self._missed_cycles += missed
+
+
+class PeriodicScheduler:
+    """Thread executing periodic jobs at their deadlines."""
+
+    def __init__(self) -> None:
+        """Initialize attributes."""
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[float, int, PeriodicJob]] = []
+        self._counter = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._running_job: Optional[PeriodicJob] = None
+        self._stop = False
+
+    @property
+    def is_running(self) -> bool:
+        """True if the scheduler thread is alive."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    @property
+    def jobs(self) -> List[PeriodicJob]:
+        """Scheduled jobs, by deadline."""
+        with self._condition:
+            return [job for _, _, job in sorted(self._heap)]
+
+    def schedule(
+        self,
+        callback: Callable[[], None],
+        period: float,
+        name: Optional[str] = None,
+        delay: float = 0.0,
+    ) -> PeriodicJob:
+        """Execute a callback periodically, until the returned job is
+        cancelled. The scheduler thread is started if needed.
+
+        :param callback: callable without arguments executed at each cycle
+        :param period: period in seconds
+        :param name: name of the job used in the logs, by default the
+            name of the callback
+        :param delay: time in seconds before the first execution
+
+        :raises ValueError: if the period is not strictly positive
+
+        :return: the scheduled job
+        """
+        if period <= 0:
+            raise ValueError(f"period of a periodic job must be positive, got {period}")
+        name = name or getattr(callback, "__qualname__", repr(callback))
+        job = PeriodicJob(self, callback, period, name, time.monotonic() + delay)
+        with self._condition:
+            self._push(job)
+            if not self.is_running:
+                self._stop = False
+                self._thread = threading.Thread(name="PeriodicScheduler", target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        log.internal_debug(f"scheduled {job}")
+        return job
+
+    def cancel(self, job: PeriodicJob) -> None:
+        """Stop executing a job, see :py:meth:`PeriodicJob.cancel`.
+
+        :param job: job to cancel
+        """
+        with self._condition:
+            job.cancelled = True
+            self._heap = [entry for entry in self._heap if entry[2] is not job]
+            heapq.heapify(self._heap)
+            if threading.current_thread() is not self._thread:
+                self._condition.wait_for(lambda: self._running_job is not job)
+            self._condition.notify_all()
+        log.internal_debug(f"cancelled {job}")
+
+    def stop(self) -> None:
+        """Cancel all jobs and stop the scheduler thread."""
+        with self._condition:
+            for _, _, job in self._heap:
+                job.cancelled = True
+            self._heap.clear()
+            self._stop = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _push(self, job: PeriodicJob) -> None:
+        """Insert a job in the heap, the condition must be held."""
+        heapq.heappush(self._heap, (job.deadline, next(self._counter), job))
+
+    def _run(self) -> None:
+        """Execute each job at its deadline until stopped or until no
+        job is left."""
+        while True:
+            with self._condition:
+                while not self._stop and self._heap:
+                    timeout = self._heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                if self._stop or not self._heap:
+                    # a later scheduled job starts a new thread
+                    self._thread = None
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                self._running_job = job
+            job._execute(time.monotonic())
+            with self._condition:
+                self._running_job = None
+                if not job.cancelled:
+                    job._advance(time.monotonic())
+                    self._push(job)
+                self._condition.notify_all()
+
+
+_scheduler: Optional[PeriodicScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> PeriodicScheduler:
+    """Return the scheduler shared by all auxiliaries.
+
+    :return: the shared scheduler
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = PeriodicScheduler()
+        return _scheduler
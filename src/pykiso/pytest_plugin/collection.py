@@ -267,8 +267,10 @@ def pytest_collection(session: Session):
     arg = kiso_configs.pop(0)
     session.config.args.remove(arg)
 
-    # parse the provided YAML file
-    cfg = parse_config(arg)
+    # parse the provided YAML file, cached next to pytest's cache if it is enabled
+    pytest_cache = getattr(session.config, "cache", None)
+    config_cache = pytest_cache.mkdir("pykiso") / "config_cache.json" if pytest_cache is not None else None
+    cfg = parse_config(arg, config_cache)
 
     # register auxiliaries and associated connectors and make fixtures out of them
     ConfigRegistry.register_aux_con(cfg)
@@ -0,0 +1,192 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Test collection cache
+*********************
+
+:module: collection_cache
+
+:synopsis: Keep the test cases collected from each test suite on disk,
+    to list them and evaluate their tags without importing the test
+    modules again.
+
+Each test suite is stored with a fingerprint made of its configuration
+and of the path, modification time and size of every python file of the
+suite folder. A test suite whose fingerprint changed is collected again.
+
+.. note:: the python files located outside of the test suite folder are
+    not part of the fingerprint.
+
+.. currentmodule:: collection_cache
+
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import unittest
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..types import PathType, SuiteConfig
+from . import test_suite
+
+log = logging.getLogger(__name__)
+
+#: version of the cache layout, a cache of another version is discarded
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CachedTest:
+    """Information of a collected test case stored in the cache."""
+
+    #: unittest ID of the test case
+    test_id: str
+    #: name of the test module
+    module: str
+    #: qualified name of the test class
+    class_name: str
+    #: name of the test method
+    method: str
+    test_suite_id: Optional[int]
+    test_case_id: Optional[int]
+    #: tags of the test case
+    tag: Optional[Dict[str, List[str]]]
+    #: the test case is a test suite setup or teardown
+    fixture: bool
+
+    @classmethod
+    def from_test(cls, test: unittest.TestCase) -> CachedTest:
+        """Describe a collected test case.
+
+        :param test: collected test case
+
+        :return: the information to cache
+        """
+        return cls(
+            test_id=test.id(),
+            module=test.__class__.__module__,
+            class_name=test.__class__.__qualname__,
+            method=test._testMethodName,
+            test_suite_id=getattr(test, "test_suite_id", None),
+            test_case_id=getattr(test, "test_case_id", None),
+            tag=getattr(test, "tag", None),
+            fixture=test_suite.is_suite_fixture(test),
+        )
+
+
+def get_suite_fingerprint(suite_config: SuiteConfig) -> str:
+    """Compute the fingerprint of a test suite.
+
+    :param suite_config: test suite configuration
+
+    :return: hash of the test suite configuration and of the path,
+        modification time and size of its python files
+    """
+    suite_dir = Path(suite_config["suite_dir"])
+    files = []
+    for root, dirs, file_names in os.walk(suite_dir):
+        dirs[:] = sorted(name for name in dirs if name != "__pycache__")
+        for file_name in sorted(file_names):
+            if file_name.endswith(".py"):
+                stat = os.stat(os.path.join(root, file_name))
+                files.append(
+                    (os.path.relpath(os.path.join(root, file_name), suite_dir), stat.st_mtime_ns, stat.st_size)
+                )
+    content = json.dumps({"config": suite_config, "files": files}, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class CollectionCache:
+    """On-disk cache of the test cases collected from each test suite."""
+
+    def __init__(self, path: PathType) -> None:
+        """Load the cache, an unreadable cache is started over.
+
+        :param path: JSON file of the cache
+        """
+        self.path = Path(path)
+        self.suites: Dict[str, Dict[str, Any]] = {}
+        self.modified = False
+        if self.path.is_file():
+            try:
+                content = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                log.warning(f"collection cache {self.path} could not be read, starting a new one")
+                return
+            if content.get("version") == CACHE_VERSION:
+                self.suites = content["suites"]
+
+    @staticmethod
+    def _get_key(suite_config: SuiteConfig) -> str:
+        """Get the cache key of a test suite."""
+        return f'{Path(suite_config["suite_dir"]).resolve()}::{suite_config["test_filter_pattern"]}'
+
+    def get(self, suite_config: SuiteConfig) -> Optional[List[CachedTest]]:
+        """Get the cached test cases of a test suite.
+
+        :param suite_config: test suite configuration
+
+        :return: the cached test cases, None if the test suite is not
+            cached or changed since it was cached
+        """
+        entry = self.suites.get(self._get_key(suite_config))
+        if entry is None or entry["fingerprint"] != get_suite_fingerprint(suite_config):
+            return None
+        return [CachedTest(**test) for test in entry["tests"]]
+
+    def put(self, suite_config: SuiteConfig, tests: Iterable[unittest.TestCase]) -> None:
+        """Store the test cases collected from a test suite.
+
+        :param suite_config: test suite configuration
+        :param tests: collected test cases
+        """
+        key = self._get_key(suite_config)
+        entry = {
+            "fingerprint": get_suite_fingerprint(suite_config),
+            "tests": [asdict(CachedTest.from_test(test)) for test in tests],
+        }
+        if self.suites.get(key) != entry:
+            self.suites[key] = entry
+            self.modified = True
+
+    def save(self) -> None:
+        """Write the cache to its file if it was modified, replacing it
+        atomically."""
+        if not self.modified:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps({"version": CACHE_VERSION, "suites": self.suites}))
+        os.replace(tmp_path, self.path)
+        self.modified = False
+
+
+def get_cached_tests(suite_list: List[SuiteConfig], cache: CollectionCache) -> Optional[List[CachedTest]]:
+    """Get the cached test cases of all test suites.
+
+    :param suite_list: configuration of the test suites
+    :param cache: collection cache
+
+    :return: the cached test cases, None if any test suite has to be
+        collected again
+    """
+    cached_tests = []
+    for suite_config in suite_list:
+        suite_tests = cache.get(suite_config)
+        if suite_tests is None:
+            log.internal_debug(f"test suite {suite_config['suite_dir']} not cached or changed")
+            return None
+        cached_tests.extend(suite_tests)
+    return cached_tests
@@ -0,0 +1,489 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Parallel execution of test suites
+*********************************
+
+:module: parallel_execution
+
+:synopsis: Run the test suites bound to disjoint auxiliaries in parallel
+    worker processes.
+
+The auxiliaries used by each test suite are found by looking for the
+``pykiso.auxiliaries`` imports in its python files, without importing
+them. Test suites sharing an auxiliary or a connector (directly, or
+because their auxiliaries share a communication channel) are grouped
+together and run one after another. Each group is run in its own worker
+process, with a :py:class:`~pykiso.test_setup.config_registry.ConfigRegistry`
+only providing the auxiliaries and connectors the group needs.
+
+The output of each group is shown once the group is over, the junit
+reports and the step report of all groups are merged into a single one.
+
+.. note:: auxiliaries only retrieved at runtime (e.g. with
+    :py:meth:`~pykiso.test_setup.config_registry.ConfigRegistry.get_aux_by_alias`)
+    are not detected, such auxiliaries have to be imported from
+    ``pykiso.auxiliaries`` in the test suite. A test suite importing
+    ``from pykiso.auxiliaries import *`` requires all auxiliaries and is
+    therefore never run in parallel to another test suite.
+
+.. currentmodule:: parallel_execution
+
+"""
+from __future__ import annotations
+
+import ast
+import copy
+import functools
+import io
+import json
+import logging
+import multiprocessing
+import operator
+import sys
+import tempfile
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
+
+from junitparser.cli import merge as merge_junit_xml
+
+from ..logging_initializer import LogOptions, get_logging_options, initialize_logging
+from ..test_result import assert_step_report
+from ..test_result.assert_step_report import update_step_report, write_step_report
+from ..test_result.text_result import ResultStream
+from ..test_setup.config_registry import ConfigRegistry
+from . import test_suite
+from .test_execution import (
+    ExitCode,
+    TestFilterPattern,
+    check_tag_names,
+    collect_tests,
+    failure_and_error_handling,
+    handle_execution_error,
+    run_tests,
+    select_test_suites,
+)
+from .test_scheduling import TestOrder
+
+if TYPE_CHECKING:
+    from ..types import AuxiliaryAlias, ConfigDict, SuiteConfig
+    from .tag_index import TagExpression
+    from .test_scheduling import RunHistory
+    from .test_sharding import TestShard
+
+log = logging.getLogger(__name__)
+
+AUXILIARIES_PACKAGE = "pykiso.auxiliaries"
+
+#: imported name standing for all auxiliaries
+ALL_AUXILIARIES = "*"
+
+
+@dataclass
+class SuiteGroup:
+    """Test suites run one after another in the same worker process."""
+
+    suites: List[SuiteConfig]
+    auxiliaries: Set[AuxiliaryAlias]
+
+
+@dataclass
+class GroupResult:
+    """Picklable result of a group of test suites."""
+
+    exit_code: int
+    output: str = ""
+    tests_run: int = 0
+    failures: int = 0
+    errors: int = 0
+    test_tags: Set[str] = field(default_factory=set)
+    history_records: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    step_report: Dict[str, Any] = field(default_factory=dict)
+    junit_report: Optional[str] = None
+
+
+def find_imported_auxiliaries(suite: SuiteConfig) -> Set[AuxiliaryAlias]:
+    """Find the auxiliaries imported by the python files of a test suite.
+
+    :param suite: test suite configuration
+
+    :return: aliases of the auxiliaries imported from ``pykiso.auxiliaries``,
+        containing :py:data:`ALL_AUXILIARIES` for a wildcard import
+    """
+    auxiliaries = set()
+    for python_file in Path(suite["suite_dir"]).glob("**/*.py"):
+        try:
+            tree = ast.parse(python_file.read_bytes(), str(python_file))
+        except (OSError, SyntaxError, ValueError):
+            # reported by the test collection if it is a test file
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module == AUXILIARIES_PACKAGE:
+                auxiliaries.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and (node.module or "").startswith(f"{AUXILIARIES_PACKAGE}."):
+                auxiliaries.add(node.module.split(".")[2])
+            elif isinstance(node, ast.Import):
+                auxiliaries.update(
+                    alias.name.split(".")[2] for alias in node.names if alias.name.startswith(f"{AUXILIARIES_PACKAGE}.")
+                )
+    return auxiliaries
+
+
+def _get_required_auxiliaries(config: ConfigDict, auxiliaries: Set[AuxiliaryAlias]) -> Set[AuxiliaryAlias]:
+    """Add the auxiliaries linked to the given ones through a proxy
+    auxiliary configuration.
+
+    :param config: dict from converted YAML config file
+    :param auxiliaries: aliases of the imported auxiliaries
+
+    :return: aliases of all auxiliaries to provide
+    """
+    aux_configs = config["auxiliaries"]
+    if ALL_AUXILIARIES in auxiliaries:
+        return set(aux_configs)
+    required = {alias for alias in auxiliaries if alias in aux_configs}
+    while True:
+        linked = set()
+        for alias, aux_config in aux_configs.items():
+            aux_list = set((aux_config.get("config") or {}).get("aux_list") or [])
+            if alias in required:
+                linked |= aux_list & aux_configs.keys()
+            elif aux_list & required:
+                linked.add(alias)
+        if linked <= required:
+            return required
+        required |= linked
+
+
+def _get_connectors(config: ConfigDict, auxiliaries: Set[AuxiliaryAlias]) -> Set[str]:
+    """Get the connectors attached to the given auxiliaries.
+
+    :param config: dict from converted YAML config file
+    :param auxiliaries: aliases of the auxiliaries
+
+    :return: aliases of the connectors
+    """
+    return {
+        connector
+        for alias in auxiliaries
+        for connector in (config["auxiliaries"][alias].get("connectors") or {}).values()
+    }
+
+
+def group_test_suites(config: ConfigDict, suites: List[SuiteConfig]) -> List[SuiteGroup]:
+    """Group the test suites sharing an auxiliary or a connector.
+
+    :param config: dict from converted YAML config file
+    :param suites: configuration of the test suites to run
+
+    :return: the groups of test suites, in the configuration order
+    """
+    auxiliaries = []
+    for suite in suites:
+        imported = find_imported_auxiliaries(suite)
+        if ALL_AUXILIARIES in imported:
+            log.warning(
+                f"test suite {suite['suite_dir']} imports all auxiliaries with 'from {AUXILIARIES_PACKAGE} import *', "
+                "it will not run in parallel to other test suites"
+            )
+        auxiliaries.append(_get_required_auxiliaries(config, imported))
+    resources = [
+        {f"aux:{alias}" for alias in suite_auxes} | {f"con:{con}" for con in _get_connectors(config, suite_auxes)}
+        for suite_auxes in auxiliaries
+    ]
+    # union-find over the suite indexes
+    parents = list(range(len(suites)))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    owners: Dict[str, int] = {}
+    for index, suite_resources in enumerate(resources):
+        for resource in suite_resources:
+            if resource in owners:
+                parents[find(index)] = find(owners[resource])
+            else:
+                owners[resource] = index
+
+    groups: Dict[int, SuiteGroup] = {}
+    for index, suite in enumerate(suites):
+        group = groups.setdefault(find(index), SuiteGroup([], set()))
+        group.suites.append(suite)
+        group.auxiliaries |= auxiliaries[index]
+    return list(groups.values())
+
+
+def make_group_config(config: ConfigDict, group: SuiteGroup) -> ConfigDict:
+    """Create the configuration of a worker, only containing the test
+    suites of a group and the auxiliaries and connectors they need.
+
+    :param config: dict from converted YAML config file
+    :param group: group of test suites run by the worker
+
+    :return: the worker configuration
+    """
+    connectors = _get_connectors(config, group.auxiliaries)
+    group_config = {
+        key: copy.deepcopy(value)
+        for key, value in config.items()
+        if key not in ("auxiliaries", "connectors", "test_suite_list")
+    }
+    group_config["auxiliaries"] = {
+        alias: copy.deepcopy(aux_config)
+        for alias, aux_config in config["auxiliaries"].items()
+        if alias in group.auxiliaries
+    }
+    group_config["connectors"] = {
+        alias: copy.deepcopy(con_config) for alias, con_config in config["connectors"].items() if alias in connectors
+    }
+    group_config["test_suite_list"] = copy.deepcopy(group.suites)
+    return group_config
+
+
+def combine_exit_codes(exit_codes: Iterable[int]) -> ExitCode:
+    """Combine the exit codes of the workers.
+
+    :param exit_codes: exit code of each worker
+
+    :return: the most severe exit code that is not related to the test
+        results if any, otherwise the exit code combining the failures
+        and errors of all workers
+    """
+    exit_codes = list(exit_codes)
+    other_codes = [
+        code for code in exit_codes if code > ExitCode.ONE_OR_MORE_TESTS_FAILED_AND_RAISED_UNEXPECTED_EXCEPTION
+    ]
+    if other_codes:
+        return ExitCode(max(other_codes))
+    # failed and raised exit codes are bit flags
+    return ExitCode(functools.reduce(operator.or_, exit_codes, ExitCode.ALL_TESTS_SUCCEEDED))
+
+
+def run_suite_group(
+    group_config: ConfigDict,
+    test_file_pattern: TestFilterPattern,
+    report_type: str,
+    user_tags: Optional[Dict[str, List[str]]],
+    step_report: Optional[Path],
+    failfast: bool,
+    junit_report_path: Optional[str],
+    log_options: Optional[LogOptions],
+    shard: Optional[TestShard] = None,
+    test_order: TestOrder = TestOrder.DISCOVERY,
+    history: Optional[RunHistory] = None,
+    tag_expression: Optional[TagExpression] = None,
+) -> GroupResult:
+    """Run a group of test suites, executed in a worker process.
+
+    :param group_config: worker configuration
+    :param test_file_pattern: test selection pattern from the CLI
+    :param report_type: str to set the type of report wanted, i.e. test
+        or junit
+    :param user_tags: test case tags to execute
+    :param step_report: file path for the step report or None
+    :param failfast: stop the test run on the first error or failure
+    :param junit_report_path: junit report file path of the worker
+    :param log_options: logging options of the main process
+    :param shard: only run the test cases of this shard, partitioned by
+        test ID
+    :param test_order: order of the test cases of the group
+    :param history: history of the previous runs, the records of the
+        test cases run by the group are returned
+    :param tag_expression: boolean expression the tags of the test cases
+        to run have to match
+
+    :return: the result of the group
+    """
+    output = io.StringIO()
+    sys.stdout = sys.stderr = output
+    if log_options is None:
+        log_options = LogOptions(None, "INFO", report_type, False)
+    initialize_logging(None, log_options.log_level, log_options.verbose, report_type)
+    # the worker process can run several groups one after another
+    assert_step_report.ALL_STEP_REPORT.clear()
+
+    result = GroupResult(ExitCode.ALL_TESTS_SUCCEEDED, junit_report=junit_report_path)
+    try:
+        with ConfigRegistry.provide_auxiliaries(group_config):
+            all_tests_to_run = collect_tests(
+                group_config,
+                test_file_pattern,
+                user_tags,
+                step_report,
+                check_tags=False,
+                shard=shard,
+                test_order=test_order,
+                history=history,
+                tag_expression=tag_expression,
+            )
+            # the test suites drop their tests once run
+            tests = list(test_suite.flatten(all_tests_to_run))
+            test_result = run_tests(all_tests_to_run, report_type, output, failfast, junit_report_path)
+        result.test_tags = {tag for tc in tests for tag in getattr(tc, "tag", None) or {}}
+        if history is not None:
+            result.history_records = history.update(tests, test_result)
+        result.tests_run = test_result.testsRun
+        result.failures = len(test_result.failures)
+        result.errors = len(test_result.errors)
+        if step_report is not None:
+            update_step_report(test_result)
+            # only keep picklable values, the step report renders them as strings anyway
+            result.step_report = json.loads(json.dumps(assert_step_report.ALL_STEP_REPORT, default=str))
+        result.exit_code = failure_and_error_handling(test_result)
+    except (Exception, KeyboardInterrupt) as e:
+        result.exit_code = handle_execution_error(e, group_config)
+    result.output = output.getvalue()
+    return result
+
+
+def execute_parallel(
+    config: ConfigDict,
+    test_file_pattern: TestFilterPattern,
+    workers: int,
+    report_type: str = "text",
+    user_tags: Optional[Dict[str, List[str]]] = None,
+    step_report: Optional[Path] = None,
+    failfast: bool = False,
+    junit_report_path: Optional[str] = None,
+    step_report_streaming: bool = False,
+    step_report_export: Optional[Path] = None,
+    shard: Optional[TestShard] = None,
+    test_order: TestOrder = TestOrder.DISCOVERY,
+    history: Optional[RunHistory] = None,
+    tag_expression: Optional[TagExpression] = None,
+) -> ExitCode:
+    """Run the test suites in parallel worker processes and merge their
+    results.
+
+    The auxiliaries must not be registered in the calling process.
+
+    :param config: dict from converted YAML config file
+    :param test_file_pattern: test selection pattern from the CLI
+    :param workers: maximum number of worker processes
+    :param report_type: str to set the type of report wanted, i.e. test
+        or junit
+    :param user_tags: test case tags to execute
+    :param step_report: file path for the step report or None
+    :param failfast: stop the test run on the first error or failure,
+        the groups already running are completed
+    :param junit_report_path: junit report file path, only used for
+        junit reports
+    :param step_report_streaming: not supported, the step report is
+        rendered at the end of the test run
+    :param step_report_export: file path of the structured step report
+        export or None
+    :param shard: only run the test cases of this shard, only the
+        partition by test ID is supported as each worker only collects
+        the test cases of its group
+    :param test_order: order of the test cases within each group
+    :param history: history of the previous runs, updated and saved
+        with the results of all groups
+    :param tag_expression: boolean expression the tags of the test cases
+        to run have to match
+
+    :raises ValueError: if the shard is partitioned by duration
+    :raises NameError: if a provided tag name is not defined in any test
+        case
+    :raises pykiso.TestCollectionError: if none of the configured test
+        suites contains a test file to run
+
+    :return: the exit code combining the results of all groups
+    """
+    if shard is not None and shard.timings is not None:
+        raise ValueError("duration-weighted sharding is not supported with parallel workers")
+    suites = select_test_suites(config["test_suite_list"], test_file_pattern.test_file)
+    groups = group_test_suites(config, suites)
+    if step_report_streaming:
+        log.warning("streaming step report not supported with parallel workers, rendering it at the end")
+    log.internal_info(f"running {len(groups)} group(s) of test suites in up to {workers} worker processes")
+
+    # groups cancelled by failfast keep no result
+    results: List[Optional[GroupResult]] = [None for _ in groups]
+    start_time = time.perf_counter()
+    log_options = get_logging_options()
+    log_file_path = log_options.log_path if log_options is not None else None
+    with tempfile.TemporaryDirectory(prefix="pykiso_workers_") as tmp_dir, ResultStream(log_file_path) as stream:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(groups)), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures: Dict[Future, int] = {}
+            for index, group in enumerate(groups):
+                group_junit_path = str(Path(tmp_dir) / f"group_{index}.xml") if junit_report_path else None
+                future = executor.submit(
+                    run_suite_group,
+                    make_group_config(config, group),
+                    test_file_pattern,
+                    report_type,
+                    user_tags,
+                    step_report,
+                    failfast,
+                    group_junit_path,
+                    log_options,
+                    shard,
+                    test_order,
+                    history,
+                    tag_expression,
+                )
+                futures[future] = index
+            for future in as_completed(futures):
+                index = futures[future]
+                if future.cancelled():
+                    continue
+                try:
+                    results[index] = future.result()
+                except Exception:
+                    log.exception(f"worker running the test suites {groups[index].suites} crashed")
+                    results[index] = GroupResult(ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION)
+                    continue
+                stream.write(results[index].output)
+                stream.flush()
+                if failfast and results[index].exit_code != ExitCode.ALL_TESTS_SUCCEEDED:
+                    for pending in futures:
+                        pending.cancel()
+
+        cancelled = results.count(None)
+        results = [result for result in results if result is not None]
+        tests_run = sum(result.tests_run for result in results)
+        failures = sum(result.failures for result in results)
+        errors = sum(result.errors for result in results)
+        stream.write(
+            f"\nRan {tests_run} tests in {len(groups)} parallel group(s) in {time.perf_counter() - start_time:.3f}s\n"
+        )
+        if cancelled:
+            stream.write(f"{cancelled} group(s) not run after a failure (failfast)\n")
+        stream.write(f"FAILED (failures={failures}, errors={errors})\n" if failures or errors else "OK\n")
+
+        if junit_report_path is not None:
+            junit_reports = [result.junit_report for result in results if result.junit_report]
+            junit_reports = [path for path in junit_reports if Path(path).is_file()]
+            if junit_reports:
+                merge_junit_xml(junit_reports, junit_report_path, None)
+
+        if step_report is not None:
+            stream.write("Generating HTML reports...\n")
+            assert_step_report.ALL_STEP_REPORT.clear()
+            for result in results:
+                assert_step_report.ALL_STEP_REPORT.update(result.step_report)
+            write_step_report(step_report, step_report_export)
+
+    if history is not None:
+        for result in results:
+            history.records.update(result.history_records)
+        history.save()
+
+    if user_tags or tag_expression is not None:
+        check_tag_names(user_tags or {}, set().union(*(result.test_tags for result in results)), tag_expression)
+    return combine_exit_codes(result.exit_code for result in results)
@@ -0,0 +1,231 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Test tag index
+**************
+
+:module: tag_index
+
+:synopsis: Index the test cases by tag name and value to select them with
+    set operations, from the CLI tags or from a boolean tag expression.
+
+The index is built once per collection. A selection then only combines
+the sets of test IDs of the requested tags instead of evaluating every
+test case against every provided tag.
+
+A tag expression combines ``name=value`` terms with ``and``, ``or``,
+``not`` and parentheses, ``not`` binding tighter than ``and`` and
+``and`` tighter than ``or``:
+
+.. code:: bash
+
+    variant=variant1,variant2 and not (branch_level=nightly or slow)
+
+* ``name=value1,value2`` matches the test cases whose tag ``name``
+  contains any of the values
+* ``name`` matches the test cases defining the tag ``name``
+
+As for the CLI tags, the tag names are compared without their dashes and
+underscores and the test cases without any tag are never filtered out.
+
+.. currentmodule:: tag_index
+
+"""
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+#: tokens of a tag expression: parentheses, operators and words
+_TOKEN_PATTERN = re.compile(r"\s*(?:(\(|\)|=)|([^\s()=]+))")
+
+_KEYWORDS = ("and", "or", "not")
+
+
+def format_tag_name(name: str) -> str:
+    """Remove any dash or underscore from a tag name.
+
+    :param name: tag name as defined in a test case or on the CLI
+
+    :return: the name used to compare the tags
+    """
+    return name.replace("_", "").replace("-", "")
+
+
+class TagIndex:
+    """Inverted index of the test IDs by tag name and by tag value."""
+
+    def __init__(self, tests: Iterable[Tuple[str, Optional[Dict[str, List[str]]]]]) -> None:
+        """Index the test cases.
+
+        :param tests: ID and tags of each test case, with formatted tag
+            names
+        """
+        #: IDs of all indexed test cases
+        self.test_ids: Set[str] = set()
+        #: IDs of the test cases defining tags
+        self.tagged: Set[str] = set()
+        #: IDs of the test cases by tag name
+        self.names: Dict[str, Set[str]] = defaultdict(set)
+        #: IDs of the test cases by tag name and tag value
+        self.values: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        for test_id, tags in tests:
+            self.test_ids.add(test_id)
+            if tags is None:
+                continue
+            self.tagged.add(test_id)
+            for name, values in tags.items():
+                self.names[name].add(test_id)
+                for value in values:
+                    self.values[name, value].add(test_id)
+
+    def get_skip_reasons(self, usr_tags: Dict[str, Union[str, List[str]]]) -> Dict[str, str]:
+        """Select the test cases matching all provided tags.
+
+        A test case is skipped if it defines tags but not one of the
+        provided tag names, or none of the provided values of a tag.
+
+        :param usr_tags: provided values of each tag, with formatted
+            names
+
+        :return: the reason to skip each test ID to skip
+        """
+        reasons = {}
+        for name, usr_values in usr_tags.items():
+            usr_values = usr_values if isinstance(usr_values, list) else [usr_values]
+            defined = self.names.get(name, set())
+            for test_id in self.tagged - defined:
+                reasons.setdefault(test_id, f"provided tag {name!r} not present in test tags")
+            matching = set().union(*(self.values.get((name, value), set()) for value in usr_values))
+            for test_id in defined - matching:
+                reasons.setdefault(test_id, f"non-matching value for tag {name!r}")
+        return reasons
+
+
+class TagExpression:
+    """Boolean expression over the test tags."""
+
+    def __init__(self, text: str) -> None:
+        """Parse a tag expression.
+
+        :param text: tag expression, see the module documentation
+
+        :raises ValueError: if the expression is invalid
+        """
+        self.text = text
+        #: names of the tags used in the expression, formatted
+        self.tag_names: Set[str] = set()
+        self._tokens = self._tokenize(text)
+        self._position = 0
+        self._tree = self._parse_or()
+        if self._peek() is not None:
+            raise ValueError(f"unexpected {self._peek()!r} in tag expression {text!r}")
+        del self._tokens
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.text!r})"
+
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        """Split a tag expression in tokens.
+
+        :param text: tag expression
+
+        :return: the tokens of the expression
+        """
+        tokens, position = [], 0
+        text = text.rstrip()
+        while position < len(text):
+            match = _TOKEN_PATTERN.match(text, position)
+            tokens.append(match.group(1) or match.group(2))
+            position = match.end()
+        return tokens
+
+    def _peek(self) -> Optional[str]:
+        """Get the next token without consuming it."""
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _next(self) -> str:
+        """Consume the next token.
+
+        :raises ValueError: if the expression ended
+        """
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"unexpected end of tag expression {self.text!r}")
+        self._position += 1
+        return token
+
+    def _parse_or(self) -> tuple:
+        """Parse ``and_expression ("or" and_expression)*``."""
+        operands = [self._parse_and()]
+        while self._peek() == "or":
+            self._next()
+            operands.append(self._parse_and())
+        return operands[0] if len(operands) == 1 else ("or", operands)
+
+    def _parse_and(self) -> tuple:
+        """Parse ``not_expression ("and" not_expression)*``."""
+        operands = [self._parse_not()]
+        while self._peek() == "and":
+            self._next()
+            operands.append(self._parse_not())
+        return operands[0] if len(operands) == 1 else ("and", operands)
+
+    def _parse_not(self) -> tuple:
+        """Parse ``"not" not_expression | "(" or_expression ")" | term``."""
+        token = self._next()
+        if token == "not":
+            return ("not", self._parse_not())
+        if token == "(":
+            tree = self._parse_or()
+            if self._next() != ")":
+                raise ValueError(f"missing ')' in tag expression {self.text!r}")
+            return tree
+        if token in _KEYWORDS or token in (")", "="):
+            raise ValueError(f"unexpected {token!r} in tag expression {self.text!r}")
+        name = format_tag_name(token)
+        self.tag_names.add(name)
+        if self._peek() != "=":
+            return ("name", name)
+        self._next()
+        values = self._next()
+        if values in _KEYWORDS or values in ("(", ")", "="):
+            raise ValueError(f"missing value of tag {token!r} in tag expression {self.text!r}")
+        return ("values", name, values.split(","))
+
+    def evaluate(self, index: TagIndex) -> Set[str]:
+        """Select the test cases matching the expression.
+
+        :param index: index of the test cases
+
+        :return: IDs of the matching test cases, including the test cases
+            without any tag
+        """
+        return self._evaluate(self._tree, index) | (index.test_ids - index.tagged)
+
+    def _evaluate(self, tree: tuple, index: TagIndex) -> Set[str]:
+        """Evaluate a node of the expression on the tagged test cases.
+
+        :param tree: node of the expression
+        :param index: index of the test cases
+
+        :return: IDs of the matching tagged test cases
+        """
+        kind = tree[0]
+        if kind == "name":
+            return index.names.get(tree[1], set())
+        if kind == "values":
+            return set().union(*(index.values.get((tree[1], value), set()) for value in tree[2]))
+        if kind == "not":
+            return index.tagged - self._evaluate(tree[1], index)
+        operands = [self._evaluate(operand, index) for operand in tree[1]]
+        return set.intersection(*operands) if kind == "and" else set.union(*operands)
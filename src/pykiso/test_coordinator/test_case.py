@@ -28,9 +28,6 @@ import unittest
 import warnings
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
 
-import lxml
-import lxml.etree
-
 import pykiso.test_result.assert_step_report as step_report
 
 from .. import message
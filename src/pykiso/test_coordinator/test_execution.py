@@ -27,7 +27,7 @@ from __future__ import annotations
 
 import functools
 import os
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, TextIO, Union
 from unittest import util
 from unittest.loader import VALID_MODULE_NAME
 
@@ -36,8 +36,9 @@ from pykiso.test_result.multi_result import MultiTestResult
 if TYPE_CHECKING:
     from ..lib.connectors.cc_pcan_can import CCPCanCan
     from ..lib.connectors.cc_socket_can.cc_socket_can import CCSocketCan
-    from ..types import ConfigDict, SuiteConfig
+    from ..types import ConfigDict, PathType, SuiteConfig
     from .test_case import BasicTest
+    from .test_sharding import TestShard
 
 import enum
 import logging
@@ -56,9 +57,14 @@ import pykiso
 from ..exceptions import AuxiliaryCreationError, TestCollectionError
 from ..logging_initializer import get_logging_options
 from ..test_result.assert_step_report import StepReportData, assert_decorator, generate_step_report
+from ..test_result.step_report_journal import start_streaming_step_report
 from ..test_result.text_result import BannerTestResult, ResultStream
 from ..test_result.xml_result import XmlTestResult
 from . import test_suite
+from .collection_cache import CollectionCache, get_cached_tests
+from .tag_index import TagExpression, TagIndex, format_tag_name
+from .test_scheduling import RunHistory, TestOrder, order_tests
+from .test_sharding import apply_shard
 
 log = logging.getLogger(__name__)
 
@@ -93,78 +99,126 @@ def create_test_suite(
     )
 
 
-def apply_tag_filter(all_tests_to_run: unittest.TestSuite, usr_tags: Dict[str, List[str]]) -> None:
+def _format_tag_names(tags: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Remove any comma or underscore from the provided dict's keys."""
+    return {format_tag_name(name): value for name, value in tags.items()}
+
+
+def apply_tag_filter(
+    all_tests_to_run: unittest.TestSuite,
+    usr_tags: Dict[str, List[str]],
+    check_tags: bool = True,
+    tag_expression: Optional[TagExpression] = None,
+) -> Set[str]:
     """Filter the test cases based on user tags provided via CLI.
 
+    The test cases are indexed by tag once, the test cases to skip are
+    then selected with set operations, see
+    :py:mod:`~pykiso.test_coordinator.tag_index`.
+
     :param all_tests_to_run: a dict containing all testsuites and testcases
     :param usr_tags: encapsulate user's variant choices
-    """
+    :param check_tags: raise if a provided tag name is not defined in
+        any test case
+    :param tag_expression: boolean expression the tags of the test
+        cases to run have to match
 
-    def format_tag_names(tags: Dict[str, List[str]]) -> Dict[str, List[str]]:
-        """Remove any comma or underscore from the provided dict's keys."""
-        for char in ["_", "-"]:
-            tags = {name.replace(char, ""): value for name, value in tags.items()}
-        return tags
+    :raises NameError: if a provided tag name is not defined in any test
+        case and check_tags is True
 
-    def should_skip(test_case: BasicTest) -> bool:
-        """Check if test shall be skipped by evaluating the test case tag
-        attribute.
+    :return: the tag names defined in the test cases
+    """
+    # collect and reformat all CLI and test case tag names
+    usr_tags = _format_tag_names(usr_tags)
 
-        :param test_case: test_case to check
-        :return: True if test shall be skipped else False
-        """
-        if test_case.tag is None:
-            return False
+    # the test cases of a test class share the same tags, only format them once
+    formatted_tags = {}
+    indexed_tests = []
+    for tc in test_suite.flatten(all_tests_to_run):
+        tags = getattr(tc, "tag", None)
+        if tags is not None:
+            if id(tags) not in formatted_tags:
+                formatted_tags[id(tags)] = (tags, _format_tag_names(tags))
+            tc.tag = formatted_tags[id(tags)][1]
+        indexed_tests.append((tc.id(), tc.tag if tags is not None else None))
+    index = TagIndex(indexed_tests)
 
-        # Skip only the test cases that have a matching tag name but no matching tag value
-        for cli_tag_id, cli_tag_value in usr_tags.items():
-            # skip any test case that doesn't define a CLI-provided tag name
-            if cli_tag_id not in test_case.tag.keys():
-                test_case._skip_msg = f"provided tag {cli_tag_id!r} not present in test tags"
-                return True
-            # skip any test case that which tag value don't match the provided tag's value
-            cli_tag_values = cli_tag_value if isinstance(cli_tag_value, list) else [cli_tag_value]
-            if not any(cli_val in test_case.tag[cli_tag_id] for cli_val in cli_tag_values):
-                test_case._skip_msg = f"non-matching value for tag {cli_tag_id!r}"
-                return True
+    # skip the tests according to the provided CLI tags and the defined test tags
+    skip_reasons = index.get_skip_reasons(usr_tags)
+    if tag_expression is not None:
+        for test_id in index.test_ids - tag_expression.evaluate(index):
+            skip_reasons.setdefault(test_id, f"tag expression {tag_expression.text!r} not matched")
 
-        return False
+    for tc in test_suite.flatten(all_tests_to_run):
+        skip_msg = skip_reasons.get(tc.id())
+        if skip_msg is not None:
+            tc._skip_msg = skip_msg
+            unittest.skip(skip_msg)(tc.__class__)
 
-    def set_skipped(test_case: BasicTest) -> BasicTest:
-        """Set testcase to skipped.
+    # verify that each provided tag name is defined in at least one test case
+    all_test_tags = set(index.names)
+    if check_tags:
+        check_tag_names(usr_tags, all_test_tags, tag_expression)
+    return all_test_tags
 
-        :param test_case: testcase to be skipped
-        :return: the skipped testcase as a new instance of the provided
-            TestCase subclass.
-        """
-        if should_skip(test_case):
-            skipped_test_cls = unittest.skip(test_case._skip_msg)(test_case.__class__)
-            return skipped_test_cls()
-        return test_case
 
-    # collect and reformat all CLI and test case tag names
-    usr_tags = format_tag_names(usr_tags)
+def check_tag_names(
+    usr_tags: Dict[str, List[str]], test_tags: Set[str], tag_expression: Optional[TagExpression] = None
+) -> None:
+    """Verify that each provided tag name is defined in at least one test
+    case.
 
-    all_test_tags = []
-    for tc in test_suite.flatten(all_tests_to_run):
-        if getattr(tc, "tag", None) is None:
-            continue
-        tc.tag = format_tag_names(tc.tag)
-        all_test_tags.extend(tc.tag.keys())
-
-    # skip the tests according to the provided CLI tags and the defined test tags
-    list(map(set_skipped, test_suite.flatten(all_tests_to_run)))
+    :param usr_tags: encapsulate user's variant choices
+    :param test_tags: tag names defined in the test cases
+    :param tag_expression: tag expression whose tag names are verified
+        as well
 
-    # verify that each provided tag name is defined in at least one test case
-    all_test_tags = set(all_test_tags)
-    for tag_name in usr_tags:
-        if tag_name not in all_test_tags:
+    :raises NameError: if a provided tag name is not defined in any test
+        case
+    """
+    tag_names = list(_format_tag_names(usr_tags))
+    if tag_expression is not None:
+        tag_names.extend(sorted(tag_expression.tag_names))
+    for tag_name in tag_names:
+        if tag_name not in test_tags:
             raise NameError(
                 f"Provided tag {tag_name!r} is not defined in any testcase.",
                 tag_name,
             )
 
 
+def check_cached_tag_names(
+    config: ConfigDict,
+    test_file_pattern: TestFilterPattern,
+    usr_tags: Dict[str, List[str]],
+    cache: CollectionCache,
+    tag_expression: Optional[TagExpression] = None,
+) -> bool:
+    """Verify the provided tag names against the cached test cases,
+    before importing any test module.
+
+    :param config: dict from converted YAML config file
+    :param test_file_pattern: test selection pattern from the CLI
+    :param usr_tags: encapsulate user's variant choices
+    :param cache: collection cache
+    :param tag_expression: tag expression whose tag names are verified
+        as well
+
+    :raises NameError: if a provided tag name is not defined in any
+        cached test case
+
+    :return: True if all test suites were cached and the tag names could
+        be verified
+    """
+    suites = select_test_suites(config["test_suite_list"], test_file_pattern.test_file)
+    cached_tests = get_cached_tests(suites, cache)
+    if cached_tests is None:
+        return False
+    test_tags = {tag_name for test in cached_tests for tag_name in _format_tag_names(test.tag or {})}
+    check_tag_names(usr_tags, test_tags, tag_expression)
+    return True
+
+
 def apply_test_case_filter(
     all_tests_to_run: unittest.TestSuite,
     test_class_pattern: str,
@@ -218,14 +272,21 @@ def failure_and_error_handling(result: unittest.TestResult) -> int:
     return exit_code
 
 
-def enable_step_report(all_tests_to_run: unittest.suite.TestSuite, step_report: Path) -> None:
+def enable_step_report(
+    all_tests_to_run: unittest.suite.TestSuite, step_report: Path, step_report_streaming: bool = False
+) -> None:
     """Decorate all assert method from Test-Case.
 
     This will allow to save the assert inputs in
     order to generate the HTML step report.
 
     :param all_tests_to_run: a dict containing all testsuites and testcases
+    :param step_report: file path for the step report or None
+    :param step_report_streaming: write the steps to a journal as they
+        happen and render one page per test class
     """
+    if step_report is not None and step_report_streaming:
+        start_streaming_step_report(step_report)
 
     # Step report header fed during test
     base_suite = test_suite.flatten(all_tests_to_run)
@@ -350,23 +411,23 @@ def filter_test_modules_by_suite(
     return filtered_data
 
 
-def collect_test_suites(
+def select_test_suites(
     config_test_suite_list: List[SuiteConfig],
     test_filter_pattern: Optional[str] = None,
-) -> List[test_suite.BasicTestSuite]:
-    """Collect and load all test suites defined in the test configuration.
+) -> List[SuiteConfig]:
+    """Select the test suites of the test configuration containing
+    test files to run.
 
     :param config_test_suite_list: list of dictionaries from the configuration
         file corresponding each to one test suite.
     :param test_filter_pattern: optional filter pattern to overwrite
         the one defined in the test suite configuration.
 
-    :raises pykiso.TestCollectionError: if any test case inside one of
-        the configured test suites failed to be loaded.
+    :raises pykiso.TestCollectionError: if none of the configured test
+        suites contains a test file to run.
 
-    :return: a list of all loaded test suites.
+    :return: the configuration of the selected test suites.
     """
-    list_of_test_suites = []
     valid_test_modules = []
 
     for test_suite_configuration in config_test_suite_list:
@@ -384,13 +445,37 @@ def collect_test_suites(
 
     if not valid_test_modules:
         raise TestCollectionError([test_suite_config["suite_dir"] for test_suite_config in config_test_suite_list])
+    return valid_test_modules
+
+
+def collect_test_suites(
+    config_test_suite_list: List[SuiteConfig],
+    test_filter_pattern: Optional[str] = None,
+    cache: Optional[CollectionCache] = None,
+) -> List[test_suite.BasicTestSuite]:
+    """Collect and load all test suites defined in the test configuration.
+
+    :param config_test_suite_list: list of dictionaries from the configuration
+        file corresponding each to one test suite.
+    :param test_filter_pattern: optional filter pattern to overwrite
+        the one defined in the test suite configuration.
+    :param cache: collection cache updated with the loaded test cases
 
-    for test_suite_configuration in valid_test_modules:
+    :raises pykiso.TestCollectionError: if any test case inside one of
+        the configured test suites failed to be loaded.
+
+    :return: a list of all loaded test suites.
+    """
+    list_of_test_suites = []
+
+    for test_suite_configuration in select_test_suites(config_test_suite_list, test_filter_pattern):
         try:
             current_test_suite = create_test_suite(test_suite_configuration)
             list_of_test_suites.append(current_test_suite)
         except BaseException as e:
             raise TestCollectionError(test_suite_configuration["suite_dir"]) from e
+        if cache is not None:
+            cache.put(test_suite_configuration, test_suite.flatten(current_test_suite))
     return list_of_test_suites
 
 
@@ -406,6 +491,153 @@ def abort(reason: str = None) -> None:
     os.kill(os.getpid(), ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION)
 
 
+def collect_tests(
+    config: ConfigDict,
+    test_file_pattern: TestFilterPattern,
+    user_tags: Optional[Dict[str, List[str]]] = None,
+    step_report: Optional[Path] = None,
+    step_report_streaming: bool = False,
+    check_tags: bool = True,
+    shard: Optional[TestShard] = None,
+    test_order: TestOrder = TestOrder.DISCOVERY,
+    history: Optional[RunHistory] = None,
+    cache: Optional[CollectionCache] = None,
+    tag_expression: Optional[TagExpression] = None,
+) -> unittest.TestSuite:
+    """Collect the tests of the configured test suites, apply the
+    user's tag, test selection and shard filters and order them.
+
+    :param config: dict from converted YAML config file
+    :param test_file_pattern: test selection pattern from the CLI
+    :param user_tags: test case tags to execute
+    :param step_report: file path for the step report or None
+    :param step_report_streaming: write the step report incrementally,
+        one page per test class plus an index
+    :param check_tags: raise if a user tag is not defined in any of the
+        collected test cases
+    :param shard: only keep the test cases of this shard, see
+        :py:mod:`~pykiso.test_coordinator.test_sharding`
+    :param test_order: order of the test cases, see
+        :py:mod:`~pykiso.test_coordinator.test_scheduling`
+    :param history: history of the previous runs the order is based on
+    :param cache: collection cache updated with the collected test cases
+    :param tag_expression: boolean expression the tags of the test cases
+        to run have to match
+
+    :return: the test suite grouping all tests to run
+    """
+    test_suites = collect_test_suites(config["test_suite_list"], test_file_pattern.test_file, cache)
+    if cache is not None:
+        cache.save()
+    test_suites = handle_can_trace_strategy(config, test_suites)
+    # Group all the collected test suites in one global test suite
+    all_tests_to_run = unittest.TestSuite(test_suites)
+
+    # filter test cases based on variant and branch-level options
+    if user_tags or tag_expression is not None:
+        apply_tag_filter(all_tests_to_run, user_tags or {}, check_tags, tag_expression)
+
+    # Enable step report
+    enable_step_report(all_tests_to_run, step_report, step_report_streaming)
+
+    if test_file_pattern.test_class:
+        all_tests_to_run = apply_test_case_filter(
+            all_tests_to_run,
+            test_file_pattern.test_class,
+            test_file_pattern.test_case,
+        )
+
+    if shard is not None:
+        all_tests_to_run = apply_shard(all_tests_to_run, shard)
+
+    if history is not None:
+        all_tests_to_run = order_tests(all_tests_to_run, test_order, history)
+    return all_tests_to_run
+
+
+def get_junit_report_path(junit_path: str, report_name: str) -> str:
+    """Get the path of the junit report and create its folder.
+
+    :param junit_path: path (file or dir) to junit report
+    :param report_name: name of the junit report if junit_path is a dir
+
+    :return: the junit report file path
+    """
+    full_report_path = Path.cwd() / junit_path
+    if full_report_path.suffix == ".xml":
+        junit_report_path = str(full_report_path)
+        full_report_path.parent.mkdir(exist_ok=True)
+    else:
+        junit_report_path = str(full_report_path / Path(time.strftime(f"%Y-%m-%d_%H-%M-%S-{report_name}.xml")))
+        full_report_path.mkdir(exist_ok=True)
+    return junit_report_path
+
+
+def run_tests(
+    all_tests_to_run: unittest.TestSuite,
+    report_type: str,
+    stream: TextIO,
+    failfast: bool = False,
+    junit_report_path: Optional[str] = None,
+) -> unittest.TestResult:
+    """Run the tests with the test runner matching the report type.
+
+    :param all_tests_to_run: tests to run
+    :param report_type: str to set the type of report wanted, i.e. test
+        or junit
+    :param stream: stream the test results are written to
+    :param failfast: stop the test run on the first error or failure.
+    :param junit_report_path: junit report file path, only used for
+        junit reports
+
+    :return: the result of the test run
+    """
+    # TestRunner selection: generate or not a junit report. Start the tests and publish the results
+    if report_type == "junit":
+        with open(junit_report_path, "wb") as junit_output:
+            test_runner = xmlrunner.XMLTestRunner(
+                output=junit_output,
+                resultclass=MultiTestResult(XmlTestResult, BannerTestResult),
+                failfast=failfast,
+                verbosity=0,
+                stream=stream,
+            )
+            return test_runner.run(all_tests_to_run)
+    test_runner = unittest.TextTestRunner(
+        stream=stream,
+        resultclass=MultiTestResult(BannerTestResult),
+        failfast=failfast,
+        verbosity=0,
+    )
+    return test_runner.run(all_tests_to_run)
+
+
+def handle_execution_error(error: BaseException, config: ConfigDict) -> ExitCode:
+    """Log an error that interrupted the test execution.
+
+    Has to be called from the except clause handling the error.
+
+    :param error: raised error
+    :param config: dict from converted YAML config file
+
+    :return: the exit code corresponding to the error
+    """
+    if isinstance(error, NameError):
+        log.exception("Error occurred during tag evaluation.")
+        return ExitCode.BAD_CLI_USAGE
+    if isinstance(error, TestCollectionError):
+        log.exception("Error occurred during test collection.")
+        return ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION
+    if isinstance(error, AuxiliaryCreationError):
+        log.exception("Error occurred during auxiliary creation.")
+        return ExitCode.AUXILIARY_CREATION_FAILED
+    if isinstance(error, KeyboardInterrupt):
+        log.exception("Keyboard Interrupt detected")
+        return ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION
+    log.exception(f'Issue detected in the test-suite: {config["test_suite_list"]}!')
+    return ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION
+
+
 def execute(
     config: ConfigDict,
     report_type: str = "text",
@@ -415,6 +647,14 @@ def execute(
     pattern_inject: Optional[str] = None,
     failfast: bool = False,
     junit_path: str = "reports",
+    step_report_streaming: bool = False,
+    step_report_export: Optional[Path] = None,
+    workers: int = 1,
+    shard: Optional[TestShard] = None,
+    test_order: TestOrder = TestOrder.DISCOVERY,
+    test_history: Optional[PathType] = None,
+    collection_cache: Optional[PathType] = None,
+    tag_expression: Optional[TagExpression] = None,
 ) -> int:
     """Create test environment based on test configuration.
 
@@ -429,82 +669,87 @@ def execute(
         run specific tests.
     :param failfast: stop the test run on the first error or failure.
     :param junit_path: path (file or dir) to junit report
+    :param step_report_streaming: write the step report incrementally,
+        one page per test class plus an index
+    :param step_report_export: file path of the structured step report
+        export or None, its extension selects the format
+    :param workers: number of worker processes running the test suites
+        in parallel, see :py:mod:`~pykiso.test_coordinator.parallel_execution`.
+        The auxiliaries must not be registered by the caller if greater
+        than 1.
+    :param shard: only run the test cases of this shard
+    :param test_order: order of the test cases, based on the run history
+    :param test_history: JSON file recording the duration and outcome
+        of the test cases, updated after the run
+    :param collection_cache: JSON file caching the collected test cases,
+        used to verify the user tags before importing the test modules
+    :param tag_expression: boolean expression the tags of the test cases
+        to run have to match
 
     :return: exit code corresponding to the result of the test execution
         (tests failed, unexpected exception, ...)
     """
     try:
         test_file_pattern = parse_test_selection_pattern(pattern_inject)
-
-        test_suites = collect_test_suites(config["test_suite_list"], test_file_pattern.test_file)
-        test_suites = handle_can_trace_strategy(config, test_suites)
-        # Group all the collected test suites in one global test suite
-        all_tests_to_run = unittest.TestSuite(test_suites)
-
-        # filter test cases based on variant and branch-level options
-        if user_tags:
-            apply_tag_filter(all_tests_to_run, user_tags)
-
-        # Enable step report
-        enable_step_report(all_tests_to_run, step_report)
-
-        if test_file_pattern.test_class:
-            all_tests_to_run = apply_test_case_filter(
-                all_tests_to_run,
-                test_file_pattern.test_class,
-                test_file_pattern.test_case,
+        junit_report_path = get_junit_report_path(junit_path, report_name) if report_type == "junit" else None
+
+        history = RunHistory.load(test_history) if test_history is not None else None
+        cache = CollectionCache(collection_cache) if collection_cache is not None else None
+        if cache is not None and (user_tags or tag_expression is not None):
+            check_cached_tag_names(config, test_file_pattern, user_tags or {}, cache, tag_expression)
+
+        if workers > 1:
+            from .parallel_execution import execute_parallel
+
+            return int(
+                execute_parallel(
+                    config,
+                    test_file_pattern,
+                    workers,
+                    report_type,
+                    user_tags,
+                    step_report,
+                    failfast,
+                    junit_report_path,
+                    step_report_streaming,
+                    step_report_export,
+                    shard,
+                    test_order,
+                    history,
+                    tag_expression,
+                )
             )
 
+        all_tests_to_run = collect_tests(
+            config,
+            test_file_pattern,
+            user_tags,
+            step_report,
+            step_report_streaming,
+            shard=shard,
+            test_order=test_order,
+            history=history,
+            cache=cache,
+            tag_expression=tag_expression,
+        )
+        # the test suites drop their tests once run
+        tests = list(test_suite.flatten(all_tests_to_run))
+
         log_file_path = get_logging_options().log_path
-        # TestRunner selection: generate or not a junit report. Start the tests and publish the results
-        if report_type == "junit":
-            report_path = junit_path
-            full_report_path = Path.cwd() / report_path
-            if full_report_path.suffix == ".xml":
-                junit_report_path = str(full_report_path)
-                full_report_path.parent.mkdir(exist_ok=True)
-            else:
-                junit_report_path = str(full_report_path / Path(time.strftime(f"%Y-%m-%d_%H-%M-%S-{report_name}.xml")))
-                full_report_path.mkdir(exist_ok=True)
-            with open(junit_report_path, "wb") as junit_output, ResultStream(log_file_path) as stream:
-                test_runner = xmlrunner.XMLTestRunner(
-                    output=junit_output,
-                    resultclass=MultiTestResult(XmlTestResult, BannerTestResult),
-                    failfast=failfast,
-                    verbosity=0,
-                    stream=stream,
-                )
-                result = test_runner.run(all_tests_to_run)
-        else:
-            with ResultStream(log_file_path) as stream:
-                test_runner = unittest.TextTestRunner(
-                    stream=stream,
-                    resultclass=MultiTestResult(BannerTestResult),
-                    failfast=failfast,
-                    verbosity=0,
-                )
-                result = test_runner.run(all_tests_to_run)
+        with ResultStream(log_file_path) as stream:
+            result = run_tests(all_tests_to_run, report_type, stream, failfast, junit_report_path)
+
+        if history is not None:
+            history.update(tests, result)
+            history.save()
 
         # Generate the html step report
         if step_report is not None:
-            generate_step_report(result, step_report)
+            generate_step_report(result, step_report, step_report_export)
 
         exit_code = failure_and_error_handling(result)
-    except NameError:
-        log.exception("Error occurred during tag evaluation.")
-        exit_code = ExitCode.BAD_CLI_USAGE
-    except TestCollectionError:
-        log.exception("Error occurred during test collection.")
-        exit_code = ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION
-    except AuxiliaryCreationError:
-        log.exception("Error occurred during auxiliary creation.")
-        exit_code = ExitCode.AUXILIARY_CREATION_FAILED
-    except KeyboardInterrupt:
-        log.exception("Keyboard Interrupt detected")
-        exit_code = ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION
-    except Exception:
-        log.exception(f'Issue detected in the test-suite: {config["test_suite_list"]}!')
-        exit_code = ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION
+    except (Exception, KeyboardInterrupt) as e:
+        exit_code = handle_execution_error(e, config)
     return int(exit_code)
 
 
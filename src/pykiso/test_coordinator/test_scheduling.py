@@ -0,0 +1,270 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Test scheduling
+***************
+
+:module: test_scheduling
+
+:synopsis: Record the duration and outcome of each test case across runs
+    and order the next runs from them.
+
+The run history is a JSON file holding, for each test ID, the duration
+and the outcome of the last run of the test case. It is updated after
+each run, skipped test cases keep their previous record.
+
+The test cases can then be ordered to run the previously failed test
+cases first, the longest test cases first or the shortest ones first.
+The order always keeps the test cases of a test suite between its setup
+and teardown, and the test cases of a test class together, so that
+every fixture is still run once.
+
+.. currentmodule:: test_scheduling
+
+"""
+from __future__ import annotations
+
+import enum
+import functools
+import json
+import logging
+import os
+import statistics
+import time
+import unittest
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from xmlrunner.result import _TestInfo as TestInfo
+
+from ..types import PathType
+from . import test_suite
+
+log = logging.getLogger(__name__)
+
+#: duration assumed for all test cases if no duration was recorded yet
+DEFAULT_TEST_DURATION = 1.0
+
+
+class TestOrder(str, enum.Enum):
+    """Order of the test cases within the boundaries of their test suite
+    and test class."""
+
+    __test__ = False
+
+    #: keep the discovery order
+    DISCOVERY = "discovery"
+    #: previously failed test cases first, then the discovery order
+    FAILED_FIRST = "failed-first"
+    #: longest test cases first
+    LONGEST_FIRST = "longest-first"
+    #: shortest test cases first
+    SHORTEST_FIRST = "shortest-first"
+
+
+class Outcome(str, enum.Enum):
+    """Recorded outcome of a test case."""
+
+    PASSED = "passed"
+    FAILED = "failed"
+
+
+class RunHistory:
+    """Duration and outcome of the test cases of the previous runs."""
+
+    def __init__(self, path: Optional[PathType] = None, records: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """Initialize the run history.
+
+        :param path: JSON file the history is saved to
+        :param records: record of each test ID, containing its
+            ``duration`` in seconds, its ``outcome`` and the time it was
+            last ``updated``
+        """
+        self.path = Path(path) if path is not None else None
+        self.records = records if records is not None else {}
+
+    @classmethod
+    def load(cls, path: PathType) -> RunHistory:
+        """Load the run history, an unreadable history is started over.
+
+        :param path: JSON file of the history
+
+        :return: the loaded history, empty if the file does not exist
+        """
+        path = Path(path)
+        records = {}
+        if path.is_file():
+            try:
+                records = json.loads(path.read_text())
+            except (OSError, ValueError):
+                log.warning(f"run history {path} could not be read, starting a new one")
+        return cls(path, records)
+
+    def save(self) -> None:
+        """Write the run history to its file, replacing it atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(self.records, indent=1, sort_keys=True))
+        os.replace(tmp_path, self.path)
+        log.internal_info(f"run history of {len(self.records)} test case(s) saved to {self.path}")
+
+    def get_durations(self) -> Dict[str, float]:
+        """Get the last recorded duration of each test case.
+
+        :return: duration in seconds by test ID
+        """
+        return {test_id: record["duration"] for test_id, record in self.records.items()}
+
+    def update(self, tests: Iterable[unittest.TestCase], test_result: unittest.TestResult) -> Dict[str, Dict[str, Any]]:
+        """Record the duration and outcome of the test cases of a run.
+
+        :param tests: test cases of the run, as collected before the run
+        :param test_result: result of the run
+
+        :return: the updated records by test ID
+        """
+        failed = {
+            _get_test_id(test) for test in test_result.failures + test_result.errors + test_result.unexpectedSuccesses
+        }
+        skipped = {_get_test_id(test) for test in test_result.skipped}
+        updated = {}
+        now = time.time()
+        for test in tests:
+            test_id = test.id()
+            # skipped test cases and test cases not run because of failfast
+            if test_id in skipped or not getattr(test, "stop_time", 0):
+                continue
+            updated[test_id] = {
+                "duration": test.elapsed_time,
+                "outcome": Outcome.FAILED.value if test_id in failed else Outcome.PASSED.value,
+                "updated": now,
+            }
+        self.records.update(updated)
+        return updated
+
+
+def _get_test_id(test: Union[unittest.TestCase, TestInfo, tuple]) -> str:
+    """Get the ID of a test case reported in a test result.
+
+    :param test: reported test case, test information of a junit report,
+        or tuple of either of them and a message
+
+    :return: the test ID
+    """
+    if isinstance(test, tuple):
+        test = test[0]
+    if isinstance(test, TestInfo):
+        return test.test_id
+    if isinstance(test, unittest.case._SubTest):
+        return test.test_case.id()
+    return test.id()
+
+
+def _get_sort_key(order: TestOrder, history: RunHistory, test_ids: List[str]) -> Callable[[str], float]:
+    """Get the sort key of a test case from its ID for an order.
+
+    :param order: order of the test cases
+    :param history: history of the previous runs
+    :param test_ids: IDs of all collected test cases
+
+    :return: function returning the sort key of a test ID
+    """
+    records = history.records
+    if order is TestOrder.FAILED_FIRST:
+        return lambda test_id: 0 if records.get(test_id, {}).get("outcome") == Outcome.FAILED else 1
+    known = [records[test_id]["duration"] for test_id in test_ids if test_id in records]
+    # test cases never run are assumed to last as long as the average test case
+    default_duration = statistics.mean(known) if known else DEFAULT_TEST_DURATION
+    sign = -1 if order is TestOrder.LONGEST_FIRST else 1
+    return lambda test_id: sign * records.get(test_id, {}).get("duration", default_duration)
+
+
+def _sort_blocks(
+    items: List[Any], key: Callable[[Any], float], aggregate: Callable[[Iterable[float]], float], block_keys: List
+) -> List[Any]:
+    """Sort items while keeping the items sharing a block key together.
+
+    :param items: items to sort
+    :param key: sort key of an item
+    :param aggregate: combine the sort keys of the items of a block
+    :param block_keys: functions returning the block of an item, from
+        the outermost to the innermost block
+
+    :return: the sorted items, the sort is stable
+    """
+    if not block_keys:
+        return sorted(items, key=key)
+    blocks = OrderedDict()
+    for item in items:
+        blocks.setdefault(block_keys[0](item), []).append(item)
+    sorted_blocks = [_sort_blocks(block, key, aggregate, block_keys[1:]) for block in blocks.values()]
+    sorted_blocks.sort(key=lambda block: aggregate(key(item) for item in block))
+    return [item for block in sorted_blocks for item in block]
+
+
+def _order_suite(
+    suite: unittest.TestSuite, key: Callable[[str], float], aggregate: Callable[[Iterable[float]], float]
+) -> None:
+    """Order the tests of a (nested) test suite in place.
+
+    The test suite setups and teardowns stay in place, the tests between
+    them are ordered by test suite, then by test class, then by test
+    case.
+
+    :param suite: test suite to order
+    :param key: sort key of a test ID
+    :param aggregate: combine the sort keys of several tests
+    """
+
+    def item_key(item: Union[unittest.TestSuite, unittest.TestCase]) -> float:
+        if isinstance(item, unittest.TestSuite):
+            return aggregate(key(test.id()) for test in test_suite.flatten(item))
+        return key(item.id())
+
+    block_keys = [
+        lambda item: id(item) if isinstance(item, unittest.TestSuite) else getattr(item, "test_suite_id", None),
+        lambda item: id(item) if isinstance(item, unittest.TestSuite) else type(item),
+    ]
+
+    ordered, segment = [], []
+    for item in suite._tests:
+        if isinstance(item, unittest.TestSuite):
+            _order_suite(item, key, aggregate)
+        elif test_suite.is_suite_fixture(item):
+            ordered.extend(_sort_blocks(segment, item_key, aggregate, block_keys))
+            ordered.append(item)
+            segment = []
+            continue
+        segment.append(item)
+    ordered.extend(_sort_blocks(segment, item_key, aggregate, block_keys))
+    suite._tests = ordered
+
+
+def order_tests(all_tests_to_run: unittest.TestSuite, order: TestOrder, history: RunHistory) -> unittest.TestSuite:
+    """Order the test cases from the history of the previous runs.
+
+    :param all_tests_to_run: collected tests
+    :param order: order of the test cases
+    :param history: history of the previous runs
+
+    :return: the ordered test suite, with the same nesting
+    """
+    order = TestOrder(order)
+    if order is TestOrder.DISCOVERY:
+        return all_tests_to_run
+    test_ids = [test.id() for test in test_suite.flatten(all_tests_to_run)]
+    if order is TestOrder.FAILED_FIRST:
+        aggregate = functools.partial(min, default=1)
+    else:
+        aggregate = sum
+    _order_suite(all_tests_to_run, _get_sort_key(order, history, test_ids), aggregate)
+    log.internal_info(f"test cases ordered {order.value} from the history of {len(history.records)} test case(s)")
+    return all_tests_to_run
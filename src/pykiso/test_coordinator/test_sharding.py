@@ -0,0 +1,178 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Test sharding
+*************
+
+:module: test_sharding
+
+:synopsis: Deterministically split the collected test cases across
+    several test benches running the same configuration.
+
+Each test case is identified by its unittest ID
+(``module.Class-suite_id-case_id.test_method``). Without timings, a test
+case is assigned to a shard from a stable hash of its ID, so that every
+bench selects the same partition whatever the order of the collection.
+With the JUnit report of a previous run, the test cases are instead
+distributed from the longest to the shortest to the least loaded shard,
+balancing the expected duration of the shards.
+
+The test suite setup and teardown are run by every shard containing at
+least one test case of their test suite.
+
+.. currentmodule:: test_sharding
+
+"""
+from __future__ import annotations
+
+import heapq
+import logging
+import statistics
+import unittest
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from junitparser import JUnitXml, TestSuite
+
+from ..types import PathType
+from . import test_suite
+
+log = logging.getLogger(__name__)
+
+#: duration assumed for all test cases if the timings of a previous run are empty
+DEFAULT_TEST_DURATION = 1.0
+
+
+@dataclass
+class TestShard:
+    """Part of the test cases run by one test bench."""
+
+    #: index of the shard, starting at 0
+    index: int
+    #: total number of shards
+    count: int
+    #: duration in seconds of the test cases of a previous run by test ID,
+    #: the test cases are partitioned by ID if None
+    timings: Optional[Dict[str, float]] = None
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"invalid shard index {self.index} for {self.count} shard(s)")
+
+
+def load_junit_timings(junit_path: PathType) -> Dict[str, float]:
+    """Load the duration of each test case from JUnit reports.
+
+    :param junit_path: JUnit report file, or folder containing JUnit
+        reports
+
+    :return: duration in seconds by test ID, the last report wins if a
+        test case appears several times
+    """
+    junit_path = Path(junit_path)
+    report_paths = sorted(junit_path.glob("**/*.xml")) if junit_path.is_dir() else [junit_path]
+    timings = {}
+    for report_path in report_paths:
+        xml = JUnitXml.fromfile(str(report_path))
+        # a report either contains a single test suite or several of them
+        suites = [xml] if isinstance(xml, TestSuite) else xml
+        for suite in suites:
+            for case in suite:
+                timings[f"{case.classname}.{case.name}"] = case.time
+    log.internal_info(f"loaded the timings of {len(timings)} test case(s) from {junit_path}")
+    return timings
+
+
+def partition_by_id(test_ids: Iterable[str], count: int) -> List[Set[str]]:
+    """Partition the test cases from a stable hash of their ID.
+
+    :param test_ids: IDs of the test cases
+    :param count: number of shards
+
+    :return: IDs of the test cases of each shard
+    """
+    shards = [set() for _ in range(count)]
+    for test_id in test_ids:
+        shards[zlib.crc32(test_id.encode()) % count].add(test_id)
+    return shards
+
+
+def partition_by_duration(test_ids: Iterable[str], count: int, timings: Dict[str, float]) -> List[Set[str]]:
+    """Partition the test cases to balance the expected duration of the
+    shards.
+
+    The longest test cases are assigned first, each one to the shard
+    with the lowest expected duration. Test cases missing from the
+    timings are assumed to last as long as the average test case.
+
+    :param test_ids: IDs of the test cases
+    :param count: number of shards
+    :param timings: duration in seconds of the test cases by test ID
+
+    :return: IDs of the test cases of each shard
+    """
+    test_ids = set(test_ids)
+    known = [timings[test_id] for test_id in test_ids if test_id in timings]
+    default_duration = statistics.mean(known) if known else DEFAULT_TEST_DURATION
+    durations = {test_id: timings.get(test_id, default_duration) for test_id in test_ids}
+
+    shards = [set() for _ in range(count)]
+    # (expected duration, index) of each shard, ties go to the lowest index
+    loads = [(0.0, index) for index in range(count)]
+    for test_id in sorted(test_ids, key=lambda test_id: (-durations[test_id], test_id)):
+        load, index = heapq.heappop(loads)
+        shards[index].add(test_id)
+        heapq.heappush(loads, (load + durations[test_id], index))
+    return shards
+
+
+def _filter_suite(suite: unittest.TestSuite, selected: Set[str], suite_ids: Set[int]) -> None:
+    """Remove the tests that are not part of the shard, in place.
+
+    :param suite: (nested) test suite to filter
+    :param selected: IDs of the test cases of the shard
+    :param suite_ids: test suite IDs of the selected test cases
+    """
+    tests = []
+    for test in suite._tests:
+        if isinstance(test, unittest.TestSuite):
+            _filter_suite(test, selected, suite_ids)
+            tests.append(test)
+        elif test.id() in selected or (test_suite.is_suite_fixture(test) and test.test_suite_id in suite_ids):
+            tests.append(test)
+    suite._tests = tests
+
+
+def apply_shard(all_tests_to_run: unittest.TestSuite, shard: TestShard) -> unittest.TestSuite:
+    """Only keep the test cases of a shard.
+
+    :param all_tests_to_run: tests collected from the configuration
+    :param shard: shard to run
+
+    :return: the filtered test suite, with the same nesting
+    """
+    test_ids = [test.id() for test in test_suite.flatten(all_tests_to_run) if not test_suite.is_suite_fixture(test)]
+    if shard.timings is None:
+        shards = partition_by_id(test_ids, shard.count)
+    else:
+        shards = partition_by_duration(test_ids, shard.count, shard.timings)
+    selected = shards[shard.index]
+    suite_ids = {
+        test.test_suite_id
+        for test in test_suite.flatten(all_tests_to_run)
+        if test.id() in selected and hasattr(test, "test_suite_id")
+    }
+    _filter_suite(all_tests_to_run, selected, suite_ids)
+    log.internal_info(
+        f"shard {shard.index} of {shard.count} runs {len(selected)} of the {len(test_ids)} collected test case(s)"
+    )
+    return all_tests_to_run
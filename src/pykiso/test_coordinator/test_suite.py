@@ -449,6 +449,15 @@ def tc_sort_key(tc):
     return (fix_ind, tc.test_suite_id, tc.test_case_id)
 
 
+def is_suite_fixture(test: unittest.TestCase) -> bool:
+    """Check if a test is a test suite setup or teardown.
+
+    :param test: test to check
+    :return: True if the test is a test suite setup or teardown
+    """
+    return isinstance(test, (BasicTestSuiteSetup, BasicTestSuiteTeardown))
+
+
 def flatten(it: unittest.TestSuite) -> Iterable[BasicTest]:
     """Flatten all level of nesting.
 
@@ -29,6 +29,7 @@ import linecache
 import logging
 import re
 import sys
+import time
 import traceback
 import types
 import typing
@@ -37,15 +38,15 @@ from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 from unittest.case import TestCase, _SubTest
 
-import jinja2
+if TYPE_CHECKING:
+    from pykiso.test_coordinator.test_case import BasicTest
 
-from pykiso.test_coordinator.test_case import BasicTest
-
-from .text_result import BannerTestResult
-from .xml_result import TestInfo, XmlTestResult
+    from .step_report_journal import StepReportJournal
+    from .text_result import BannerTestResult
+    from .xml_result import XmlTestResult
 
 log = logging.getLogger(__name__)
 
@@ -53,6 +54,8 @@ log = logging.getLogger(__name__)
 # Global variables
 # Store the Result Step report
 ALL_STEP_REPORT = OrderedDict()
+# Journal of the streaming step report, None if the report is rendered at once
+_STEP_REPORT_JOURNAL: Optional["StepReportJournal"] = None
 # Step result keys used by Jinja for columns name
 REPORT_KEYS = [
     "message",
@@ -81,6 +84,62 @@ UNITTEST_DEPRECATED_FUNCTION_MAPPING: dict[str:str] = {
 }
 
 
+@dataclass(frozen=True)
+class _CallSite:
+    """Metadata of an assertion call site that does not change between
+    two executions of the same source line."""
+
+    # name of the variable given as first argument to the assert method
+    var_name: str
+    # assert method name found in the source (can be a deprecated alias)
+    assert_name: str
+    # parent test function, None if it depends on the calling stack
+    test_name: Optional[str]
+
+
+class _SignatureLayout:
+    """Parameter layout of an assert method, used to bind its arguments
+    without going through :py:meth:`inspect.Signature.bind` on each call."""
+
+    def __init__(self, signature: inspect.Signature) -> None:
+        """Initialize attributes.
+
+        :param signature: signature of the assert method
+        """
+        parameters = signature.parameters.values()
+        self.signature = signature
+        self.positional = tuple(param.name for param in parameters if param.kind is param.POSITIONAL_OR_KEYWORD)
+        self.index = {name: idx for idx, name in enumerate(signature.parameters)}
+        self.required = tuple(param.name for param in parameters if param.default is param.empty)
+        # *args, **kwargs or positional only parameters need the complete binding logic
+        self.simple = all(param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY) for param in parameters)
+        self.has_msg = "msg" in signature.parameters
+
+    def bind(self, args: tuple, kwargs: dict) -> Dict[str, typing.Any]:
+        """Map the given arguments to the parameters names, in the
+        parameters order, like :py:attr:`inspect.BoundArguments.arguments`.
+
+        :param args: positional arguments
+        :param kwargs: named arguments
+
+        :return: the explicitly given arguments by parameter name
+        """
+        if self.simple and len(args) <= len(self.positional):
+            arguments = dict(zip(self.positional, args))
+            if kwargs:
+                if any(key not in self.index or key in arguments for key in kwargs):
+                    return dict(self.signature.bind(*args, **kwargs).arguments)
+                for key in sorted(kwargs, key=self.index.__getitem__):
+                    arguments[key] = kwargs[key]
+            if all(name in arguments for name in self.required):
+                return arguments
+        return dict(self.signature.bind(*args, **kwargs).arguments)
+
+
+# Call sites already resolved, keyed by (caller code object, line number, assert method name)
+_CALL_SITE_CACHE: Dict[Tuple[types.CodeType, int, str], _CallSite] = {}
+
+
 @dataclass
 class StepReportData:
     # Store additional data fetched during test for
@@ -154,6 +213,17 @@ def _get_variable_name(f_back: types.FrameType, assert_name: str) -> str:
     return expected_varname
 
 
+@functools.lru_cache(maxsize=None)
+def _get_assertion_purpose(func_name: str) -> str:
+    """Get the assertion purpose (eg: get Equal from assertEqual).
+
+    :param func_name: name of the assertion function
+
+    :return: assertion purpose
+    """
+    return " ".join(re.findall(r"([A-Z][a-z]+)", func_name))
+
+
 def _get_expected(func_name: str, arguments: dict) -> str:
     """Get the assertion purpose and the expected value
 
@@ -163,9 +233,7 @@ def _get_expected(func_name: str, arguments: dict) -> str:
 
     :return: expected value
     """
-    # Get assertion purpose (eg: get Equal from assertEqual)
-    name = re.findall(r"([A-Z][a-z]+)", func_name)
-    expected = " ".join(name)
+    expected = _get_assertion_purpose(func_name)
 
     # Get expected value and parameters if exist
     # eg: assertAlmostEqual(50, 60, msg="message", delta=10)
@@ -215,6 +283,10 @@ def _prepare_report(test: unittest.case.TestCase, test_name: str) -> None:
 
     # Create the testClass
     if not ALL_STEP_REPORT.get(test_class_name):
+        if _STEP_REPORT_JOURNAL is not None:
+            # a new test class starts, the previous ones are over
+            for finished_class_name in list(ALL_STEP_REPORT):
+                _STEP_REPORT_JOURNAL.finish_class(finished_class_name)
         ALL_STEP_REPORT[test_class_name] = OrderedDict()
         # Add test succeed flag
         ALL_STEP_REPORT[test_class_name]["succeed"] = True
@@ -229,6 +301,13 @@ def _prepare_report(test: unittest.case.TestCase, test_name: str) -> None:
         ALL_STEP_REPORT[test_class_name]["time_result"]["Start Time"] = 0
         # Store the tests list
         ALL_STEP_REPORT[test_class_name]["test_list"] = OrderedDict()
+        if _STEP_REPORT_JOURNAL is not None:
+            _STEP_REPORT_JOURNAL.write(
+                "class",
+                test_class_name,
+                description=ALL_STEP_REPORT[test_class_name]["description"],
+                file_path=ALL_STEP_REPORT[test_class_name]["file_path"],
+            )
 
     # Create the current test step storage
     if not ALL_STEP_REPORT[test_class_name]["test_list"].get(test_name):
@@ -242,6 +321,8 @@ def _prepare_report(test: unittest.case.TestCase, test_name: str) -> None:
             "steps": [[]],
             "unexpected_errors": [[]],
         }
+        if _STEP_REPORT_JOURNAL is not None:
+            _STEP_REPORT_JOURNAL.write("test", test_class_name, test=test_name, description=test_description)
 
 
 def _add_step(
@@ -254,37 +335,106 @@ def _add_step(
 ):
     global ALL_STEP_REPORT, REPORT_KEYS
 
-    ALL_STEP_REPORT[test_class_name]["test_list"][test_name]["steps"][-1].append(
-        dict(zip(REPORT_KEYS, [message, var_name, expected, received, True]))
-    )
+    step = [message, var_name, expected, received, True]
+    timestamp = time.time()
+    steps = ALL_STEP_REPORT[test_class_name]["test_list"][test_name]["steps"][-1]
+    if _STEP_REPORT_JOURNAL is not None:
+        _STEP_REPORT_JOURNAL.write("step", test_class_name, test=test_name, step=step, timestamp=timestamp)
+        # only keep the last step in memory, in case its assertion fails
+        steps.clear()
+    steps.append({**dict(zip(REPORT_KEYS, step)), "timestamp": timestamp})
+
+
+def _is_test_function(name: str) -> bool:
+    """Check if a function name matches a test fixture or a test function.
 
+    :param name: function name
+
+    :return: True if the function is a test fixture or a test function
+    """
+    return name.lower() in DEFAULT_TEST_METHOD or name.startswith("test_")
+
+
+@functools.lru_cache(maxsize=None)
+def _match_parent_method(test_name: str) -> Tuple[str, ...]:
+    """Get the known test methods contained in a test function name.
+
+    :param test_name: test function name
+
+    :return: the matched known test methods, empty if none
+    """
+    return tuple(re.findall(_FUNCTION_TO_APPLY, test_name.lower()))
 
-def determine_parent_test_function(test_name: str) -> str:
+
+def determine_parent_test_function(test_name: str, frame: Optional[types.FrameType] = None) -> str:
     """Determine the parent test function.
 
     This function attached the nested assertion to the correct parent test
     function.
 
     :param test_name: current test function
+    :param frame: innermost frame to inspect, the caller's frame if None
 
     :return: parent test function
     """
     # the function respect the default test method pattern or in default test function
-    if test_name.lower() in DEFAULT_TEST_METHOD or test_name.startswith("test_"):
+    if _is_test_function(test_name):
         return test_name
 
-    # collect all methods called from the stack to get the parent test function
-    methods = [frame.function for frame in inspect.stack()]
+    # walk up the raw frames (the outermost match wins) instead of building
+    # the full inspect.stack(), which reads the source context of each frame
+    frame = frame or sys._getframe(1)
+    fixture = test_function = None
+    while frame is not None:
+        method = frame.f_code.co_name
+        if method.lower() in DEFAULT_TEST_METHOD:
+            fixture = method
+        elif method.startswith("test_"):
+            test_function = method
+        frame = frame.f_back
 
-    # determine if the parent test function is a fixture or a test function
-    fixture = [method for method in methods if method.lower() in DEFAULT_TEST_METHOD]
-    test_function = [method for method in methods if method.startswith("test_")]
+    return fixture or test_function
 
-    if fixture:
-        return fixture.pop()
 
-    if test_function:
-        return test_function.pop()
+def _find_variable_name(frame: types.FrameType, assert_name: str) -> Tuple[str, str, Optional[types.FrameType]]:
+    """Find the name of the variable given to an assertion, walking up
+    the frames until the assertion call is found.
+
+    :param frame: frame calling the assert method
+    :param assert_name: name of the assert method
+
+    :return: the variable name, the name of the assert method as called
+        (deprecated unittest alias) and the frame in which the call was
+        found, None if not found
+    """
+    caller_frame = frame
+    deprecated_try = False
+    while True:
+        try:
+            return _get_variable_name(frame, assert_name), assert_name, frame
+        except IndexError:
+            frame = frame.f_back
+        except TypeError:
+            # replace assert name with depecrated function assert name
+            if not deprecated_try and assert_name in UNITTEST_DEPRECATED_FUNCTION_MAPPING.keys():
+                deprecated_try = True
+                frame = caller_frame
+                assert_name = UNITTEST_DEPRECATED_FUNCTION_MAPPING[assert_name]
+                continue
+            log.error(f"Step report error: Variable name couldn't be find for {caller_frame}")
+            return "Variable name not found", assert_name, None
+
+
+def _fail_last_step(test_class_name: str, test_name: str) -> None:
+    """Mark the last step of a test as failed.
+
+    :param test_class_name: name of the test class
+    :param test_name: name of the test method
+    """
+    ALL_STEP_REPORT[test_class_name]["test_list"][test_name]["steps"][-1][-1]["succeed"] = False
+    ALL_STEP_REPORT[test_class_name]["succeed"] = False
+    if _STEP_REPORT_JOURNAL is not None:
+        _STEP_REPORT_JOURNAL.write("fail", test_class_name, test=test_name)
 
 
 def assert_decorator(assert_method: types.MethodType):
@@ -314,6 +464,9 @@ def assert_decorator(assert_method: types.MethodType):
     return: The func output if it exists. Otherwise, None
     """
 
+    # the signature of the assert method is resolved once, at its first call
+    layout: Optional[_SignatureLayout] = None
+
     @functools.wraps(assert_method)
     def func_wrapper(*args, **kwargs):
         """Decorator Main
@@ -321,7 +474,7 @@ def assert_decorator(assert_method: types.MethodType):
 
         return: The assertion method output if it exists. Otherwise, None
         """
-        global _FUNCTION_TO_APPLY
+        nonlocal layout
         original_logic = False
         try:
             # Context
@@ -333,20 +486,28 @@ def assert_decorator(assert_method: types.MethodType):
                 original_logic = True
                 return assert_method(*args, **kwargs)
 
-            test_name = determine_parent_test_function(f_back.f_code.co_name)
             test_case_inst: TestCase = assert_method.__self__
             test_class_name = type(test_case_inst).__name__
             assert_name = assert_method.__name__
+            call_site_key = (f_back.f_code, f_back.f_lineno, assert_name)
+            call_site = _CALL_SITE_CACHE.get(call_site_key)
+
+            if call_site is not None and call_site.test_name is not None:
+                test_name = call_site.test_name
+            else:
+                test_name = determine_parent_test_function(f_back.f_code.co_name, f_back)
+            parent_test_name = test_name
 
             # filter parent call, only known function recorded
-            parent_method = re.findall(_FUNCTION_TO_APPLY, test_name.lower())
+            parent_method = _match_parent_method(test_name)
             # get the decorated test fixture name (setUp, tearDown, ...)
             if parent_method and parent_method[0] == "handle_interaction":
                 test_name = f_back.f_locals["func"].__name__
 
             # Assign variables to signature
-            signature = inspect.signature(assert_method)
-            arguments = signature.bind(*args, **kwargs).arguments
+            if layout is None:
+                layout = _SignatureLayout(inspect.signature(assert_method))
+            arguments = layout.bind(args, kwargs)
             test_name = test_case_inst.step_report.current_table or test_name
             # 1. Gather message, var_name, expected, received
             # 1.1 Get message. default value: ""
@@ -358,7 +519,7 @@ def assert_decorator(assert_method: types.MethodType):
 
             # ensure message is always present in the arguments
             # dictionary. (used in _get_expected)
-            if not message and "msg" in signature.parameters:
+            if not message and layout.has_msg:
                 arguments["msg"] = ""
 
             # 1.2. Get 'received" value (Always 1st argument)
@@ -366,24 +527,16 @@ def assert_decorator(assert_method: types.MethodType):
             received = assert_value if assert_name not in MUTE_CONTENT_ASSERTION else ""
 
             # 1.3. Get variable name
-            found = False
-            deprecated_try = False
-            while not found:
-                try:
-                    var_name = _get_variable_name(f_back, assert_name)
-                    found = True
-                except IndexError:
-                    f_back = f_back.f_back
-                except TypeError:
-                    # replace assert name with depecrated function assert name
-                    if not deprecated_try and assert_name in UNITTEST_DEPRECATED_FUNCTION_MAPPING.keys():
-                        deprecated_try = True
-                        f_back = currentframe.f_back
-                        assert_name = UNITTEST_DEPRECATED_FUNCTION_MAPPING[assert_name]
-                        continue
-                    log.error(f"Step report error: Variable name couldn't be find for {currentframe.f_back}")
-                    var_name = "Variable name not found"
-                    break
+            if call_site is not None:
+                var_name, assert_name = call_site.var_name, call_site.assert_name
+            else:
+                var_name, assert_name, var_frame = _find_variable_name(f_back, assert_name)
+                # the call site only depends on its source line if the variable name
+                # was found in the caller's frame
+                if var_frame is f_back:
+                    _CALL_SITE_CACHE[call_site_key] = _CallSite(
+                        var_name, assert_name, parent_test_name if _is_test_function(f_back.f_code.co_name) else None
+                    )
 
             # 1.4. Get Expected value
             expected = _get_expected(assert_name, arguments)
@@ -414,8 +567,7 @@ def assert_decorator(assert_method: types.MethodType):
             log.error(f"Assert step exception: {e}")
             test_case_inst.step_report.last_error_message = f"{e}"
             if parent_method:
-                ALL_STEP_REPORT[test_class_name]["test_list"][test_name]["steps"][-1][-1]["succeed"] = False
-                ALL_STEP_REPORT[test_class_name]["succeed"] = False
+                _fail_last_step(test_class_name, test_name)
 
             test_case_inst.step_report.success = False
 
@@ -454,16 +606,32 @@ jinja_template_functions = {
 
 
 def generate_step_report(
-    test_result: Union[BannerTestResult, XmlTestResult],
+    test_result: Union["BannerTestResult", "XmlTestResult"],
     output_file: str,
+    export_file: Optional[str] = None,
 ) -> None:
     """Generate the HTML step report based on Jinja2 template
 
     :param test_result: Result of tests to generate the report from
     :param output_file: Report output file path
+    :param export_file: if given, also export the step report in a
+        structured format selected from the file extension (see
+        :py:mod:`~pykiso.test_result.step_report_export`)
     """
-    global ALL_STEP_REPORT, SCRIPT_PATH, REPORT_TEMPLATE
     test_result.stream.writeln("Generating HTML reports...")
+    update_step_report(test_result)
+    write_step_report(output_file, export_file)
+
+
+def update_step_report(test_result: Union["BannerTestResult", "XmlTestResult"]) -> None:
+    """Add the timing and the unexpected errors of each test to the step
+    report.
+
+    :param test_result: Result of tests to update the report from
+    """
+    global ALL_STEP_REPORT
+
+    from .xml_result import TestInfo
 
     succeeded_tests = test_result.successes + test_result.expectedFailures
     failed_test = test_result.failures + test_result.errors + test_result.unexpectedSuccesses
@@ -478,32 +646,77 @@ def generate_step_report(
 
         if isinstance(test_info, _SubTest):
             class_name = test_info.test_case.__class__.__name__
-            start_time = _parse_timestamp(test_info.test_case.start_time)
-            stop_time = _parse_timestamp(test_info.test_case.stop_time)
+            start_timestamp = test_info.test_case.start_time
+            stop_timestamp = test_info.test_case.stop_time
             elapsed_time = test_info.test_case.elapsed_time
             test_method_name = test_info.test_case._testMethodName
         elif isinstance(test_info, TestCase):
             class_name = test_info.__class__.__name__
-            start_time = _parse_timestamp(test_info.start_time)
-            stop_time = _parse_timestamp(test_info.stop_time)
+            start_timestamp = test_info.start_time
+            stop_timestamp = test_info.stop_time
             elapsed_time = test_info.elapsed_time
             test_method_name = test_info._testMethodName
         elif isinstance(test_info, TestInfo):
             # test_info is TestInfo
             class_name = test_info.test_name.split(".")[-1]
-            start_time = _parse_timestamp(test_info.test_result.start_time)
-            stop_time = _parse_timestamp(test_info.test_result.stop_time)
+            start_timestamp = test_info.test_result.start_time
+            stop_timestamp = test_info.test_result.stop_time
             elapsed_time = test_info.elapsed_time
             test_method_name = test_info.test_id.split(".")[-1]
+        start_time = _parse_timestamp(start_timestamp)
+        stop_time = _parse_timestamp(stop_timestamp)
+        timing = {"start_time": start_timestamp, "stop_time": stop_timestamp, "elapsed_time": elapsed_time}
         # Update test_case
-        if class_name in ALL_STEP_REPORT:
+        if _STEP_REPORT_JOURNAL is not None:
+            if class_name not in _STEP_REPORT_JOURNAL.offsets:
+                continue
+            _STEP_REPORT_JOURNAL.write(
+                "result",
+                class_name,
+                test=test_method_name,
+                time_result={"Start Time": start_time, "End Time": stop_time, "Elapsed Time": round(elapsed_time, 2)},
+                timing=timing,
+                error=test_case[1] if test_case in test_result.errors else None,
+            )
+        elif class_name in ALL_STEP_REPORT:
             ALL_STEP_REPORT[class_name]["time_result"]["Start Time"] = start_time
             ALL_STEP_REPORT[class_name]["time_result"]["End Time"] = stop_time
             ALL_STEP_REPORT[class_name]["time_result"]["Elapsed Time"] = round(elapsed_time, 2)
+            test_content = ALL_STEP_REPORT[class_name]["test_list"].get(test_method_name)
+            if test_content is not None:
+                test_content["timing"] = timing
             if test_case in test_result.errors:
                 ALL_STEP_REPORT[class_name]["test_list"][test_method_name]["unexpected_errors"][-1].append(test_case[1])
                 ALL_STEP_REPORT[class_name]["succeed"] = False
 
+
+def write_step_report(output_file: str, export_file: Optional[str] = None) -> None:
+    """Render the HTML step report based on Jinja2 template
+
+    :param output_file: Report output file path
+    :param export_file: if given, also export the step report in a
+        structured format selected from the file extension (see
+        :py:mod:`~pykiso.test_result.step_report_export`)
+    """
+    global ALL_STEP_REPORT, SCRIPT_PATH, REPORT_TEMPLATE
+
+    # the report dependencies are only loaded when a report is written
+    import jinja2
+
+    from .step_report_export import export_step_report
+
+    if _STEP_REPORT_JOURNAL is not None:
+        # render the remaining test class pages and the index
+        journal = _STEP_REPORT_JOURNAL
+        journal.complete()
+        if export_file is not None:
+            export_step_report(export_file, journal.iter_classes())
+        return
+
+    if export_file is not None:
+        # export before rendering, the template consumes the succeed flag of each step
+        export_step_report(export_file, ALL_STEP_REPORT.items())
+
     # Render the source template
     render_environment = jinja2.Environment(loader=jinja2.FileSystemLoader(SCRIPT_PATH), autoescape=True)
     template = render_environment.get_template(REPORT_TEMPLATE)
@@ -518,7 +731,7 @@ def generate_step_report(
 
 
 def add_retry_information(
-    test: BasicTest,
+    test: "BasicTest",
     result_test: bool,
     retry_nb: int,
     max_try: int,
@@ -541,8 +754,19 @@ def add_retry_information(
     # Add another list to steps to differentiate the try
     test_information["steps"].append([])
     # We add the error raised if it was not an assertion error
-    if not isinstance(exc, AssertionError):
-        test_information["unexpected_errors"][-1].append(traceback.format_exc())
+    error = None if isinstance(exc, AssertionError) else traceback.format_exc()
+    if error is not None:
+        test_information["unexpected_errors"][-1].append(error)
     test_information["unexpected_errors"].append([])
     # Go back to the state before executing the test
     ALL_STEP_REPORT[test_class_name]["succeed"] = result_test
+    if _STEP_REPORT_JOURNAL is not None:
+        _STEP_REPORT_JOURNAL.write(
+            "retry",
+            test_class_name,
+            test=test._testMethodName,
+            number_try=retry_nb + 1,
+            max_try=max_try,
+            error=error,
+            succeed=result_test,
+        )
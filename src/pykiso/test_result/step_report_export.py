@@ -0,0 +1,408 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Structured step report export
+*****************************
+
+:module: step_report_export
+
+:synopsis: Export the step report data in a machine-readable format,
+    together with aggregated summaries.
+
+The content of the step report is flattened into one record per test and
+one record per step (with its timestamp and duration) and given to a
+:py:class:`StepReportWriter`. The writer is selected from the export file
+extension:
+
+- ``.jsonl``: :py:class:`JsonLinesWriter`, one JSON object per line
+- ``.parquet``: :py:class:`ParquetWriter`, columnar format (requires
+  ``pyarrow``)
+
+Additional writers can be registered with :py:func:`register_writer`.
+
+.. currentmodule:: step_report_export
+
+"""
+from __future__ import annotations
+
+import abc
+import heapq
+import itertools
+import json
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+log = logging.getLogger(__name__)
+
+#: columns of a step record
+STEP_COLUMNS = [
+    "class_name",
+    "test_name",
+    "attempt",
+    "step",
+    "message",
+    "var_name",
+    "expected_result",
+    "actual_result",
+    "succeed",
+    "timestamp",
+    "duration",
+]
+#: columns of a test record
+TEST_COLUMNS = [
+    "class_name",
+    "test_name",
+    "succeed",
+    "start_time",
+    "stop_time",
+    "elapsed_time",
+    "attempts",
+    "steps",
+    "failed_steps",
+    "errors",
+]
+
+
+class StepReportWriter(abc.ABC):
+    """Base class of the structured step report writers."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize attributes.
+
+        :param path: export file path
+        """
+        self.path = Path(path)
+
+    def open(self) -> None:
+        """Create the export file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @abc.abstractmethod
+    def write_test(self, test: Dict[str, Any]) -> None:
+        """Write the record of a test.
+
+        :param test: test record, with the keys of :py:data:`TEST_COLUMNS`
+        """
+
+    @abc.abstractmethod
+    def write_step(self, step: Dict[str, Any]) -> None:
+        """Write the record of a step.
+
+        :param step: step record, with the keys of :py:data:`STEP_COLUMNS`
+        """
+
+    @abc.abstractmethod
+    def write_summary(self, summary: Dict[str, Any]) -> None:
+        """Write the aggregated summary, called once after all records.
+
+        :param summary: summary of the step report
+        """
+
+    def close(self) -> None:
+        """Close the export file."""
+
+    def __enter__(self) -> StepReportWriter:
+        self.open()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+class JsonLinesWriter(StepReportWriter):
+    """Write each test, step and the summary as one JSON object per line,
+    the ``record`` key holding the type of the record."""
+
+    def open(self) -> None:
+        """Create the export file."""
+        super().open()
+        self._file = self.path.open("w", encoding="utf-8")
+
+    def _write(self, record_type: str, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps({"record": record_type, **record}, default=str) + "\n")
+
+    def write_test(self, test: Dict[str, Any]) -> None:
+        self._write("test", test)
+
+    def write_step(self, step: Dict[str, Any]) -> None:
+        self._write("step", step)
+
+    def write_summary(self, summary: Dict[str, Any]) -> None:
+        self._write("summary", summary)
+
+    def close(self) -> None:
+        """Close the export file."""
+        self._file.close()
+
+
+class ParquetWriter(StepReportWriter):
+    """Write the steps in a parquet file, the tests in a ``_tests.parquet``
+    file and the summary in a ``_summary.json`` file next to it."""
+
+    def __init__(self, path: Path, batch_size: int = 10000) -> None:
+        """Initialize attributes.
+
+        :param path: export file path of the steps
+        :param batch_size: number of steps written per row group
+        """
+        super().__init__(path)
+        self.batch_size = batch_size
+        self.tests_path = self.path.with_name(f"{self.path.stem}_tests.parquet")
+        self.summary_path = self.path.with_name(f"{self.path.stem}_summary.json")
+
+    def open(self) -> None:
+        """Check that pyarrow is available and create the export folder."""
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(f"{e.name} dependency missing, consider installing it with 'pip install pyarrow'")
+        super().open()
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._steps: List[Dict[str, Any]] = []
+        self._tests: List[Dict[str, Any]] = []
+        # the inferred types of a batch could differ from the previous ones, e.g. a column only
+        # made of None values, so that all values are written as their string representation
+        self._steps_schema = pyarrow.schema([(column, pyarrow.string()) for column in STEP_COLUMNS])
+        self._steps_writer = pyarrow.parquet.ParquetWriter(self.path, self._steps_schema)
+
+    def write_test(self, test: Dict[str, Any]) -> None:
+        self._tests.append({**test, "errors": list(map(str, test["errors"]))})
+
+    def write_step(self, step: Dict[str, Any]) -> None:
+        self._steps.append(
+            {column: None if step.get(column) is None else str(step[column]) for column in STEP_COLUMNS}
+        )
+        if len(self._steps) >= self.batch_size:
+            self._flush_steps()
+
+    def _flush_steps(self) -> None:
+        """Write the buffered steps as a row group."""
+        self._steps_writer.write_table(self._pa.Table.from_pylist(self._steps, schema=self._steps_schema))
+        self._steps = []
+
+    def write_summary(self, summary: Dict[str, Any]) -> None:
+        self.summary_path.write_text(json.dumps(summary, default=str, indent=2))
+
+    def close(self) -> None:
+        """Write the remaining steps and the tests."""
+        if self._steps:
+            self._flush_steps()
+        self._steps_writer.close()
+        self._pq.write_table(self._pa.Table.from_pylist(self._tests), self.tests_path)
+
+
+_WRITERS: Dict[str, Type[StepReportWriter]] = {
+    ".jsonl": JsonLinesWriter,
+    ".parquet": ParquetWriter,
+}
+
+
+def register_writer(suffix: str, writer_class: Type[StepReportWriter]) -> None:
+    """Use a writer for the export files with the given extension.
+
+    :param suffix: file extension, e.g. ``.csv``
+    :param writer_class: writer class, instantiated with the export path
+    """
+    _WRITERS[suffix.lower()] = writer_class
+
+
+def get_writer(path: Path) -> StepReportWriter:
+    """Create the writer matching the export file extension.
+
+    :param path: export file path
+
+    :raises ValueError: if no writer is registered for the extension
+    :return: the writer instance
+    """
+    path = Path(path)
+    try:
+        writer_class = _WRITERS[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"No step report writer for '{path.suffix}' files, supported: {', '.join(_WRITERS)}")
+    return writer_class(path)
+
+
+class StepReportSummary:
+    """Aggregate the exported records into summaries."""
+
+    def __init__(self, slowest: int = 10) -> None:
+        """Initialize attributes.
+
+        :param slowest: number of slowest steps and tests to keep
+        """
+        self.slowest = slowest
+        self.tests = 0
+        self.failed_tests = 0
+        self.steps = 0
+        self.failed_steps = 0
+        self.failures_per_class: Counter = Counter()
+        self.elapsed_per_class: Counter = Counter()
+        self._slowest_steps: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._slowest_tests: List[Tuple[float, int, Dict[str, Any]]] = []
+        # tie-breaker preventing the comparison of records with equal durations
+        self._counter = itertools.count()
+
+    def _push(self, heap: List[Tuple[float, int, Dict[str, Any]]], duration: float, record: Dict[str, Any]) -> None:
+        """Keep the records with the longest durations in a min-heap."""
+        item = (duration, next(self._counter), record)
+        if len(heap) < self.slowest:
+            heapq.heappush(heap, item)
+        elif duration > heap[0][0]:
+            heapq.heapreplace(heap, item)
+
+    def add_test(self, test: Dict[str, Any]) -> None:
+        """Account for a test record.
+
+        :param test: test record
+        """
+        self.tests += 1
+        self.elapsed_per_class[test["class_name"]] += test["elapsed_time"] or 0
+        if not test["succeed"]:
+            self.failed_tests += 1
+            self.failures_per_class[test["class_name"]] += 1
+        # fixtures (setUp, tearDown...) reported apart from their test are not timed
+        if test["elapsed_time"] is not None:
+            self._push(
+                self._slowest_tests,
+                test["elapsed_time"],
+                {key: test[key] for key in ("class_name", "test_name", "elapsed_time")},
+            )
+
+    def add_step(self, step: Dict[str, Any]) -> None:
+        """Account for a step record.
+
+        :param step: step record
+        """
+        self.steps += 1
+        if not step["succeed"]:
+            self.failed_steps += 1
+        if step["duration"] is not None:
+            self._push(
+                self._slowest_steps,
+                step["duration"],
+                {key: step[key] for key in ("class_name", "test_name", "attempt", "step", "message", "duration")},
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the summary.
+
+        :return: counters, failures and elapsed time per test class, and
+            the slowest tests and steps
+        """
+        return {
+            "tests": self.tests,
+            "failed_tests": self.failed_tests,
+            "steps": self.steps,
+            "failed_steps": self.failed_steps,
+            "failures_per_class": dict(self.failures_per_class),
+            "elapsed_per_class": {name: round(elapsed, 3) for name, elapsed in self.elapsed_per_class.items()},
+            "slowest_tests": [record for *_, record in sorted(self._slowest_tests, key=lambda item: -item[0])],
+            "slowest_steps": [record for *_, record in sorted(self._slowest_steps, key=lambda item: -item[0])],
+        }
+
+
+def iter_records(class_contents: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Flatten the step report content into test and step records.
+
+    :param class_contents: name and content of each test class, laid out
+        like :py:data:`~pykiso.test_result.assert_step_report.ALL_STEP_REPORT`
+
+    :return: iterator over the type ("test" or "step") and content of
+        each record, the steps of a test preceding its test record
+    """
+    for class_name, class_content in class_contents:
+        for test_name, test_content in class_content["test_list"].items():
+            timing = test_content.get("timing", {})
+            start_time = timing.get("start_time")
+            steps = failed_steps = 0
+            succeed = True
+            for attempt, attempt_steps in enumerate(test_content["steps"], start=1):
+                previous_timestamp = start_time
+                attempt_succeed = True
+                for index, row in enumerate(attempt_steps, start=1):
+                    timestamp = row.get("timestamp")
+                    duration = None
+                    if timestamp is not None and previous_timestamp is not None:
+                        duration = round(max(0.0, timestamp - previous_timestamp), 6)
+                    previous_timestamp = timestamp
+                    steps += 1
+                    failed_steps += not row["succeed"]
+                    attempt_succeed = attempt_succeed and row["succeed"]
+                    yield (
+                        "step",
+                        {
+                            "class_name": class_name,
+                            "test_name": test_name,
+                            "attempt": attempt,
+                            "step": index,
+                            "message": row["message"],
+                            "var_name": row["var_name"],
+                            "expected_result": row["expected_result"],
+                            "actual_result": row["actual_result"],
+                            "succeed": row["succeed"],
+                            "timestamp": timestamp,
+                            "duration": duration,
+                        },
+                    )
+                # only the last attempt decides the test result
+                succeed = attempt_succeed
+            errors = test_content["unexpected_errors"][-1] if test_content["unexpected_errors"] else []
+            yield (
+                "test",
+                {
+                    "class_name": class_name,
+                    "test_name": test_name,
+                    "succeed": succeed and not errors,
+                    "start_time": start_time,
+                    "stop_time": timing.get("stop_time"),
+                    "elapsed_time": timing.get("elapsed_time"),
+                    "attempts": len(test_content["steps"]),
+                    "steps": steps,
+                    "failed_steps": failed_steps,
+                    "errors": errors,
+                },
+            )
+
+
+def export_step_report(
+    export_file: Path,
+    class_contents: Iterable[Tuple[str, Dict[str, Any]]],
+    writer: Optional[StepReportWriter] = None,
+    slowest: int = 10,
+) -> Dict[str, Any]:
+    """Export the step report content with the writer matching the export
+    file extension.
+
+    :param export_file: export file path
+    :param class_contents: name and content of each test class
+    :param writer: writer to use instead of the one matching the export
+        file extension
+    :param slowest: number of slowest tests and steps in the summary
+
+    :return: the summary of the exported step report
+    """
+    writer = writer or get_writer(export_file)
+    summary = StepReportSummary(slowest)
+    with writer:
+        for record_type, record in iter_records(class_contents):
+            if record_type == "step":
+                summary.add_step(record)
+                writer.write_step(record)
+            else:
+                summary.add_test(record)
+                writer.write_test(record)
+        summary_content = summary.to_dict()
+        writer.write_summary(summary_content)
+    log.internal_info(f"step report exported to {writer.path}")
+    return summary_content
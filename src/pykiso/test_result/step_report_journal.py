@@ -0,0 +1,338 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Streaming step report
+*********************
+
+:module: step_report_journal
+
+:synopsis: Write the step report incrementally instead of keeping every
+    step in memory until the end of the test run.
+
+Each step is appended to a JSON Lines journal as soon as it is reported.
+When a test class is over, its steps are dropped from memory and the
+class is rendered in its own HTML page, linked from an index page. Memory
+therefore stays bounded by the size of a single test class, and the
+journal and the pages of the finished test classes remain usable if the
+test run crashes: :py:func:`render_step_report` renders them again from
+the journal.
+
+.. code:: bash
+
+    python -m pykiso.test_result.step_report_journal step_report.jsonl step_report.html
+
+.. currentmodule:: step_report_journal
+
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+import jinja2
+
+from . import assert_step_report
+from .assert_step_report import REPORT_KEYS, REPORT_TEMPLATE, SCRIPT_PATH, is_test_success, jinja_template_functions
+
+log = logging.getLogger(__name__)
+
+INDEX_TEMPLATE = "templates/report_index.html.j2"
+
+
+def get_journal_path(output_file: Path) -> Path:
+    """Get the journal path of a step report.
+
+    :param output_file: step report index path
+
+    :return: path of the JSON Lines journal
+    """
+    return Path(output_file).with_suffix(".jsonl")
+
+
+def get_pages_dir(output_file: Path) -> Path:
+    """Get the folder containing the pages of each test class.
+
+    :param output_file: step report index path
+
+    :return: folder of the test class pages
+    """
+    output_file = Path(output_file)
+    return output_file.parent / f"{output_file.stem}_pages"
+
+
+class StepReportJournal:
+    """Append-only JSON Lines journal of the step report."""
+
+    def __init__(self, output_file: Path) -> None:
+        """Create the journal and the pages folder.
+
+        :param output_file: path of the step report index page
+        """
+        self.output_file = Path(output_file).resolve()
+        self.path = get_journal_path(self.output_file)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        get_pages_dir(self.output_file).mkdir(exist_ok=True)
+        self._file = self.path.open("wb")
+        # offsets of the records of each test class in the journal
+        self.offsets: Dict[str, List[int]] = OrderedDict()
+        self.status: Dict[str, bool] = OrderedDict()
+        # rendered test classes which received records afterwards
+        self._outdated: Set[str] = set()
+
+    def write(self, kind: str, test_class_name: str, **content: Any) -> None:
+        """Append a record to the journal and flush it to disk.
+
+        :param kind: type of record (class, test, step, fail, retry,
+            header or result)
+        :param test_class_name: test class the record belongs to
+        :param content: record content
+        """
+        offset = self._file.tell()
+        record = {"kind": kind, "class": test_class_name, **content}
+        self._file.write(json.dumps(record, default=str).encode() + b"\n")
+        self._file.flush()
+        self.offsets.setdefault(test_class_name, []).append(offset)
+        if test_class_name in self.status:
+            self._outdated.add(test_class_name)
+
+    def finish_class(self, test_class_name: str) -> None:
+        """Drop a finished test class from memory and render its page.
+
+        :param test_class_name: test class to finish
+        """
+        class_content = assert_step_report.ALL_STEP_REPORT.pop(test_class_name, None)
+        if class_content is None:
+            return
+        self.write("header", test_class_name, header=class_content["header"])
+        self.render_class(test_class_name)
+        self.render_index()
+
+    def render_class(self, test_class_name: str) -> None:
+        """Render the page of a test class from the journal.
+
+        :param test_class_name: test class to render
+        """
+        self._file.flush()
+        class_content = _load_class(self.path, self.offsets[test_class_name])
+        self.status[test_class_name] = _is_class_success(class_content)
+        self._outdated.discard(test_class_name)
+        _render_class_page(self.output_file, test_class_name, class_content)
+
+    def render_index(self) -> None:
+        """Render the index page linking all rendered test classes."""
+        _render_index(self.output_file, self.status)
+
+    def iter_classes(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Load the test classes written to the journal one at a time.
+
+        :return: iterator over the name and content of each test class
+        """
+        for test_class_name, offsets in self.offsets.items():
+            yield test_class_name, _load_class(self.path, offsets)
+
+    def close(self) -> None:
+        """Close the journal without rendering the remaining classes."""
+        self._file.close()
+        if assert_step_report._STEP_REPORT_JOURNAL is self:
+            assert_step_report._STEP_REPORT_JOURNAL = None
+
+    def complete(self) -> None:
+        """Render the remaining test classes and the index, then close
+        the journal."""
+        for test_class_name in list(assert_step_report.ALL_STEP_REPORT):
+            self.finish_class(test_class_name)
+        # render again the classes finished before their final results were known
+        for test_class_name in [name for name in self.offsets if name in self._outdated]:
+            self.render_class(test_class_name)
+        self.render_index()
+        self.close()
+
+
+def start_streaming_step_report(output_file: Path) -> StepReportJournal:
+    """Stream the steps of the upcoming tests to a journal.
+
+    :param output_file: path of the step report index page
+
+    :return: the created journal
+    """
+    previous_journal = assert_step_report._STEP_REPORT_JOURNAL
+    if previous_journal is not None:
+        # left open by an aborted test run
+        previous_journal.close()
+    # steps of a previous test run are not part of this report
+    assert_step_report.ALL_STEP_REPORT.clear()
+    journal = StepReportJournal(output_file)
+    assert_step_report._STEP_REPORT_JOURNAL = journal
+    log.internal_info(f"step report streamed to {journal.path}")
+    return journal
+
+
+def _read_journal(path: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Read the records of a journal.
+
+    An incomplete last line, left by a crash, is ignored.
+
+    :param path: journal path
+
+    :return: iterator over the offset and content of each record
+    """
+    with Path(path).open("rb") as journal:
+        offset = 0
+        for line in journal:
+            try:
+                yield offset, json.loads(line)
+            except json.JSONDecodeError:
+                log.warning(f"skip incomplete record at offset {offset} of {path}")
+            offset += len(line)
+
+
+def _new_class_content() -> Dict[str, Any]:
+    """Create the content of a test class, laid out like in
+    :py:data:`~pykiso.test_result.assert_step_report.ALL_STEP_REPORT`."""
+    return {
+        "succeed": True,
+        "header": {},
+        "description": "Not provided",
+        "file_path": "",
+        "time_result": OrderedDict({"Start Time": 0}),
+        "test_list": OrderedDict(),
+    }
+
+
+def _load_class(path: Path, offsets: List[int]) -> Dict[str, Any]:
+    """Rebuild the content of a test class from the journal.
+
+    :param path: journal path
+    :param offsets: offsets of the records of the class
+
+    :return: the class content
+    """
+    content = _new_class_content()
+    with Path(path).open("rb") as journal:
+        for offset in offsets:
+            journal.seek(offset)
+            try:
+                record = json.loads(journal.readline())
+            except json.JSONDecodeError:
+                log.warning(f"skip incomplete record at offset {offset} of {path}")
+                continue
+            _apply_record(content, record)
+    return content
+
+
+def _apply_record(content: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Apply a journal record to the content of its test class.
+
+    :param content: test class content
+    :param record: journal record
+    """
+    kind = record["kind"]
+    test = None
+    if "test" in record:
+        test = content["test_list"].setdefault(
+            record["test"], {"description": record.get("description", ""), "steps": [[]], "unexpected_errors": [[]]}
+        )
+    if kind == "class":
+        content["description"] = record["description"]
+        content["file_path"] = record["file_path"]
+    elif kind == "step":
+        row = dict(zip(REPORT_KEYS, record["step"]))
+        if "timestamp" in record:
+            row["timestamp"] = record["timestamp"]
+        test["steps"][-1].append(row)
+    elif kind == "fail":
+        test["steps"][-1][-1]["succeed"] = False
+        content["succeed"] = False
+    elif kind == "retry":
+        test["number_try"] = record["number_try"]
+        test["max_try"] = record["max_try"]
+        test["steps"].append([])
+        if record.get("error"):
+            test["unexpected_errors"][-1].append(record["error"])
+        test["unexpected_errors"].append([])
+        content["succeed"] = record["succeed"]
+    elif kind == "header":
+        content["header"] = record["header"]
+    elif kind == "result":
+        content["time_result"].update(record["time_result"])
+        if "timing" in record:
+            test["timing"] = record["timing"]
+        if record.get("error") is not None:
+            test["unexpected_errors"][-1].append(record["error"])
+            content["succeed"] = False
+
+
+def _is_class_success(class_content: Dict[str, Any]) -> bool:
+    """Check if all tests of a test class were successful.
+
+    :param class_content: content of the test class
+
+    :return: True if no step failed and no unexpected error was raised
+    """
+    return class_content["succeed"] and all(is_test_success(test) for test in class_content["test_list"].values())
+
+
+def _get_environment() -> jinja2.Environment:
+    """Create the jinja environment rendering the step report pages."""
+    environment = jinja2.Environment(loader=jinja2.FileSystemLoader(SCRIPT_PATH), autoescape=True)
+    environment.globals.update(jinja_template_functions)
+    return environment
+
+
+def _render_class_page(output_file: Path, test_class_name: str, class_content: Dict[str, Any]) -> None:
+    """Render the page of a single test class.
+
+    :param output_file: step report index path
+    :param test_class_name: test class to render
+    :param class_content: content of the test class
+    """
+    template = _get_environment().get_template(REPORT_TEMPLATE)
+    page = get_pages_dir(output_file) / f"{test_class_name}.html"
+    page.write_text(template.render({"ALL_STEP_REPORT": {test_class_name: class_content}}))
+
+
+def _render_index(output_file: Path, status: Dict[str, bool]) -> None:
+    """Render the index page linking the page of each test class.
+
+    :param output_file: step report index path
+    :param status: success of each rendered test class
+    """
+    template = _get_environment().get_template(INDEX_TEMPLATE)
+    pages_dir = get_pages_dir(output_file).name
+    classes = [(name, f"{pages_dir}/{name}.html", succeed) for name, succeed in status.items()]
+    Path(output_file).write_text(template.render({"classes": classes}))
+
+
+def render_step_report(journal_path: Path, output_file: Path) -> None:
+    """Render the step report pages and index from a journal, for
+    instance after a crash of the test run.
+
+    :param journal_path: path of the JSON Lines journal
+    :param output_file: path of the step report index page
+    """
+    output_file = Path(output_file).resolve()
+    get_pages_dir(output_file).mkdir(parents=True, exist_ok=True)
+    offsets: Dict[str, List[int]] = OrderedDict()
+    for offset, record in _read_journal(journal_path):
+        offsets.setdefault(record["class"], []).append(offset)
+    status = OrderedDict()
+    for test_class_name, class_offsets in offsets.items():
+        class_content = _load_class(journal_path, class_offsets)
+        status[test_class_name] = _is_class_success(class_content)
+        _render_class_page(output_file, test_class_name, class_content)
+    _render_index(output_file, status)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    render_step_report(*sys.argv[1:3])
@@ -89,6 +89,9 @@ class TestInfo(xmlrunner.result._TestInfo):
             log_options.log_level,
             log_options.verbose,
             log_options.report_type,
+            async_logging=log_options.async_logging,
+            queue_size=log_options.queue_size,
+            overflow=log_options.overflow,
         )
 
         # handle class setup error
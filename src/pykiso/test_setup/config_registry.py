@@ -22,7 +22,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
 from ..exceptions import PykisoError
 from .dynamic_loader import DynamicImportLinker
@@ -112,10 +112,12 @@ class ConfigRegistry:
         return cchannel_to_auxiliaries
 
     @classmethod
-    def register_aux_con(cls, config: ConfigDict) -> None:
+    def register_aux_con(cls, config: ConfigDict, parallel_start: bool = False) -> None:
         """Create import hooks. Register auxiliaries and connectors.
 
         :param config: dictionary containing yaml configuration content
+        :param parallel_start: if True, create all auxiliaries
+            concurrently at registration instead of at their first import
         """
         # 1. Detect required proxy setups
         cchannel_to_auxiliaries = cls._link_cchannel_to_auxiliaries(config)
@@ -167,13 +169,32 @@ class ConfigRegistry:
             )
 
         # 5. Finally, import required ProxyAuxiliary instances so that user doesn't have to
-        for proxy_aux in proxies:
-            try:
+        try:
+            if parallel_start:
+                cls.start_auxiliaries()
+            for proxy_aux in proxies:
                 cls.get_aux_by_alias(proxy_aux)
-            except PykisoError:
-                # ensure that the created ProxyAuxiliary is stopped if its creation fails
-                cls.delete_aux_con()
-                raise
+        except PykisoError:
+            # ensure that the created auxiliaries are stopped if one creation fails
+            cls.delete_aux_con()
+            raise
+
+    @classmethod
+    def start_auxiliaries(
+        cls, aliases: Optional[Iterable[AuxiliaryAlias]] = None, max_workers: Optional[int] = None
+    ) -> Dict[AuxiliaryAlias, float]:
+        """Create the given auxiliaries concurrently.
+
+        Auxiliaries attached to a proxy auxiliary are created before it,
+        all other auxiliaries are created in parallel.
+
+        :param aliases: aliases of the auxiliaries to create, all
+            registered auxiliaries if None
+        :param max_workers: maximum number of auxiliaries created at the
+            same time
+        :return: the creation duration in seconds of each auxiliary
+        """
+        return cls._linker._aux_cache.start_auxiliaries(aliases, max_workers)
 
     @classmethod
     def delete_aux_con(cls) -> None:
@@ -185,17 +206,19 @@ class ConfigRegistry:
 
     @classmethod
     @contextmanager
-    def provide_auxiliaries(cls, config: ConfigDict) -> Iterator[None]:
+    def provide_auxiliaries(cls, config: ConfigDict, parallel_start: bool = False) -> Iterator[None]:
         """Context manager that registers importable auxiliary
         aliases and cleans them up at exit.
 
         :param config: config dictionary from the YAML configuration
             file.
+        :param parallel_start: if True, create all auxiliaries
+            concurrently at registration
 
         :yield: None
         """
         try:
-            cls.register_aux_con(config)
+            cls.register_aux_con(config, parallel_start)
             yield
         finally:
             cls.delete_aux_con()
@@ -20,6 +20,7 @@ Auxiliary Interface Definition
 
 from __future__ import annotations
 
+import concurrent.futures
 import importlib
 import importlib.abc
 import importlib.machinery
@@ -27,8 +28,11 @@ import importlib.util
 import logging
 import pathlib
 import sys
+import threading
+import time
 import types
-from typing import TYPE_CHECKING, Type, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Type, Union
 
 from pykiso.exceptions import ConnectorRequiredError
 
@@ -240,6 +244,10 @@ class AuxiliaryCache(ModuleCache):
         super().__init__()
         self.con_cache = con_cache
         self.connectors = dict()
+        self.start_timings: Dict[str, float] = dict()
+        self.stop_timings: Dict[str, float] = dict()
+        self._locks = defaultdict(threading.RLock)
+        self._locks_guard = threading.Lock()
 
     def provide(self, name: str, module: str, connectors=None, **config_params):
         """Provide an aliased instance.
@@ -253,6 +261,14 @@ class AuxiliaryCache(ModuleCache):
         super().provide(name, module, **config_params)
 
     def get_instance(self, name: str) -> AuxiliaryInterface:
+        """Get an instance of alias <name> (create and configure one of not existed)."""
+        with self._locks_guard:
+            lock = self._locks[name]
+        # avoid creating the same auxiliary twice when auxiliaries are started concurrently
+        with lock:
+            return self._get_instance(name)
+
+    def _get_instance(self, name: str) -> AuxiliaryInterface:
         """Get an instance of alias <name> (create and configure one of not existed)."""
         for cn, con in self.connectors.get(name, dict()).items():
             # add connector-instances as configs
@@ -276,11 +292,111 @@ class AuxiliaryCache(ModuleCache):
         self.instances[name] = inst
         return inst
 
-    def _stop_auxiliaries(self):
-        """Elegant workaround to shut down all the auxiliaries."""
-        for alias, aux in self.instances.items():
+    def get_dependencies(self, name: str) -> List[str]:
+        """Get the aliases of the auxiliaries the given auxiliary relies
+        on, e.g. the auxiliaries attached to a proxy auxiliary.
+
+        :param name: the auxiliary alias
+
+        :return: the aliases of the auxiliaries to create before
+            (and to stop before) the given one
+        """
+        aux_list = self.configs.get(name, dict()).get("aux_list") or []
+        return [aux for aux in aux_list if isinstance(aux, str) and aux in self.locations]
+
+    def start_auxiliaries(
+        self, names: Optional[Iterable[str]] = None, max_workers: Optional[int] = None
+    ) -> Dict[str, float]:
+        """Create the given auxiliaries concurrently.
+
+        Independent auxiliaries are created in parallel, whereas an
+        auxiliary is only created once all auxiliaries it depends on
+        (see :meth:`get_dependencies`) are created.
+
+        :param names: aliases of the auxiliaries to create, all provided
+            auxiliaries if None
+        :param max_workers: maximum number of auxiliaries created at the
+            same time, defaults to the ThreadPoolExecutor's default
+
+        :return: the creation duration in seconds of each auxiliary
+        """
+        names = list(self.locations) if names is None else list(names)
+        timings = self._run_in_dependency_order(names, self.get_instance, max_workers)
+        self.start_timings.update(timings)
+        self._log_timings("created", timings)
+        return timings
+
+    def _run_in_dependency_order(
+        self, names: List[str], action: Callable[[str], object], max_workers: Optional[int]
+    ) -> Dict[str, float]:
+        """Execute an action on each alias concurrently once the action
+        was executed on all of its dependencies.
+
+        :param names: aliases to execute the action on
+        :param action: callable taking the alias as only argument
+        :param max_workers: maximum number of actions executed in parallel
+
+        :raises ValueError: if the dependencies are circular
+        :return: the duration in seconds of each action
+        """
+
+        def timed_action(name: str) -> float:
+            start = time.perf_counter()
+            action(name)
+            return time.perf_counter() - start
+
+        remaining = {name: set(self.get_dependencies(name)) & set(names) for name in names}
+        timings = dict()
+        running = dict()
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix="aux_cache")
+        try:
+            while remaining or running:
+                for name in [name for name, dependencies in remaining.items() if not dependencies]:
+                    del remaining[name]
+                    running[pool.submit(timed_action, name)] = name
+                if not running:
+                    raise ValueError(f"Circular dependency between the auxiliaries {list(remaining)}")
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    timings[name] = future.result()
+                    for dependencies in remaining.values():
+                        dependencies.discard(name)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        return timings
+
+    @staticmethod
+    def _log_timings(action: str, timings: Dict[str, float]) -> None:
+        """Log the duration of the action executed on each auxiliary,
+        slowest first.
+
+        :param action: action executed on the auxiliaries
+        :param timings: duration in seconds of the action per alias
+        """
+        for alias, duration in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+            log.internal_info(f"auxiliary '{alias}' {action} in {duration:.3f}s")
+
+    def _stop_auxiliaries(self, max_workers: Optional[int] = None):
+        """Elegant workaround to shut down all the auxiliaries.
+
+        The auxiliaries are stopped concurrently, an auxiliary being only
+        stopped once all auxiliaries it depends on are stopped.
+
+        :param max_workers: maximum number of auxiliaries stopped at the
+            same time
+        """
+
+        def stop(alias: str) -> None:
+            aux = self.instances[alias]
             log.internal_debug(f"issuing stop for auxiliary '{aux}'")
             aux.stop()
+
+        timings = self._run_in_dependency_order(list(self.instances), stop, max_workers)
+        self.stop_timings.update(timings)
+        self._log_timings("stopped", timings)
+
+        for alias in self.instances:
             aux_mod = f"{AuxLinkLoader._COMMON_PREFIX}.{alias}"
             # ensure that the module was created
             if sys.modules.get(aux_mod) is not None:
@@ -0,0 +1,137 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Report merging
+**************
+
+:module: merge_reports
+
+:synopsis: Combine the JUnit reports and step reports of the shards of a
+    test run into a single JUnit report and step report. Meant to be
+    invoked as ``pykiso-merge`` CLI utility.
+
+The step reports can only be merged from their journal, the shards must
+therefore be run with ``--step-report-streaming``.
+
+.. currentmodule:: merge_reports
+"""
+
+import shutil
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import click
+from junitparser.cli import merge as merge_junit_xml
+
+from pykiso.test_result.step_report_journal import get_journal_path, render_step_report
+from pykiso.types import PathType
+
+
+def find_reports(paths: Tuple[PathType]) -> Tuple[List[Path], List[Path]]:
+    """Find the JUnit reports and step report journals to merge.
+
+    Folders are searched recursively for JUnit reports (``.xml``) and
+    step reports (``.html``) having a journal.
+
+    :param paths: report files or folders containing them
+    :raises click.BadParameter: if a step report has no journal or a
+        file is neither a JUnit report nor a step report
+    :return: the JUnit reports and the step report journals
+    """
+    junit_reports, journals = [], []
+    for path in map(Path, paths):
+        if path.is_dir():
+            junit_reports.extend(sorted(path.glob("**/*.xml")))
+            journals.extend(
+                get_journal_path(html) for html in sorted(path.glob("**/*.html")) if get_journal_path(html).is_file()
+            )
+        elif path.suffix == ".xml":
+            junit_reports.append(path)
+        elif path.suffix == ".jsonl":
+            journals.append(path)
+        elif path.suffix == ".html":
+            if not get_journal_path(path).is_file():
+                raise click.BadParameter(
+                    f"no journal found for the step report {path}, run the shards with --step-report-streaming"
+                )
+            journals.append(get_journal_path(path))
+        else:
+            raise click.BadParameter(f"{path} is neither a JUnit report nor a step report")
+    return junit_reports, journals
+
+
+def merge_step_reports(journals: List[Path], output_file: PathType) -> None:
+    """Merge step report journals and render the combined step report.
+
+    :param journals: journals of the step reports to merge
+    :param output_file: path of the merged step report index page
+    """
+    output_journal = get_journal_path(Path(output_file).resolve())
+    output_journal.parent.mkdir(parents=True, exist_ok=True)
+    with output_journal.open("wb") as merged:
+        for journal in journals:
+            with journal.open("rb") as shard_journal:
+                shutil.copyfileobj(shard_journal, merged)
+    render_step_report(output_journal, output_file)
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.argument("reports", nargs=-1, required=True, type=click.Path(exists=True, readable=True))
+@click.option(
+    "-j",
+    "--junit",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Path of the merged JUnit report.",
+)
+@click.option(
+    "-s",
+    "--step-report",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Path of the merged step report, the shards have to be run with --step-report-streaming.",
+)
+def main(reports: Tuple[PathType], junit: Optional[PathType] = None, step_report: Optional[PathType] = None) -> None:
+    """Merge the JUnit reports and step reports of test run shards.
+
+    REPORTS are JUnit reports, step reports or folders containing them.
+
+    For example: pykiso-merge --junit merged.xml --step-report merged.html shard_0/ shard_1/
+
+    \f
+    :param reports: report files or folders containing them
+    :param junit: path of the merged JUnit report
+    :param step_report: path of the merged step report
+    """
+    if junit is None and step_report is None:
+        raise click.UsageError("at least one of --junit or --step-report has to be provided")
+
+    junit_reports, journals = find_reports(reports)
+    # do not merge the outputs of a previous merge located in a searched folder
+    if junit is not None:
+        junit_reports = [report for report in junit_reports if report.resolve() != Path(junit).resolve()]
+    if step_report is not None:
+        output_journal = get_journal_path(Path(step_report).resolve())
+        journals = [journal for journal in journals if journal.resolve() != output_journal]
+
+    if junit is not None:
+        if not junit_reports:
+            raise click.UsageError("no JUnit report found to merge")
+        Path(junit).parent.mkdir(parents=True, exist_ok=True)
+        merge_junit_xml([str(report) for report in junit_reports], str(junit), None)
+        click.echo(f"Merged {len(junit_reports)} JUnit report(s) into {junit}")
+
+    if step_report is not None:
+        if not journals:
+            raise click.UsageError("no step report found to merge, run the shards with --step-report-streaming")
+        merge_step_reports(journals, step_report)
+        click.echo(f"Merged {len(journals)} step report(s) into {step_report}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -25,7 +25,7 @@ import json
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from unittest import mock  # used to disable the test auxiliaries run
 
 import click
@@ -34,6 +34,7 @@ from tabulate import tabulate
 from pykiso.config_parser import parse_config
 from pykiso.exceptions import TestCollectionError
 from pykiso.test_coordinator import test_case, test_execution
+from pykiso.test_coordinator.collection_cache import CachedTest, CollectionCache, get_cached_tests
 from pykiso.types import PathType
 
 
@@ -64,11 +65,16 @@ def get_yaml_files(config_path: PathType, recursive: bool) -> List[Path]:
     return config_files
 
 
-def get_test_cases(cfg_dict: Dict[str, List[dict]]) -> List[test_case.BasicTest]:
+def get_test_cases(
+    cfg_dict: Dict[str, List[dict]], cache: Optional[CollectionCache] = None
+) -> List[Union[test_case.BasicTest, CachedTest]]:
     """Return the list of tests meant to be run by the provided
     test configuration file.
 
     :param cfg_dict: loaded configuration yaml file.
+    :param cache: collection cache, the test cases are taken from it
+        without loading the test modules if none of the test suites
+        changed, otherwise it is updated with the loaded test cases.
     :raises ValueError: if no test suite is specified in the
         configuration file.
     :return: list of tests meant to be run by the yaml file.
@@ -76,36 +82,48 @@ def get_test_cases(cfg_dict: Dict[str, List[dict]]) -> List[test_case.BasicTest]
     if "test_suite_list" not in cfg_dict:
         raise ValueError("Provided YAML file does not define a test suite")
 
-    test_suites = test_execution.collect_test_suites(cfg_dict["test_suite_list"])
+    if cache is not None:
+        cached_tests = get_cached_tests(cfg_dict["test_suite_list"], cache)
+        if cached_tests is not None:
+            return cached_tests
+
+    test_suites = test_execution.collect_test_suites(cfg_dict["test_suite_list"], cache=cache)
     test_cases = [tc for ts in test_suites if ts is not None for tc in ts._tests]
     return test_cases
 
 
-def get_test_tags(test_case_list: List[test_case.BasicTest]) -> Dict[str, List[str]]:
+def get_test_name(test: Union[test_case.BasicTest, CachedTest]) -> str:
+    """Return the qualified name of the class of a test case.
+
+    :param test: loaded or cached test case.
+    :return: the module and class name of the test case.
+    """
+    if isinstance(test, CachedTest):
+        return f"{test.module}.{test.class_name}"
+    return f"{test.__module__}.{test.__class__.__qualname__}"
+
+
+def get_test_tags(test_case_list: List[Union[test_case.BasicTest, CachedTest]]) -> Dict[str, List[str]]:
     """Return the list of tag and values contained in the test case list
 
     :param test_case_list: list of loaded test cases.
     :return: dictionary linking the tag names to their values.
     """
-    tag_dict = {}
+    tag_dict: Dict[str, Set[str]] = {}
     # search the tag for each test case
     for testCase in test_case_list:
         if testCase.tag is None:
             continue
         for tag_name, tag_values in testCase.tag.items():
-            if tag_name not in tag_dict:
-                tag_dict[tag_name] = list()
-            # tag values are lists of strings
-            tag_dict[tag_name].extend(tag_values)
-            # remove duplicated tag values
-            tag_dict[tag_name] = sorted(set(tag_dict[tag_name]))
+            # tag values are lists of strings, duplicated values are removed
+            tag_dict.setdefault(tag_name, set()).update(tag_values)
 
-    return tag_dict
+    return {tag_name: sorted(tag_values) for tag_name, tag_values in tag_dict.items()}
 
 
 def build_result_dict(
     config_file_name: str,
-    test_case_list: List[test_case.BasicTest],
+    test_case_list: List[Union[test_case.BasicTest, CachedTest]],
     test_tags: Dict[str, list],
     show_test_cases: bool = False,
 ) -> Dict[str, Union[str, int]]:
@@ -126,9 +144,7 @@ def build_result_dict(
         "Number of tests": len(test_case_list),
     }
     if show_test_cases:
-        config_result_dict.update(
-            {"Test cases": "\n".join(f"{test.__module__}.{test.__class__.__qualname__}" for test in test_case_list)}
-        )
+        config_result_dict.update({"Test cases": "\n".join(get_test_name(test) for test in test_case_list)})
     if test_tags:
         tag_dict = {tag_name: "\n".join(tag_list) for tag_name, tag_list in test_tags.items()}
         config_result_dict = {**config_result_dict, **tag_dict}
@@ -199,11 +215,21 @@ def tabulate_test_information(
     Extend the resulting table with all loaded test cases per configuration file.
     """,
 )
+@click.option(
+    "--cache",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="""
+    JSON file caching the loaded test cases, test suites that did not change
+    since the last analysis are not loaded again.
+    """,
+)
 def main(
     test_configuration: Tuple[PathType],
     output: Optional[PathType] = None,
     recurse_dir: bool = False,
     show_tests: bool = False,
+    cache: Optional[PathType] = None,
 ):
     """Embedded Integration Test Framework - Test tag analysis.
 
@@ -228,6 +254,8 @@ def main(
         Supported formats are csv, json and txt.
     :param recurse_dir: if a folder is provided, recurse all
         subfolders to find configuration files (default: False).
+    :param show_tests: list the loaded test cases of each configuration file.
+    :param cache: optional path to the collection cache file.
     """
     # disable logging
     logging.getLogger().setLevel(logging.CRITICAL)
@@ -235,6 +263,7 @@ def main(
     sys.modules["pykiso.auxiliaries"] = mock.MagicMock()
 
     all_results: List[Dict[str, Any]] = list()
+    collection_cache = CollectionCache(cache) if cache is not None else None
 
     click.echo("\nStart analyzing provided configuration file...")
     # handle multiple files or folders provided by the user
@@ -252,7 +281,7 @@ def main(
 
             try:
                 # get all test cases meant to be loaded by the config file
-                test_cases = get_test_cases(cfg_dict)
+                test_cases = get_test_cases(cfg_dict, collection_cache)
             except ValueError as e:
                 click.echo(f"Failed to load test cases from config file {config_file.name}: {e.args[0]}")
                 continue
@@ -265,6 +294,9 @@ def main(
             single_config_result = build_result_dict(config_file.name, test_cases, tags, show_test_cases=show_tests)
             all_results.append(single_config_result)
 
+    if collection_cache is not None:
+        collection_cache.save()
+
     table_header, table_data = tabulate_test_information(all_results)
     table = tabulate(table_data, headers=table_header, tablefmt="fancy_grid")
 
@@ -0,0 +1,144 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Traffic trace conversion
+************************
+
+:module: traffic_trace
+
+:synopsis: Convert the traffic recordings of the connectors to text,
+    optionally filtered. Meant to be invoked as ``pykiso-trace`` CLI
+    utility.
+
+.. currentmodule:: traffic_trace
+"""
+
+import datetime
+from typing import Iterable, Iterator, Optional, Tuple
+
+import click
+
+from pykiso.traffic_recorder import Direction, TraceFrame, TraceReader
+from pykiso.types import PathType
+
+
+def filter_frames(
+    frames: Iterable[TraceFrame],
+    direction: Optional[Direction] = None,
+    remote_ids: Tuple[int, ...] = (),
+    pattern: Optional[bytes] = None,
+) -> Iterator[TraceFrame]:
+    """Select the frames matching all given criteria.
+
+    :param frames: frames to filter
+    :param direction: only keep the frames of this direction
+    :param remote_ids: only keep the frames with one of these remote ids
+    :param pattern: only keep the frames whose data contain these bytes
+
+    :return: the matching frames
+    """
+    for frame in frames:
+        if direction is not None and frame.direction != direction:
+            continue
+        if remote_ids and frame.remote_id not in remote_ids:
+            continue
+        if pattern is not None and pattern not in frame.data:
+            continue
+        yield frame
+
+
+def format_frame(frame: TraceFrame) -> str:
+    """Format a frame as one line of text.
+
+    :param frame: frame to format
+    :return: the time, direction, remote id, length and data of the frame
+    """
+    timestamp = datetime.datetime.fromtimestamp(frame.timestamp).isoformat(timespec="microseconds")
+    remote_id = "-" if frame.remote_id is None else f"0x{frame.remote_id:X}"
+    return f"{timestamp} {frame.direction.name} {remote_id} [{len(frame.data)}] {frame.data.hex(' ').upper()}"
+
+
+def parse_remote_id(ctx: click.Context, param: click.Parameter, values: Tuple[str, ...]) -> Tuple[int, ...]:
+    """Parse the remote ids given in decimal or hexadecimal notation."""
+    try:
+        return tuple(int(value, 0) for value in values)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def parse_pattern(ctx: click.Context, param: click.Parameter, value: Optional[str]) -> Optional[bytes]:
+    """Parse the searched bytes given in hexadecimal notation."""
+    if value is None:
+        return None
+    try:
+        return bytes.fromhex(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.argument("recording", type=click.Path(exists=True, dir_okay=False, readable=True))
+@click.option(
+    "-d",
+    "--direction",
+    type=click.Choice([direction.name for direction in Direction], case_sensitive=False),
+    help="only show the received (RX) or sent (TX) frames",
+)
+@click.option(
+    "-i",
+    "--remote-id",
+    multiple=True,
+    callback=parse_remote_id,
+    help="only show the frames with this remote id, e.g. 0x7E0, can be given several times",
+)
+@click.option(
+    "-c",
+    "--contains",
+    callback=parse_pattern,
+    help="only show the frames containing these bytes in hexadecimal, e.g. '62 F1 90'",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="write the text to this file instead of the standard output",
+)
+def main(
+    recording: PathType,
+    direction: Optional[str] = None,
+    remote_id: Tuple[int, ...] = (),
+    contains: Optional[bytes] = None,
+    output: Optional[PathType] = None,
+) -> None:
+    """Convert a traffic recording to text, one frame per line.
+
+    For example: pykiso-trace can.pktrace --direction RX --remote-id 0x7E8
+
+    \f
+    :param recording: path of the recording
+    :param direction: only show the frames of this direction
+    :param remote_id: only show the frames with one of these remote ids
+    :param contains: only show the frames containing these bytes
+    :param output: path of the text file, standard output by default
+    """
+    try:
+        reader = TraceReader(recording)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'RECORDING'")
+
+    frames = filter_frames(reader, Direction[direction.upper()] if direction else None, remote_id, contains)
+    with click.open_file(output or "-", "w") as text:
+        text.write(f"# {reader.name}\n")
+        for frame in frames:
+            text.write(format_frame(frame) + "\n")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
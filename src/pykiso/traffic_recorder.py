@@ -0,0 +1,259 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+"""
+Traffic recorder
+****************
+
+:module: traffic_recorder
+
+:synopsis: record the raw frames sent and received by a channel in a
+    compact binary file and read them back.
+
+A recording starts with a header made of the magic bytes ``PKTR``, the
+format version and the name of the recorded channel::
+
+    magic (4s) | version (uint16) | name length (uint16) | name (utf-8)
+
+It is followed by one record per frame, prefixed with the length of the
+frame data::
+
+    length (uint32) | timestamp (float64) | direction (uint8) | remote id (int64) | data
+
+All integers are little endian, the timestamp is in seconds since the
+epoch and the remote id is -1 if the frame has none.
+
+The frames are packed by the thread sending or receiving them and
+written in batches by a writer thread, so that recording does not wait
+for the disk. A recording interrupted before the recorder was closed can
+still be read up to its last complete frame.
+
+Recording is enabled on any connector with its ``record_path``
+parameter, see :py:class:`~pykiso.connector.CChannel`, and the
+recordings are converted to text with the ``pykiso-trace`` tool.
+
+.. currentmodule:: traffic_recorder
+
+"""
+from __future__ import annotations
+
+import enum
+import logging
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional
+
+from .types import MsgType, PathType
+
+log = logging.getLogger(__name__)
+
+#: magic bytes starting a recording
+MAGIC = b"PKTR"
+#: version of the recording format
+FORMAT_VERSION = 1
+#: file extension of the recordings
+RECORDING_SUFFIX = ".pktrace"
+
+_FILE_HEADER = struct.Struct("<4sHH")
+_FRAME_HEADER = struct.Struct("<IdBq")
+_NO_REMOTE_ID = -1
+
+
+class Direction(enum.IntEnum):
+    """Direction of a recorded frame."""
+
+    RX = 0
+    TX = 1
+
+
+class TraceFrame(NamedTuple):
+    """Frame read from a recording."""
+
+    #: time of the frame in seconds since the epoch
+    timestamp: float
+    direction: Direction
+    #: remote id of the frame, None if it has none
+    remote_id: Optional[int]
+    data: bytes
+
+
+def to_bytes(msg: MsgType) -> bytes:
+    """Get the raw data of a sent or received message.
+
+    :param msg: message given to or returned by a channel
+    :return: the message itself if it is a bytes-like object, the UTF-8
+        encoded string, the serialized pykiso message or the string
+        representation of any other object
+    """
+    if isinstance(msg, (bytes, bytearray, memoryview)):
+        return bytes(msg)
+    if isinstance(msg, str):
+        return msg.encode()
+    serialize = getattr(msg, "serialize", None)
+    if callable(serialize):
+        return serialize()
+    return str(msg).encode()
+
+
+class TrafficRecorder:
+    """Record frames into a file from a writer thread."""
+
+    def __init__(self, path: PathType, name: str = "", flush_interval: float = 0.5) -> None:
+        """Open the recording and start the writer thread. An existing
+        recording is appended to.
+
+        :param path: path of the recording
+        :param name: name of the recorded channel, written in the header
+            of a new recording
+        :param flush_interval: maximum time in seconds a frame waits
+            before being written
+        """
+        self.path = Path(path)
+        self.name = name
+        self.flush_interval = flush_interval
+        #: number of recorded frames
+        self.frames = 0
+        #: number of bytes written to the recording
+        self.written = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = self.path.open("ab")
+        if self._file.tell() == 0:
+            encoded_name = name.encode()
+            self._write([_FILE_HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded_name)), encoded_name])
+        self._pending: List[bytes] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(name=f"{name or self.path.name}.Recorder", target=self._run, daemon=True)
+        self._thread.start()
+        log.internal_info("recording traffic of %s to %s", name, self.path)
+
+    def __enter__(self) -> TrafficRecorder:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """True once the recorder is closed."""
+        return self._closed
+
+    def record(self, direction: Direction, msg: MsgType, remote_id: Optional[int] = None) -> None:
+        """Queue a frame to be written. Frames recorded after the recorder
+        is closed are ignored.
+
+        :param direction: direction of the frame
+        :param msg: sent or received message, see :py:func:`to_bytes`
+        :param remote_id: remote id of the frame, e.g. a CAN identifier
+        """
+        data = to_bytes(msg)
+        header = _FRAME_HEADER.pack(
+            len(data), time.time(), direction, _NO_REMOTE_ID if remote_id is None else remote_id
+        )
+        with self._condition:
+            if self._closed:
+                return
+            self._pending.append(header)
+            self._pending.append(data)
+            self.frames += 1
+            if len(self._pending) == 2:
+                self._condition.notify()
+
+    def close(self) -> None:
+        """Write the queued frames, stop the writer thread and close the
+        recording."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._file.close()
+        log.internal_info("recorded %d frames of %s to %s", self.frames, self.name, self.path)
+
+    def _write(self, chunks: List[bytes]) -> None:
+        """Write chunks of data to the recording."""
+        data = b"".join(chunks)
+        self._file.write(data)
+        self.written += len(data)
+
+    def _run(self) -> None:
+        """Write the queued frames in batches until closed."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                # let the frames accumulate to write them in large batches
+                self._condition.wait_for(lambda: self._closed, timeout=self.flush_interval)
+                batch, self._pending = self._pending, []
+                closed = self._closed
+            self._write(batch)
+            self._file.flush()
+            if closed:
+                return
+
+
+class TraceReader:
+    """Read the frames of a recording."""
+
+    def __init__(self, path: PathType) -> None:
+        """Read the header of a recording.
+
+        :param path: path of the recording
+
+        :raises ValueError: if the file is not a recording or if its
+            format version is not supported
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            header = file.read(_FILE_HEADER.size)
+            if len(header) < _FILE_HEADER.size or header[:4] != MAGIC:
+                raise ValueError(f"{self.path} is not a traffic recording")
+            _, version, name_length = _FILE_HEADER.unpack(header)
+            if version > FORMAT_VERSION:
+                raise ValueError(f"format version {version} of {self.path} is not supported")
+            self.version = version
+            #: name of the recorded channel
+            self.name = file.read(name_length).decode(errors="replace")
+            self._offset = file.tell()
+
+    def __iter__(self) -> Iterator[TraceFrame]:
+        """Read the frames, oldest first. An incomplete last frame is
+        ignored."""
+        with self.path.open("rb") as file:
+            file.seek(self._offset)
+            while True:
+                header = file.read(_FRAME_HEADER.size)
+                if not header:
+                    return
+                if len(header) < _FRAME_HEADER.size:
+                    break
+                length, timestamp, direction, remote_id = _FRAME_HEADER.unpack(header)
+                data = file.read(length)
+                if len(data) < length:
+                    break
+                yield TraceFrame(
+                    timestamp, Direction(direction), None if remote_id == _NO_REMOTE_ID else remote_id, data
+                )
+        log.internal_warning("%s ends with an incomplete frame, it was not closed properly", self.path)
+
+
+def read_trace(path: PathType) -> Iterator[TraceFrame]:
+    """Read the frames of a recording.
+
+    :param path: path of the recording
+
+    :raises ValueError: if the file is not a recording or if its format
+        version is not supported
+
+    :return: an iterator over the frames, oldest first
+    """
+    return iter(TraceReader(path))
@@ -19,6 +19,12 @@ RemoteTest.__test__ = False
 _SubTest.__test__ = False
 
 
+@pytest.fixture(autouse=True)
+def all_step_report(mocker):
+    # restore the global step report after each test
+    mocker.patch.object(assert_step_report, "ALL_STEP_REPORT", OrderedDict())
+
+
 @pytest.fixture
 def test_case():
     tc = TestCase()
@@ -209,9 +215,10 @@ def test_generate(mocker, test_result):
     assert_step_report.ALL_STEP_REPORT["TestClassName"]["time_result"]["Start Time"] = 1
     assert_step_report.ALL_STEP_REPORT["TestClassName"]["time_result"]["End Time"] = 2
     assert_step_report.ALL_STEP_REPORT["TestClassName"]["time_result"]["Elapsed Time"] = 1
+    assert_step_report.ALL_STEP_REPORT["TestClassName"]["test_list"] = OrderedDict()
 
-    jinja2.FileSystemLoader = mock_loader = mock.MagicMock()
-    jinja2.Environment = mock_environment = mock.MagicMock()
+    mocker.patch.object(jinja2, "FileSystemLoader")
+    mocker.patch.object(jinja2, "Environment")
 
     mock_path = mock.MagicMock()
     mocker.patch.object(pathlib.Path, "resolve", return_value=mock_path)
@@ -238,6 +245,7 @@ def test_add_step():
         4.5,
     )
     assert len(steplist) == 1
+    assert isinstance(steplist[-1][0]["timestamp"], float)
 
 
 def test_is_test_success():
@@ -270,21 +278,27 @@ def test_is_test_success():
     ],
 )
 def test_determine_parent_test_function(mocker, parent_method):
-    frame = inspect.FrameInfo(
-        "frame",
-        "filename",
-        "lineno",
-        parent_method,
-        "code_context",
-        "index",
-    )
-    mocker.patch.object(inspect, "stack", return_value=[frame])
+    parent_frame = mocker.MagicMock(f_back=None)
+    parent_frame.f_code.co_name = parent_method
+    frame = mocker.MagicMock(f_back=parent_frame)
+    frame.f_code.co_name = "whaou_function"
 
-    function = assert_step_report.determine_parent_test_function("whaou_function")
+    function = assert_step_report.determine_parent_test_function("whaou_function", frame)
 
     assert function == parent_method
 
 
+def test_determine_parent_test_function_outermost(mocker):
+    frames = None
+    for name in ("test_run", "test_helper", "setUp", "helper"):
+        frames = mocker.MagicMock(f_back=frames)
+        frames.f_code.co_name = name
+
+    function = assert_step_report.determine_parent_test_function("helper", frames)
+
+    assert function == "setUp"
+
+
 @pytest.mark.parametrize(
     "function_name",
     [
@@ -377,3 +391,73 @@ def test_assert_decorator_step_report_assert_called_in_unittest(mocker, remote_t
         "Equal to Test",
         "Test",
     )
+
+
+def test_assert_decorator_call_site_cached(mocker, test_case):
+    step_result = mocker.patch("pykiso.test_result.assert_step_report._add_step")
+    get_variable_name = mocker.spy(assert_step_report, "_get_variable_name")
+    determine_parent = mocker.spy(assert_step_report, "determine_parent_test_function")
+
+    for data_to_test in (True, 1, "x"):
+        test_case.assertTrue(data_to_test)
+
+    get_variable_name.assert_called_once()
+    determine_parent.assert_called_once()
+    assert step_result.call_count == 3
+    step_result.assert_called_with(
+        "TestCase", "test_assert_decorator_call_site_cached", "", "data_to_test", "True", "x"
+    )
+
+
+def test_assert_decorator_call_site_cached_deprecated(mocker, remote_test_case):
+    step_result = mocker.patch("pykiso.test_result.assert_step_report._add_step")
+    remote_test_case.assertEquals = assert_step_report.assert_decorator(remote_test_case.assertEquals)
+
+    for var in ("Test", "Test"):
+        remote_test_case.assertEquals(var, "Test")
+
+    assert step_result.call_args_list[0] == step_result.call_args_list[1]
+    assert step_result.call_args.args[4] == "Equals to Test"
+
+
+def test_assert_decorator_call_site_helper_not_cached(mocker, test_case):
+    step_result = mocker.patch("pykiso.test_result.assert_step_report._add_step")
+
+    def check(value):
+        test_case.assertTrue(value)
+
+    def setUp():
+        check(True)
+
+    setUp()
+    check(True)
+
+    assert [call.args[1] for call in step_result.call_args_list] == [
+        "setUp",
+        "test_assert_decorator_call_site_helper_not_cached",
+    ]
+
+
+@pytest.mark.parametrize(
+    "args,kwargs",
+    [
+        ((1, 2), {}),
+        ((1, 2), {"delta": 1, "msg": "message"}),
+        ((1,), {"second": 2, "places": 3}),
+        ((1, 2, 3, "message"), {}),
+    ],
+)
+def test_signature_layout_bind(test_case, args, kwargs):
+    signature = inspect.signature(TestCase().assertAlmostEqual)
+    layout = assert_step_report._SignatureLayout(signature)
+
+    arguments = layout.bind(args, kwargs)
+
+    assert list(arguments.items()) == list(signature.bind(*args, **kwargs).arguments.items())
+
+
+def test_signature_layout_bind_invalid(test_case):
+    layout = assert_step_report._SignatureLayout(inspect.signature(TestCase().assertTrue))
+
+    with pytest.raises(TypeError):
+        layout.bind((True,), {"expr": True})
@@ -0,0 +1,197 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import queue
+import socket
+import threading
+
+import pytest
+
+from pykiso import auxiliary_reactor
+from pykiso.auxiliary import AuxiliaryInterface
+from pykiso.auxiliary_reactor import AuxiliaryReactor, ReactorQueue, configure_reactor
+from pykiso.lib.connectors.cc_proxy import CCProxy
+
+
+class EchoAux(AuxiliaryInterface):
+    def __init__(self, channel=None, **kwargs):
+        super().__init__(name="echo", use_reactor=True, **kwargs)
+        self.channel = channel
+        self.received = queue.Queue()
+
+    def _create_auxiliary_instance(self):
+        return True
+
+    def _delete_auxiliary_instance(self):
+        return True
+
+    def _run_command(self, cmd_message, cmd_data=None):
+        self.queue_out.put((cmd_message, cmd_data))
+
+    def _receive_message(self, timeout_in_s):
+        if self.channel is None:
+            self.received.put(timeout_in_s)
+        elif isinstance(self.channel, socket.socket):
+            self.received.put(self.channel.recv(16))
+        else:
+            self.received.put(self.channel.cc_receive(timeout=timeout_in_s)["msg"])
+
+
+class IdleChannel:
+    """Polled channel counting the messages it received."""
+
+    def __init__(self):
+        self.rx_count = 0
+
+    def cc_receive(self, timeout):
+        return {"msg": None}
+
+
+@pytest.fixture
+def reactor(mocker):
+    reactor = AuxiliaryReactor(workers=2, poll_interval=0.001)
+    mocker.patch.object(auxiliary_reactor, "_reactor", reactor)
+    yield reactor
+    reactor.stop()
+
+
+def test_reactor_queue_notifies_on_put():
+    notified = threading.Event()
+    reactor_queue = ReactorQueue(notified.set)
+
+    reactor_queue.put(1)
+
+    assert notified.is_set()
+    assert reactor_queue.get_nowait() == 1
+
+
+def test_get_reactor_is_shared(reactor):
+    assert auxiliary_reactor.get_reactor() is reactor
+    assert reactor.is_running
+
+
+def test_reactor_runs_commands(reactor):
+    aux = EchoAux()
+    aux.create_instance()
+
+    response = aux.run_command("send", b"\x01", timeout_in_s=1)
+
+    aux.delete_instance()
+    assert response == ("send", b"\x01")
+    assert aux.tx_thread is None and aux.rx_thread is None
+
+
+def test_reactor_polls_channel_without_fileno(reactor):
+    aux = EchoAux()
+    aux.create_instance()
+
+    timeout = aux.received.get(timeout=1)
+    aux.received.get(timeout=1)
+
+    aux.delete_instance()
+    assert timeout == reactor.poll_timeout
+
+
+def test_reactor_selects_channel_with_fileno(reactor):
+    sock_read, sock_write = socket.socketpair()
+    aux = EchoAux(channel=sock_read)
+    aux.create_instance()
+
+    sock_write.send(b"\x01\x02")
+    received = aux.received.get(timeout=1)
+
+    aux.delete_instance()
+    sock_read.close()
+    sock_write.close()
+    assert received == b"\x01\x02"
+    assert aux.received.empty()
+
+
+def test_reactor_unregister_stops_reception(reactor):
+    aux = EchoAux()
+    aux.create_instance()
+    aux.received.get(timeout=1)
+
+    aux.delete_instance()
+    with aux.received.mutex:
+        aux.received.queue.clear()
+
+    with pytest.raises(queue.Empty):
+        aux.received.get(timeout=0.05)
+
+
+def test_reactor_stop(reactor):
+    reactor.start()
+
+    reactor.stop()
+
+    assert not reactor.is_running
+
+
+def test_reactor_notified_channel(reactor, mocker):
+    channel = CCProxy()
+    channel.open()
+    aux = EchoAux(channel=channel)
+    schedule_spy = mocker.spy(reactor, "_schedule_poll")
+    aux.create_instance()
+    # the reception job checking the messages received before the registration
+    assert aux.received.get(timeout=1) is None
+
+    channel.queue_out.put({"msg": b"\x01"})
+    channel.queue_out.put({"msg": b"\x02"})
+
+    assert aux.received.get(timeout=1) == b"\x01"
+    assert aux.received.get(timeout=1) == b"\x02"
+    aux.delete_instance()
+    channel.close()
+    # notified channels are never polled
+    schedule_spy.assert_not_called()
+    assert channel._rx_notifier is None
+    with pytest.raises(queue.Empty):
+        aux.received.get(timeout=0.05)
+
+
+def test_reactor_polling_backs_off(reactor):
+    reactor.max_poll_interval = 0.004
+    aux = EchoAux()
+    aux.channel = IdleChannel()
+    aux.create_instance()
+    for _ in range(4):
+        aux.received.get(timeout=1)
+
+    with reactor._lock:
+        assert reactor._poll_intervals[aux] == 0.004
+    aux.channel.rx_count += 1
+    aux.received.get(timeout=1)
+    aux.received.get(timeout=1)
+
+    aux.delete_instance()
+    assert aux not in reactor._poll_intervals
+
+
+def test_reactor_set_workers(reactor):
+    reactor.start()
+
+    reactor.set_workers(3)
+    assert len(reactor._worker_threads) == 3
+    reactor.set_workers(1)
+    for worker in [thread for thread in reactor._worker_threads]:
+        worker.join(timeout=0.05)
+
+    assert reactor.workers == 1
+    assert len(reactor._worker_threads) == 1
+    with pytest.raises(ValueError, match="at least one worker"):
+        reactor.set_workers(0)
+
+
+def test_configure_reactor(reactor):
+    assert configure_reactor(workers=3, poll_interval=0.02, max_poll_interval=0.01) is reactor
+
+    assert reactor.workers == 3
+    assert reactor.poll_interval == reactor.max_poll_interval == 0.02
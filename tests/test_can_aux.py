@@ -388,3 +388,26 @@ class TestCanAux:
         assert messages[0].signals == {"signal_a": 116, "signal_b": 101}
         assert messages[0].timestamp == 0.0
         assert len(messages) == 1
+
+    def test_send_message_periodically(self, can_aux_instance, mocker):
+        cc_send_mock = mocker.patch.object(can_aux_instance.channel, "cc_send")
+        mocker.patch.object(can_aux_instance.channel, "close")
+
+        job = can_aux_instance.send_message_periodically("Message_1", {"signal_a": 1, "signal_b": 5}, 0.01)
+        time.sleep(0.055)
+        can_aux_instance._delete_auxiliary_instance()
+        send_count = cc_send_mock.call_count
+        time.sleep(0.03)
+
+        assert job.cancelled
+        assert can_aux_instance._periodic_jobs == []
+        assert cc_send_mock.call_count == send_count
+        assert 4 <= send_count <= 7
+        cc_send_mock.assert_called_with(b"\x01\x05\x00\x00", remote_id=16)
+        assert job.statistics.executions == send_count
+
+    def test_send_message_periodically_with_wrong_msg_name(self, can_aux_instance):
+        with pytest.raises(ValueError, match=r"Message_2 is not a message defined in the DBC file."):
+            can_aux_instance.send_message_periodically("Message_2", {"signal_a": 1}, 0.01)
+
+        assert can_aux_instance._periodic_jobs == []
@@ -7,9 +7,12 @@
 # SPDX-License-Identifier: EPL-2.0
 ##########################################################################
 
+import threading
+
 import pytest
 
-from pykiso.lib.connectors.cc_proxy import CCProxy, queue
+from pykiso.exceptions import ProxyBufferOverflowError
+from pykiso.lib.connectors.cc_proxy import BroadcastRing, CCProxy, OverflowPolicy, RingSubscriber, queue
 
 
 def test_constructor():
@@ -95,3 +98,191 @@ def test_attached_tx_callback_replace():
         proxy_inst.attach_tx_callback(func_2)
         assert proxy_inst._tx_callback != func_1
         assert proxy_inst._tx_callback == func_2
+
+
+def test_ring_buffer_broadcast():
+    ring = BroadcastRing(capacity=4)
+    sub_1 = ring.subscribe("sub_1")
+    sub_2 = ring.subscribe("sub_2")
+
+    ring.publish({"msg": b"\x01"})
+    ring.publish({"msg": b"\x02"}, exclude="sub_1")
+
+    record = sub_1.get_nowait()
+    assert record == {"msg": b"\x01"}
+    assert record is sub_2.get_nowait()
+    assert sub_2.get_nowait() == {"msg": b"\x02"}
+    assert sub_1.empty() is False
+    with pytest.raises(queue.Empty):
+        sub_1.get(timeout=0.01)
+    assert sub_1.empty() and sub_2.empty()
+    with pytest.raises(TypeError):
+        record["msg"] = b"\x03"
+
+
+def test_ring_buffer_invalid_capacity():
+    with pytest.raises(ValueError):
+        BroadcastRing(capacity=0)
+
+
+def test_ring_buffer_drop_oldest():
+    ring = BroadcastRing(capacity=2)
+    sub = ring.subscribe("sub", OverflowPolicy.DROP_OLDEST)
+
+    for idx in range(3):
+        ring.publish({"msg": idx})
+
+    assert sub.qsize() == 2
+    assert sub.get_nowait() == {"msg": 1}
+    assert sub.dropped == 1
+    assert ring.dropped == {"sub": 1}
+
+
+def test_ring_buffer_error():
+    ring = BroadcastRing(capacity=1)
+    sub = ring.subscribe("sub", "error")
+
+    ring.publish({"msg": 0})
+    ring.publish({"msg": 1})
+
+    with pytest.raises(ProxyBufferOverflowError):
+        sub.get_nowait()
+    assert sub.get_nowait() == {"msg": 1}
+
+
+def test_ring_buffer_block():
+    ring = BroadcastRing(capacity=1)
+    sub = ring.subscribe("sub", OverflowPolicy.BLOCK)
+    ring.publish({"msg": 0})
+
+    publisher = threading.Thread(target=ring.publish, args=({"msg": 1},))
+    publisher.start()
+    publisher.join(0.05)
+    # the publisher waits until the subscriber reads
+    assert publisher.is_alive()
+
+    assert sub.get(timeout=1) == {"msg": 0}
+    publisher.join(1)
+    assert not publisher.is_alive()
+    assert sub.get(timeout=1) == {"msg": 1}
+    assert sub.dropped == 0
+
+
+@pytest.mark.parametrize("policy", [OverflowPolicy.ERROR, OverflowPolicy.BLOCK])
+def test_ring_buffer_send_only_subscriber(policy):
+    ring = BroadcastRing(capacity=2)
+    sub = ring.subscribe("sub", policy)
+
+    # the messages sent by the subscriber's owner never count against it
+    for idx in range(5):
+        ring.publish({"msg": idx}, exclude="sub")
+
+    assert sub.dropped == 0
+    with pytest.raises(queue.Empty):
+        sub.get_nowait()
+
+
+def test_ring_buffer_skips_excluded_messages_after_unread_message():
+    ring = BroadcastRing(capacity=2)
+    sub = ring.subscribe("sub", OverflowPolicy.ERROR)
+
+    ring.publish({"msg": 0}, exclude="sub")
+    ring.publish({"msg": 1})
+    ring.publish({"msg": 2}, exclude="sub")
+    ring.publish({"msg": 3}, exclude="sub")
+
+    # only the accepted message overwritten before being read is dropped
+    assert sub.dropped == 1
+    with pytest.raises(ProxyBufferOverflowError):
+        sub.get_nowait()
+    with pytest.raises(queue.Empty):
+        sub.get_nowait()
+
+
+def test_ring_buffer_unsubscribe():
+    ring = BroadcastRing(capacity=1)
+    sub = ring.subscribe("sub", OverflowPolicy.BLOCK)
+
+    ring.unsubscribe(sub)
+    ring.publish({"msg": 0})
+    ring.publish({"msg": 1})
+
+    assert ring.dropped == {}
+
+
+def test_cc_open_with_ring_buffer(mocker):
+    ring = BroadcastRing()
+    proxy_aux = mocker.MagicMock(ring=ring)
+
+    with CCProxy(overflow_policy="block") as proxy_inst:
+        proxy_inst._bind_channel_info(proxy_aux)
+        assert isinstance(proxy_inst.queue_out, RingSubscriber)
+        assert proxy_inst.queue_out.policy is OverflowPolicy.BLOCK
+
+        ring.publish({"msg": b"\x01"})
+        assert proxy_inst._cc_receive() == {"msg": b"\x01"}
+
+    assert ring._subscribers == []
+
+
+def test_ring_buffer_targets():
+    ring = BroadcastRing(capacity=4)
+    sub_1 = ring.subscribe("sub_1")
+    sub_2 = ring.subscribe("sub_2")
+
+    ring.publish({"msg": b"\x01"}, targets=frozenset({"sub_2"}))
+
+    with pytest.raises(queue.Empty):
+        sub_1.get_nowait()
+    assert sub_2.get_nowait() == {"msg": b"\x01"}
+
+
+@pytest.mark.parametrize("policy", [OverflowPolicy.ERROR, OverflowPolicy.BLOCK])
+def test_ring_buffer_not_targeted_subscriber(policy, mocker):
+    ring = BroadcastRing(capacity=2)
+    filtered = ring.subscribe("filtered", policy)
+    other = ring.subscribe("other")
+    notify_spy = mocker.spy(filtered._cond, "notify_all")
+
+    for idx in range(5):
+        ring.publish({"msg": idx}, targets=frozenset({"other"}))
+    ring.publish({"msg": 5}, targets=frozenset({"filtered", "other"}))
+
+    # the filtered subscriber is only woken up by the message it accepts
+    notify_spy.assert_called_once()
+    assert filtered.dropped == 0
+    assert filtered.get_nowait() == {"msg": 5}
+    assert other.dropped == 4
+
+
+@pytest.mark.parametrize(
+    "msg_prefix,predicate,message,expected",
+    [
+        (None, None, {"msg": b"\x01\x02"}, True),
+        (b"\x01", None, {"msg": b"\x01\x02"}, True),
+        ([0x02], None, {"msg": b"\x01\x02"}, False),
+        (b"\x01", None, {"msg": None}, False),
+        (b"\x01", None, {"msg": bytearray(b"\x01\x02")}, True),
+        (b"p", None, {"msg": "ping"}, False),
+        (b"\x01", None, {"msg": 1}, False),
+        (None, lambda message: message["msg"][-1] == 0x02, {"msg": b"\x01\x02"}, True),
+        (b"\x01", lambda message: False, {"msg": b"\x01\x02"}, False),
+    ],
+)
+def test_accepts(msg_prefix, predicate, message, expected):
+    proxy_inst = CCProxy()
+    proxy_inst.set_filter(msg_prefix=msg_prefix, predicate=predicate)
+
+    assert proxy_inst.accepts(message) is expected
+
+
+def test_set_filter_rebuilds_dispatch_table(mocker):
+    proxy_aux = mocker.MagicMock()
+    proxy_inst = CCProxy(remote_ids=[0x10, 0x11])
+    assert proxy_inst.remote_ids == {0x10, 0x11}
+
+    proxy_inst._bind_channel_info(proxy_aux)
+    proxy_inst.set_filter()
+
+    assert proxy_inst.remote_ids is None
+    proxy_aux._build_dispatch_table.assert_called_once()
@@ -165,3 +165,12 @@ def test__cc_receive_with_errors(
     for err in errors_to_catch:
         socket_connector.max_msg_size = err
         assert socket_connector._cc_receive() == {"msg": None}
+
+
+def test_fileno(mocker):
+    socket_connector = cc_tcp_ip.CCTcpip(*constructor_params.values())
+    assert socket_connector.fileno() is None
+
+    socket_connector.socket = mocker.Mock(**{"fileno.return_value": 7})
+
+    assert socket_connector.fileno() == 7
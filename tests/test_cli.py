@@ -106,6 +106,81 @@ def test_check_file_extension(mocker):
     assert actual == paths
 
 
+@pytest.mark.parametrize(
+    "shard_index, shard_count, shard_timings, workers, expected_message",
+    [
+        (None, None, "timings.xml", 1, "--shard-timings requires --shard-index and --shard-count"),
+        (0, None, None, 1, "must be provided together"),
+        (2, 2, None, 1, "--shard-index must be lower than --shard-count (2)"),
+        (0, 2, "timings.xml", 2, "--shard-timings cannot be combined with --workers"),
+    ],
+)
+def test_get_test_shard_usage_error(shard_index, shard_count, shard_timings, workers, expected_message):
+    with pytest.raises(click.UsageError) as exec_info:
+        cli.get_test_shard(shard_index, shard_count, shard_timings, workers)
+    assert expected_message in exec_info.value.format_message()
+
+
+def test_get_test_shard(mocker):
+    load_timings_mock = mocker.patch("pykiso.cli.load_junit_timings", return_value={"test_id": 1.0})
+
+    assert cli.get_test_shard(None, None, None, 1) is None
+    assert cli.get_test_shard(1, 2, None, 2) == cli.TestShard(1, 2)
+    assert cli.get_test_shard(0, 2, "timings.xml", 1) == cli.TestShard(0, 2, {"test_id": 1.0})
+    load_timings_mock.assert_called_once_with("timings.xml")
+
+
+def test_get_test_shard_run_history(tmp_path):
+    history = tmp_path / "history.json"
+    history.write_text('{"test_id": {"duration": 2.0, "outcome": "passed", "updated": 0}}')
+
+    assert cli.get_test_shard(0, 2, str(history), 1) == cli.TestShard(0, 2, {"test_id": 2.0})
+
+
+def test_main_test_order_without_history(runner):
+    result = runner.invoke(cli.main, ["-c", "examples/dummy.yaml", "--test-order", "failed-first"])
+
+    assert result.exit_code == 2
+    assert "--test-order failed-first requires --test-history" in result.output
+
+
+def test_main_invalid_tag_expression(runner):
+    result = runner.invoke(cli.main, ["-c", "examples/dummy.yaml", "--tag-expression", "variant=v1 and"])
+
+    assert result.exit_code == 2
+    assert "unexpected end of tag expression 'variant=v1 and'" in result.output
+
+
+def test_main_async_logging(runner, mocker):
+    initialize_logging_mock = mocker.patch("pykiso.cli.initialize_logging")
+    stop_async_logging_mock = mocker.patch("pykiso.cli.stop_async_logging")
+    mocker.patch("pykiso.cli.parse_config", return_value={})
+    mocker.patch("pykiso.cli.ConfigRegistry.provide_auxiliaries")
+    mocker.patch("pykiso.cli.test_execution.execute", return_value=0)
+    mocker.patch("pykiso.cli.check_and_handle_unresolved_threads")
+
+    result = runner.invoke(
+        cli.main, ["-c", "examples/dummy.yaml", "--async-logging", "--log-overflow", "drop-oldest"]
+    )
+
+    assert result.exit_code == 0
+    initialize_logging_mock.assert_called_once_with(None, "INFO", False, "text", "dummy", True, 10000, "drop-oldest")
+    stop_async_logging_mock.assert_called_once()
+
+
+def test_main_config_cache(runner, mocker):
+    mocker.patch("pykiso.cli.initialize_logging")
+    parse_config_mock = mocker.patch("pykiso.cli.parse_config", return_value={})
+    mocker.patch("pykiso.cli.ConfigRegistry.provide_auxiliaries")
+    mocker.patch("pykiso.cli.test_execution.execute", return_value=0)
+    mocker.patch("pykiso.cli.check_and_handle_unresolved_threads")
+
+    result = runner.invoke(cli.main, ["-c", "examples/dummy.yaml", "--config-cache", "config_cache.json"])
+
+    assert result.exit_code == 0
+    parse_config_mock.assert_called_once_with("examples/dummy.yaml", "config_cache.json")
+
+
 def test_check_and_handle_unresolved_threads_no_unresolved_threads(mocker):
     log_mock = mocker.MagicMock()
     mocker.patch("pykiso.cli.active_threads", return_value=[])
@@ -0,0 +1,160 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import json
+import os
+
+import pytest
+
+from pykiso.test_coordinator import test_execution, test_suite
+from pykiso.test_coordinator.collection_cache import (
+    CACHE_VERSION,
+    CachedTest,
+    CollectionCache,
+    get_cached_tests,
+    get_suite_fingerprint,
+)
+
+SUITE = """
+import pykiso
+
+
+@pykiso.define_test_parameters(suite_id=1, case_id=0)
+class SuiteSetup(pykiso.BasicTestSuiteSetup):
+    pass
+
+
+@pykiso.define_test_parameters(suite_id=1, case_id=0)
+class SuiteTeardown(pykiso.BasicTestSuiteTeardown):
+    pass
+
+
+@pykiso.define_test_parameters(suite_id=1, case_id=1, tag={"variant": ["variant1"], "branch-level": ["daily"]})
+class MyTest(pykiso.BasicTest):
+    def test_run(self):
+        pass
+"""
+
+
+@pytest.fixture(scope="module")
+def suite_config(tmp_path_factory):
+    suite_dir = tmp_path_factory.mktemp("cache_suite")
+    (suite_dir / "test_cache_suite.py").write_text(SUITE)
+    return {"suite_dir": str(suite_dir), "test_filter_pattern": "test_*.py", "test_suite_id": 1}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CollectionCache(tmp_path / "cache" / "collection.json")
+
+
+def collect(suite_config, cache=None):
+    return test_execution.collect_test_suites([suite_config], cache=cache)
+
+
+def test_cached_test_from_test(suite_config):
+    tests = list(test_suite.flatten(collect(suite_config)[0]))
+
+    cached = [CachedTest.from_test(test) for test in tests]
+
+    assert [test.fixture for test in cached] == [True, False, True]
+    assert cached[1] == CachedTest(
+        test_id=tests[1].id(),
+        module="test_cache_suite",
+        class_name="MyTest-1-1",
+        method="test_run",
+        test_suite_id=1,
+        test_case_id=1,
+        tag={"variant": ["variant1"], "branch-level": ["daily"]},
+        fixture=False,
+    )
+
+
+def test_get_suite_fingerprint(suite_config, tmp_path):
+    fingerprint = get_suite_fingerprint(suite_config)
+    assert get_suite_fingerprint(suite_config) == fingerprint
+    assert get_suite_fingerprint({**suite_config, "test_filter_pattern": "*.py"}) != fingerprint
+
+    # a modified python file changes the fingerprint, other files are ignored
+    (tmp_path / "test_module.py").write_text("")
+    (tmp_path / "data.txt").write_text("")
+    config = {**suite_config, "suite_dir": str(tmp_path)}
+    fingerprint = get_suite_fingerprint(config)
+    (tmp_path / "data.txt").write_text("modified")
+    assert get_suite_fingerprint(config) == fingerprint
+    os.utime(tmp_path / "test_module.py", ns=(0, 0))
+    assert get_suite_fingerprint(config) != fingerprint
+
+
+def test_collection_cache_put_get_save(suite_config, cache):
+    assert cache.get(suite_config) is None
+
+    collect(suite_config, cache)
+    cache.save()
+
+    assert cache.path.is_file()
+    assert not cache.modified
+    reloaded = CollectionCache(cache.path)
+    cached_tests = reloaded.get(suite_config)
+    assert [test.method for test in cached_tests] == ["test_suite_setUp", "test_run", "test_suite_tearDown"]
+    assert get_cached_tests([suite_config], reloaded) == cached_tests
+
+    # collecting the unchanged test suite again does not modify the cache
+    collect(suite_config, reloaded)
+    assert not reloaded.modified
+
+
+def test_collection_cache_outdated(suite_config, cache, tmp_path):
+    other_config = {**suite_config, "suite_dir": str(tmp_path)}
+    collect(suite_config, cache)
+
+    assert cache.get({**suite_config, "test_filter_pattern": "test_cache_*.py"}) is None
+    assert get_cached_tests([suite_config, other_config], cache) is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["{invalid", json.dumps({"version": CACHE_VERSION + 1, "suites": {"key": {}}})],
+    ids=["unreadable", "other_version"],
+)
+def test_collection_cache_discarded(tmp_path, content):
+    path = tmp_path / "collection.json"
+    path.write_text(content)
+
+    assert CollectionCache(path).suites == {}
+
+
+def test_check_cached_tag_names(suite_config, cache):
+    config = {"test_suite_list": [suite_config]}
+    pattern = test_execution.TestFilterPattern(None, None, None)
+
+    assert test_execution.check_cached_tag_names(config, pattern, {"variant": ["variant2"]}, cache) is False
+
+    collect(suite_config, cache)
+
+    assert test_execution.check_cached_tag_names(config, pattern, {"branch_level": ["daily"]}, cache) is True
+    with pytest.raises(NameError, match="Provided tag 'unknown' is not defined in any testcase"):
+        test_execution.check_cached_tag_names(config, pattern, {"unknown": ["value"]}, cache)
+
+
+def test_execute_collection_cache(suite_config, tmp_path, mocker):
+    config = {"test_suite_list": [suite_config], "auxiliaries": {}, "connectors": {}}
+    cache_path = tmp_path / "collection.json"
+
+    exit_code = test_execution.execute(config, user_tags={"variant": ["variant1"]}, collection_cache=cache_path)
+
+    assert exit_code == test_execution.ExitCode.ALL_TESTS_SUCCEEDED
+    assert cache_path.is_file()
+
+    # an unknown tag is reported before loading the test modules again
+    collect_spy = mocker.spy(test_execution, "collect_test_suites")
+    exit_code = test_execution.execute(config, user_tags={"unknown": ["value"]}, collection_cache=cache_path)
+
+    assert exit_code == test_execution.ExitCode.BAD_CLI_USAGE
+    collect_spy.assert_not_called()
@@ -7,7 +7,9 @@
 # SPDX-License-Identifier: EPL-2.0
 ##########################################################################
 
+import importlib
 import io
+import json
 import logging
 import os
 import unittest.mock
@@ -19,6 +21,7 @@ from types import SimpleNamespace
 import pytest
 import yaml
 
+from pykiso import config_parser
 from pykiso.config_parser import YamlLoader, check_requirements, metadata, parse_config
 from pykiso.exceptions import ConnectorRequiredError
 
@@ -409,6 +412,134 @@ def test_parse_config_env_var(tmp_cfg_env_var, mocker, tmp_path):
         )
 
 
+@pytest.fixture
+def tmp_cfg_cached(tmp_path):
+    (tmp_path / "aux.yaml").write_text("aux1:\n  config:\n    value: ENV{CACHED_VAR=1}\n    path: ./data\n")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("auxiliaries: !include aux.yaml\nconnectors: {}\n")
+    return config_file
+
+
+def test_yaml_loader_uses_libyaml():
+    assert issubclass(YamlLoader, yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader)
+
+
+def test_yaml_loader_safe_loader_fallback(tmp_path, monkeypatch):
+    (tmp_path / "data").mkdir()
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        dedent(
+            """
+            data:
+              ENV{KEY_VAR}: ENV{VALUE_VAR=./data}
+              paths: [./data, ./missing]
+              base: &base
+                data: ./data
+              merged:
+                <<: *base
+                ENV{OTHER_VAR}: data
+            """
+        )
+    )
+    data_dir = str(tmp_path / "data")
+    expected = {
+        "data": {
+            "ENV{KEY_VAR}": data_dir,
+            "paths": [data_dir, "./missing"],
+            "base": {"data": data_dir},
+            "merged": {"data": data_dir, "ENV{OTHER_VAR}": data_dir},
+        }
+    }
+    cfg = yaml.load(config_file, Loader=YamlLoader)
+    module_vars = dict(vars(config_parser))
+
+    # reload the config parser as if libyaml was not available
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    try:
+        safe_loader = importlib.reload(config_parser).YamlLoader
+        safe_cfg = yaml.load(config_file, Loader=safe_loader)
+    finally:
+        vars(config_parser).update(module_vars)
+
+    assert safe_loader.__mro__[1] is yaml.SafeLoader
+    # the ENV{} and relative path keys are left untouched by both loaders
+    assert cfg == expected
+    assert safe_cfg == expected
+
+
+def test_parse_config_cached(tmp_cfg_cached, tmp_path, mocker):
+    cache = tmp_path / "cache" / "config_cache.json"
+    load_spy = mocker.spy(yaml, "load")
+
+    first = parse_config(tmp_cfg_cached, cache)
+    first["auxiliaries"]["aux1"]["config"]["value"] = 42
+    second = parse_config(tmp_cfg_cached, cache)
+
+    # the main file and the included file are only loaded once
+    assert load_spy.call_count == 2
+    assert second["auxiliaries"]["aux1"]["config"] == {"value": 1, "path": "./data"}
+    content = json.loads(cache.read_text())
+    dependencies = content["configs"][str(tmp_cfg_cached.resolve())]["dependencies"]
+    assert dependencies["env_vars"] == {"CACHED_VAR": None}
+    assert len(dependencies["files"]) == 2
+
+    cache.unlink()
+    parse_config(tmp_cfg_cached, cache)
+
+    assert load_spy.call_count == 4
+
+
+def test_parse_config_not_cached_by_default(tmp_cfg_cached, mocker):
+    load_spy = mocker.spy(yaml, "load")
+
+    parse_config(tmp_cfg_cached)
+    parse_config(tmp_cfg_cached)
+
+    assert load_spy.call_count == 4
+
+
+@pytest.mark.parametrize("content", ["{", '{"version": 0, "configs": {}}'])
+def test_parse_config_invalid_cache(tmp_cfg_cached, tmp_path, content):
+    cache = tmp_path / "config_cache.json"
+    cache.write_text(content)
+
+    cfg = parse_config(tmp_cfg_cached, cache)
+
+    assert cfg["auxiliaries"]["aux1"]["config"]["value"] == 1
+    assert json.loads(cache.read_text())["version"] == config_parser.ConfigCache.VERSION
+
+
+def test_parse_config_not_json_serializable(tmp_cfg_cached, tmp_path, mocker):
+    mocker.patch.object(yaml, "load", return_value={1: "integer key", "connectors": {}})
+    cache = tmp_path / "config_cache.json"
+
+    cfg = parse_config(tmp_cfg_cached, cache)
+
+    assert cfg[1] == "integer key"
+    assert not cache.exists()
+
+
+@pytest.mark.parametrize("change", ["include", "env_var", "path"])
+def test_parse_config_cache_invalidated(tmp_cfg_cached, tmp_path, mocker, change):
+    cache = tmp_path / "config_cache.json"
+    parse_config(tmp_cfg_cached, cache)
+    if change == "include":
+        (tmp_cfg_cached.parent / "aux.yaml").write_text("aux1:\n  config:\n    value: 2\n    path: ./data\n")
+    elif change == "env_var":
+        mocker.patch.dict(os.environ, {"CACHED_VAR": "2"})
+    else:
+        (tmp_cfg_cached.parent / "data").mkdir()
+    load_spy = mocker.spy(yaml, "load")
+
+    cfg = parse_config(tmp_cfg_cached, cache)
+
+    assert load_spy.call_count == 2
+    if change == "path":
+        assert cfg["auxiliaries"]["aux1"]["config"]["path"] == str(tmp_cfg_cached.parent / "data")
+    else:
+        assert cfg["auxiliaries"]["aux1"]["config"]["value"] == 2
+
+
 def test_parse_config_without_connector(tmp_cfg_without_connector):
 
     cfg = parse_config(tmp_cfg_without_connector)
@@ -8,6 +8,7 @@
 ##########################################################################
 
 import copy
+import json
 import logging
 import pathlib
 import re
@@ -145,6 +146,17 @@ def test_test_execution_with_user_tags(tmp_test, capsys):
     assert exit_code == test_execution.ExitCode.ALL_TESTS_SUCCEEDED
 
 
+@pytest.mark.parametrize("tmp_test", [("aux5", "aux6", False)], indirect=True)
+def test_config_registry_parallel_start(tmp_test):
+    cfg = parse_config(tmp_test)
+
+    with ConfigRegistry.provide_auxiliaries(cfg, parallel_start=True):
+        all_auxes = ConfigRegistry.get_all_auxes()
+
+        assert set(all_auxes) == {"aux5", "aux6"}
+        assert all(aux.is_instance for aux in all_auxes.values())
+
+
 def test_config_registry_context_manager(tmp_test, mocker):
     mock_register_aux_con = mocker.patch.object(ConfigRegistry, "register_aux_con")
     mocker_delete_aux_con = mocker.patch.object(ConfigRegistry, "delete_aux_con")
@@ -154,7 +166,7 @@ def test_config_registry_context_manager(tmp_test, mocker):
     with ConfigRegistry.provide_auxiliaries(cfg):
         pass
 
-    mock_register_aux_con.assert_called_once_with(cfg)
+    mock_register_aux_con.assert_called_once_with(cfg, False)
     mocker_delete_aux_con.assert_called_once_with()
 
 
@@ -629,6 +641,54 @@ def test_test_execution_with_step_report(tmp_test, capsys):
     assert pathlib.Path("step_report.html").is_file()
 
 
+@pytest.mark.parametrize("tmp_test", [("step_aux3", "step_aux4", False)], indirect=True)
+def test_test_execution_with_streaming_step_report(tmp_test, tmp_path):
+    """Call execute function from test_execution with the streaming step report
+
+    Validation criteria:
+        -  creates the step report index, pages and journal
+    """
+    cfg = parse_config(tmp_test)
+    ConfigRegistry.register_aux_con(cfg)
+    test_execution.execute(cfg, step_report=tmp_path / "step_report.html", step_report_streaming=True)
+    ConfigRegistry.delete_aux_con()
+
+    assert (tmp_path / "step_report.html").is_file()
+    assert (tmp_path / "step_report.jsonl").is_file()
+    assert list((tmp_path / "step_report_pages").glob("*.html"))
+
+
+@pytest.mark.parametrize(
+    "tmp_test, streaming",
+    [(("step_aux5", "step_aux6", False), False), (("step_aux7", "step_aux8", False), True)],
+    indirect=["tmp_test"],
+)
+def test_test_execution_with_step_report_export(tmp_test, tmp_path, streaming):
+    """Call execute function from test_execution with a structured step
+    report export
+
+    Validation criteria:
+        -  exports the tests, steps and summary next to the step report
+    """
+    cfg = parse_config(tmp_test)
+    ConfigRegistry.register_aux_con(cfg)
+    test_execution.execute(
+        cfg,
+        step_report=tmp_path / "step_report.html",
+        step_report_streaming=streaming,
+        step_report_export=tmp_path / "export.jsonl",
+    )
+    ConfigRegistry.delete_aux_con()
+
+    records = [json.loads(line) for line in (tmp_path / "export.jsonl").read_text().splitlines()]
+    assert (tmp_path / "step_report.html").is_file()
+    assert {record["record"] for record in records} == {"test", "step", "summary"}
+    assert records[-1]["record"] == "summary"
+    assert records[-1]["tests"] == sum(record["record"] == "test" for record in records)
+    timed_tests = [record for record in records if record["record"] == "test" and record["test_name"].startswith("test")]
+    assert timed_tests and all(record["elapsed_time"] is not None for record in timed_tests)
+
+
 def test_failure_and_error_handling():
     TR_ALL_TESTS_SUCCEEDED = TestResult()
     TR_ONE_OR_MORE_TESTS_FAILED = TestResult()
@@ -51,6 +51,12 @@ def test_channel_constructor_thread(channel_obj):
     assert isinstance(cc_inst._lock, type(threading.Lock()))
 
 
+def test_channel_fileno_default(channel_obj):
+    cc_inst = channel_obj(name="thread-channel")
+
+    assert cc_inst.fileno() is None
+
+
 def test_channel_context_manager(channel_obj):
     cc_inst = channel_obj(name="thread-channel")
 
@@ -7,6 +7,7 @@
 # SPDX-License-Identifier: EPL-2.0
 ##########################################################################
 
+import asyncio
 import logging
 from unittest.mock import Mock
 
@@ -386,3 +387,36 @@ def test_wait_for_queue_out_empty(aux_inst):
     value = aux_inst.wait_for_queue_out(blocking=False, timeout_in_s=0)
 
     assert value is None
+
+
+def test_run_command_async(mocker, aux_inst):
+    run_command = mocker.patch.object(aux_inst, "run_command", return_value=b"\x02")
+
+    future = aux_inst.run_command_async("send", b"\x01", timeout_in_s=1)
+
+    assert future.result(timeout=1) == b"\x02"
+    run_command.assert_called_once_with("send", b"\x01", timeout_in_s=1)
+
+
+def test_run_command_async_exception(mocker, aux_inst):
+    aux_inst.is_instance = False
+
+    future = aux_inst.run_command_async("send", b"\x01")
+
+    with pytest.raises(AuxiliaryNotStarted):
+        future.result(timeout=1)
+
+
+def test_run_command_awaitable(mocker, aux_inst):
+    run_command = mocker.patch.object(aux_inst, "run_command", side_effect=[b"\x02", b"\x03"])
+
+    async def send_all():
+        return await asyncio.gather(
+            aux_inst.run_command_awaitable("send", b"\x01"),
+            aux_inst.run_command_awaitable("send", b"\x02"),
+        )
+
+    responses = asyncio.run(send_all())
+
+    assert sorted(responses) == [b"\x02", b"\x03"]
+    assert run_command.call_count == 2
@@ -8,6 +8,7 @@
 ##########################################################################
 
 import sys
+import threading
 
 import pytest
 
@@ -165,3 +166,66 @@ def test_import_aux_instanciated(linker):
     assert aux11.is_instance == False
     with pytest.raises(ImportError):
         from pykiso.auxiliaries import aux13
+
+
+@pytest.fixture
+def aux_cache(mocker):
+    linker = DynamicImportLinker()
+    cache = linker._aux_cache
+    for alias in ("aux1", "aux2"):
+        cache.provide(alias, "module:Aux", connectors={})
+    cache.provide("proxy", "module:Proxy", connectors={}, aux_list=["aux1", "aux2"])
+    return cache
+
+
+def test_get_dependencies(aux_cache):
+    assert aux_cache.get_dependencies("proxy") == ["aux1", "aux2"]
+    assert aux_cache.get_dependencies("aux1") == []
+
+
+def test_start_auxiliaries_dependency_order(mocker, aux_cache):
+    started = []
+    mocker.patch.object(aux_cache, "get_instance", side_effect=started.append)
+
+    timings = aux_cache.start_auxiliaries(max_workers=2)
+
+    assert started[-1] == "proxy"
+    assert sorted(started) == ["aux1", "aux2", "proxy"]
+    assert set(timings) == {"aux1", "aux2", "proxy"}
+    assert aux_cache.start_timings == timings
+
+
+def test_start_auxiliaries_parallel(mocker, aux_cache):
+    barrier = threading.Barrier(2, timeout=1)
+    # both auxiliaries have to be created at the same time to pass the barrier
+    mocker.patch.object(aux_cache, "get_instance", side_effect=lambda name: barrier.wait())
+
+    aux_cache.start_auxiliaries(["aux1", "aux2"])
+
+
+def test_start_auxiliaries_error(mocker, aux_cache):
+    mocker.patch.object(aux_cache, "get_instance", side_effect=ValueError("creation failed"))
+
+    with pytest.raises(ValueError, match="creation failed"):
+        aux_cache.start_auxiliaries()
+
+
+def test_start_auxiliaries_circular_dependency(mocker, aux_cache):
+    aux_cache.configs["aux1"]["aux_list"] = ["proxy"]
+    mocker.patch.object(aux_cache, "get_instance")
+
+    with pytest.raises(ValueError, match="Circular dependency"):
+        aux_cache.start_auxiliaries()
+
+
+def test_stop_auxiliaries_dependency_order(mocker, aux_cache):
+    stopped = []
+    for alias in ("proxy", "aux1", "aux2"):
+        aux = mocker.MagicMock()
+        aux.stop.side_effect = lambda alias=alias: stopped.append(alias)
+        aux_cache.instances[alias] = aux
+
+    aux_cache._stop_auxiliaries()
+
+    assert stopped[-1] == "proxy"
+    assert set(aux_cache.stop_timings) == {"aux1", "aux2", "proxy"}
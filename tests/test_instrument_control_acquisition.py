@@ -0,0 +1,191 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import threading
+import time
+
+import pytest
+
+from pykiso import CChannel
+from pykiso.lib.auxiliaries.instrument_control_auxiliary import InstrumentControlAuxiliary, MeasurementAcquisition
+from pykiso.lib.auxiliaries.instrument_control_auxiliary.measurement_acquisition import MeasurementRingBuffer
+
+
+class PowerSupplySimulator(CChannel):
+    """Answer the measurement queries with the current output values."""
+
+    def __init__(self, **kwargs):
+        super().__init__(name="power-supply", **kwargs)
+        self.voltage = 12.0
+        self.current = 0.5
+        self.response = b""
+        self.requests = 0
+
+    def _cc_open(self):
+        pass
+
+    def _cc_close(self):
+        pass
+
+    def _cc_send(self, msg, **kwargs):
+        self.requests += 1
+        values = {"MEASure:VOLTage?": f"{self.voltage} V", "MEASure:CURRent?": f"{self.current:.3f}"}
+        responses = [values[command.lstrip(":")] for command in msg.strip().split(";")]
+        self.response = (";".join(responses) + "\n").encode()
+
+    def _cc_receive(self, timeout=0.1, **kwargs):
+        msg, self.response = self.response, b""
+        return {"msg": msg or None}
+
+
+@pytest.fixture
+def power_supply_aux():
+    aux = InstrumentControlAuxiliary(PowerSupplySimulator(), "", name="power_supply")
+    yield aux
+    aux._delete_auxiliary_instance()
+
+
+def test_ring_buffer():
+    buffer = MeasurementRingBuffer(["voltage", "current"], capacity=3)
+    assert len(buffer) == 0
+    assert list(buffer.timestamps()) == []
+
+    for index in range(5):
+        buffer.append(float(index), [10.0 + index, 0.1 * index])
+
+    assert len(buffer) == 3
+    assert buffer.total == 5
+    assert list(buffer.timestamps()) == [2.0, 3.0, 4.0]
+    assert list(buffer.values("voltage")) == [12.0, 13.0, 14.0]
+    assert buffer.get(4, "voltage") == (4.0, 14.0)
+    with pytest.raises(IndexError):
+        buffer.get(1, "voltage")
+    with pytest.raises(KeyError):
+        buffer.values("power")
+
+    buffer.clear()
+    buffer.append(5.0, [15.0, 0.5])
+    assert list(buffer.timestamps()) == [5.0]
+    assert list(buffer.values("current")) == [0.5]
+
+
+def test_ring_buffer_invalid_capacity():
+    with pytest.raises(ValueError, match="must be positive"):
+        MeasurementRingBuffer(["voltage"], capacity=0)
+
+
+@pytest.mark.parametrize(
+    "measurements, rate, error",
+    [
+        (["temperature"], 10, "unknown measurement 'temperature'"),
+        (["current"], 0, "acquisition rate must be positive"),
+    ],
+)
+def test_acquisition_invalid_parameters(power_supply_aux, measurements, rate, error):
+    with pytest.raises(ValueError, match=error):
+        MeasurementAcquisition(power_supply_aux, measurements, rate)
+
+
+def test_acquisition_not_available_measurement(power_supply_aux, mocker):
+    mocker.patch.object(power_supply_aux.helpers, "get_command", return_value=("COMMAND_NOT_AVAILABLE", None))
+
+    with pytest.raises(ValueError, match="measurement 'power' is not available"):
+        MeasurementAcquisition(power_supply_aux, ["power"])
+
+
+def test_start_acquisition(power_supply_aux):
+    acquisition = power_supply_aux.start_acquisition(rate=100)
+    time.sleep(0.205)
+    acquisition.stop()
+
+    assert not acquisition.is_running
+    samples = acquisition.get_samples()
+    assert list(samples) == ["timestamp", "voltage", "current"]
+    # one transaction per sample with all measurements
+    assert 15 <= len(samples["timestamp"]) == power_supply_aux.channel.requests <= 22
+    assert set(samples["voltage"]) == {12.0}
+    assert set(samples["current"]) == {0.5}
+    assert list(samples["timestamp"]) == sorted(samples["timestamp"])
+    assert acquisition.failed_samples == 0
+
+
+def test_acquisition_statistics(power_supply_aux):
+    acquisition = MeasurementAcquisition(power_supply_aux, ["current"], capacity=100)
+    with pytest.raises(ValueError, match="no sample of 'current'"):
+        acquisition.statistics("current")
+
+    for index in range(1, 101):
+        acquisition.buffer.append(float(index), [index / 100])
+    statistics = acquisition.statistics("current", percentiles=(0, 50, 95))
+
+    assert statistics.count == 100
+    assert statistics.min == 0.01
+    assert statistics.max == 1.0
+    assert statistics.mean == pytest.approx(0.505)
+    assert statistics.percentiles == pytest.approx({0: 0.01, 50: 0.505, 95: 0.9505})
+
+
+def test_acquisition_wait_for_threshold(power_supply_aux):
+    channel = power_supply_aux.channel
+    with power_supply_aux.start_acquisition(["current"], rate=200) as acquisition:
+        # the current raises after 50ms
+        threading.Timer(0.05, setattr, args=(channel, "current", 2.0)).start()
+        start = time.time()
+        crossing = acquisition.wait_for_threshold("current", above=1.0, timeout=2)
+
+        assert crossing is not None
+        timestamp, value = crossing
+        assert value == 2.0
+        assert timestamp - start == pytest.approx(0.05, abs=0.04)
+        assert acquisition.wait_for_threshold("current", below=1.0, timeout=0.05) is None
+
+    assert not acquisition.is_running
+
+
+def test_acquisition_wait_for_threshold_invalid(power_supply_aux):
+    acquisition = MeasurementAcquisition(power_supply_aux, ["current"])
+
+    with pytest.raises(ValueError, match="at least one of the thresholds"):
+        acquisition.wait_for_threshold("current")
+    with pytest.raises(KeyError):
+        acquisition.wait_for_threshold("voltage", above=1)
+
+
+def test_acquisition_failed_samples(power_supply_aux, mocker):
+    mocker.patch.object(power_supply_aux, "execute_batch", return_value=None)
+
+    with power_supply_aux.start_acquisition(["voltage"], rate=100) as acquisition:
+        time.sleep(0.05)
+
+    assert acquisition.failed_samples >= 3
+    assert len(acquisition.buffer) == 0
+
+
+def test_acquisition_missed_samples(power_supply_aux, mocker):
+    def slow_batch(*args, **kwargs):
+        time.sleep(0.035)
+        return ["12.0"]
+
+    mocker.patch.object(power_supply_aux, "execute_batch", side_effect=slow_batch)
+
+    with power_supply_aux.start_acquisition(["voltage"], rate=100) as acquisition:
+        time.sleep(0.2)
+
+    assert acquisition.missed_samples >= 10
+    assert acquisition.missed_samples + len(acquisition.buffer) == pytest.approx(20, abs=5)
+
+
+def test_delete_auxiliary_stops_acquisitions(power_supply_aux):
+    acquisition = power_supply_aux.start_acquisition(["voltage"], rate=50)
+
+    assert acquisition.is_running
+    power_supply_aux._delete_auxiliary_instance()
+
+    assert not acquisition.is_running
+    assert power_supply_aux._acquisitions == []
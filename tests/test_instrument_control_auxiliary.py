@@ -13,7 +13,11 @@ import threading
 import pytest
 
 from pykiso import CChannel
-from pykiso.lib.auxiliaries.instrument_control_auxiliary import InstrumentControlAuxiliary
+from pykiso.lib.auxiliaries.instrument_control_auxiliary import (
+    InstrumentControlAuxiliary,
+    parse_scpi_values,
+    split_scpi_response,
+)
 from pykiso.lib.connectors.cc_visa import VISAChannel
 
 
@@ -220,3 +224,108 @@ def test_handle_query_with_visa_cc(mocker, aux_inst, cc_visa_inst):
     aux_inst.handle_query(query)
 
     cc_visa_inst.query.assert_called_with(f"{query}{aux_inst.write_termination}")
+
+
+class ScpiInstrumentSimulator(CChannel):
+    """Answer the queries of a transaction once all its commands are
+    executed, as a power supply storing the set values would do."""
+
+    def __init__(self, chunk_size=8, **kwargs):
+        super().__init__(name="scpi-simulator", **kwargs)
+        self.values = {"SOUR:VOLT": "0.0", "SOUR:CURR": "0.0", "SYST:ERR": '0,"No error"'}
+        self.chunk_size = chunk_size
+        self.transactions = []
+        self.pending = b""
+
+    def _cc_open(self):
+        pass
+
+    def _cc_close(self):
+        pass
+
+    def _cc_send(self, msg, **kwargs):
+        self.transactions.append(msg)
+        responses = []
+        for command in msg.strip().split(";"):
+            header, _, argument = command.lstrip(":").partition(" ")
+            if header == "*OPC?":
+                responses.append("1")
+            elif header.endswith("?"):
+                responses.append(self.values[header[:-1]])
+            else:
+                self.values[header] = argument
+        if responses:
+            self.pending += (";".join(responses) + "\n").encode()
+
+    def _cc_receive(self, timeout=0.1, **kwargs):
+        # the response can be split over several messages
+        msg, self.pending = self.pending[: self.chunk_size], self.pending[self.chunk_size :]
+        return {"msg": msg or None}
+
+
+@pytest.fixture
+def simulator_aux():
+    return InstrumentControlAuxiliary(ScpiInstrumentSimulator(), "")
+
+
+def test_execute_batch(simulator_aux):
+    responses = simulator_aux.execute_batch(
+        ["SOUR:VOLT 12.5", "SOUR:CURR 1.5", "SOUR:VOLT?", "SOUR:CURR?", "SYST:ERR?"]
+    )
+
+    assert simulator_aux.channel.transactions == [
+        "SOUR:VOLT 12.5;:SOUR:CURR 1.5;:SOUR:VOLT?;:SOUR:CURR?;:SYST:ERR?;*OPC?\n"
+    ]
+    assert responses == ["12.5", "1.5", '0,"No error"']
+
+
+def test_execute_batch_without_query(simulator_aux):
+    assert simulator_aux.execute_batch(["SOUR:VOLT 12.5", ":SOUR:CURR 1.5"], synchronize=False) == []
+    assert simulator_aux.execute_batch([], synchronize=False) == []
+
+    assert simulator_aux.channel.transactions == ["SOUR:VOLT 12.5;:SOUR:CURR 1.5\n"]
+    assert simulator_aux.channel.values["SOUR:CURR"] == "1.5"
+
+
+def test_execute_batch_synchronize_only(simulator_aux):
+    assert simulator_aux.execute_batch(["SOUR:VOLT 3"]) == []
+
+    assert simulator_aux.channel.transactions == ["SOUR:VOLT 3;*OPC?\n"]
+
+
+def test_execute_batch_incomplete_response(simulator_aux):
+    # no response at all
+    simulator_aux.channel._cc_send = lambda msg, **kwargs: None
+    assert simulator_aux.execute_batch(["SOUR:VOLT?"], timeout=0.05) is None
+
+    # response to the query but not to the synchronization
+    simulator_aux.channel.pending = b"0.0\n"
+    assert simulator_aux.execute_batch(["SOUR:VOLT?"], timeout=0.05) is None
+
+
+def test_execute_batch_with_visa_cc(aux_inst, cc_visa_inst):
+    aux_inst.channel = cc_visa_inst
+    cc_visa_inst.query.return_value = {"msg": "5.0;1\n"}
+
+    responses = aux_inst.execute_batch(["SOUR:VOLT?"])
+
+    cc_visa_inst.query.assert_called_with("SOUR:VOLT?;*OPC?\n")
+    assert responses == ["5.0"]
+
+
+@pytest.mark.parametrize(
+    "response, separator, expected",
+    [
+        ("12.5;1.5;1", ";", ["12.5", "1.5", "1"]),
+        ('0,"No error";1', ";", ['0,"No error"', "1"]),
+        ('"a;b";2', ";", ['"a;b"', "2"]),
+        ('0,"No error, really"', ",", ["0", '"No error, really"']),
+        ("", ";", [""]),
+    ],
+)
+def test_split_scpi_response(response, separator, expected):
+    assert split_scpi_response(response, separator) == expected
+
+
+def test_parse_scpi_values():
+    assert parse_scpi_values('+5.0E+00, "CH1",ON,-3') == [5.0, "CH1", "ON", -3.0]
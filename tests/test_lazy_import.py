@@ -0,0 +1,66 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import subprocess
+import sys
+
+import pytest
+
+import pykiso
+
+
+def test_import_does_not_load_heavy_modules():
+    code = (
+        "import sys, pykiso; "
+        "print(','.join(name for name in ('click', 'jinja2', 'xmlrunner', 'yaml', 'pykiso.cli', "
+        "'pykiso.test_coordinator.test_execution', 'pykiso.auxiliary_reactor') if name in sys.modules))"
+    )
+
+    process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert process.stdout.strip() == ""
+
+
+@pytest.mark.parametrize(
+    "name, module",
+    [
+        ("cli", "pykiso.cli"),
+        ("config_parser", "pykiso.config_parser"),
+        ("abort", "pykiso.test_coordinator.test_execution"),
+        ("parse_config", "pykiso.config_parser"),
+        ("ConfigRegistry", "pykiso.test_setup.config_registry"),
+    ],
+)
+def test_lazy_attributes(name, module):
+    value = getattr(pykiso, name)
+
+    assert getattr(value, "__name__", None) == module or value.__module__ == module
+    assert name in dir(pykiso)
+
+
+def test_dir_without_duplicates():
+    pykiso.cli
+    pykiso.__version__
+
+    names = dir(pykiso)
+
+    assert len(names) == len(set(names))
+    assert {"cli", "__version__", "parse_config"} <= set(names)
+
+
+def test_lazy_version():
+    from pykiso import __version__
+
+    assert __version__ == pykiso.__version__
+    assert isinstance(__version__, str)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="module 'pykiso' has no attribute 'unknown'"):
+        pykiso.unknown
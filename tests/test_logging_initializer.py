@@ -7,8 +7,11 @@
 # SPDX-License-Identifier: EPL-2.0
 ##########################################################################
 
+import io
 import logging
+import queue
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -165,3 +168,157 @@ def test_disable_logging(mocker, level, caplog):
 
     assert message not in caplog.text
     assert "in log" in caplog.text
+
+
+@pytest.fixture
+def restore_root_logger():
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+    options = logging_initializer.log_options
+    yield root_logger
+    logging_initializer.stop_async_logging()
+    root_logger.handlers = handlers
+    root_logger.setLevel(level)
+    logging_initializer.log_options = options
+
+
+def make_record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_bounded_queue_handler_drop_new():
+    handler = logging_initializer.BoundedQueueHandler(2, "drop-new")
+
+    for index in range(4):
+        handler.handle(make_record(f"record {index}"))
+
+    assert handler.enqueued == 2
+    assert handler.dropped == 2
+    assert handler.max_depth == 2
+    assert [handler.queue.get().msg for _ in range(2)] == ["record 0", "record 1"]
+
+
+def test_bounded_queue_handler_drop_oldest():
+    handler = logging_initializer.BoundedQueueHandler(
+        2, logging_initializer.OverflowPolicy.DROP_OLDEST
+    )
+
+    for index in range(4):
+        handler.handle(make_record(f"record {index}"))
+
+    assert handler.enqueued == 4
+    assert handler.dropped == 2
+    # the discarded records do not have to be processed by the writer thread
+    assert handler.queue.unfinished_tasks == 2
+    assert [handler.queue.get().msg for _ in range(2)] == ["record 2", "record 3"]
+
+
+def test_bounded_queue_handler_block():
+    handler = logging_initializer.BoundedQueueHandler(1, "block")
+    handler.handle(make_record("record 0"))
+    consumer = threading.Timer(0.05, handler.queue.get)
+    consumer.start()
+
+    handler.handle(make_record("record 1"))
+    consumer.join()
+
+    assert handler.enqueued == 2
+    assert handler.blocked == 1
+    assert handler.dropped == 0
+    assert handler.queue.get_nowait().msg == "record 1"
+
+
+@pytest.mark.parametrize(
+    "size, overflow, error",
+    [(0, "block", "must be positive"), (10, "drop-all", "is not a valid")],
+)
+def test_bounded_queue_handler_invalid(size, overflow, error):
+    with pytest.raises(ValueError, match=error):
+        logging_initializer.BoundedQueueHandler(size, overflow)
+
+
+def test_initialize_logging_async(tmp_path, restore_root_logger):
+    log_file = tmp_path / "async.log"
+
+    logging_initializer.initialize_logging(
+        log_file, "INFO", False, async_logging=True, queue_size=100
+    )
+    queue_handler = logging_initializer.get_async_logging_handler()
+    logging.getLogger("pykiso.test").info("value is %d", 42)
+
+    assert restore_root_logger.handlers == [queue_handler]
+    assert logging_initializer.get_logging_options().async_logging is True
+
+    logging_initializer.stop_async_logging()
+
+    assert logging_initializer.get_async_logging_handler() is None
+    assert queue_handler.enqueued == 1
+    assert "value is 42" in log_file.read_text()
+    assert [type(handler) for handler in restore_root_logger.handlers] == [
+        logging.FileHandler,
+        logging.StreamHandler,
+    ]
+    restore_root_logger.handlers[0].close()
+
+
+def test_initialize_logging_async_reuses_writer_thread(
+    tmp_path, mocker, restore_root_logger
+):
+    log_file = tmp_path / "async.log"
+    first_stdout, second_stdout = io.StringIO(), io.StringIO()
+    mocker.patch.object(sys, "stdout", first_stdout)
+    logging_initializer.initialize_logging(
+        log_file, "INFO", False, "junit", async_logging=True
+    )
+    queue_handler = logging_initializer.get_async_logging_handler()
+    logging.getLogger("pykiso.test").info("first test")
+
+    # like the junit report does before each test
+    mocker.patch.object(sys, "stdout", second_stdout)
+    options = logging_initializer.get_logging_options()
+    logging_initializer.initialize_logging(
+        options.log_path,
+        options.log_level,
+        options.verbose,
+        options.report_type,
+        async_logging=True,
+    )
+    logging.getLogger("pykiso.test").info("second test")
+
+    assert logging_initializer.get_async_logging_handler() is queue_handler
+    assert restore_root_logger.handlers == [queue_handler]
+
+    # other options start a new writer thread
+    logging_initializer.initialize_logging(
+        log_file, "DEBUG", False, "junit", async_logging=True
+    )
+    assert logging_initializer.get_async_logging_handler() is not queue_handler
+    logging_initializer.stop_async_logging()
+
+    assert "first test" in first_stdout.getvalue()
+    assert "second test" not in first_stdout.getvalue()
+    assert "second test" in second_stdout.getvalue()
+    assert log_file.read_text().count("test\n") == 2
+    for handler in restore_root_logger.handlers:
+        handler.close()
+
+
+def test_stop_async_logging_reports_dropped_records(
+    tmp_path, mocker, restore_root_logger
+):
+    log_file = tmp_path / "async.log"
+    logging_initializer.initialize_logging(
+        log_file, "INFO", False, async_logging=True, overflow="drop-new"
+    )
+    queue_handler = logging_initializer.get_async_logging_handler()
+    mocker.patch.object(queue_handler.queue, "put_nowait", side_effect=queue.Full)
+
+    logging.getLogger("pykiso.test").warning("lost")
+    mocker.stopall()
+    logging_initializer.stop_async_logging()
+
+    assert queue_handler.dropped == 1
+    content = log_file.read_text()
+    assert "lost" not in content
+    assert "1 log records were dropped" in content
+    restore_root_logger.handlers[0].close()
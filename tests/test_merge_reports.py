@@ -0,0 +1,103 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import json
+
+import pytest
+from click.testing import CliRunner
+from junitparser import JUnitXml
+
+from pykiso.tool.merge_reports import find_reports, main
+
+JUNIT_REPORT = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+    <testsuite name="{name}" tests="1" errors="0" failures="0" skipped="0" time="1.0">
+        <testcase classname="module.{name}" name="test_run" time="1.0"/>
+    </testsuite>
+</testsuites>
+"""
+
+
+def write_shard(shard_dir, test_class_name):
+    """Write the JUnit report and the step report journal of a shard."""
+    shard_dir.mkdir()
+    (shard_dir / "junit.xml").write_text(JUNIT_REPORT.format(name=test_class_name))
+    records = [
+        {"kind": "class", "description": "test class", "file_path": "test_file.py"},
+        {"kind": "step", "test": "test_run", "step": ["", "value", "True", True, True]},
+        {"kind": "header", "header": {}},
+        {"kind": "result", "test": "test_run", "time_result": {"Elapsed Time": 1.0}},
+    ]
+    with (shard_dir / "report.jsonl").open("w") as journal:
+        for record in records:
+            journal.write(json.dumps({**record, "class": test_class_name}) + "\n")
+    (shard_dir / "report.html").write_text("index")
+
+
+@pytest.fixture
+def shards(tmp_path):
+    write_shard(tmp_path / "shard_0", "FirstTest")
+    write_shard(tmp_path / "shard_1", "SecondTest")
+    return tmp_path
+
+
+def test_find_reports(shards):
+    (shards / "shard_1" / "report_pages").mkdir()
+    (shards / "shard_1" / "report_pages" / "SecondTest.html").write_text("page")
+
+    junit_reports, journals = find_reports((str(shards / "shard_0"), str(shards / "shard_1" / "junit.xml")))
+
+    assert junit_reports == [shards / "shard_0" / "junit.xml", shards / "shard_1" / "junit.xml"]
+    assert journals == [shards / "shard_0" / "report.jsonl"]
+
+
+def test_merge_reports(shards):
+    result = CliRunner().invoke(
+        main, ["--junit", str(shards / "merged.xml"), "--step-report", str(shards / "merged.html"), str(shards)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Merged 2 JUnit report(s)" in result.output
+    assert "Merged 2 step report(s)" in result.output
+    assert [case.classname for suite in JUnitXml.fromfile(str(shards / "merged.xml")) for case in suite] == [
+        "module.FirstTest",
+        "module.SecondTest",
+    ]
+    assert (shards / "merged_pages" / "FirstTest.html").is_file()
+    assert (shards / "merged_pages" / "SecondTest.html").is_file()
+    index = (shards / "merged.html").read_text()
+    assert "FirstTest" in index and "SecondTest" in index
+
+    # merging again ignores the previous merge outputs
+    result = CliRunner().invoke(
+        main, ["--junit", str(shards / "merged.xml"), "--step-report", str(shards / "merged.html"), str(shards)]
+    )
+
+    assert "Merged 2 JUnit report(s)" in result.output
+    assert "Merged 2 step report(s)" in result.output
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (["shard_0"], "at least one of --junit or --step-report has to be provided"),
+        (["--step-report", "merged.html", "shard_0/report.html", "other.html"], "no journal found for the step report"),
+        (["--junit", "merged.xml", "shard_0/report.jsonl"], "no JUnit report found to merge"),
+        (["--junit", "merged.xml", "shard_0/other.txt"], "is neither a JUnit report nor a step report"),
+    ],
+)
+def test_merge_reports_error(shards, monkeypatch, args, message):
+    monkeypatch.chdir(shards)
+    (shards / "other.html").write_text("not streamed")
+    (shards / "shard_0" / "other.txt").write_text("")
+
+    result = CliRunner().invoke(main, args)
+
+    assert result.exit_code == 2
+    assert message in result.output
@@ -8,11 +8,12 @@
 ##########################################################################
 
 
+import json
 from xml.etree.ElementTree import Element, ElementTree
 
 import pytest
 
-from pykiso.lib.auxiliaries.udsaux.common.odx_parser import OdxParser
+from pykiso.lib.auxiliaries.udsaux.common.odx_parser import INDEX_VERSION, OdxIndex, OdxParser, get_file_hash
 
 
 def odx_content():
@@ -236,9 +237,7 @@ def test__find_diag_service_by_sd(tmp_odx_file):
 def test__find_diag_service_by_sd_not_found(tmp_odx_file):
     odx_parser = OdxParser(tmp_odx_file)
     sd_name = "HardwareVersion"
-    with pytest.raises(
-        ValueError, match=f"No DIAG-SERVICE has a SD containing {sd_name}"
-    ):
+    with pytest.raises(ValueError, match=f"No DIAG-SERVICE has a SD containing {sd_name}"):
         element = odx_parser._find_diag_services_by_sd(sd_name)
 
 
@@ -258,3 +257,65 @@ def test_get_coded_values_failure(tmp_odx_file):
         match=f"Could not create request for service={sid} and sd={sw_version}",
     ):
         coded_values = odx_parser.get_coded_values(sw_version, sid)
+
+
+def test_odx_index_from_file(tmp_odx_file):
+    index = OdxIndex.from_file(tmp_odx_file)
+
+    # each SD content references the diag service only once
+    references = [{"REQUEST-REF": "9", "POS-RESPONSE-REF": "10"}]
+    assert index.services == {"SoftwareVersion": references, "Read": references, "no": references}
+    assert index.messages["9"] == ("34", ["34", "42069"])
+    assert index.messages["10"] == ("98", ["98", "42069"])
+    assert index.messages["11"] == ("127", ["127", "34", "19", "20", "34", "49", "51"])
+
+
+def test_get_coded_values_positive_response(tmp_odx_file):
+    odx_parser = OdxParser(tmp_odx_file)
+
+    coded_values = odx_parser.get_coded_values("SoftwareVersion", 98, OdxParser.RefType.POS_RESPONSE)
+
+    assert coded_values == [98, 42069]
+    # the lookup does not need the complete xml tree
+    assert odx_parser._odx_tree is None
+
+
+def test_get_coded_values_unknown_sd(tmp_odx_file):
+    odx_parser = OdxParser(tmp_odx_file)
+
+    with pytest.raises(ValueError, match="No DIAG-SERVICE has a SD containing HardwareVersion"):
+        odx_parser.get_coded_values("HardwareVersion", 34)
+
+
+def test_odx_parser_cache(tmp_odx_file, tmp_path, mocker):
+    cache_dir = tmp_path / "cache"
+    cache_path = cache_dir / f"{get_file_hash(tmp_odx_file)}.json"
+
+    odx_parser = OdxParser(tmp_odx_file, cache_dir=cache_dir)
+
+    assert json.loads(cache_path.read_text())["version"] == INDEX_VERSION
+    from_file_spy = mocker.spy(OdxIndex, "from_file")
+    cached_parser = OdxParser(tmp_odx_file, cache_dir=cache_dir)
+    from_file_spy.assert_not_called()
+    assert cached_parser.index == odx_parser.index
+    assert cached_parser.get_coded_values("SoftwareVersion", 34) == [34, 42069]
+
+    # a modified ODX file is indexed again
+    tmp_odx_file.write_text(tmp_odx_file.read_text().replace("42069", "1337"))
+    assert OdxParser(tmp_odx_file, cache_dir=cache_dir).get_coded_values("SoftwareVersion", 34) == [34, 1337]
+    from_file_spy.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["{invalid", json.dumps({"version": INDEX_VERSION + 1, "services": {}, "messages": {}})],
+    ids=["unreadable", "other_version"],
+)
+def test_odx_parser_cache_discarded(tmp_odx_file, tmp_path, content):
+    cache_path = tmp_path / f"{get_file_hash(tmp_odx_file)}.json"
+    cache_path.write_text(content)
+
+    odx_parser = OdxParser(tmp_odx_file, cache_dir=tmp_path)
+
+    assert odx_parser.get_coded_values("SoftwareVersion", 34) == [34, 42069]
+    assert json.loads(cache_path.read_text())["version"] == INDEX_VERSION
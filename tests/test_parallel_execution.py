@@ -0,0 +1,296 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import logging
+import sys
+import textwrap
+from concurrent.futures import Future
+
+import pytest
+
+from pykiso import logging_initializer
+from pykiso.test_coordinator import parallel_execution, test_execution, test_sharding
+from pykiso.test_coordinator.parallel_execution import (
+    SuiteGroup,
+    combine_exit_codes,
+    find_imported_auxiliaries,
+    group_test_suites,
+    make_group_config,
+    run_suite_group,
+)
+from pykiso.test_coordinator.test_execution import ExitCode, execute
+from pykiso.test_coordinator.test_scheduling import RunHistory
+from pykiso.test_result import assert_step_report
+
+TEST_CASE = """
+import pykiso
+from pykiso.auxiliaries import {aux}
+
+
+@pykiso.define_test_parameters(suite_id={suite_id}, case_id=1, aux_list=[{aux}])
+class MyTest(pykiso.BasicTest):
+    def test_run(self):
+        self.assertTrue({result})
+"""
+
+
+@pytest.fixture
+def worker_process(monkeypatch):
+    """Restore the streams and logging configuration changed by a worker."""
+    root_logger = logging.getLogger()
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+    monkeypatch.setattr(sys, "stderr", sys.stderr)
+    monkeypatch.setattr(root_logger, "handlers", root_logger.handlers[:])
+    monkeypatch.setattr(logging_initializer, "log_options", logging_initializer.log_options)
+    level = root_logger.level
+    yield
+    root_logger.setLevel(level)
+
+
+def make_suite(path, aux, suite_id, result=True):
+    suite_dir = path / f"suite_{suite_id}"
+    suite_dir.mkdir()
+    (suite_dir / f"test_suite_{suite_id}.py").write_text(TEST_CASE.format(aux=aux, suite_id=suite_id, result=result))
+    return {"suite_dir": str(suite_dir), "test_filter_pattern": "test_*.py", "test_suite_id": suite_id}
+
+
+def make_config(suites, shared_channel=False):
+    return {
+        "auxiliaries": {
+            "aux1": {
+                "connectors": {"com": "chan1"},
+                "type": "pykiso.lib.auxiliaries.dut_auxiliary:DUTAuxiliary",
+            },
+            "aux2": {
+                "connectors": {"com": "chan1" if shared_channel else "chan2"},
+                "type": "pykiso.lib.auxiliaries.dut_auxiliary:DUTAuxiliary",
+            },
+            "aux3": {
+                "connectors": {"com": "chan3"},
+                "type": "pykiso.lib.auxiliaries.dut_auxiliary:DUTAuxiliary",
+            },
+        },
+        "connectors": {
+            "chan1": {"type": "pykiso.lib.connectors.cc_example:CCExample"},
+            "chan2": {"type": "pykiso.lib.connectors.cc_example:CCExample"},
+            "chan3": {"type": "pykiso.lib.connectors.cc_example:CCExample"},
+        },
+        "test_suite_list": suites,
+    }
+
+
+def test_find_imported_auxiliaries(tmp_path):
+    (tmp_path / "test_a.py").write_text(
+        textwrap.dedent(
+            """
+            import os
+            import pykiso.auxiliaries.aux3
+            from pykiso.auxiliaries import aux1, aux2 as renamed
+            from pykiso.auxiliaries.aux4 import send
+            from pykiso import auxiliaries
+            """
+        )
+    )
+    (tmp_path / "helpers").mkdir()
+    (tmp_path / "helpers" / "helper.py").write_text("from pykiso.auxiliaries import aux5\n")
+    (tmp_path / "broken.py").write_text("def broken(:\n")
+
+    auxiliaries = find_imported_auxiliaries({"suite_dir": str(tmp_path)})
+
+    assert auxiliaries == {"aux1", "aux2", "aux3", "aux4", "aux5"}
+
+
+def test_group_test_suites_wildcard_import(tmp_path, caplog):
+    suites = [make_suite(tmp_path, "aux1", 1), make_suite(tmp_path, "aux2", 2), make_suite(tmp_path, "aux3", 3)]
+    (tmp_path / "suite_2" / "test_suite_2.py").write_text("from pykiso.auxiliaries import *\n")
+
+    with caplog.at_level(logging.WARNING):
+        groups = group_test_suites(make_config(suites), suites)
+
+    assert len(groups) == 1
+    assert groups[0].auxiliaries == {"aux1", "aux2", "aux3"}
+    assert "suite_2 imports all auxiliaries with 'from pykiso.auxiliaries import *'" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "auxes, shared_channel, expected_groups",
+    [
+        (["aux1", "aux2", "aux3"], False, [[1], [2], [3]]),
+        (["aux1", "aux3", "aux1"], False, [[1, 3], [2]]),
+        (["aux1", "aux3", "aux2"], True, [[1, 3], [2]]),
+    ],
+)
+def test_group_test_suites(tmp_path, auxes, shared_channel, expected_groups):
+    suites = [make_suite(tmp_path, aux, suite_id) for suite_id, aux in enumerate(auxes, start=1)]
+
+    groups = group_test_suites(make_config(suites, shared_channel), suites)
+
+    assert [[suite["test_suite_id"] for suite in group.suites] for group in groups] == expected_groups
+
+
+def test_group_test_suites_proxy_aux_list(tmp_path):
+    suites = [make_suite(tmp_path, "aux1", 1), make_suite(tmp_path, "aux2", 2)]
+    config = make_config(suites)
+    config["auxiliaries"]["proxy"] = {
+        "connectors": {"com": "chan3"},
+        "config": {"aux_list": ["aux1", "aux2"]},
+        "type": "pykiso.lib.auxiliaries.proxy_auxiliary:ProxyAuxiliary",
+    }
+
+    groups = group_test_suites(config, suites)
+
+    assert len(groups) == 1
+    assert groups[0].auxiliaries == {"aux1", "aux2", "proxy"}
+
+
+def test_make_group_config(tmp_path):
+    suites = [make_suite(tmp_path, "aux1", 1), make_suite(tmp_path, "aux3", 2)]
+    config = make_config(suites)
+    config["extra"] = {"key": "value"}
+
+    group_config = make_group_config(config, SuiteGroup([suites[1]], {"aux3"}))
+
+    assert list(group_config["auxiliaries"]) == ["aux3"]
+    assert list(group_config["connectors"]) == ["chan3"]
+    assert group_config["test_suite_list"] == [suites[1]]
+    assert group_config["extra"] == config["extra"]
+    assert group_config["auxiliaries"]["aux3"] is not config["auxiliaries"]["aux3"]
+
+
+@pytest.mark.parametrize(
+    "exit_codes, expected",
+    [
+        ([0, 0], ExitCode.ALL_TESTS_SUCCEEDED),
+        ([0, 1], ExitCode.ONE_OR_MORE_TESTS_FAILED),
+        ([1, 2], ExitCode.ONE_OR_MORE_TESTS_FAILED_AND_RAISED_UNEXPECTED_EXCEPTION),
+        ([3, 4, 1], ExitCode.AUXILIARY_CREATION_FAILED),
+        ([], ExitCode.ALL_TESTS_SUCCEEDED),
+    ],
+)
+def test_combine_exit_codes(exit_codes, expected):
+    assert combine_exit_codes(exit_codes) == expected
+
+
+def test_run_suite_group(tmp_path, mocker, worker_process):
+    mocker.patch.object(assert_step_report, "ALL_STEP_REPORT", assert_step_report.ALL_STEP_REPORT.copy())
+    suites = [make_suite(tmp_path, "aux1", 1, result=False)]
+    config = make_config(suites)
+    group_config = make_group_config(config, SuiteGroup(suites, {"aux1"}))
+
+    result = run_suite_group(
+        group_config,
+        test_execution.TestFilterPattern(None, None, None),
+        "junit",
+        None,
+        tmp_path / "report.html",
+        False,
+        str(tmp_path / "group.xml"),
+        None,
+        history=RunHistory(),
+    )
+
+    assert result.exit_code == ExitCode.ONE_OR_MORE_TESTS_FAILED
+    assert [record["outcome"] for record in result.history_records.values()] == ["failed"]
+    assert (result.tests_run, result.failures, result.errors) == (1, 1, 0)
+    assert "END OF TEST" in result.output
+    assert result.step_report["MyTest-1-1"]["succeed"] is False
+    assert (tmp_path / "group.xml").is_file()
+
+
+def test_run_suite_group_error(tmp_path, worker_process):
+    group_config = make_config([{"suite_dir": str(tmp_path), "test_filter_pattern": "*.py", "test_suite_id": 1}])
+
+    result = run_suite_group(
+        group_config, test_execution.TestFilterPattern(None, None, None), "text", None, None, False, None, None
+    )
+
+    assert result.exit_code == ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION
+    assert "Error occurred during test collection." in result.output
+
+
+def test_execute_parallel(tmp_path, mocker, capsys):
+    mocker.patch.object(assert_step_report, "ALL_STEP_REPORT", assert_step_report.ALL_STEP_REPORT.copy())
+    suites = [make_suite(tmp_path, "aux1", 1), make_suite(tmp_path, "aux3", 2, result=False)]
+    config = make_config(suites)
+    execute_parallel = mocker.spy(parallel_execution, "execute_parallel")
+
+    exit_code = execute(
+        config,
+        report_type="junit",
+        report_name="parallel",
+        step_report=tmp_path / "step_report.html",
+        junit_path=str(tmp_path / "junit.xml"),
+        workers=2,
+    )
+
+    output = capsys.readouterr().err
+    assert execute_parallel.call_count == 1
+    assert exit_code == ExitCode.ONE_OR_MORE_TESTS_FAILED
+    assert "Ran 2 tests in 2 parallel group(s)" in output
+    assert "FAILED (failures=1, errors=0)" in output
+    junit_report = (tmp_path / "junit.xml").read_text()
+    assert junit_report.count("<testcase") == 2
+    step_report = (tmp_path / "step_report.html").read_text()
+    assert "MyTest-1-1" in step_report and "MyTest-2-1" in step_report
+
+
+def test_execute_parallel_undefined_tag(tmp_path, mocker, worker_process):
+    suites = [make_suite(tmp_path, "aux1", 1)]
+    mocker.patch.object(
+        parallel_execution,
+        "ProcessPoolExecutor",
+        side_effect=lambda max_workers, mp_context: InlineExecutor(),
+    )
+    mocker.patch.object(parallel_execution, "run_suite_group", return_value=parallel_execution.GroupResult(0))
+
+    exit_code = execute(make_config(suites), user_tags={"variant": ["v1"]}, workers=2)
+
+    assert exit_code == ExitCode.BAD_CLI_USAGE
+
+
+class InlineExecutor:
+    """Executor running the submitted calls in the calling process."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def submit(self, func, *args):
+        future = Future()
+        future.set_result(func(*args))
+        return future
+
+
+def test_execute_parallel_duration_shard(tmp_path):
+    suites = [make_suite(tmp_path, "aux1", 1)]
+
+    exit_code = execute(make_config(suites), workers=2, shard=test_sharding.TestShard(0, 2, {}))
+
+    assert exit_code == ExitCode.ONE_OR_MORE_TESTS_RAISED_UNEXPECTED_EXCEPTION
+
+
+def test_execute_parallel_failfast_cancelled_group(tmp_path, mocker, capsys):
+    suites = [make_suite(tmp_path, "aux1", 1), make_suite(tmp_path, "aux3", 2)]
+    failed = Future()
+    failed.set_result(parallel_execution.GroupResult(ExitCode.ONE_OR_MORE_TESTS_FAILED, tests_run=1, failures=1))
+    cancelled = Future()
+    cancelled.cancel()
+    cancelled.set_running_or_notify_cancel()
+    executor = mocker.MagicMock()
+    executor.__enter__.return_value.submit.side_effect = [failed, cancelled]
+    mocker.patch.object(parallel_execution, "ProcessPoolExecutor", return_value=executor)
+
+    exit_code = execute(make_config(suites), failfast=True, workers=2)
+
+    output = capsys.readouterr().err
+    assert exit_code == ExitCode.ONE_OR_MORE_TESTS_FAILED
+    assert "Ran 1 tests in 2 parallel group(s)" in output
+    assert "1 group(s) not run after a failure (failfast)" in output
@@ -0,0 +1,152 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import threading
+import time
+
+import pytest
+
+from pykiso import periodic_scheduler
+from pykiso.periodic_scheduler import JobStatistics, PeriodicScheduler, get_scheduler
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = PeriodicScheduler()
+    yield scheduler
+    scheduler.stop()
+
+
+def test_get_scheduler(mocker):
+    mocker.patch.object(periodic_scheduler, "_scheduler", None)
+
+    scheduler = get_scheduler()
+
+    assert isinstance(scheduler, PeriodicScheduler)
+    assert get_scheduler() is scheduler
+    assert not scheduler.is_running
+
+
+def test_schedule_invalid_period(scheduler):
+    with pytest.raises(ValueError, match="must be positive"):
+        scheduler.schedule(lambda: None, 0)
+
+
+def test_schedule_and_cancel(scheduler):
+    times = []
+
+    job = scheduler.schedule(lambda: times.append(time.monotonic()), 0.02, name="job")
+    time.sleep(0.21)
+    job.cancel()
+    executions = len(times)
+    time.sleep(0.05)
+
+    # the thread ends with the last job
+    assert not scheduler.is_running
+    assert scheduler.jobs == []
+    assert job.cancelled
+    assert repr(job) == "PeriodicJob('job', period=0.02)"
+    assert len(times) == executions
+    assert 9 <= executions <= 12
+    # the execution times do not drift from the start of the job
+    assert times[-1] - times[0] == pytest.approx((executions - 1) * 0.02, abs=0.015)
+    statistics = job.statistics
+    assert statistics.executions == executions
+    assert 0 <= statistics.min_jitter <= statistics.mean_jitter <= statistics.max_jitter
+
+
+def test_jobs_ordered_by_deadline(scheduler):
+    slow = scheduler.schedule(lambda: None, 10, name="slow", delay=5)
+    fast = scheduler.schedule(lambda: None, 1, name="fast", delay=1)
+
+    assert scheduler.jobs == [fast, slow]
+
+
+def test_missed_cycles_are_skipped(scheduler):
+    blocker_called = threading.Event()
+    counter = []
+
+    def blocker():
+        blocker_called.set()
+        time.sleep(0.1)
+
+    fast = scheduler.schedule(lambda: counter.append(None), 0.02, name="fast", delay=0.01)
+    scheduler.schedule(blocker, 10, name="blocker")
+    assert blocker_called.wait(1)
+    time.sleep(0.15)
+    fast.cancel()
+
+    statistics = fast.statistics
+    # the cycles during which the blocker ran are not executed in a burst
+    assert statistics.missed_cycles >= 3
+    assert statistics.executions + statistics.missed_cycles == pytest.approx(8, abs=2)
+    assert statistics.max_jitter >= 0.02
+
+
+def test_callback_exception_is_logged(scheduler, caplog):
+    called = threading.Event()
+
+    def failing():
+        called.set()
+        raise RuntimeError("boom")
+
+    job = scheduler.schedule(failing, 0.01, name="failing")
+    assert called.wait(1)
+    time.sleep(0.03)
+    job.cancel()
+
+    assert "periodic job 'failing' raised an exception" in caplog.text
+    assert job.statistics.executions >= 2
+
+
+def test_cancel_from_callback(scheduler):
+    jobs = []
+    job = scheduler.schedule(lambda: jobs[0].cancel(), 0.01)
+    jobs.append(job)
+    time.sleep(0.05)
+
+    assert job.cancelled
+    assert job.statistics.executions == 1
+
+
+def test_cancel_waits_for_running_callback(scheduler):
+    started = threading.Event()
+    finished = []
+
+    def callback():
+        started.set()
+        time.sleep(0.05)
+        finished.append(None)
+
+    job = scheduler.schedule(callback, 1)
+    assert started.wait(1)
+    job.cancel()
+
+    assert finished == [None]
+
+
+def test_statistics_without_execution(scheduler):
+    job = scheduler.schedule(lambda: None, 1, delay=10)
+
+    assert job.statistics == JobStatistics(
+        executions=0, missed_cycles=0, min_jitter=0.0, max_jitter=0.0, mean_jitter=0.0
+    )
+
+
+def test_stop_and_restart(scheduler):
+    job = scheduler.schedule(lambda: None, 1, delay=10)
+    scheduler.stop()
+
+    assert not scheduler.is_running
+    assert job.cancelled
+    assert scheduler.jobs == []
+
+    called = threading.Event()
+    scheduler.schedule(called.set, 1)
+    assert called.wait(1)
@@ -16,6 +16,7 @@ import threading
 import pytest
 
 from pykiso.lib.auxiliaries.proxy_auxiliary import AuxiliaryInterface, CCProxy, ConfigRegistry, ProxyAuxiliary, log
+from pykiso.lib.connectors.cc_proxy import RingSubscriber
 
 AUX_LIST_NAMES = ["MockAux1", "MockAux2"]
 AUX_LIST_INCOMPATIBLE = ["MockAux3"]
@@ -120,6 +121,26 @@ def test_init_trace_not_activate(mocker):
     assert logger == log
 
 
+def test_init_binary_trace(cchannel_inst, tmp_path):
+    proxy_inst = ProxyAuxiliary(
+        cchannel_inst,
+        [],
+        activate_trace=True,
+        trace_dir=str(tmp_path),
+        trace_name="can",
+        trace_format="binary",
+    )
+
+    assert proxy_inst.logger == log
+    assert cchannel_inst.record_path.parent == tmp_path
+    assert cchannel_inst.record_path.name.endswith("_can.pktrace")
+
+
+def test_init_invalid_trace_format(cchannel_inst):
+    with pytest.raises(ValueError, match="unknown trace format 'pcap'"):
+        ProxyAuxiliary(cchannel_inst, [], activate_trace=True, trace_format="pcap")
+
+
 def test_get_proxy_con_valid(mocker, cchannel_inst, mock_aux_interface):
     mock_check_aux = mocker.patch.object(ProxyAuxiliary, "_check_aux_compatibility")
     mock_check_channels = mocker.patch.object(
@@ -483,3 +504,87 @@ def test_run_command(mocker, cchannel_inst):
     proxy_inst.run_command(conn_use, **req)
 
     _run.assert_called_with(conn_use, **req)
+
+
+def test_dispatch_command_ring_buffer(mocker, mock_auxiliaries, cchannel_inst):
+    proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES], buffer_size=8)
+
+    conn_use = sys.modules["pykiso.auxiliaries.MockAux1"].channel
+    conn_not_use = sys.modules["pykiso.auxiliaries.MockAux2"].channel
+
+    # the mocked proxy channels are already open, so they subscribe at binding
+    assert isinstance(conn_use.queue_out, RingSubscriber)
+    assert proxy_inst._count_open_proxy_channels() == 2
+
+    proxy_inst._dispatch_command(conn_use, msg=b"\x01", remote_id=0x10)
+
+    assert conn_not_use.queue_out.get(timeout=0) == {"msg": b"\x01", "remote_id": 0x10}
+    with pytest.raises(queue.Empty):
+        conn_use.queue_out.get(timeout=0)
+
+
+def test_receive_message_ring_buffer(mocker, mock_auxiliaries, cchannel_inst):
+    proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES], buffer_size=1)
+    mocker.patch.object(proxy_inst.channel, "cc_receive", return_value={"msg": b"\x01", "remote_id": 0x10})
+
+    proxy_inst._receive_message()
+    proxy_inst._receive_message()
+
+    link_aux_1 = sys.modules["pykiso.auxiliaries.MockAux1"]
+    link_aux_2 = sys.modules["pykiso.auxiliaries.MockAux2"]
+
+    assert link_aux_1.channel.queue_out.get_nowait() == {"msg": b"\x01", "remote_id": 0x10}
+    assert link_aux_2.channel.queue_out.get_nowait() is link_aux_1.channel.queue_out.ring._slots[0][0]
+    assert proxy_inst.get_dropped_messages() == {"test-cc-proxy": 1}
+
+
+def test_get_dropped_messages_without_ring_buffer(mock_auxiliaries, cchannel_inst):
+    proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES])
+
+    assert proxy_inst.get_dropped_messages() == {}
+
+
+def test_receive_message_filtered(mocker, mock_auxiliaries, cchannel_inst):
+    link_aux_1 = sys.modules["pykiso.auxiliaries.MockAux1"]
+    link_aux_2 = sys.modules["pykiso.auxiliaries.MockAux2"]
+    link_aux_1.channel.set_filter(remote_ids=[0x10])
+    proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES])
+
+    assert proxy_inst._dispatch_table == {0x10: (link_aux_1.channel, link_aux_2.channel)}
+    assert proxy_inst._unrouted_channels == (link_aux_2.channel,)
+
+    for remote_id in (0x10, 0x20, None):
+        mocker.patch.object(proxy_inst.channel, "cc_receive", return_value={"msg": b"\x01", "remote_id": remote_id})
+        proxy_inst._receive_message()
+
+    assert link_aux_1.channel.queue_out.qsize() == 1
+    assert link_aux_1.channel.queue_out.get_nowait()["remote_id"] == 0x10
+    assert link_aux_2.channel.queue_out.qsize() == 3
+
+
+def test_dispatch_command_filtered(mock_auxiliaries, cchannel_inst):
+    proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES])
+    conn_use = sys.modules["pykiso.auxiliaries.MockAux1"].channel
+    conn_filtered = sys.modules["pykiso.auxiliaries.MockAux2"].channel
+
+    # the proxy auxiliary is notified of the filter change
+    conn_filtered.set_filter(msg_prefix=b"\x22")
+    proxy_inst._dispatch_command(conn_use, msg=b"\x11\x22", remote_id=0x10)
+    proxy_inst._dispatch_command(conn_use, msg=b"\x22\x11", remote_id=0x10)
+
+    assert conn_filtered.queue_out.get_nowait()["msg"] == b"\x22\x11"
+    assert conn_filtered.queue_out.empty()
+
+
+def test_receive_message_filtered_ring_buffer(mocker, mock_auxiliaries, cchannel_inst):
+    link_aux_1 = sys.modules["pykiso.auxiliaries.MockAux1"]
+    link_aux_2 = sys.modules["pykiso.auxiliaries.MockAux2"]
+    link_aux_1.channel.set_filter(remote_ids=[0x10])
+    proxy_inst = ProxyAuxiliary(cchannel_inst, [*AUX_LIST_NAMES], buffer_size=8)
+    mocker.patch.object(proxy_inst.channel, "cc_receive", return_value={"msg": b"\x01", "remote_id": 0x20})
+
+    proxy_inst._receive_message()
+
+    with pytest.raises(queue.Empty):
+        link_aux_1.channel.queue_out.get_nowait()
+    assert link_aux_2.channel.queue_out.get_nowait() == {"msg": b"\x01", "remote_id": 0x20}
@@ -73,6 +73,15 @@ def test_query(mocker, instrument_aux_instance):
     query_mock.assert_called_with("*IDN?")
 
 
+def test_execute_batch(mocker, instrument_aux_instance):
+    batch_mock = mocker.patch.object(InstAux, "execute_batch", return_value=["5.0"])
+
+    responses = instrument_aux_instance.execute_batch(["SOUR:VOLT 5", "SOUR:VOLT?"], "inst_aux")
+
+    batch_mock.assert_called_with(["SOUR:VOLT 5", "SOUR:VOLT?"], True)
+    assert responses == ["5.0"]
+
+
 def test_get_identification(mocker, instrument_aux_instance):
     ident_mock = mocker.patch.object(LibSCPI, "get_identification", return_value=True)
 
@@ -128,7 +128,7 @@ def test_get_test_cases(mocker):
     test_cases = get_test_cases(cfg_dict)
 
     assert test_cases == ["test1", "test2"] * 2
-    collect_test_suite.assert_called_once_with(cfg_dict["test_suite_list"])
+    collect_test_suite.assert_called_once_with(cfg_dict["test_suite_list"], cache=None)
 
 
 def test_get_test_cases_error():
@@ -221,6 +221,22 @@ def test_show_tag_main(tmp_path, tmp_test, runner):
     assert result.exit_code == 0
 
 
+@pytest.mark.parametrize("tmp_test", [("aux1", "aux2", False)], indirect=True)
+def test_show_tag_main_cache(tmp_path, tmp_test, mocker, runner):
+    cache_path = tmp_path / "collection_cache.json"
+    collect_spy = mocker.spy(test_execution, "collect_test_suites")
+
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        first = runner.invoke(main, [f"-c{tmp_test}", "--show-tests", "--cache", str(cache_path)])
+        second = runner.invoke(main, [f"-c{tmp_test}", "--show-tests", "--cache", str(cache_path)])
+
+    assert first.exit_code == second.exit_code == 0
+    assert cache_path.is_file()
+    # the unchanged test suites are not loaded again
+    collect_spy.assert_called_once()
+    assert second.output == first.output
+
+
 @pytest.mark.parametrize(
     "tmp_test,error_raised",
     [
@@ -0,0 +1,206 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import json
+from collections import OrderedDict
+
+import pytest
+
+from pykiso.test_result import step_report_export
+from pykiso.test_result.step_report_export import (
+    STEP_COLUMNS,
+    JsonLinesWriter,
+    ParquetWriter,
+    StepReportSummary,
+    StepReportWriter,
+    export_step_report,
+    get_writer,
+    iter_records,
+    register_writer,
+)
+
+
+def make_step(message, succeed=True, timestamp=None):
+    return {
+        "message": message,
+        "var_name": "value",
+        "expected_result": "True",
+        "actual_result": succeed,
+        "succeed": succeed,
+        "timestamp": timestamp,
+    }
+
+
+@pytest.fixture
+def class_contents():
+    return [
+        (
+            "FirstTest",
+            {
+                "test_list": OrderedDict(
+                    test_run={
+                        "steps": [[make_step("first", timestamp=10.5), make_step("second", timestamp=12.0)]],
+                        "unexpected_errors": [[]],
+                        "timing": {"start_time": 10.0, "stop_time": 13.0, "elapsed_time": 3.0},
+                    },
+                    setUp={
+                        "steps": [[make_step("fixture")]],
+                        "unexpected_errors": [[]],
+                    },
+                )
+            },
+        ),
+        (
+            "SecondTest",
+            {
+                "test_list": OrderedDict(
+                    test_run={
+                        "steps": [
+                            [make_step("attempt 1", succeed=False, timestamp=20.2)],
+                            [make_step("attempt 2", timestamp=21.0)],
+                        ],
+                        "unexpected_errors": [[], ["error"]],
+                        "timing": {"start_time": 20.0, "stop_time": 22.0, "elapsed_time": 2.0},
+                    },
+                )
+            },
+        ),
+    ]
+
+
+class RecordingWriter(StepReportWriter):
+    def __init__(self, path):
+        super().__init__(path)
+        self.records = []
+
+    def open(self):
+        pass
+
+    def write_test(self, test):
+        self.records.append(("test", test))
+
+    def write_step(self, step):
+        self.records.append(("step", step))
+
+    def write_summary(self, summary):
+        self.records.append(("summary", summary))
+
+
+def test_iter_records(class_contents):
+    records = list(iter_records(class_contents))
+
+    assert [record_type for record_type, _ in records] == ["step", "step", "test", "step", "test", "step", "step", "test"]
+    first_step, second_step, first_test = (record for _, record in records[:3])
+    assert first_step["duration"] == 0.5
+    assert second_step["duration"] == 1.5
+    assert second_step["step"] == 2 and second_step["attempt"] == 1
+    assert first_test["elapsed_time"] == 3.0
+    assert first_test["succeed"] is True
+    fixture_step, fixture_test = (record for _, record in records[3:5])
+    assert fixture_step["duration"] is None
+    assert fixture_test["elapsed_time"] is None
+    retried_test = records[-1][1]
+    assert retried_test["attempts"] == 2
+    assert retried_test["failed_steps"] == 1
+    assert retried_test["errors"] == ["error"]
+    assert retried_test["succeed"] is False
+    # the duration of the first step of each attempt is measured from the test start
+    assert records[-2][1]["duration"] == 1.0
+
+
+def test_summary(class_contents):
+    summary = StepReportSummary(slowest=2)
+    for record_type, record in iter_records(class_contents):
+        getattr(summary, f"add_{record_type}")(record)
+
+    content = summary.to_dict()
+
+    assert content["tests"] == 3
+    assert content["failed_tests"] == 1
+    assert content["steps"] == 5
+    assert content["failed_steps"] == 1
+    assert content["failures_per_class"] == {"SecondTest": 1}
+    assert content["elapsed_per_class"] == {"FirstTest": 3.0, "SecondTest": 2.0}
+    assert [test["class_name"] for test in content["slowest_tests"]] == ["FirstTest", "SecondTest"]
+    assert [step["duration"] for step in content["slowest_steps"]] == [1.5, 1.0]
+
+
+def test_summary_equal_durations():
+    summary = StepReportSummary(slowest=1)
+    step = {"class_name": "A", "test_name": "test", "attempt": 1, "step": 1, "message": "", "succeed": True}
+
+    summary.add_step({**step, "duration": 1.0})
+    summary.add_step({**step, "duration": 1.0})
+
+    assert len(summary.to_dict()["slowest_steps"]) == 1
+
+
+def test_export_json_lines(tmp_path, class_contents):
+    export_file = tmp_path / "export" / "report.jsonl"
+
+    summary = export_step_report(export_file, class_contents)
+
+    records = [json.loads(line) for line in export_file.read_text().splitlines()]
+    assert [record["record"] for record in records].count("step") == 5
+    assert [record["record"] for record in records].count("test") == 3
+    assert records[-1] == {"record": "summary", **summary}
+
+
+def test_export_custom_writer(tmp_path, class_contents):
+    writer = RecordingWriter(tmp_path / "report.custom")
+
+    export_step_report(writer.path, class_contents, writer=writer)
+
+    assert len(writer.records) == 9
+    assert writer.records[-1][0] == "summary"
+
+
+def test_get_writer(tmp_path, mocker):
+    mocker.patch.dict(step_report_export._WRITERS)
+
+    assert isinstance(get_writer(tmp_path / "report.JSONL"), JsonLinesWriter)
+    with pytest.raises(ValueError, match="No step report writer for '.csv' files"):
+        get_writer(tmp_path / "report.csv")
+
+    register_writer(".CSV", RecordingWriter)
+
+    assert isinstance(get_writer(tmp_path / "report.csv"), RecordingWriter)
+
+
+def test_parquet_writer_missing_dependency(tmp_path, mocker):
+    mocker.patch.dict("sys.modules", {"pyarrow": None, "pyarrow.parquet": None})
+
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        export_step_report(tmp_path / "report.parquet", [])
+
+
+def test_parquet_writer(tmp_path, class_contents):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    export_step_report(tmp_path / "report.parquet", class_contents)
+
+    assert pq.read_table(tmp_path / "report.parquet").num_rows == 5
+    assert pq.read_table(tmp_path / "report_tests.parquet").num_rows == 3
+    assert json.loads((tmp_path / "report_summary.json").read_text())["tests"] == 3
+
+
+def test_parquet_writer_fixed_steps_schema(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    step = dict.fromkeys(STEP_COLUMNS)
+
+    with ParquetWriter(tmp_path / "report.parquet", batch_size=1) as writer:
+        # the first row group only contains None timestamps
+        writer.write_step({**step, "step": 1})
+        writer.write_step({**step, "step": 2, "timestamp": 12.5, "succeed": True})
+        writer.write_summary({})
+
+    table = pq.read_table(tmp_path / "report.parquet")
+    assert table.column_names == STEP_COLUMNS
+    assert table.column("timestamp").to_pylist() == [None, "12.5"]
+    assert table.column("succeed").to_pylist() == [None, "True"]
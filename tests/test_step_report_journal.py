@@ -0,0 +1,166 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import json
+import sys
+from collections import OrderedDict
+from unittest import TestCase, mock
+
+import pytest
+
+from pykiso.test_result import assert_step_report, step_report_journal
+from pykiso.test_result.text_result import BannerTestResult
+
+
+class FirstTest(TestCase):
+    """First test class"""
+
+    __test__ = False
+
+    def test_run(self):
+        for value in range(3):
+            self.assertTrue(value >= 0)
+
+
+class SecondTest(TestCase):
+    __test__ = False
+
+    def test_run(self):
+        self.assertEqual(1, 2)
+
+
+@pytest.fixture
+def decorated_tests():
+    tests = [FirstTest("test_run"), SecondTest("test_run")]
+    for test in tests:
+        test.step_report = assert_step_report.StepReportData()
+        test.start_time = test.stop_time = test.elapsed_time = 0
+        for method_name in ("assertTrue", "assertEqual"):
+            setattr(test, method_name, assert_step_report.assert_decorator(getattr(test, method_name)))
+    return tests
+
+
+@pytest.fixture
+def journal(tmp_path, mocker):
+    mocker.patch.object(assert_step_report, "ALL_STEP_REPORT", OrderedDict())
+    journal = step_report_journal.start_streaming_step_report(tmp_path / "report.html")
+    yield journal
+    journal.close()
+
+
+def read_records(journal):
+    return [json.loads(line) for line in journal.path.read_text().splitlines()]
+
+
+def test_streaming_steps_written_as_they_happen(journal, decorated_tests):
+    first, second = decorated_tests
+
+    first.test_run()
+
+    records = read_records(journal)
+    assert [record["kind"] for record in records] == ["class", "test", "step", "step", "step"]
+    assert records[-1]["step"] == ["", "value", "True", True, True]
+    # only the last step is kept in memory
+    assert len(assert_step_report.ALL_STEP_REPORT["FirstTest"]["test_list"]["test_run"]["steps"][-1]) == 1
+
+    with pytest.raises(AssertionError):
+        second.test_run()
+
+    # the first class is over: dropped from memory and rendered
+    assert list(assert_step_report.ALL_STEP_REPORT) == ["SecondTest"]
+    assert (journal.output_file.parent / "report_pages" / "FirstTest.html").is_file()
+    assert "FirstTest" in journal.output_file.read_text()
+    assert read_records(journal)[-1] == {"kind": "fail", "class": "SecondTest", "test": "test_run"}
+
+
+def test_streaming_generate_step_report(journal, decorated_tests):
+    first, second = decorated_tests
+    first.test_run()
+    with pytest.raises(AssertionError):
+        second.test_run()
+    result = mock.MagicMock(spec=BannerTestResult(sys.stderr, False, 0))
+    result.successes = [first]
+    result.failures = [(second, "")]
+    result.expectedFailures = result.errors = result.unexpectedSuccesses = []
+
+    assert_step_report.generate_step_report(result, journal.output_file)
+
+    assert assert_step_report._STEP_REPORT_JOURNAL is None
+    assert journal.status == {"FirstTest": True, "SecondTest": False}
+    second_page = (journal.output_file.parent / "report_pages" / "SecondTest.html").read_text()
+    assert "Elapsed Time" in second_page
+    assert "timestamp" not in second_page
+    index = journal.output_file.read_text()
+    assert 'href="report_pages/FirstTest.html"' in index
+    assert 'href="report_pages/SecondTest.html"' in index
+
+
+def test_streaming_complete_renders_outdated_classes(journal, decorated_tests, mocker):
+    first, second = decorated_tests
+    first.test_run()
+    with pytest.raises(AssertionError):
+        second.test_run()
+    journal.finish_class("SecondTest")
+    render_spy = mocker.spy(journal, "render_class")
+
+    journal.write("result", "SecondTest", test="test_run", time_result={"End Time": "now"})
+    journal.complete()
+
+    # the first class did not change since it was rendered
+    render_spy.assert_called_once_with("SecondTest")
+    assert len(journal.offsets["FirstTest"]) == 6
+    second_page = (journal.output_file.parent / "report_pages" / "SecondTest.html").read_text()
+    assert "now" in second_page
+
+
+def test_streaming_export(journal, decorated_tests, tmp_path):
+    first, second = decorated_tests
+    first.start_time, first.stop_time, first.elapsed_time = 10.0, 12.0, 2.0
+    first.test_run()
+    result = mock.MagicMock(spec=BannerTestResult(sys.stderr, False, 0))
+    result.successes = [first]
+    result.failures = result.expectedFailures = result.errors = result.unexpectedSuccesses = []
+
+    assert_step_report.generate_step_report(result, journal.output_file, tmp_path / "export.jsonl")
+
+    records = [json.loads(line) for line in (tmp_path / "export.jsonl").read_text().splitlines()]
+    assert [record["record"] for record in records] == ["step", "step", "step", "test", "summary"]
+    assert all(isinstance(record["timestamp"], float) for record in records[:3])
+    assert records[3]["start_time"] == 10.0 and records[3]["elapsed_time"] == 2.0
+
+
+def test_streaming_retry(journal, decorated_tests):
+    first, _ = decorated_tests
+    first.test_run()
+
+    assert_step_report.add_retry_information(first, True, 0, 2, ValueError())
+    first.test_run()
+    journal.finish_class("FirstTest")
+
+    content = step_report_journal._load_class(journal.path, journal.offsets["FirstTest"])
+    test = content["test_list"]["test_run"]
+    assert test["number_try"] == 1 and test["max_try"] == 2
+    assert [len(steps) for steps in test["steps"]] == [3, 3]
+    assert len(test["unexpected_errors"]) == 2
+    assert content["header"] == {}
+
+
+def test_render_step_report_after_crash(journal, decorated_tests, tmp_path):
+    first, _ = decorated_tests
+    first.test_run()
+    # simulate a crash while writing a record
+    with journal.path.open("ab") as journal_file:
+        journal_file.write(b'{"kind": "st')
+
+    step_report_journal.render_step_report(journal.path, tmp_path / "recovered.html")
+
+    page = (tmp_path / "recovered_pages" / "FirstTest.html").read_text()
+    assert "First test class" in page
+    assert page.count("<tr>") == 4
+    assert "FirstTest" in (tmp_path / "recovered.html").read_text()
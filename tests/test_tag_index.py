@@ -0,0 +1,153 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import re
+import unittest
+
+import pytest
+
+from pykiso.test_coordinator import test_execution, test_suite
+from pykiso.test_coordinator.tag_index import TagExpression, TagIndex, format_tag_name
+
+TESTS = [
+    ("test_1", {"variant": ["v1", "v2"], "branchlevel": ["daily"]}),
+    ("test_2", {"variant": ["v2"], "branchlevel": ["nightly"]}),
+    ("test_3", {"variant": ["v3"]}),
+    ("test_4", {"slow": ["yes"], "branchlevel": ["daily", "nightly"]}),
+    ("untagged", None),
+]
+
+SUITE = """
+import pykiso
+
+
+@pykiso.define_test_parameters(suite_id=1, case_id=1, tag={"variant": ["v1"], "branch-level": ["daily"]})
+class DailyTest(pykiso.BasicTest):
+    def test_run(self):
+        pass
+
+
+@pykiso.define_test_parameters(suite_id=1, case_id=2, tag={"variant": ["v1"], "branch_level": ["nightly"]})
+class NightlyTest(pykiso.BasicTest):
+    def test_run(self):
+        pass
+
+
+@pykiso.define_test_parameters(suite_id=1, case_id=3)
+class UntaggedTest(pykiso.BasicTest):
+    def test_run(self):
+        pass
+"""
+
+
+@pytest.fixture
+def index():
+    return TagIndex(TESTS)
+
+
+def test_format_tag_name():
+    assert format_tag_name("branch-level_name") == "branchlevelname"
+
+
+def test_tag_index(index):
+    assert index.test_ids == {"test_1", "test_2", "test_3", "test_4", "untagged"}
+    assert index.tagged == {"test_1", "test_2", "test_3", "test_4"}
+    assert index.names["branchlevel"] == {"test_1", "test_2", "test_4"}
+    assert index.values["variant", "v2"] == {"test_1", "test_2"}
+
+
+def test_tag_index_get_skip_reasons(index):
+    reasons = index.get_skip_reasons({"variant": ["v1", "v3"], "branchlevel": "daily"})
+
+    assert reasons == {
+        "test_2": "non-matching value for tag 'variant'",
+        "test_3": "provided tag 'branchlevel' not present in test tags",
+        "test_4": "provided tag 'variant' not present in test tags",
+    }
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("variant=v2", {"test_1", "test_2"}),
+        ("variant=v1,v3", {"test_1", "test_3"}),
+        ("slow", {"test_4"}),
+        ("not slow", {"test_1", "test_2", "test_3"}),
+        ("variant=v2 and branch-level=nightly", {"test_2"}),
+        ("variant=v3 or slow and branch_level=daily", {"test_3", "test_4"}),
+        ("(variant=v3 or slow) and not branchlevel=nightly", {"test_3"}),
+        ("not not variant=unknown", set()),
+    ],
+)
+def test_tag_expression_evaluate(index, expression, expected):
+    tag_expression = TagExpression(expression)
+
+    # the test cases without tags are always selected
+    assert tag_expression.evaluate(index) == expected | {"untagged"}
+
+
+def test_tag_expression_tag_names():
+    tag_expression = TagExpression("variant=v1 and not (branch-level=daily or slow)")
+
+    assert tag_expression.tag_names == {"variant", "branchlevel", "slow"}
+    assert repr(tag_expression) == "TagExpression('variant=v1 and not (branch-level=daily or slow)')"
+
+
+@pytest.mark.parametrize(
+    "expression, message",
+    [
+        ("", "unexpected end of tag expression"),
+        ("variant=v1 and", "unexpected end of tag expression"),
+        ("(variant=v1", "unexpected end of tag expression"),
+        ("variant=v1)", "unexpected ')'"),
+        ("variant=v1 slow", "unexpected 'slow'"),
+        ("and slow", "unexpected 'and'"),
+        ("variant= and slow", "missing value of tag 'variant'"),
+        ("(variant=v1 or slow(", "missing ')'"),
+    ],
+)
+def test_tag_expression_invalid(expression, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        TagExpression(expression)
+
+
+@pytest.fixture(scope="module")
+def suite_config(tmp_path_factory):
+    suite_dir = tmp_path_factory.mktemp("tag_index_suite")
+    (suite_dir / "test_tag_index_suite.py").write_text(SUITE)
+    return {"suite_dir": str(suite_dir), "test_filter_pattern": "test_*.py", "test_suite_id": 1}
+
+
+def get_skipped(all_tests):
+    return {
+        test.__class__.__name__.split("-")[0]: getattr(test.__class__, "__unittest_skip_why__", None)
+        for test in test_suite.flatten(all_tests)
+    }
+
+
+def test_apply_tag_filter_expression(suite_config):
+    all_tests = unittest.TestSuite(test_execution.collect_test_suites([suite_config]))
+
+    test_tags = test_execution.apply_tag_filter(
+        all_tests, {"variant": ["v1"]}, tag_expression=TagExpression("not branch-level=nightly")
+    )
+
+    assert test_tags == {"variant", "branchlevel"}
+    assert get_skipped(all_tests) == {
+        "DailyTest": None,
+        "NightlyTest": "tag expression 'not branch-level=nightly' not matched",
+        "UntaggedTest": None,
+    }
+
+
+def test_apply_tag_filter_expression_unknown_tag(suite_config):
+    all_tests = unittest.TestSuite(test_execution.collect_test_suites([suite_config]))
+
+    with pytest.raises(NameError, match="Provided tag 'unknown' is not defined in any testcase"):
+        test_execution.apply_tag_filter(all_tests, {}, tag_expression=TagExpression("variant=v1 or unknown"))
@@ -0,0 +1,219 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import io
+import json
+import unittest
+
+import pytest
+
+from pykiso.test_coordinator import test_execution, test_suite
+from pykiso.test_coordinator.test_scheduling import RunHistory, TestOrder, order_tests
+
+SUITE = """
+import unittest
+
+import pykiso
+
+
+@pykiso.define_test_parameters(suite_id={suite_id}, case_id=0)
+class SuiteSetup(pykiso.BasicTestSuiteSetup):
+    pass
+
+
+@pykiso.define_test_parameters(suite_id={suite_id}, case_id=0)
+class SuiteTeardown(pykiso.BasicTestSuiteTeardown):
+    pass
+
+
+@pykiso.define_test_parameters(suite_id={suite_id}, case_id=1)
+class MultipleTests(pykiso.BasicTest):
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+
+
+@pykiso.define_test_parameters(suite_id={suite_id}, case_id=2)
+class FailingTest(pykiso.BasicTest):
+    def test_run(self):
+        self.assertTrue({result})
+
+
+@pykiso.define_test_parameters(suite_id={suite_id}, case_id=3)
+class SkippedTest(pykiso.BasicTest):
+    @unittest.skip("not this time")
+    def test_run(self):
+        pass
+"""
+
+
+@pytest.fixture(scope="module")
+def suite_list(tmp_path_factory):
+    suites = []
+    for suite_id, result in ((1, True), (2, False)):
+        suite_dir = tmp_path_factory.mktemp(f"scheduling_suite_{suite_id}")
+        (suite_dir / f"test_scheduling_suite_{suite_id}.py").write_text(
+            SUITE.format(suite_id=suite_id, result=result)
+        )
+        suites.append({"suite_dir": str(suite_dir), "test_filter_pattern": "test_*.py", "test_suite_id": suite_id})
+    return suites
+
+
+@pytest.fixture
+def all_tests(suite_list):
+    return unittest.TestSuite(test_execution.collect_test_suites(suite_list))
+
+
+def short_ids(tests):
+    return [test.id().split(".", 1)[1] for test in test_suite.flatten(tests)]
+
+
+def make_history(all_tests, durations, failed=()):
+    records = {}
+    for test in test_suite.flatten(all_tests):
+        short_id = test.id().split(".", 1)[1]
+        if short_id in durations:
+            outcome = "failed" if short_id in failed else "passed"
+            records[test.id()] = {"duration": durations[short_id], "outcome": outcome, "updated": 0}
+    return RunHistory(records=records)
+
+
+def test_run_history_load_and_save(tmp_path):
+    path = tmp_path / "history" / "history.json"
+
+    history = RunHistory.load(path)
+    history.records["test_id"] = {"duration": 1.5, "outcome": "passed", "updated": 0}
+    history.save()
+
+    assert RunHistory.load(path).records == history.records
+    assert RunHistory.load(path).get_durations() == {"test_id": 1.5}
+    assert list((tmp_path / "history").iterdir()) == [path]
+
+
+def test_run_history_load_invalid(tmp_path, caplog):
+    path = tmp_path / "history.json"
+    path.write_text("{invalid")
+
+    assert RunHistory.load(path).records == {}
+    assert "could not be read" in caplog.text
+
+
+def test_run_history_update(all_tests):
+    history = RunHistory(records={"other.Test.test_run": {"duration": 3.0, "outcome": "failed", "updated": 0}})
+    tests = list(test_suite.flatten(all_tests))
+
+    result = test_execution.run_tests(all_tests, "text", io.StringIO())
+    updated = history.update(tests, result)
+
+    outcomes = {test_id.split(".", 1)[1]: record["outcome"] for test_id, record in updated.items()}
+    assert outcomes["FailingTest-2-2.test_run"] == "failed"
+    assert outcomes["FailingTest-1-2.test_run"] == "passed"
+    assert outcomes["MultipleTests-1-1.test_a"] == "passed"
+    assert "SkippedTest-1-3.test_run" not in outcomes
+    assert all(record["duration"] >= 0 for record in updated.values())
+    assert "other.Test.test_run" in history.records
+
+
+def test_run_history_update_junit(all_tests, tmp_path):
+    history = RunHistory()
+    tests = list(test_suite.flatten(all_tests))
+
+    result = test_execution.run_tests(all_tests, "junit", io.StringIO(), junit_report_path=str(tmp_path / "report.xml"))
+    updated = history.update(tests, result)
+
+    failed = [test_id for test_id, record in updated.items() if record["outcome"] == "failed"]
+    assert [test_id.split(".", 1)[1] for test_id in failed] == ["FailingTest-2-2.test_run"]
+
+
+def test_order_tests_discovery(all_tests):
+    expected = short_ids(all_tests)
+
+    assert short_ids(order_tests(all_tests, TestOrder.DISCOVERY, RunHistory())) == expected
+
+
+def test_order_tests_failed_first(all_tests):
+    history = make_history(all_tests, {"FailingTest-2-2.test_run": 1.0}, failed={"FailingTest-2-2.test_run"})
+
+    ordered = short_ids(order_tests(all_tests, TestOrder.FAILED_FIRST, history))
+
+    # the test suite and the test case that failed are run first
+    assert ordered == [
+        "SuiteSetup-2-0.test_suite_setUp",
+        "FailingTest-2-2.test_run",
+        "MultipleTests-2-1.test_a",
+        "MultipleTests-2-1.test_b",
+        "SkippedTest-2-3.test_run",
+        "SuiteTeardown-2-0.test_suite_tearDown",
+        "SuiteSetup-1-0.test_suite_setUp",
+        "MultipleTests-1-1.test_a",
+        "MultipleTests-1-1.test_b",
+        "FailingTest-1-2.test_run",
+        "SkippedTest-1-3.test_run",
+        "SuiteTeardown-1-0.test_suite_tearDown",
+    ]
+
+
+@pytest.mark.parametrize(
+    "order, expected_suite_1",
+    [
+        (
+            TestOrder.LONGEST_FIRST,
+            ["MultipleTests-1-1.test_b", "MultipleTests-1-1.test_a", "SkippedTest-1-3.test_run", "FailingTest-1-2.test_run"],
+        ),
+        (
+            TestOrder.SHORTEST_FIRST,
+            ["FailingTest-1-2.test_run", "SkippedTest-1-3.test_run", "MultipleTests-1-1.test_a", "MultipleTests-1-1.test_b"],
+        ),
+    ],
+)
+def test_order_tests_duration(all_tests, order, expected_suite_1):
+    # the test cases of a class are kept together, the skipped test case lasts as long as the average
+    durations = {
+        "MultipleTests-1-1.test_a": 1.0,
+        "MultipleTests-1-1.test_b": 4.0,
+        "FailingTest-1-2.test_run": 0.5,
+        "MultipleTests-2-1.test_a": 10.0,
+    }
+    history = make_history(all_tests, durations)
+
+    ordered = short_ids(order_tests(all_tests, order, history))
+
+    # the second test suite lasts longer than the first one
+    suite_1 = ordered[6:] if order is TestOrder.LONGEST_FIRST else ordered[:6]
+    assert suite_1[0] == "SuiteSetup-1-0.test_suite_setUp"
+    assert suite_1[1:5] == expected_suite_1
+    assert suite_1[5] == "SuiteTeardown-1-0.test_suite_tearDown"
+
+
+def test_order_tests_without_fixtures(all_tests):
+    history = make_history(all_tests, {"MultipleTests-2-1.test_a": 10.0, "FailingTest-1-2.test_run": 5.0})
+    # the test case filter flattens the suites and drops the fixtures
+    filtered = test_execution.apply_test_case_filter(all_tests, "*Test*", None)
+
+    ordered = short_ids(order_tests(filtered, TestOrder.LONGEST_FIRST, history))
+
+    # the test cases of the second test suite last the longest
+    assert ordered[:2] == ["MultipleTests-2-1.test_a", "MultipleTests-2-1.test_b"]
+    assert [short_id.split("-")[1] for short_id in ordered] == ["2"] * 4 + ["1"] * 4
+
+
+def test_execute_test_history(suite_list, tmp_path):
+    config = {"test_suite_list": suite_list, "auxiliaries": {}, "connectors": {}}
+    history_path = tmp_path / "history.json"
+
+    exit_code = test_execution.execute(config, test_history=history_path)
+
+    assert exit_code == test_execution.ExitCode.ONE_OR_MORE_TESTS_FAILED
+    records = json.loads(history_path.read_text())
+    # the skipped test cases are not recorded
+    assert len(records) == 10
+    failed = [test_id for test_id, record in records.items() if record["outcome"] == "failed"]
+    assert [test_id.split(".", 1)[1] for test_id in failed] == ["FailingTest-2-2.test_run"]
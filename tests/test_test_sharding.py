@@ -0,0 +1,148 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import io
+import unittest
+
+import pytest
+
+from pykiso.test_coordinator import test_execution, test_sharding, test_suite
+from pykiso.test_coordinator.test_sharding import (
+    apply_shard,
+    load_junit_timings,
+    partition_by_duration,
+    partition_by_id,
+)
+
+SUITE_FIXTURES = """
+import pykiso
+
+
+@pykiso.define_test_parameters(suite_id={suite_id}, case_id=0)
+class SuiteSetup(pykiso.BasicTestSuiteSetup):
+    pass
+
+
+@pykiso.define_test_parameters(suite_id={suite_id}, case_id=0)
+class SuiteTeardown(pykiso.BasicTestSuiteTeardown):
+    pass
+"""
+
+TEST_CASE = """
+
+@pykiso.define_test_parameters(suite_id={suite_id}, case_id={case_id})
+class MyTest{case_id}(pykiso.BasicTest):
+    def test_run(self):
+        pass
+"""
+
+
+@pytest.fixture(scope="module")
+def suite_list(tmp_path_factory):
+    """Create two test suites of 4 and 2 test cases."""
+    suites = []
+    for suite_id, case_count in ((1, 4), (2, 2)):
+        suite_dir = tmp_path_factory.mktemp(f"shard_suite_{suite_id}")
+        content = SUITE_FIXTURES.format(suite_id=suite_id) + "".join(
+            TEST_CASE.format(suite_id=suite_id, case_id=case_id) for case_id in range(1, case_count + 1)
+        )
+        (suite_dir / f"test_shard_suite_{suite_id}.py").write_text(content)
+        suites.append({"suite_dir": str(suite_dir), "test_filter_pattern": "test_*.py", "test_suite_id": suite_id})
+    return suites
+
+
+@pytest.fixture
+def all_tests(suite_list):
+    return unittest.TestSuite(test_execution.collect_test_suites(suite_list))
+
+
+def get_test_ids(tests, fixtures=False):
+    return [test.id() for test in test_suite.flatten(tests) if fixtures or not test_suite.is_suite_fixture(test)]
+
+
+def test_test_shard_invalid():
+    with pytest.raises(ValueError, match="invalid shard index 2 for 2 shard"):
+        test_sharding.TestShard(2, 2)
+
+
+def test_partition_by_id():
+    test_ids = [f"module.MyTest-1-{case_id}.test_run" for case_id in range(50)]
+
+    shards = partition_by_id(test_ids, 3)
+
+    assert set().union(*shards) == set(test_ids)
+    assert sum(len(shard) for shard in shards) == len(test_ids)
+    # independent from the collection order
+    assert partition_by_id(reversed(test_ids), 3) == shards
+    assert all(shards)
+
+
+def test_partition_by_duration():
+    timings = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 1.0, "ignored": 100.0}
+
+    shards = partition_by_duration(["a", "b", "c", "d", "e", "unknown"], 2, timings)
+
+    # "unknown" lasts as long as the average test case (3.2s)
+    assert shards == [{"a", "c", "e"}, {"b", "unknown", "d"}]
+
+
+def test_partition_by_duration_without_timings():
+    shards = partition_by_duration(["a", "b", "c", "d"], 2, {})
+
+    assert [len(shard) for shard in shards] == [2, 2]
+
+
+@pytest.mark.parametrize("with_timings", [False, True])
+def test_apply_shard(suite_list, with_timings):
+    all_ids = get_test_ids(unittest.TestSuite(test_execution.collect_test_suites(suite_list)))
+    timings = {test_id: 1.0 for test_id in all_ids} if with_timings else None
+
+    shard_ids = []
+    for index in range(3):
+        tests = unittest.TestSuite(test_execution.collect_test_suites(suite_list))
+        tests = apply_shard(tests, test_sharding.TestShard(index, 3, timings))
+        shard_ids.append(get_test_ids(tests))
+        # the suite fixtures are kept for each suite of the shard, around its test cases
+        for suite in tests:
+            suite_tests = list(test_suite.flatten(suite))
+            if any(not test_suite.is_suite_fixture(test) for test in suite_tests):
+                assert isinstance(suite_tests[0], test_suite.BasicTestSuiteSetup)
+                assert isinstance(suite_tests[-1], test_suite.BasicTestSuiteTeardown)
+            else:
+                assert suite_tests == []
+
+    assert sorted(sum(shard_ids, [])) == sorted(all_ids)
+    if with_timings:
+        assert [len(ids) for ids in shard_ids] == [2, 2, 2]
+
+
+def test_collect_tests_shard(suite_list, mocker):
+    shard = test_sharding.TestShard(0, 2)
+    apply_shard = mocker.spy(test_execution, "apply_shard")
+
+    tests = test_execution.collect_tests(
+        {"test_suite_list": suite_list, "auxiliaries": {}, "connectors": {}},
+        test_execution.TestFilterPattern(None, None, None),
+        shard=shard,
+    )
+
+    apply_shard.assert_called_once_with(mocker.ANY, shard)
+    assert len(get_test_ids(tests)) < 6
+
+
+def test_load_junit_timings(tmp_path, all_tests):
+    expected_ids = get_test_ids(all_tests, fixtures=True)
+    (tmp_path / "nested").mkdir()
+
+    test_execution.run_tests(all_tests, "junit", io.StringIO(), junit_report_path=str(tmp_path / "nested" / "run.xml"))
+    timings = load_junit_timings(tmp_path)
+
+    assert sorted(timings) == sorted(expected_ids)
+    assert all(isinstance(duration, float) for duration in timings.values())
+    assert load_junit_timings(tmp_path / "nested" / "run.xml") == timings
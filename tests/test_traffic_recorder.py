@@ -0,0 +1,175 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import threading
+import time
+
+import pytest
+
+from pykiso import CChannel, message
+from pykiso.traffic_recorder import Direction, TraceReader, TrafficRecorder, read_trace, to_bytes
+
+
+class CCEcho(CChannel):
+    """Receive the sent messages back with their remote id."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.messages = []
+
+    def _cc_open(self):
+        pass
+
+    def _cc_close(self):
+        pass
+
+    def _cc_send(self, msg, remote_id=None):
+        self.messages.append({"msg": msg, "remote_id": remote_id})
+
+    def _cc_receive(self, timeout=0.1):
+        return self.messages.pop(0) if self.messages else {"msg": None}
+
+
+@pytest.fixture
+def recording(tmp_path):
+    return tmp_path / "traces" / "channel.pktrace"
+
+
+@pytest.mark.parametrize(
+    "msg, expected",
+    [
+        (b"\x01\x02", b"\x01\x02"),
+        (bytearray(b"\x03"), b"\x03"),
+        ("ping", b"ping"),
+        (42, b"42"),
+    ],
+)
+def test_to_bytes(msg, expected):
+    assert to_bytes(msg) == expected
+
+
+def test_to_bytes_message():
+    msg = message.Message(msg_type=message.MessageType.COMMAND, sub_type=message.MessageCommandType.TEST_CASE_RUN)
+
+    assert to_bytes(msg) == msg.serialize()
+
+
+def test_record_and_read(recording):
+    start = time.time()
+    with TrafficRecorder(recording, name="can") as recorder:
+        recorder.record(Direction.TX, b"\x22\xf1\x90", remote_id=0x7E0)
+        recorder.record(Direction.RX, b"\x62\xf1\x90\x00", remote_id=0x7E8)
+        recorder.record(Direction.RX, b"")
+
+    assert recorder.closed
+    assert recorder.frames == 3
+    assert recorder.written == recording.stat().st_size
+
+    reader = TraceReader(recording)
+    frames = list(reader)
+    assert reader.name == "can"
+    assert [frame[1:] for frame in frames] == [
+        (Direction.TX, 0x7E0, b"\x22\xf1\x90"),
+        (Direction.RX, 0x7E8, b"\x62\xf1\x90\x00"),
+        (Direction.RX, None, b""),
+    ]
+    assert start <= frames[0].timestamp <= frames[1].timestamp <= time.time()
+    # frames recorded after closing the recorder are ignored
+    recorder.record(Direction.TX, b"\x00")
+    assert recorder.frames == 3
+
+
+def test_record_appends_to_existing_recording(recording):
+    for data in (b"\x01", b"\x02"):
+        with TrafficRecorder(recording, name="uart") as recorder:
+            recorder.record(Direction.TX, data)
+
+    assert [frame.data for frame in read_trace(recording)] == [b"\x01", b"\x02"]
+
+
+def test_record_concurrently(recording):
+    recorder = TrafficRecorder(recording, flush_interval=0.01)
+
+    def send(index):
+        for _ in range(500):
+            recorder.record(Direction.TX, bytes([index] * 8))
+
+    threads = [threading.Thread(target=send, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    recorder.close()
+
+    frames = list(read_trace(recording))
+    assert len(frames) == 2000
+    assert {frame.data for frame in frames} == {bytes([index] * 8) for index in range(4)}
+
+
+def test_read_incomplete_recording(recording):
+    with TrafficRecorder(recording) as recorder:
+        recorder.record(Direction.RX, b"\x01\x02\x03")
+        recorder.record(Direction.RX, b"\x04\x05\x06")
+    content = recording.read_bytes()
+    recording.write_bytes(content[:-2])
+
+    assert [frame.data for frame in read_trace(recording)] == [b"\x01\x02\x03"]
+
+
+@pytest.mark.parametrize(
+    "content, error",
+    [
+        (b"", "is not a traffic recording"),
+        (b"PCAP\x01\x00\x00\x00", "is not a traffic recording"),
+        (b"PKTR\x02\x00\x00\x00", "format version 2"),
+    ],
+)
+def test_read_invalid_recording(tmp_path, content, error):
+    path = tmp_path / "invalid.pktrace"
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError, match=error):
+        TraceReader(path)
+
+
+def test_channel_records_while_open(tmp_path):
+    channel = CCEcho(name="echo", record_path=tmp_path)
+
+    with channel:
+        assert channel.recorder is not None
+        channel.cc_send(b"\x01\x02")
+        channel.cc_send("ping", remote_id=0x10)
+        channel.cc_receive()
+        channel.cc_receive()
+        channel.cc_receive()
+
+    assert channel.recorder is None
+    frames = list(read_trace(tmp_path / "echo.pktrace"))
+    assert [frame[1:] for frame in frames] == [
+        (Direction.TX, None, b"\x01\x02"),
+        (Direction.TX, 0x10, b"ping"),
+        (Direction.RX, None, b"\x01\x02"),
+        (Direction.RX, 0x10, b"ping"),
+    ]
+
+
+def test_channel_start_and_stop_recording(tmp_path):
+    channel = CCEcho()
+    channel.open()
+    channel.cc_send(b"\x00")
+
+    recorder = channel.start_recording(tmp_path / "manual.pktrace")
+    channel.cc_send(b"\x01")
+    channel.stop_recording()
+    channel.cc_send(b"\x02")
+    channel.close()
+
+    assert recorder.closed
+    assert [frame.data for frame in read_trace(tmp_path / "manual.pktrace")] == [b"\x01"]
+    assert TraceReader(tmp_path / "manual.pktrace").name == "CCEcho"
@@ -0,0 +1,87 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import datetime
+
+import pytest
+from click.testing import CliRunner
+
+from pykiso.tool.traffic_trace import format_frame, main
+from pykiso.traffic_recorder import Direction, TraceFrame, TrafficRecorder
+
+
+@pytest.fixture
+def recording(tmp_path):
+    path = tmp_path / "can.pktrace"
+    with TrafficRecorder(path, name="can") as recorder:
+        recorder.record(Direction.TX, b"\x22\xf1\x90", remote_id=0x7E0)
+        recorder.record(Direction.RX, b"\x62\xf1\x90\x41", remote_id=0x7E8)
+        recorder.record(Direction.RX, b"\x01\x02", remote_id=0x100)
+    return path
+
+
+def test_format_frame():
+    timestamp = datetime.datetime(2024, 5, 1, 12, 30, 15, 250).timestamp()
+
+    assert format_frame(TraceFrame(timestamp, Direction.RX, 0x7E8, b"\x62\xf1")) == (
+        "2024-05-01T12:30:15.000250 RX 0x7E8 [2] 62 F1"
+    )
+    assert format_frame(TraceFrame(timestamp, Direction.TX, None, b"")).endswith(" TX - [0] ")
+
+
+@pytest.mark.parametrize(
+    "args, expected_ids",
+    [
+        ([], ["0x7E0", "0x7E8", "0x100"]),
+        (["--direction", "rx"], ["0x7E8", "0x100"]),
+        (["-i", "0x7E0", "-i", "256"], ["0x7E0", "0x100"]),
+        (["--contains", "F190"], ["0x7E0", "0x7E8"]),
+        (["-d", "RX", "-c", "f1 90"], ["0x7E8"]),
+    ],
+)
+def test_main_filters(recording, args, expected_ids):
+    result = CliRunner().invoke(main, [str(recording), *args])
+
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0] == "# can"
+    assert [line.split()[2] for line in lines[1:]] == expected_ids
+
+
+def test_main_output_file(recording, tmp_path):
+    output = tmp_path / "can.txt"
+
+    result = CliRunner().invoke(main, [str(recording), "-o", str(output)])
+
+    assert result.exit_code == 0
+    assert output.read_text().splitlines()[1].endswith("TX 0x7E0 [3] 22 F1 90")
+
+
+@pytest.mark.parametrize(
+    "args, error",
+    [
+        (["-i", "ECU"], "invalid literal"),
+        (["-c", "XY"], "non-hexadecimal"),
+    ],
+)
+def test_main_invalid_filter(recording, args, error):
+    result = CliRunner().invoke(main, [str(recording), *args])
+
+    assert result.exit_code == 2
+    assert error in result.output
+
+
+def test_main_not_a_recording(tmp_path):
+    path = tmp_path / "trace.log"
+    path.write_text("12:00:00 : received response")
+
+    result = CliRunner().invoke(main, [str(path)])
+
+    assert result.exit_code == 2
+    assert "is not a traffic recording" in result.output
@@ -8,6 +8,7 @@
 ##########################################################################
 
 import importlib
+import json
 import logging
 import sys
 from time import sleep
@@ -20,6 +21,7 @@ from pykiso.lib.auxiliaries.udsaux import uds_auxiliary
 from pykiso.lib.auxiliaries.udsaux.common import UDSCommands
 from pykiso.lib.auxiliaries.udsaux.common.uds_response import NegativeResponseCode, UdsResponse
 from pykiso.lib.auxiliaries.udsaux.uds_auxiliary import UdsAuxiliary
+from pykiso.traffic_recorder import Direction, read_trace
 
 
 def test_import():
@@ -135,6 +137,20 @@ class TestUdsAuxiliary:
         assert call_arg.data == data
         assert call_arg.is_extended_id == False
 
+    def test_transmit_recorded(self, uds_raw_aux_inst, tmp_path):
+        uds_raw_aux_inst.channel.start_recording(tmp_path / "uds.pktrace")
+
+        uds_raw_aux_inst.transmit(b"\x22\xf1\x90", req_id=0x7E0)
+        uds_raw_aux_inst.channel.stop_recording()
+
+        uds_raw_aux_inst.channel._cc_send.assert_called_with(
+            msg=b"\x22\xf1\x90", remote_id=0x7E0
+        )
+        frames = list(read_trace(tmp_path / "uds.pktrace"))
+        assert [frame[1:] for frame in frames] == [
+            (Direction.TX, 0x7E0, b"\x22\xf1\x90")
+        ]
+
     def test_check_max_pending_time(self, uds_raw_aux_inst, mock_uds_config):
         response = UdsResponse([0x00, 0x00, 0x00], pending_resp_times=[1, 5, 7])
         assert uds_raw_aux_inst.check_max_pending_time(response, 10) is True
@@ -412,3 +428,53 @@ class TestUdsAuxiliary:
         assert uds_raw_aux_inst.is_tester_present is not None
         assert uds_raw_aux_inst._delete_auxiliary_instance() is True
         assert uds_raw_aux_inst.is_tester_present is None
+
+    def test_send_uds_raw_metrics(self, mock_uds_config, uds_raw_aux_inst):
+        uds_raw_aux_inst.uds_config = mock_uds_config
+        mock_uds_config.send.return_value = [0x7F, 0x22, 0x31]
+        mock_uds_config.last_pending_resp_times = [0.005, 0.003]
+
+        uds_raw_aux_inst.send_uds_raw([0x22, 0xF1, 0x90])
+        mock_uds_config.send.return_value = None
+        uds_raw_aux_inst.send_uds_raw([0x3E, 0x80], response_required=False)
+        with pytest.raises(uds_raw_aux_inst.errors.ResponseNotReceivedError):
+            uds_raw_aux_inst.send_uds_raw([0x22, 0xF1, 0x91])
+        mock_uds_config.send.side_effect = Exception()
+        uds_raw_aux_inst.send_uds_raw([0x3E, 0x00])
+
+        rdbi = uds_raw_aux_inst.metrics[0x22]
+        assert (rdbi.requests, rdbi.responses, rdbi.timeouts) == (2, 1, 1)
+        assert rdbi.latency_max == 0.015
+        assert rdbi.nrc == {"REQUEST_OUT_OF_RANGE": 1}
+        assert rdbi.pending_responses == 2
+        assert rdbi.pending_duration_max == pytest.approx(0.010)
+        tester_present = uds_raw_aux_inst.metrics[0x3E]
+        assert (tester_present.requests, tester_present.errors, tester_present.timeouts) == (1, 1, 0)
+
+    def test_report_metrics(self, mock_uds_config, uds_raw_aux_inst, mocker):
+        uds_raw_aux_inst.uds_config = mock_uds_config
+        mock_uds_config.send.return_value = [0x50, 0x03]
+        uds_raw_aux_inst.send_uds_raw([0x10, 0x03])
+        test_case = mocker.MagicMock()
+        test_case.step_report.header = {}
+
+        uds_raw_aux_inst.report_metrics(test_case)
+
+        assert test_case.step_report.header == {
+            f"UDS metrics {uds_raw_aux_inst.name}": "0x10: 1 requests, latency mean 15.0 ms, max 15.0 ms"
+        }
+
+    def test_delete_aux_instance_metrics_file(
+        self, mocker, mock_uds_config, uds_raw_aux_inst, tmp_path
+    ):
+        mocker.patch.object(uds_raw_aux_inst.channel, "close")
+        uds_raw_aux_inst.uds_config = mock_uds_config
+        mock_uds_config.send.return_value = [0x50, 0x03]
+        uds_raw_aux_inst.send_uds_raw([0x10, 0x03])
+        uds_raw_aux_inst.metrics_file = tmp_path / "metrics" / "uds.json"
+
+        assert uds_raw_aux_inst._delete_auxiliary_instance() is True
+
+        metrics = json.loads(uds_raw_aux_inst.metrics_file.read_text())
+        assert metrics["auxiliary"] == uds_raw_aux_inst.name
+        assert metrics["services"]["0x10"]["responses"] == 1
@@ -12,7 +12,7 @@ from unittest.mock import MagicMock, call
 
 import pytest
 
-from pykiso.lib.auxiliaries.udsaux.common.uds_callback import UdsCallback, UdsDownloadCallback
+from pykiso.lib.auxiliaries.udsaux.common.uds_callback import UdsCallback, UdsCallbackTrie, UdsDownloadCallback
 
 
 @pytest.fixture()
@@ -179,9 +179,9 @@ class TestUdsDownloadCallback:
         mock_get_transfer_size = mocker.patch.object(
             callback_inst, "get_transfer_size", return_value=2
         )
-        # return 3 bytes of size to receive
+        # return 4 bytes of size to receive: service id, sequence number and 2 data bytes
         mock_get_first_frame_data_length = mocker.patch.object(
-            callback_inst, "get_first_frame_data_length", side_effect=[(3, 6), (3, 6)]
+            callback_inst, "get_first_frame_data_length", side_effect=[(4, 6), (4, 6)]
         )
         aux_mock.stop_rx.is_set.return_value = False
         initial_transfer_data = [0x00] * 6 + [0x36, 0x01, 0x02]
@@ -189,8 +189,8 @@ class TestUdsDownloadCallback:
             None,  # no initial transfer_data
             initial_transfer_data,  # initial transfer_data
             None,  # no block data
-            [0x29, 0x00],  # invalid block data -> transfer_data += 1
-            [0x22, 0x00],  # valid block data -> transfer_data += 1
+            [0x29, 0x00],  # 8 missed frames -> end of the block data
+            [0x22, 0x00],  # not received
         )
 
         assert callback_inst.transfer_successful is False
@@ -206,4 +206,66 @@ class TestUdsDownloadCallback:
         assert "Consecutive frame missed" in caplog.text
 
         assert callback_inst.transfer_successful is True
-        assert callback_inst.transferred_data_size == 3
+        assert callback_inst.transferred_data_size == 2
+        assert callback_inst.downloaded_data == bytearray([0x02, 0x00])
+        assert callback_inst.statistics.missed_frames == 8
+
+    def test_handle_data_download_statistics(self, aux_mock):
+        # 11 bytes to download, minus one as computed by get_transfer_size
+        req = [0x34, 0x00, 0x11, 0x00, 0x0B]
+        data = list(range(1, 11))
+        callback_inst = UdsDownloadCallback()
+        aux_mock.stop_rx.is_set.return_value = False
+        aux_mock.receive.side_effect = (
+            # first frame of a 12 bytes TransferData request
+            [0x10, 0x0C, 0x36, 0x01, *data[:4]],
+            # padded consecutive frame
+            [0x21, *data[4:], 0xCC],
+        )
+
+        callback_inst.handle_data_download(req, aux_mock)
+
+        assert callback_inst.transfer_successful is True
+        assert callback_inst.downloaded_data == bytearray(data)
+        statistics = callback_inst.statistics
+        assert (statistics.size, statistics.blocks, statistics.frames, statistics.missed_frames) == (10, 1, 1, 0)
+        assert statistics.throughput == pytest.approx(statistics.size / statistics.duration)
+        # the frames are awaited until the transfer timeout instead of polled
+        assert all(kwargs["timeout"] > 0 for _, kwargs in aux_mock.receive.call_args_list)
+
+
+class TestUdsCallbackTrie:
+    def test_match_longest_request(self):
+        session = UdsCallback([0x10])
+        extended_session = UdsCallback([0x10, 0x03])
+        trie = UdsCallbackTrie().insert(session.request, session).insert(extended_session.request, extended_session)
+
+        assert trie.match([0x10, 0x03, 0x01]) is extended_session
+        assert trie.match([0x10, 0x03]) is extended_session
+        assert trie.match([0x10, 0x02]) is session
+        assert trie.match([0x11, 0x01]) is None
+        assert trie.match([]) is None
+
+    def test_insert_remove_copy_on_write(self):
+        read_did = UdsCallback([0x22, 0xF1, 0x90])
+        empty = UdsCallbackTrie()
+
+        trie = empty.insert(read_did.request, read_did)
+        replaced = trie.insert(read_did.request, UdsCallback([0x22, 0xF1, 0x90], [0x7F, 0x22, 0x31]))
+        removed = trie.remove(read_did.request)
+
+        # the previous tries are left untouched
+        assert empty.match(read_did.request) is None
+        assert trie.match(read_did.request) is read_did
+        assert replaced.match(read_did.request).response == [0x7F, 0x22, 0x31]
+        # the branches without callback are dropped
+        assert removed.children == {}
+
+    def test_remove_keeps_shorter_request(self):
+        session = UdsCallback([0x10])
+        trie = UdsCallbackTrie().insert([0x10], session).insert([0x10, 0x03], UdsCallback([0x10, 0x03]))
+
+        trie = trie.remove([0x10, 0x03])
+
+        assert trie.match([0x10, 0x03]) is session
+        assert trie.children[0x10].children == {}
@@ -0,0 +1,130 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import json
+import threading
+
+import pytest
+
+from pykiso.lib.auxiliaries.udsaux.common.uds_metrics import (
+    LATENCY_BUCKETS_MS,
+    METRICS_VERSION,
+    ServiceMetrics,
+    UdsMetrics,
+)
+from pykiso.lib.auxiliaries.udsaux.common.uds_response import UdsResponse
+
+
+@pytest.fixture
+def metrics():
+    return UdsMetrics()
+
+
+def test_service_metrics_latency_histogram():
+    service = ServiceMetrics(buckets=(10, 100))
+
+    for latency in (0.002, 0.010, 0.050, 0.3):
+        service.record_response(UdsResponse([0x62, 0xF1, 0x90], resp_time=latency))
+
+    assert service.responses == 4
+    assert service.histogram == [2, 1, 1]
+    assert service.latency_min == 0.002
+    assert service.latency_max == 0.3
+    assert service.latency_mean == pytest.approx(0.0905)
+    assert service.as_dict()["latency"]["histogram"] == [
+        {"le_ms": 10, "count": 2},
+        {"le_ms": 100, "count": 1},
+        {"le_ms": None, "count": 1},
+    ]
+
+
+def test_service_metrics_without_timing():
+    service = ServiceMetrics()
+
+    service.record_response(UdsResponse([0x50, 0x03]))
+
+    assert service.responses == 1
+    assert service.latency_mean is None
+    assert sum(service.histogram) == 0
+    assert service.summary() == "0 requests"
+
+
+def test_service_metrics_nrc_and_pending():
+    service = ServiceMetrics()
+
+    service.record_response(UdsResponse([0x7F, 0x31, 0x22], resp_time=0.2, pending_resp_times=[0.05, 0.1]))
+    service.record_response(UdsResponse([0x7F, 0x31, 0x22], resp_time=0.4, pending_resp_times=[0.1]))
+    service.record_response(UdsResponse([0x7F, 0x31, 0x13], resp_time=0.01))
+
+    assert service.nrc == {"CONDITIONS_NOT_CORRECT": 2, "INVALID_FORMAT": 1}
+    assert service.pending_requests == 2
+    assert service.pending_responses == 3
+    assert service.pending_duration_sum == pytest.approx(0.45)
+    assert service.pending_duration_max == pytest.approx(0.3)
+
+
+def test_uds_metrics_record(metrics):
+    metrics.record([0x22, 0xF1, 0x90], UdsResponse([0x62, 0xF1, 0x90], resp_time=0.004))
+    metrics.record(b"\x22\xf1\x91")
+    metrics.record([0x3E, 0x80], response_required=False)
+    metrics.record_error((0x3E, 0x00))
+
+    assert sorted(metrics.services) == [0x22, 0x3E]
+    assert metrics[0x22].requests == 2
+    assert metrics[0x22].timeouts == 1
+    assert metrics[0x22].histogram[LATENCY_BUCKETS_MS.index(5)] == 1
+    assert metrics[0x3E].requests == 1
+    assert metrics[0x3E].timeouts == 0
+    assert metrics[0x3E].errors == 1
+    with pytest.raises(KeyError):
+        metrics[0x10]
+
+    metrics.reset()
+    assert metrics.services == {}
+
+
+def test_uds_metrics_record_concurrently(metrics):
+    def send():
+        for _ in range(1000):
+            metrics.record([0x3E, 0x00], UdsResponse([0x7E, 0x00], resp_time=0.001))
+
+    threads = [threading.Thread(target=send) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics[0x3E].requests == 4000
+    assert metrics[0x3E].histogram[0] == 4000
+
+
+def test_uds_metrics_summary(metrics):
+    metrics.record([0x31, 0x01], UdsResponse([0x7F, 0x31, 0x22], resp_time=0.25, pending_resp_times=[0.05]))
+    metrics.record([0x10, 0x03], UdsResponse([0x50, 0x03], resp_time=0.0125))
+    metrics.record([0x10, 0x03])
+
+    assert metrics.summary() == (
+        "0x10: 2 requests, latency mean 12.5 ms, max 12.5 ms, 1 timeouts\n"
+        "0x31: 1 requests, latency mean 250.0 ms, max 250.0 ms, NRC CONDITIONS_NOT_CORRECT x1,"
+        " 1 pending responses, pending max 200.0 ms"
+    )
+
+
+def test_uds_metrics_write_json(metrics, tmp_path):
+    metrics.record([0x22, 0xF1, 0x90], UdsResponse([0x62, 0xF1, 0x90], resp_time=0.004))
+    path = tmp_path / "reports" / "uds_metrics.json"
+
+    metrics.write_json(path, auxiliary="uds_aux")
+
+    content = json.loads(path.read_text())
+    assert content["auxiliary"] == "uds_aux"
+    assert content["version"] == METRICS_VERSION
+    assert list(content["services"]) == ["0x22"]
+    assert content["services"]["0x22"]["latency"]["max"] == 0.004
+    assert [file.name for file in path.parent.iterdir()] == ["uds_metrics.json"]
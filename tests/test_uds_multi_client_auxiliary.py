@@ -0,0 +1,120 @@
+##########################################################################
+# Copyright (c) 2010-2024 Robert Bosch GmbH
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License 2.0 which is available at
+# http://www.eclipse.org/legal/epl-2.0.
+#
+# SPDX-License-Identifier: EPL-2.0
+##########################################################################
+
+import queue
+import threading
+import time
+
+import pytest
+
+from pykiso.connector import CChannel
+from pykiso.lib.auxiliaries.udsaux import UdsMultiClientAuxiliary
+from pykiso.lib.auxiliaries.udsaux.common.uds_base_auxiliary import UdsBaseAuxiliary
+from pykiso.lib.auxiliaries.udsaux.common.uds_response import UdsResponse
+
+ECUS = {
+    "engine": {"request_id": 0x7E0, "response_id": 0x7E8},
+    "brake": {"request_id": 0x7E1, "response_id": 0x7E9},
+}
+
+
+class EcuSimulatorChannel(CChannel):
+    """Answer each single frame request on the response ID of its ECU
+    after a delay, with a frame of an unknown ECU before."""
+
+    def __init__(self, delay: float = 0.0, **kwargs):
+        super().__init__(name="ecus", **kwargs)
+        self.delay = delay
+        self.frames = queue.Queue()
+        self.sent = []
+
+    def _cc_open(self):
+        pass
+
+    def _cc_close(self):
+        pass
+
+    def _cc_send(self, msg, remote_id=None, **kwargs):
+        self.sent.append((remote_id, list(msg)))
+        # positive response echoing the request, from the ECU 8 IDs above
+        length, service, *data = msg[: msg[0] + 1]
+        response = [length, service + 0x40, *data] + [0x00] * (7 - length)
+        timer = threading.Timer(self.delay, self._respond, args=(remote_id + 8, response))
+        timer.start()
+
+    def _respond(self, response_id, response):
+        self.frames.put((0x123, bytes([0x02, 0x7F, 0x22])))
+        self.frames.put((response_id, bytes(response)))
+
+    def _cc_receive(self, timeout=0.1, **kwargs):
+        try:
+            remote_id, msg = self.frames.get(timeout=timeout)
+        except queue.Empty:
+            return {"msg": None}
+        return {"msg": msg, "remote_id": remote_id}
+
+
+@pytest.fixture
+def multi_aux():
+    aux = UdsMultiClientAuxiliary(EcuSimulatorChannel(delay=0.2), ECUS, name="multi_aux")
+    # stop the reception thread quickly on deletion
+    aux.recv_timeout = 0.05
+    aux.create_instance()
+    yield aux
+    aux.delete_instance()
+
+
+def test_constructor_sessions():
+    tp_layer = {**UdsBaseAuxiliary.DEFAULT_TP_CONFIG, "discard_neg_resp": True}
+    aux = UdsMultiClientAuxiliary(
+        EcuSimulatorChannel(), {**ECUS, "gateway": {**ECUS["engine"], "response_id": 0x7EA, "tp_layer": tp_layer}}
+    )
+
+    assert list(aux.sessions) == ["engine", "brake", "gateway"]
+    assert aux["brake"].tp_layer["req_id"] == 0x7E1
+    assert aux["brake"].tp_layer["res_id"] == 0x7E9
+    assert aux["brake"].tp_layer["discard_neg_resp"] is False
+    assert aux["gateway"].tp_layer["discard_neg_resp"] is True
+    assert aux["gateway"].tp_layer["req_id"] == 0x7E0
+
+
+def test_constructor_shared_response_id():
+    with pytest.raises(ValueError, match="ECUs 'engine' and 'brake' share the response ID 0x7e8"):
+        UdsMultiClientAuxiliary(EcuSimulatorChannel(), {**ECUS, "brake": {"request_id": 0x7E1, "response_id": 0x7E8}})
+
+
+def test_send_uds_raw(multi_aux):
+    response = multi_aux.send_uds_raw("brake", [0x22, 0xF1, 0x90])
+
+    assert isinstance(response, UdsResponse)
+    assert list(response) == [0x62, 0xF1, 0x90]
+    assert multi_aux.channel.sent == [(0x7E1, [0x03, 0x22, 0xF1, 0x90, 0x00, 0x00, 0x00, 0x00])]
+    # the frames of the other ECUs are not handed over to the session
+    assert multi_aux["brake"].receive() is None
+    assert multi_aux["engine"].receive() is None
+    # the metrics are recorded per ECU
+    assert multi_aux["brake"].metrics[0x22].responses == 1
+    assert multi_aux["engine"].metrics.services == {}
+
+
+def test_send_uds_raw_concurrently(multi_aux):
+    start = time.perf_counter()
+    responses = multi_aux.send_uds_raw_concurrently({"engine": [0x10, 0x03], "brake": [0x3E, 0x00]})
+    elapsed = time.perf_counter() - start
+
+    assert list(responses["engine"]) == [0x50, 0x03]
+    assert list(responses["brake"]) == [0x7E, 0x00]
+    # both ECUs answered within the same response delay
+    assert elapsed < 2 * multi_aux.channel.delay
+    assert multi_aux["engine"].check_raw_response_positive(responses["engine"]) is True
+
+
+def test_send_uds_raw_unknown_ecu(multi_aux):
+    with pytest.raises(KeyError):
+        multi_aux.send_uds_raw("gateway", [0x10, 0x03])
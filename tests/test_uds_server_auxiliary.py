@@ -15,6 +15,7 @@ import pytest
 
 from pykiso.lib.auxiliaries.udsaux.common.uds_callback import UdsCallback
 from pykiso.lib.auxiliaries.udsaux.uds_server_auxiliary import UdsServerAuxiliary
+from pykiso.traffic_recorder import Direction, read_trace
 
 ODX_REQUEST = {
     "service": 0x22,  # IsoServices.ReadDataByIdentifier
@@ -103,7 +104,7 @@ class TestUdsServerAuxiliary:
         uds_server_aux_inst.transmit(data, req_id)
 
         mock_pad.assert_called_with(data)
-        mock_channel._cc_send.assert_called_with(msg=data, remote_id=expected_req_id)
+        mock_channel.cc_send.assert_called_with(msg=data, remote_id=expected_req_id)
 
     @pytest.mark.parametrize(
         "cc_receive_return, expected_received_data",
@@ -122,6 +123,26 @@ class TestUdsServerAuxiliary:
         uds_server_aux_inst.channel._cc_receive.assert_called_with(timeout=0)
         assert received_data == expected_received_data
 
+    def test_transmit_and_receive_recorded(self, mocker, uds_server_aux_inst, tmp_path):
+        mocker.patch.object(uds_server_aux_inst, "_pad_message", side_effect=bytes)
+        mocker.patch.object(
+            uds_server_aux_inst.channel,
+            "_cc_receive",
+            return_value={"msg": b"\x22\xf1\x90", "remote_id": 0x321},
+        )
+        uds_server_aux_inst.res_id = 0x321
+        uds_server_aux_inst.channel.start_recording(tmp_path / "uds.pktrace")
+
+        uds_server_aux_inst.transmit([0x62, 0xF1, 0x90])
+        uds_server_aux_inst.receive()
+        uds_server_aux_inst.channel.stop_recording()
+
+        frames = list(read_trace(tmp_path / "uds.pktrace"))
+        assert [frame[1:] for frame in frames] == [
+            (Direction.TX, 0x123, b"\x62\xf1\x90"),
+            (Direction.RX, 0x321, b"\x22\xf1\x90"),
+        ]
+
     def test_send_response(self, mocker, uds_server_aux_inst):
         uds_mock = mocker.patch.object(uds_server_aux_inst, "uds_config")
         uds_mock.tp.encode_isotp.return_value = "NOT NONE"
@@ -340,16 +361,40 @@ class TestUdsServerAuxiliary:
         mock_dispatch.assert_not_called()
 
     def test__dispatch_callback(self, uds_server_aux_inst):
-        callback_mock = MagicMock()
+        callback_mock = MagicMock(spec=UdsCallback)
         callback_mock.request = [0x01]
 
-        uds_server_aux_inst._callbacks = {"0x0102": callback_mock}
+        uds_server_aux_inst.register_callback(callback_mock)
 
         received_request = [0x01, 0x02]
         uds_server_aux_inst._dispatch_callback(received_request)
 
         callback_mock.assert_called_once_with(received_request, uds_server_aux_inst)
 
+    def test__dispatch_callback_longest_match(self, uds_server_aux_inst):
+        session_callback = MagicMock(spec=UdsCallback, request=[0x10])
+        extended_session_callback = MagicMock(spec=UdsCallback, request=[0x10, 0x03])
+        uds_server_aux_inst.register_callback(extended_session_callback)
+        uds_server_aux_inst.register_callback(session_callback)
+
+        uds_server_aux_inst._dispatch_callback([0x10, 0x03])
+        uds_server_aux_inst._dispatch_callback([0x10, 0x02])
+
+        extended_session_callback.assert_called_once_with([0x10, 0x03], uds_server_aux_inst)
+        session_callback.assert_called_once_with([0x10, 0x02], uds_server_aux_inst)
+
+        uds_server_aux_inst.unregister_callback([0x10, 0x03])
+        uds_server_aux_inst._dispatch_callback([0x10, 0x03])
+
+        session_callback.assert_called_with([0x10, 0x03], uds_server_aux_inst)
+
+    def test_callbacks_read_only(self, uds_server_aux_inst):
+        uds_server_aux_inst.register_callback(0x1003)
+
+        with pytest.raises(TypeError):
+            uds_server_aux_inst.callbacks["0x1003"] = None
+        assert isinstance(uds_server_aux_inst.callbacks["0x1003"], UdsCallback)
+
     def test__dispatch_callback_no_callback(self, mocker, caplog, uds_server_aux_inst):
         mocker.patch.object(UdsServerAuxiliary, "callbacks", return_value=dict())
 